@@ -0,0 +1,39 @@
+"""add calendar_sync_state
+
+Revision ID: a3f1c2d4e5b6
+Revises: 79e06d6c97c8
+Create Date: 2026-10-18 10:12:41.220318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f1c2d4e5b6"
+down_revision: Union[str, None] = "79e06d6c97c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "calendar_sync_state",
+        sa.Column("calendar_id", sa.Text(), nullable=False),
+        sa.Column("sync_token", sa.Text(), nullable=True),
+        sa.Column(
+            "updated_at",
+            postgresql.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("calendar_id", name=op.f("pk_calendar_sync_state")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("calendar_sync_state")
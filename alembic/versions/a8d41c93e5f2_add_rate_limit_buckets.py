@@ -0,0 +1,37 @@
+"""add rate limit buckets
+
+Revision ID: a8d41c93e5f2
+Revises: f3b9d27a6c14
+Create Date: 2026-10-18 17:05:12.482913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a8d41c93e5f2"
+down_revision: Union[str, None] = "f3b9d27a6c14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("bucket_key", sa.Text(), nullable=False),
+        sa.Column("tat", postgresql.TIMESTAMP(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("bucket_key"),
+    )
+    op.create_index(
+        "idx_rate_limit_buckets_tat", "rate_limit_buckets", ["tat"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_rate_limit_buckets_tat", table_name="rate_limit_buckets")
+    op.drop_table("rate_limit_buckets")
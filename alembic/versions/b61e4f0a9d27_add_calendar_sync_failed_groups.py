@@ -0,0 +1,36 @@
+"""add failed_group_ids to calendar_sync_state
+
+Revision ID: b61e4f0a9d27
+Revises: d5a27e9c4b18
+Create Date: 2026-10-19 14:02:51.734190
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b61e4f0a9d27"
+down_revision: Union[str, None] = "d5a27e9c4b18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "calendar_sync_state",
+        sa.Column(
+            "failed_group_ids",
+            postgresql.ARRAY(sa.Integer()),
+            server_default="{}",
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("calendar_sync_state", "failed_group_ids")
@@ -0,0 +1,43 @@
+"""add scoring queue columns to question_responses
+
+Revision ID: c81e4f2a9d37
+Revises: a3f1c2d4e5b6
+Create Date: 2026-10-18 11:02:17.540912
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c81e4f2a9d37"
+down_revision: Union[str, None] = "a3f1c2d4e5b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "question_responses",
+        sa.Column(
+            "scoring_attempts",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "question_responses",
+        sa.Column(
+            "scoring_locked_until", postgresql.TIMESTAMP(timezone=True), nullable=True
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("question_responses", "scoring_locked_until")
+    op.drop_column("question_responses", "scoring_attempts")
@@ -0,0 +1,30 @@
+"""index lower(email) on users
+
+Revision ID: c84d2e7f1a35
+Revises: b61e4f0a9d27
+Create Date: 2026-10-19 14:31:08.552617
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c84d2e7f1a35"
+down_revision: Union[str, None] = "b61e4f0a9d27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Emails are matched case-insensitively; nothing queries raw email anymore
+    op.create_index("idx_users_email_lower", "users", [sa.text("lower(email)")])
+    op.drop_index("idx_users_email", table_name="users")
+
+
+def downgrade() -> None:
+    op.create_index("idx_users_email", "users", ["email"])
+    op.drop_index("idx_users_email_lower", table_name="users")
@@ -0,0 +1,43 @@
+"""add scoring_cache
+
+Revision ID: d4a9b3e17c52
+Revises: c81e4f2a9d37
+Create Date: 2026-10-18 11:48:03.117254
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a9b3e17c52"
+down_revision: Union[str, None] = "c81e4f2a9d37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scoring_cache",
+        sa.Column("cache_key", sa.Text(), nullable=False),
+        sa.Column(
+            "score_data", postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.Column("model_id", sa.Text(), nullable=False),
+        sa.Column("assessment_system_prompt_version", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at",
+            postgresql.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("cache_key", name=op.f("pk_scoring_cache")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scoring_cache")
@@ -0,0 +1,35 @@
+"""add scoring queue index to question_responses
+
+Revision ID: d5a27e9c4b18
+Revises: a8d41c93e5f2
+Create Date: 2026-10-19 09:14:36.208541
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5a27e9c4b18"
+down_revision: Union[str, None] = "a8d41c93e5f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_question_responses_scoring_queue",
+        "question_responses",
+        ["completed_at"],
+        unique=False,
+        postgresql_where=sa.text("completed_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_question_responses_scoring_queue", table_name="question_responses"
+    )
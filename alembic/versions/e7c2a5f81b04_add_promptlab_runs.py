@@ -0,0 +1,58 @@
+"""add promptlab_runs
+
+Revision ID: e7c2a5f81b04
+Revises: d4a9b3e17c52
+Create Date: 2026-10-18 14:02:51.604318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7c2a5f81b04"
+down_revision: Union[str, None] = "d4a9b3e17c52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "promptlab_runs",
+        sa.Column("run_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("config", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "results",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default="[]",
+            nullable=False,
+        ),
+        sa.Column("status", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at",
+            postgresql.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("completed_at", postgresql.TIMESTAMP(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.user_id"],
+            name=op.f("fk_promptlab_runs_user_id_users"),
+            ondelete="SET NULL",
+        ),
+        sa.PrimaryKeyConstraint("run_id", name=op.f("pk_promptlab_runs")),
+    )
+    op.create_index(
+        "idx_promptlab_runs_user_id", "promptlab_runs", ["user_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_promptlab_runs_user_id", table_name="promptlab_runs")
+    op.drop_table("promptlab_runs")
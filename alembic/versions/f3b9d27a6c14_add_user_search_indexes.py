@@ -0,0 +1,64 @@
+"""add user search indexes
+
+Revision ID: f3b9d27a6c14
+Revises: e7c2a5f81b04
+Create Date: 2026-10-18 16:20:37.118402
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b9d27a6c14"
+down_revision: Union[str, None] = "e7c2a5f81b04"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Prefix search on email / Discord ID (LIKE 'q%')
+    op.create_index(
+        "idx_users_email_prefix",
+        "users",
+        [sa.text("lower(email) text_pattern_ops")],
+    )
+    op.create_index(
+        "idx_users_discord_id_prefix",
+        "users",
+        [sa.text("discord_id text_pattern_ops")],
+    )
+
+    # pg_trgm may not be installable (e.g. without superuser on a managed
+    # database); search then falls back to an in-process index
+    op.execute("""
+        DO $$
+        BEGIN
+            CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        EXCEPTION WHEN insufficient_privilege OR undefined_file THEN
+            RAISE NOTICE 'pg_trgm unavailable, skipping trigram indexes';
+        END
+        $$
+    """)
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN
+                CREATE INDEX IF NOT EXISTS idx_users_nickname_trgm
+                    ON users USING gin (nickname gin_trgm_ops);
+                CREATE INDEX IF NOT EXISTS idx_users_discord_username_trgm
+                    ON users USING gin (discord_username gin_trgm_ops);
+            END IF;
+        END
+        $$
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_users_discord_username_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_users_nickname_trgm")
+    op.drop_index("idx_users_discord_id_prefix", table_name="users")
+    op.drop_index("idx_users_email_prefix", table_name="users")
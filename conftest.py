@@ -17,3 +17,33 @@ def event_loop_policy():
     import asyncio
 
     return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Fail the test if an operation it runs issues more DB statements per
+    invocation than its budget in core.query_stats.QUERY_BUDGETS.
+
+    Call the fixture to add or tighten a budget for this test:
+        query_budget("GET /api/courses/{course_slug}/progress", 8)
+    """
+    from core import query_stats
+
+    query_stats.clear_query_stats()
+    budgets = dict(query_stats.QUERY_BUDGETS)
+
+    def set_budget(label: str, max_statements: int) -> None:
+        budgets[label] = max_statements
+
+    yield set_budget
+
+    stats = query_stats.get_query_stats()
+    over = [
+        f"{label}: {stats[label]['max_statements']} statements (budget {budget})"
+        for label, budget in budgets.items()
+        if label in stats and stats[label]["max_statements"] > budget
+    ]
+    query_stats.clear_query_stats()
+    if over:
+        pytest.fail("Query budget exceeded:\n" + "\n".join(over))
@@ -3,6 +3,8 @@ Core business logic - platform-agnostic.
 Can be used by Discord bot, web API, or any other interface.
 """
 
+import importlib
+
 # Database (SQLAlchemy) - user data migrated to database, courses removed
 from .database import (
     get_connection,
@@ -18,134 +20,129 @@ from .constants import DAY_CODES, DAY_NAMES, TIMEZONES
 # Timezone utilities
 from .timezone import local_to_utc_time, utc_to_local_time
 
-# Google Docs integration
-from .google_docs import extract_doc_id, fetch_google_doc, parse_doc_tabs, make_tab_url
-
-# Cohort name generation
-from .cohort_names import CohortNameGenerator, COHORT_NAMES
-
-# Scheduling algorithm
-import cohort_scheduler
-from .scheduling import (
-    Person,
-    DAY_MAP,
-    CohortSchedulingResult,
-    UngroupableReason,
-    UngroupableDetail,
-    calculate_total_available_time,
-    analyze_ungroupable_users,
-    schedule_cohort,
-)
-
-
-# User management (async functions - must be awaited)
-from .users import (
-    get_user_profile,
-    save_user_profile,
-    update_user_profile,
-    get_users_with_availability,
-    get_facilitators,
-    toggle_facilitator,
-    is_facilitator,
-    become_facilitator,
-    enroll_in_cohort,
-)
-
-# Nickname sync (async functions)
-from .nickname import get_user_nickname, update_user_nickname
-from .nickname_sync import (
-    register_nickname_callback,
-    unregister_nickname_callback,
-    update_nickname_in_discord,
-)
-
-# Cohorts / Availability
-from .cohorts import find_availability_overlap, format_local_time, get_timezone_abbrev
-
-# Availability format conversion
-from .availability import (
-    merge_adjacent_slots,
-    availability_json_to_intervals,
-    availability_json_to_interval_string,
-)
-
-# Auth
-from .auth import get_or_create_user
-
-# Stampy chatbot
-from . import stampy
-
-# Configuration
-from .config import (
-    is_dev_mode,
-    is_production,
-    get_api_port,
-    get_frontend_port,
-    get_frontend_url,
-    get_allowed_origins,
-)
-
-# Notifications
-from .notifications import (
-    notify_welcome,
-    notify_group_assigned,
-    notify_member_joined,
-    schedule_meeting_reminders,
-    cancel_meeting_reminders,
-)
-
-# Meetings
-from .meetings import (
-    create_meetings_for_group,
-    schedule_reminders_for_group,
-    reschedule_meeting,
-)
-
-# Attendance
-from .attendance import record_voice_attendance
-
-# Group joining
-from .group_joining import (
-    get_joinable_groups,
-    get_user_current_group,
-    join_group,
-    get_user_group_info,
-)
+# Everything below is imported on first use (PEP 562 __getattr__), so that
+# importing core, or one of its submodules, doesn't pull in the scheduling
+# solver, Google/SendGrid clients, Discord sync and so on.
+# name -> (module, attribute in it, or None for the module itself)
+_LAZY_ATTRS: dict[str, tuple[str, str | None]] = {
+    # Google Docs integration
+    "extract_doc_id": (".google_docs", "extract_doc_id"),
+    "fetch_google_doc": (".google_docs", "fetch_google_doc"),
+    "parse_doc_tabs": (".google_docs", "parse_doc_tabs"),
+    "make_tab_url": (".google_docs", "make_tab_url"),
+    # Cohort name generation
+    "CohortNameGenerator": (".cohort_names", "CohortNameGenerator"),
+    "COHORT_NAMES": (".cohort_names", "COHORT_NAMES"),
+    # Scheduling algorithm
+    "cohort_scheduler": ("cohort_scheduler", None),
+    "Person": (".scheduling", "Person"),
+    "DAY_MAP": (".scheduling", "DAY_MAP"),
+    "CohortSchedulingResult": (".scheduling", "CohortSchedulingResult"),
+    "UngroupableReason": (".scheduling", "UngroupableReason"),
+    "UngroupableDetail": (".scheduling", "UngroupableDetail"),
+    "calculate_total_available_time": (".scheduling", "calculate_total_available_time"),
+    "analyze_ungroupable_users": (".scheduling", "analyze_ungroupable_users"),
+    "schedule_cohort": (".scheduling", "schedule_cohort"),
+    # User management (async functions - must be awaited)
+    "get_user_profile": (".users", "get_user_profile"),
+    "save_user_profile": (".users", "save_user_profile"),
+    "update_user_profile": (".users", "update_user_profile"),
+    "get_users_with_availability": (".users", "get_users_with_availability"),
+    "get_facilitators": (".users", "get_facilitators"),
+    "toggle_facilitator": (".users", "toggle_facilitator"),
+    "is_facilitator": (".users", "is_facilitator"),
+    "become_facilitator": (".users", "become_facilitator"),
+    "enroll_in_cohort": (".users", "enroll_in_cohort"),
+    # Nickname sync (async functions)
+    "get_user_nickname": (".nickname", "get_user_nickname"),
+    "update_user_nickname": (".nickname", "update_user_nickname"),
+    "register_nickname_callback": (".nickname_sync", "register_nickname_callback"),
+    "unregister_nickname_callback": (".nickname_sync", "unregister_nickname_callback"),
+    "update_nickname_in_discord": (".nickname_sync", "update_nickname_in_discord"),
+    # Cohorts / Availability
+    "find_availability_overlap": (".cohorts", "find_availability_overlap"),
+    "format_local_time": (".cohorts", "format_local_time"),
+    "get_timezone_abbrev": (".cohorts", "get_timezone_abbrev"),
+    # Availability format conversion
+    "merge_adjacent_slots": (".availability", "merge_adjacent_slots"),
+    "availability_json_to_intervals": (
+        ".availability",
+        "availability_json_to_intervals",
+    ),
+    "availability_json_to_interval_string": (
+        ".availability",
+        "availability_json_to_interval_string",
+    ),
+    # Auth
+    "get_or_create_user": (".auth", "get_or_create_user"),
+    # Stampy chatbot
+    "stampy": (".stampy", None),
+    # Configuration
+    "is_dev_mode": (".config", "is_dev_mode"),
+    "is_production": (".config", "is_production"),
+    "get_api_port": (".config", "get_api_port"),
+    "get_frontend_port": (".config", "get_frontend_port"),
+    "get_frontend_url": (".config", "get_frontend_url"),
+    "get_allowed_origins": (".config", "get_allowed_origins"),
+    # Notifications
+    "notify_welcome": (".notifications", "notify_welcome"),
+    "notify_group_assigned": (".notifications", "notify_group_assigned"),
+    "notify_member_joined": (".notifications", "notify_member_joined"),
+    "schedule_meeting_reminders": (".notifications", "schedule_meeting_reminders"),
+    "cancel_meeting_reminders": (".notifications", "cancel_meeting_reminders"),
+    # Meetings
+    "create_meetings_for_group": (".meetings", "create_meetings_for_group"),
+    "schedule_reminders_for_group": (".meetings", "schedule_reminders_for_group"),
+    "reschedule_meeting": (".meetings", "reschedule_meeting"),
+    # Attendance
+    "record_voice_attendance": (".attendance", "record_voice_attendance"),
+    # Group joining
+    "get_joinable_groups": (".group_joining", "get_joinable_groups"),
+    "get_user_current_group": (".group_joining", "get_user_current_group"),
+    "join_group": (".group_joining", "join_group"),
+    "get_user_group_info": (".group_joining", "get_user_group_info"),
+    # Guest visits
+    "find_alternative_meetings": (".guest_visits", "find_alternative_meetings"),
+    "create_guest_visit": (".guest_visits", "create_guest_visit"),
+    "cancel_guest_visit": (".guest_visits", "cancel_guest_visit"),
+    "get_user_guest_visits": (".guest_visits", "get_user_guest_visits"),
+    # Sync operations (sync functions for group membership changes)
+    "sync_group": (".sync", "sync_group"),
+    "sync_group_discord_permissions": (".sync", "sync_group_discord_permissions"),
+    "sync_group_calendar": (".sync", "sync_group_calendar"),
+    "sync_group_reminders": (".sync", "sync_group_reminders"),
+    "sync_group_rsvps": (".sync", "sync_group_rsvps"),
+    "sync_all_group_rsvps": (".sync", "sync_all_group_rsvps"),
+    "sync_cohort_groups": (".sync", "sync_cohort_groups"),
+    "sync_after_group_change": (".sync", "sync_after_group_change"),
+    "sync_meeting_reminders": (".notifications.scheduler", "sync_meeting_reminders"),
+    # Questions (async functions)
+    "submit_response": (".questions", "submit_response"),
+    "update_response": (".questions", "update_response"),
+    "get_responses": (".questions", "get_responses"),
+    "get_responses_for_question": (".questions", "get_responses_for_question"),
+    "claim_question_responses": (".questions", "claim_question_responses"),
+    # Scoring (async background task)
+    "enqueue_scoring": (".scoring", "enqueue_scoring"),
+    # Feedback (streaming AI feedback conversations)
+    "build_feedback_prompt": (".modules.feedback", "build_feedback_prompt"),
+}
 
-# Guest visits
-from .guest_visits import (
-    find_alternative_meetings,
-    create_guest_visit,
-    cancel_guest_visit,
-    get_user_guest_visits,
-)
 
-# Sync operations (sync functions for group membership changes)
-from .sync import (
-    sync_group,
-    sync_group_discord_permissions,
-    sync_group_calendar,
-    sync_group_reminders,
-    sync_group_rsvps,
-    sync_all_group_rsvps,
-    sync_after_group_change,
-)
-from .notifications.scheduler import sync_meeting_reminders
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
 
-# Questions (async functions)
-from .questions import (
-    submit_response,
-    update_response,
-    get_responses,
-    get_responses_for_question,
-    claim_question_responses,
-)
 
-# Scoring (async background task)
-from .scoring import enqueue_scoring
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# Feedback (streaming AI feedback conversations)
-from .modules.feedback import build_feedback_prompt
 
 __all__ = [
     # Database (SQLAlchemy)
@@ -244,6 +241,7 @@ __all__ = [
     "sync_group_reminders",
     "sync_group_rsvps",
     "sync_all_group_rsvps",
+    "sync_cohort_groups",
     "sync_after_group_change",
     "sync_meeting_reminders",
     # Questions
@@ -9,8 +9,11 @@ from .events import (
     update_meeting_event,
     cancel_meeting_event,
     get_event_rsvps,
+    list_changed_events,
+    SyncTokenExpiredError,
 )
 from .rsvp import sync_group_rsvps_from_recurring
+from .coordinator import sync_groups_calendar
 
 __all__ = [
     "get_calendar_service",
@@ -23,5 +26,8 @@ __all__ = [
     "update_meeting_event",
     "cancel_meeting_event",
     "get_event_rsvps",
+    "list_changed_events",
+    "SyncTokenExpiredError",
     "sync_group_rsvps_from_recurring",
+    "sync_groups_calendar",
 ]
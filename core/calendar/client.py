@@ -4,17 +4,22 @@ import json
 import logging
 import os
 from datetime import timedelta
+from typing import TYPE_CHECKING
 
 import sentry_sdk
-from google.oauth2 import service_account
-from googleapiclient.discovery import build, Resource
-from googleapiclient.errors import HttpError
+
+# The Google client libraries are imported when the service is first built,
+# keeping them out of app startup
+if TYPE_CHECKING:
+    from googleapiclient.discovery import Resource
 
 logger = logging.getLogger(__name__)
 
 
 def _is_rate_limit_error(exception: Exception) -> bool:
     """Check if exception is a Google API rate limit error."""
+    from googleapiclient.errors import HttpError
+
     if isinstance(exception, HttpError):
         return exception.resp.status == 429
     return False
@@ -56,7 +61,10 @@ CREDENTIALS_FILE = os.environ.get("GOOGLE_CALENDAR_CREDENTIALS_FILE")
 CREDENTIALS_JSON = os.environ.get("GOOGLE_CALENDAR_CREDENTIALS_JSON")
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
-_service: Resource | None = None
+# Max requests per batch call (Google recommends <= 50 for Calendar)
+BATCH_SIZE = 50
+
+_service: "Resource | None" = None
 
 
 def is_calendar_configured() -> bool:
@@ -67,7 +75,7 @@ def is_calendar_configured() -> bool:
     return bool(CREDENTIALS_FILE and os.path.exists(CREDENTIALS_FILE))
 
 
-def get_calendar_service() -> Resource | None:
+def get_calendar_service() -> "Resource | None":
     """
     Get or create Google Calendar API service.
 
@@ -85,6 +93,9 @@ def get_calendar_service() -> Resource | None:
     if not is_calendar_configured():
         return None
 
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+
     try:
         if CREDENTIALS_JSON:
             # Load credentials from env var (Railway/Heroku pattern)
@@ -114,10 +125,18 @@ def get_calendar_email() -> str:
     return CALENDAR_EMAIL
 
 
-def batch_get_events(event_ids: list[str]) -> dict[str, dict] | None:
+def batch_get_events(
+    event_ids: list[str],
+    rate_limited: set[str] | None = None,
+) -> dict[str, dict] | None:
     """
     Fetch multiple calendar events in a single batch request.
 
+    Args:
+        event_ids: Google Calendar event IDs to fetch
+        rate_limited: Optional set; IDs that failed with a 429 are added to it
+                      so callers can retry them instead of treating them as missing
+
     Returns:
         Dict mapping event_id -> event data, or None if calendar not configured.
         Events that failed to fetch are omitted from the dict.
@@ -139,6 +158,8 @@ def batch_get_events(event_ids: list[str]) -> dict[str, dict] | None:
                 operation="batch_get_events",
                 context={"event_id": request_id},
             )
+            if rate_limited is not None and _is_rate_limit_error(exception):
+                rate_limited.add(request_id)
         else:
             results[request_id] = response
 
@@ -0,0 +1,242 @@
+"""
+Cross-group calendar attendee sync.
+
+sync_group_calendar() handles one group per call: one batch request to
+fetch its recurring event and another to patch it. For cohort-wide syncs
+the coordinator collects attendee diffs for many groups and flushes them
+as full batch calls (BATCH_SIZE requests each), so N groups cost about
+2 * ceil(N / 50) HTTP round-trips instead of 2 * N.
+
+Only events whose attendee list actually changed are patched. Items that
+hit a 429 are retried with exponential backoff.
+
+Groups that still need event creation (or recreation after deletion) go
+through sync_group_calendar(), which holds the row lock that prevents
+duplicate recurring events.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import func, select
+
+from ..database import get_connection
+from ..enums import GroupUserStatus
+from ..tables import groups, groups_users, meetings, users
+from .client import BATCH_SIZE, batch_get_events, batch_patch_events
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRIES = 4
+RETRY_BASE_DELAY = 1.0  # seconds, doubled after each attempt
+
+
+def _chunks(items: list, size: int = BATCH_SIZE) -> list[list]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _new_result(recurring_event_id: str | None = None) -> dict[str, Any]:
+    """Result dict with the same shape as sync_group_calendar()."""
+    return {
+        "meetings": 0,
+        "created_recurring": False,
+        "recurring_event_id": recurring_event_id,
+        "patched": 0,
+        "failed": 0,
+    }
+
+
+async def _load_calendar_state(group_ids: list[int]) -> dict[int, dict[str, Any]]:
+    """
+    Load recurring event IDs, member emails and future meeting counts for
+    all groups in three queries.
+    """
+    now = datetime.now(timezone.utc)
+    async with get_connection() as conn:
+        group_rows = await conn.execute(
+            select(groups.c.group_id, groups.c.gcal_recurring_event_id).where(
+                groups.c.group_id.in_(group_ids)
+            )
+        )
+        state = {
+            row["group_id"]: {
+                "event_id": row["gcal_recurring_event_id"],
+                "emails": set(),
+                "meetings": 0,
+            }
+            for row in group_rows.mappings()
+        }
+
+        email_rows = await conn.execute(
+            select(groups_users.c.group_id, users.c.email)
+            .join(users, users.c.user_id == groups_users.c.user_id)
+            .where(groups_users.c.group_id.in_(group_ids))
+            .where(groups_users.c.status == GroupUserStatus.active)
+            .where(users.c.email.isnot(None))
+        )
+        for row in email_rows.mappings():
+            state[row["group_id"]]["emails"].add(row["email"].lower())
+
+        meeting_rows = await conn.execute(
+            select(meetings.c.group_id, func.count().label("count"))
+            .where(meetings.c.group_id.in_(group_ids))
+            .where(meetings.c.scheduled_at > now)
+            .group_by(meetings.c.group_id)
+        )
+        for row in meeting_rows.mappings():
+            state[row["group_id"]]["meetings"] = row["count"]
+
+    return state
+
+
+async def _fetch_events(
+    event_ids: list[str],
+) -> tuple[dict[str, dict], set[str]] | None:
+    """
+    Fetch events in full batches, retrying rate-limited items with backoff.
+
+    Returns:
+        (events by ID, IDs still rate-limited after all retries),
+        or None if calendar is not configured.
+    """
+    events: dict[str, dict] = {}
+    pending = list(event_ids)
+    for attempt in range(MAX_RETRIES + 1):
+        rate_limited: set[str] = set()
+        for chunk in _chunks(pending):
+            fetched = await asyncio.to_thread(batch_get_events, chunk, rate_limited)
+            if fetched is None:
+                return None
+            events.update(fetched)
+        if not rate_limited or attempt == MAX_RETRIES:
+            return events, rate_limited
+        pending = list(rate_limited)
+        await asyncio.sleep(RETRY_BASE_DELAY * 2**attempt)
+    return events, set()
+
+
+async def _patch_events(updates: list[dict]) -> dict[str, dict]:
+    """Patch events in full batches, retrying rate-limited items with backoff."""
+    results: dict[str, dict] = {}
+    pending = list(updates)
+    for attempt in range(MAX_RETRIES + 1):
+        for chunk in _chunks(pending):
+            patched = await asyncio.to_thread(batch_patch_events, chunk)
+            results.update(patched or {})
+        pending = [
+            u for u in pending if results.get(u["event_id"], {}).get("is_rate_limit")
+        ]
+        if not pending or attempt == MAX_RETRIES:
+            break
+        await asyncio.sleep(RETRY_BASE_DELAY * 2**attempt)
+    return results
+
+
+async def sync_groups_calendar(group_ids: list[int]) -> dict[int, dict[str, Any]]:
+    """
+    Sync recurring-event attendees for many groups with coalesced batch calls.
+
+    Args:
+        group_ids: Groups to sync
+
+    Returns:
+        Dict mapping group_id -> result dict (same shape as
+        sync_group_calendar()).
+    """
+    from ..sync import sync_group_calendar
+
+    if not group_ids:
+        return {}
+
+    state = await _load_calendar_state(group_ids)
+    results: dict[int, dict[str, Any]] = {}
+    needs_create: list[int] = []
+    to_check: dict[str, int] = {}  # event_id -> group_id
+
+    for group_id in group_ids:
+        group = state.get(group_id)
+        if group is None:
+            results[group_id] = {"error": "group_not_found", **_new_result()}
+            continue
+        result = _new_result(group["event_id"])
+        if not group["emails"]:
+            results[group_id] = {"error": "no_members", **result}
+            continue
+        if not group["meetings"]:
+            results[group_id] = {"reason": "no_future_meetings", **result}
+            continue
+        result["meetings"] = group["meetings"]
+        results[group_id] = result
+        if group["event_id"]:
+            to_check[group["event_id"]] = group_id
+        else:
+            needs_create.append(group_id)
+
+    # --- Fetch all existing events in full batches ---
+    updates: list[dict] = []
+    if to_check:
+        fetched = await _fetch_events(list(to_check))
+        if fetched is None:
+            for group_id in to_check.values():
+                results[group_id] = {
+                    "error": "calendar_unavailable",
+                    **results[group_id],
+                }
+            to_check = {}
+        else:
+            events, still_rate_limited = fetched
+            for event_id, group_id in to_check.items():
+                if event_id in still_rate_limited:
+                    results[group_id]["failed"] = 1
+                    results[group_id]["error"] = "rate_limited"
+                    continue
+                if event_id not in events:
+                    # Deleted in Google Calendar - recreate under the row lock
+                    needs_create.append(group_id)
+                    continue
+
+                expected = state[group_id]["emails"]
+                current = {
+                    a.get("email", "").lower()
+                    for a in events[event_id].get("attendees", [])
+                    if a.get("email")
+                }
+                to_add = expected - current
+                to_remove = current - expected
+                if to_add or to_remove:
+                    updates.append(
+                        {
+                            "event_id": event_id,
+                            "body": {
+                                "attendees": [{"email": e} for e in sorted(expected)]
+                            },
+                            "send_updates": "all" if to_add else "none",
+                        }
+                    )
+
+    # --- Flush attendee changes in full batches ---
+    if updates:
+        patch_results = await _patch_events(updates)
+        for update in updates:
+            group_id = to_check[update["event_id"]]
+            if patch_results.get(update["event_id"], {}).get("success"):
+                results[group_id]["patched"] = 1
+            else:
+                results[group_id]["failed"] = 1
+
+    # --- Creation path stays per group (needs SELECT ... FOR UPDATE) ---
+    for group_id in needs_create:
+        try:
+            results[group_id] = await sync_group_calendar(group_id)
+        except Exception as e:
+            logger.error(f"Calendar sync failed for group {group_id}: {e}")
+            results[group_id] = {"error": str(e), **_new_result()}
+
+    logger.info(
+        f"Calendar sync for {len(group_ids)} groups: "
+        f"{len(to_check)} checked, {len(updates)} patched, "
+        f"{len(needs_create)} created"
+    )
+    return results
@@ -326,3 +326,65 @@ async def get_event_rsvps(event_id: str) -> list[dict] | None:
     except Exception as e:
         print(f"Failed to get RSVPs for event {event_id}: {e}")
         return None
+
+
+class SyncTokenExpiredError(Exception):
+    """Google rejected the sync token (HTTP 410); a full resync is needed."""
+
+
+async def list_changed_events(
+    sync_token: str | None,
+) -> tuple[list[dict], str | None] | None:
+    """
+    List events changed since the last incremental sync.
+
+    With sync_token=None this lists every event on the calendar, which is
+    only needed to obtain the first token. Recurring series are not
+    expanded: a changed item is either a series master or an exception
+    instance (which carries "recurringEventId").
+
+    Args:
+        sync_token: nextSyncToken from the previous call, or None
+
+    Returns:
+        (changed events, next sync token), or None if calendar not configured
+        or the API call failed.
+
+    Raises:
+        SyncTokenExpiredError: If the token is no longer valid.
+    """
+    from googleapiclient.errors import HttpError
+
+    service = get_calendar_service()
+    if not service:
+        return None
+
+    calendar_id = get_calendar_email()
+
+    def _sync_list():
+        items: list[dict] = []
+        page_token = None
+        while True:
+            params = {"calendarId": calendar_id, "showDeleted": True}
+            if sync_token:
+                params["syncToken"] = sync_token
+            if page_token:
+                params["pageToken"] = page_token
+            response = service.events().list(**params).execute()
+            items.extend(response.get("items", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return items, response.get("nextSyncToken")
+
+    try:
+        return await asyncio.to_thread(_sync_list)
+    except HttpError as e:
+        if e.resp.status == 410:
+            raise SyncTokenExpiredError() from e
+        logger.error(f"Failed to list changed calendar events: {e}")
+        sentry_sdk.capture_exception(e)
+        return None
+    except Exception as e:
+        logger.error(f"Failed to list changed calendar events: {e}")
+        sentry_sdk.capture_exception(e)
+        return None
@@ -7,8 +7,8 @@ from dateutil.parser import isoparse
 from sqlalchemy import select, func
 from sqlalchemy.dialects.postgresql import insert
 
-from core.database import get_connection
-from core.tables import meetings, attendances, users
+from core.database import get_connection, get_transaction
+from core.tables import meetings, attendances, users, calendar_sync_state
 from core.enums import RSVPStatus
 from .events import get_event_instances
 
@@ -67,6 +67,25 @@ async def sync_group_rsvps_from_recurring(
             for row in meetings_result.mappings()
         }
 
+        # Resolve every attendee email to a user in one query. Google may
+        # change an address's case; idx_users_email_lower serves lower(email)
+        emails = {
+            attendee.get("email", "").lower()
+            for instance in instances
+            for attendee in instance.get("attendees", [])
+            if attendee.get("email")
+        }
+        user_ids_by_email = {}
+        if emails:
+            users_result = await conn.execute(
+                select(users.c.user_id, users.c.email).where(
+                    func.lower(users.c.email).in_(emails)
+                )
+            )
+            user_ids_by_email = {
+                row["email"].lower(): row["user_id"] for row in users_result.mappings()
+            }
+
         # Process each instance
         for instance in instances:
             # Parse instance start time with error handling
@@ -96,17 +115,13 @@ async def sync_group_rsvps_from_recurring(
                     google_status, RSVPStatus.pending
                 )
 
-                # Find user by email
-                user_result = await conn.execute(
-                    select(users.c.user_id).where(users.c.email == email)
-                )
-                user_row = user_result.first()
+                user_id = user_ids_by_email.get(email)
 
-                if user_row:
+                if user_id:
                     # Upsert attendance record - only update if status changed
                     stmt = insert(attendances).values(
                         meeting_id=meeting_id,
-                        user_id=user_row.user_id,
+                        user_id=user_id,
                         rsvp_status=our_status,
                         rsvp_at=func.now(),
                     )
@@ -129,3 +144,44 @@ async def sync_group_rsvps_from_recurring(
         await conn.commit()
 
     return result
+
+
+async def get_calendar_sync_state(calendar_id: str) -> tuple[str | None, list[int]]:
+    """
+    Get a calendar's incremental sync state.
+
+    Returns:
+        (sync token or None, group IDs whose RSVP sync failed last run)
+    """
+    async with get_connection() as conn:
+        result = await conn.execute(
+            select(
+                calendar_sync_state.c.sync_token,
+                calendar_sync_state.c.failed_group_ids,
+            ).where(calendar_sync_state.c.calendar_id == calendar_id)
+        )
+        row = result.first()
+    if row is None:
+        return None, []
+    return row.sync_token, list(row.failed_group_ids)
+
+
+async def save_calendar_sync_state(
+    calendar_id: str, sync_token: str | None, failed_group_ids: list[int]
+) -> None:
+    """Store a calendar's incremental sync token and the groups to retry."""
+    async with get_transaction() as conn:
+        stmt = insert(calendar_sync_state).values(
+            calendar_id=calendar_id,
+            sync_token=sync_token,
+            failed_group_ids=failed_group_ids,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["calendar_id"],
+            set_={
+                "sync_token": sync_token,
+                "failed_group_ids": failed_group_ids,
+                "updated_at": func.now(),
+            },
+        )
+        await conn.execute(stmt)
@@ -0,0 +1,120 @@
+import pytest
+from unittest.mock import patch, AsyncMock
+
+
+def _state(n, event_prefix="evt"):
+    return {
+        gid: {
+            "event_id": f"{event_prefix}{gid}",
+            "emails": {f"user{gid}@example.com"},
+            "meetings": 4,
+        }
+        for gid in range(1, n + 1)
+    }
+
+
+def _event(gid, emails):
+    return {"id": f"evt{gid}", "attendees": [{"email": e} for e in emails]}
+
+
+class TestSyncGroupsCalendar:
+    @pytest.mark.asyncio
+    async def test_coalesces_fetches_and_patches_only_changed(self):
+        """120 groups need 3 get batches and one patch batch for the changes."""
+        state = _state(120)
+        get_calls = []
+
+        def fake_get(event_ids, rate_limited=None):
+            get_calls.append(list(event_ids))
+            return {
+                eid: _event(
+                    int(eid[3:]),
+                    # Groups 1 and 2 have stale attendee lists
+                    ["stale@example.com"]
+                    if eid in ("evt1", "evt2")
+                    else [f"user{eid[3:]}@example.com"],
+                )
+                for eid in event_ids
+            }
+
+        patch_calls = []
+
+        def fake_patch(updates):
+            patch_calls.append(updates)
+            return {u["event_id"]: {"success": True, "error": None} for u in updates}
+
+        from core.calendar.coordinator import sync_groups_calendar
+
+        with (
+            patch(
+                "core.calendar.coordinator._load_calendar_state",
+                AsyncMock(return_value=state),
+            ),
+            patch("core.calendar.coordinator.batch_get_events", fake_get),
+            patch("core.calendar.coordinator.batch_patch_events", fake_patch),
+        ):
+            results = await sync_groups_calendar(list(state))
+
+        assert [len(c) for c in get_calls] == [50, 50, 20]
+        assert len(patch_calls) == 1
+        patched = {u["event_id"]: u for u in patch_calls[0]}
+        assert set(patched) == {"evt1", "evt2"}
+        assert patched["evt1"]["body"] == {
+            "attendees": [{"email": "user1@example.com"}]
+        }
+        assert patched["evt1"]["send_updates"] == "all"
+        assert results[1]["patched"] == 1
+        assert results[3]["patched"] == 0
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_items(self):
+        """Items that hit a 429 are re-fetched, not treated as deleted."""
+        state = _state(2)
+        attempts = {"n": 0}
+
+        def fake_get(event_ids, rate_limited=None):
+            attempts["n"] += 1
+            if attempts["n"] == 1:
+                rate_limited.add("evt2")
+                return {"evt1": _event(1, ["user1@example.com"])}
+            return {"evt2": _event(2, ["user2@example.com"])}
+
+        fallback = AsyncMock()
+        from core.calendar.coordinator import sync_groups_calendar
+
+        with (
+            patch(
+                "core.calendar.coordinator._load_calendar_state",
+                AsyncMock(return_value=state),
+            ),
+            patch("core.calendar.coordinator.batch_get_events", fake_get),
+            patch("core.calendar.coordinator.RETRY_BASE_DELAY", 0),
+            patch("core.sync.sync_group_calendar", fallback),
+        ):
+            results = await sync_groups_calendar([1, 2])
+
+        assert attempts["n"] == 2
+        fallback.assert_not_called()
+        assert results[2]["failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_missing_events_fall_back_to_per_group_creation(self):
+        """Deleted or missing recurring events go through sync_group_calendar."""
+        state = _state(2)
+        state[2]["event_id"] = None
+
+        fallback = AsyncMock(return_value={"created_recurring": True})
+        from core.calendar.coordinator import sync_groups_calendar
+
+        with (
+            patch(
+                "core.calendar.coordinator._load_calendar_state",
+                AsyncMock(return_value=state),
+            ),
+            patch("core.calendar.coordinator.batch_get_events", return_value={}),
+            patch("core.sync.sync_group_calendar", fallback),
+        ):
+            results = await sync_groups_calendar([1, 2])
+
+        assert sorted(c.args[0] for c in fallback.call_args_list) == [1, 2]
+        assert results[1] == {"created_recurring": True}
@@ -3,10 +3,17 @@
 from .cache import (
     ContentCache,
     CacheNotInitializedError,
+    SnapshotCache,
     get_cache,
     set_cache,
     clear_cache,
 )
+from .content_index import (
+    ContentIndex,
+    ContentRef,
+    build_content_index,
+    get_content_index,
+)
 from .github_fetcher import (
     ContentBranchNotConfiguredError,
     GitHubFetchError,
@@ -27,9 +34,14 @@ from .webhook_handler import (
 __all__ = [
     "ContentCache",
     "CacheNotInitializedError",
+    "SnapshotCache",
     "get_cache",
     "set_cache",
     "clear_cache",
+    "ContentIndex",
+    "ContentRef",
+    "build_content_index",
+    "get_content_index",
     "ContentBranchNotConfiguredError",
     "GitHubFetchError",
     "initialize_cache",
@@ -2,9 +2,18 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from core.modules.flattened_types import FlattenedModule, ParsedCourse
+if TYPE_CHECKING:
+    # Type-only: core.modules imports this package, so a runtime import here
+    # would be circular when core.content is imported first
+    from core.modules.flattened_types import FlattenedModule, ParsedCourse
+
+    from .content_index import ContentIndex
+
+
+K = TypeVar("K")
+V = TypeVar("V")
 
 
 class CacheNotInitializedError(Exception):
@@ -22,8 +31,8 @@ class ContentCache:
     by the TypeScript processor.
     """
 
-    courses: dict[str, ParsedCourse]  # slug -> parsed course
-    flattened_modules: dict[str, FlattenedModule]  # slug -> flattened module
+    courses: dict[str, "ParsedCourse"]  # slug -> parsed course
+    flattened_modules: dict[str, "FlattenedModule"]  # slug -> flattened module
     # Legacy fields - kept for compatibility but always empty (TypeScript handles these)
     parsed_learning_outcomes: dict[str, Any]  # Always {} - TypeScript handles
     parsed_lenses: dict[str, Any]  # Always {} - TypeScript handles
@@ -53,6 +62,8 @@ class ContentCache:
     )
     # Diff from last incremental refresh (from GitHub Compare API)
     last_diff: list[dict] | None = None
+    # Content ID reverse index over flattened_modules (see content_index.py)
+    content_index: "ContentIndex | None" = None
 
 
 # Global cache singleton
@@ -84,6 +95,31 @@ def clear_cache() -> None:
     _cache = None
 
 
+class SnapshotCache(dict[K, V]):
+    """
+    A dict of values derived from content (built prompts, course skeletons),
+    emptied whenever the content cache is replaced or refreshed.
+
+    Call sync() before reading. Incremental refreshes update the cache in
+    place, so the snapshot is the cache object plus its refresh time.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._snapshot: tuple[ContentCache, datetime] | None = None
+
+    def sync(self) -> None:
+        """Drop everything if the content changed since the last sync."""
+        cache = get_cache()
+        if (
+            self._snapshot is None
+            or self._snapshot[0] is not cache
+            or self._snapshot[1] != cache.last_refreshed
+        ):
+            self.clear()
+            self._snapshot = (cache, cache.last_refreshed)
+
+
 def build_category_summary(errors: list[dict]) -> dict[str, dict[str, int]]:
     """Group validation errors by category into {category: {errors: N, warnings: N}}."""
     summary: dict[str, dict[str, int]] = {}
@@ -0,0 +1,127 @@
+"""Reverse index from content IDs to where they appear in the processed modules.
+
+Progress, chat and facilitator views need to turn a content UUID back into
+its module, section and learning outcome, or to list a module's required
+lenses. The index is built once per processed content snapshot (see
+github_fetcher) so those are dict lookups instead of walks over every
+module's sections.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from core.modules.flattened_types import FlattenedModule
+
+from .cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ContentRef:
+    """Where a content ID appears: a module, or one of its sections."""
+
+    module_slug: str
+    module_title: str
+    section_index: int | None = None  # None for the module itself
+    title: str | None = None  # Section title
+    learning_outcome_id: str | None = None
+    optional: bool = False
+
+
+@dataclass
+class ContentIndex:
+    # The flattened_modules dict this index was built from
+    modules: dict[str, FlattenedModule]
+    # content ID -> first place it appears (module IDs and section IDs)
+    refs: dict[UUID, ContentRef] = field(default_factory=dict)
+    # (module slug, content ID) -> section, for lenses shared between modules
+    module_refs: dict[tuple[str, UUID], ContentRef] = field(default_factory=dict)
+    # module slug -> section content IDs, in section order
+    module_lenses: dict[str, tuple[UUID, ...]] = field(default_factory=dict)
+    # module slug -> non-optional section content IDs
+    required_lenses: dict[str, tuple[UUID, ...]] = field(default_factory=dict)
+    # (module slug, learning outcome ID) -> non-optional lens IDs in that LO
+    lo_lenses: dict[tuple[str, str], tuple[UUID, ...]] = field(default_factory=dict)
+
+    def lookup(self, content_id: UUID | str | None) -> ContentRef | None:
+        """Find a module or section by content ID (UUID or string)."""
+        if content_id is None:
+            return None
+        if isinstance(content_id, str):
+            try:
+                content_id = UUID(content_id)
+            except ValueError:
+                return None
+        return self.refs.get(content_id)
+
+
+def _section_title(section: dict) -> str:
+    return section.get("meta", {}).get("title") or section.get("title") or "Untitled"
+
+
+def build_content_index(modules: dict[str, FlattenedModule]) -> ContentIndex:
+    """Index every module and section content ID in the flattened modules."""
+    index = ContentIndex(modules=modules)
+
+    for slug, module in modules.items():
+        if module.content_id:
+            index.refs.setdefault(module.content_id, ContentRef(slug, module.title))
+
+        lenses: list[UUID] = []
+        required: list[UUID] = []
+        lo_lenses: dict[str, list[UUID]] = {}
+        for i, section in enumerate(module.sections):
+            cid = section.get("contentId")
+            if not cid:
+                continue
+            try:
+                content_id = UUID(cid)
+            except ValueError:
+                logger.warning(f"Invalid contentId {cid!r} in module {slug}")
+                continue
+
+            optional = section.get("optional", False)
+            lo_id = section.get("learningOutcomeId")
+            ref = ContentRef(
+                module_slug=slug,
+                module_title=module.title,
+                section_index=i,
+                title=_section_title(section),
+                learning_outcome_id=lo_id,
+                optional=optional,
+            )
+            index.refs.setdefault(content_id, ref)
+            index.module_refs.setdefault((slug, content_id), ref)
+
+            lenses.append(content_id)
+            if not optional:
+                required.append(content_id)
+                if lo_id:
+                    lo_lenses.setdefault(lo_id, []).append(content_id)
+
+        index.module_lenses[slug] = tuple(lenses)
+        index.required_lenses[slug] = tuple(required)
+        for lo_id, ids in lo_lenses.items():
+            index.lo_lenses[(slug, lo_id)] = tuple(ids)
+
+    return index
+
+
+def get_content_index() -> ContentIndex:
+    """
+    Get the index for the current content cache.
+
+    Built by the fetcher when content is processed; rebuilt here if the
+    cache's modules were replaced without it (e.g. caches set up in tests).
+
+    Raises:
+        CacheNotInitializedError: If cache has not been initialized.
+    """
+    cache = get_cache()
+    index = cache.content_index
+    if index is None or index.modules is not cache.flattened_modules:
+        index = build_content_index(cache.flattened_modules)
+        cache.content_index = index
+    return index
@@ -23,6 +23,7 @@ from core.content.typescript_processor import (
     TypeScriptProcessorError,
 )
 from .cache import ContentCache, set_cache, get_cache
+from .content_index import build_content_index
 
 
 def _convert_ts_course_to_parsed_course(ts_course: dict) -> ParsedCourse:
@@ -457,6 +458,7 @@ async def fetch_all_content() -> ContentCache:
             processed_sha_timestamp=now,
             raw_files=all_files,  # Store for incremental updates
             validation_errors=validation_errors,
+            content_index=build_content_index(flattened_modules),
         )
         set_cache(cache)
         return cache
@@ -884,6 +886,7 @@ async def incremental_refresh(new_commit_sha: str) -> list[dict]:
         # Update cache in place
         cache.courses = courses
         cache.flattened_modules = flattened_modules
+        cache.content_index = build_content_index(flattened_modules)
         cache.articles = articles
         cache.video_transcripts = video_transcripts
         cache.video_timestamps = video_timestamps
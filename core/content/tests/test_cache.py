@@ -10,6 +10,7 @@ from core.content.cache import (
     set_cache,
     clear_cache,
     CacheNotInitializedError,
+    SnapshotCache,
 )
 from core.modules.flattened_types import FlattenedModule
 
@@ -169,3 +170,55 @@ class TestContentCache:
 
     # NOTE: Tests for parsed_learning_outcomes and parsed_lenses were removed
     # because the TypeScript processor now handles these - they're always empty dicts.
+
+
+class TestSnapshotCache:
+    """Derived values are dropped when the content changes."""
+
+    def setup_method(self):
+        clear_cache()
+
+    def _content(self, refreshed: datetime) -> ContentCache:
+        return ContentCache(
+            courses={},
+            flattened_modules={},
+            articles={},
+            video_transcripts={},
+            parsed_learning_outcomes={},
+            parsed_lenses={},
+            last_refreshed=refreshed,
+        )
+
+    def test_keeps_entries_while_content_unchanged(self):
+        set_cache(self._content(datetime(2026, 1, 1)))
+        snapshots = SnapshotCache()
+        snapshots.sync()
+        snapshots["key"] = "value"
+
+        snapshots.sync()
+
+        assert snapshots == {"key": "value"}
+
+    def test_clears_on_incremental_refresh(self):
+        cache = self._content(datetime(2026, 1, 1))
+        set_cache(cache)
+        snapshots = SnapshotCache()
+        snapshots.sync()
+        snapshots["key"] = "value"
+
+        cache.last_refreshed = datetime(2026, 1, 2)
+        snapshots.sync()
+
+        assert snapshots == {}
+
+    def test_clears_when_cache_replaced(self):
+        refreshed = datetime(2026, 1, 1)
+        set_cache(self._content(refreshed))
+        snapshots = SnapshotCache()
+        snapshots.sync()
+        snapshots["key"] = "value"
+
+        set_cache(self._content(refreshed))
+        snapshots.sync()
+
+        assert snapshots == {}
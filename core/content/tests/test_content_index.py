@@ -0,0 +1,111 @@
+"""Tests for the content ID reverse index."""
+
+from datetime import datetime
+from uuid import UUID
+
+from core.content.cache import ContentCache, clear_cache, set_cache
+from core.content.content_index import build_content_index, get_content_index
+from core.modules.flattened_types import FlattenedModule
+
+MODULE_ID = UUID("00000000-0000-0000-0000-000000000001")
+LENS_1 = UUID("00000000-0000-0000-0000-000000000011")
+LENS_2 = UUID("00000000-0000-0000-0000-000000000012")
+LENS_3 = UUID("00000000-0000-0000-0000-000000000013")
+LO_ID = "00000000-0000-0000-0000-0000000000a0"
+
+
+def _modules():
+    return {
+        "intro": FlattenedModule(
+            slug="intro",
+            title="Introduction",
+            content_id=MODULE_ID,
+            sections=[
+                {
+                    "type": "lens-video",
+                    "contentId": str(LENS_1),
+                    "learningOutcomeId": LO_ID,
+                    "meta": {"title": "Video"},
+                },
+                {
+                    "type": "lens-article",
+                    "contentId": str(LENS_2),
+                    "learningOutcomeId": LO_ID,
+                    "optional": True,
+                },
+                {"type": "page", "contentId": "not-a-uuid"},
+                {"type": "page"},
+            ],
+        ),
+        "next": FlattenedModule(
+            slug="next",
+            title="Next",
+            content_id=None,
+            sections=[
+                {"type": "page", "contentId": str(LENS_3), "title": "Page"},
+                {"type": "lens-video", "contentId": str(LENS_1)},
+            ],
+        ),
+    }
+
+
+class TestBuildContentIndex:
+    def test_maps_modules_and_sections(self):
+        index = build_content_index(_modules())
+
+        module = index.lookup(MODULE_ID)
+        assert module.module_slug == "intro"
+        assert module.section_index is None
+
+        lens = index.lookup(str(LENS_1))
+        assert lens.module_slug == "intro"
+        assert lens.module_title == "Introduction"
+        assert lens.section_index == 0
+        assert lens.title == "Video"
+        assert lens.learning_outcome_id == LO_ID
+
+        assert index.lookup(LENS_2).title == "Untitled"
+        assert index.lookup("not-a-uuid") is None
+        assert index.lookup(None) is None
+
+    def test_lenses_shared_between_modules(self):
+        index = build_content_index(_modules())
+
+        assert index.lookup(LENS_1).module_slug == "intro"
+        assert index.module_refs[("next", LENS_1)].section_index == 1
+
+    def test_module_and_lo_lens_lists(self):
+        index = build_content_index(_modules())
+
+        assert index.module_lenses["intro"] == (LENS_1, LENS_2)
+        assert index.required_lenses["intro"] == (LENS_1,)
+        assert index.lo_lenses[("intro", LO_ID)] == (LENS_1,)
+        assert index.required_lenses["next"] == (LENS_3, LENS_1)
+
+
+class TestGetContentIndex:
+    def setup_method(self):
+        clear_cache()
+
+    def teardown_method(self):
+        clear_cache()
+
+    def test_rebuilds_when_modules_replaced(self):
+        cache = ContentCache(
+            courses={},
+            flattened_modules=_modules(),
+            parsed_learning_outcomes={},
+            parsed_lenses={},
+            articles={},
+            video_transcripts={},
+            last_refreshed=datetime.now(),
+        )
+        set_cache(cache)
+
+        index = get_content_index()
+        assert get_content_index() is index
+
+        cache.flattened_modules = {}
+
+        assert get_content_index() is not index
+        assert get_content_index().lookup(LENS_1) is None
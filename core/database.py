@@ -2,21 +2,92 @@
 SQLAlchemy async database client for the AI Safety Course Platform.
 
 Provides async connection management using SQLAlchemy Core with asyncpg.
+
+Connections come from one of three pools, so one workload can't exhaust
+another's connections:
+
+- interactive: HTTP requests and bot commands (the default)
+- background: scheduler jobs, group syncs and scoring workers, selected
+  with use_pool(BACKGROUND_POOL) or @in_background_pool
+- replica: get_read_connection(), when DATABASE_READ_URL points at a read
+  replica (otherwise those reads use the interactive pool)
+
+Each pool is sized from DB_<POOL>_POOL_SIZE, DB_<POOL>_MAX_OVERFLOW and
+DB_<POOL>_POOL_TIMEOUT; get_pool_stats() reports saturation and wait times.
 """
 
+import asyncio
+import functools
 import os
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Awaitable, Callable, Iterator, TypeVar
 
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
+from .query_stats import instrument_engine
 from .tables import metadata  # noqa: F401 - exported for Alembic
 
-# Module-level engine (created on first use)
-_engine: AsyncEngine | None = None
+INTERACTIVE_POOL = "interactive"
+BACKGROUND_POOL = "background"
+REPLICA_POOL = "replica"
+
+# Default (pool_size, max_overflow, pool_timeout) per pool
+_POOL_DEFAULTS = {
+    INTERACTIVE_POOL: (5, 10, 30),
+    BACKGROUND_POOL: (2, 3, 60),
+    REPLICA_POOL: (5, 10, 30),
+}
+
+# Engines per pool (created on first use)
+_engines: dict[str, AsyncEngine] = {}
+
+# Pool used by get_connection()/get_transaction() in the current context
+_current_pool: ContextVar[str] = ContextVar("db_pool", default=INTERACTIVE_POOL)
+
+# pool -> checkout counters for get_pool_stats()
+_pool_waits: dict[str, dict[str, Any]] = {}
+
+T = TypeVar("T")
+
+
+class _RequestScope:
+    """One lazily checked-out connection shared by a request's DB calls."""
+
+    def __init__(self) -> None:
+        self.task = asyncio.current_task()
+        self.conn: AsyncConnection | None = None
+        self.closed = False
+        # Nesting of get_connection/get_transaction blocks using the connection
+        self.depth = 0
+        self.transaction_depth = 0
+
+    def usable(self) -> bool:
+        # Only the task that opened the scope may share its connection: work
+        # it spawns (gather, create_task, streamed bodies) may run concurrently
+        # or outlive the scope, so that checks out connections as usual
+        return not self.closed and asyncio.current_task() is self.task
+
+    async def acquire(self) -> AsyncConnection:
+        if self.conn is None:
+            self.conn = await _connect(INTERACTIVE_POOL)
+        return self.conn
+
+    async def release(self) -> None:
+        self.closed = True
+        if self.conn is not None:
+            conn, self.conn = self.conn, None
+            await conn.close()  # Rolls back anything uncommitted
 
 
-def _get_database_url() -> str:
+_request_scope: ContextVar[_RequestScope | None] = ContextVar(
+    "request_scope", default=None
+)
+
+
+def _get_database_url(env_var: str = "DATABASE_URL") -> str:
     """
     Construct async database URL from environment variables.
 
@@ -26,10 +97,10 @@ def _get_database_url() -> str:
     For asyncpg, we need:
         postgresql+asyncpg://...
     """
-    database_url = os.environ.get("DATABASE_URL")
+    database_url = os.environ.get(env_var)
     if not database_url:
         raise ValueError(
-            "DATABASE_URL environment variable must be set. "
+            f"{env_var} environment variable must be set. "
             "Get your connection string from Supabase Dashboard > Settings > Database > Connection string"
         )
 
@@ -40,25 +111,98 @@ def _get_database_url() -> str:
     return database_url
 
 
-def get_engine() -> AsyncEngine:
-    """Get or create the async SQLAlchemy engine singleton."""
-    global _engine
-    if _engine is None:
-        database_url = _get_database_url()
-        _engine = create_async_engine(
+def _pool_setting(pool: str, setting: str, default: int) -> int:
+    return int(os.environ.get(f"DB_{pool.upper()}_{setting}", default))
+
+
+def has_read_replica() -> bool:
+    """Whether reads via get_read_connection() go to a separate replica."""
+    return bool(os.environ.get("DATABASE_READ_URL"))
+
+
+def get_engine(pool: str = INTERACTIVE_POOL) -> AsyncEngine:
+    """Get or create the async SQLAlchemy engine for a pool."""
+    engine = _engines.get(pool)
+    if engine is None:
+        if pool == REPLICA_POOL:
+            database_url = _get_database_url("DATABASE_READ_URL")
+        else:
+            database_url = _get_database_url()
+        pool_size, max_overflow, pool_timeout = _POOL_DEFAULTS[pool]
+        engine = create_async_engine(
             database_url,
+            # Full statement logging; per-route counts are in core.query_stats
             echo=os.environ.get("SQL_ECHO", "").lower() == "true",
             # Connection pool settings
-            pool_size=5,
-            max_overflow=10,
-            pool_timeout=30,
+            pool_size=_pool_setting(pool, "POOL_SIZE", pool_size),
+            max_overflow=_pool_setting(pool, "MAX_OVERFLOW", max_overflow),
+            pool_timeout=_pool_setting(pool, "POOL_TIMEOUT", pool_timeout),
             pool_recycle=1800,  # Recycle connections every 30 minutes
             pool_pre_ping=True,  # Test connections before use
             # Disable prepared statement cache for Supabase pooler compatibility
             # (pgbouncer in transaction mode doesn't support prepared statements)
             connect_args={"statement_cache_size": 0},
         )
-    return _engine
+        instrument_engine(engine)
+        _engines[pool] = engine
+    return engine
+
+
+async def _connect(pool: str) -> AsyncConnection:
+    """Check out a connection from a pool, recording how long it took."""
+    waits = _pool_waits.setdefault(
+        pool, {"checkouts": 0, "wait_total": 0.0, "wait_max": 0.0, "timeouts": 0}
+    )
+    engine = get_engine(pool)
+    start = time.perf_counter()
+    try:
+        conn = await engine.connect()
+    except PoolTimeoutError:
+        waits["timeouts"] += 1
+        raise
+    wait = time.perf_counter() - start
+    waits["checkouts"] += 1
+    waits["wait_total"] += wait
+    waits["wait_max"] = max(waits["wait_max"], wait)
+    return conn
+
+
+@contextmanager
+def use_pool(pool: str) -> Iterator[None]:
+    """
+    Take connections for this block from another pool.
+
+    Outside the interactive pool, calls don't share a request's connection
+    (see request_scope()), so a long sync run from an admin request holds a
+    background connection rather than an interactive one.
+    """
+    token = _current_pool.set(pool)
+    try:
+        yield
+    finally:
+        _current_pool.reset(token)
+
+
+def in_background_pool(
+    func: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """Decorator running an async function inside use_pool(BACKGROUND_POOL)."""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs) -> T:
+        with use_pool(BACKGROUND_POOL):
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def _shared_scope() -> "_RequestScope | None":
+    scope = _request_scope.get()
+    if scope is None or not scope.usable():
+        return None
+    if _current_pool.get() != INTERACTIVE_POOL:
+        return None
+    return scope
 
 
 @asynccontextmanager
@@ -71,9 +215,27 @@ async def get_connection() -> AsyncGenerator[AsyncConnection, None]:
             result = await conn.execute(select(users))
             row = result.mappings().first()
     """
-    engine = get_engine()
-    async with engine.connect() as conn:
+    scope = _shared_scope()
+    if scope is None:
+        conn = await _connect(_current_pool.get())
+        try:
+            yield conn
+        finally:
+            await conn.close()
+        return
+
+    conn = await scope.acquire()
+    scope.depth += 1
+    try:
         yield conn
+    except BaseException:
+        # Leave the shared connection usable for the rest of the request, as
+        # closing a private one would have
+        if scope.depth == 1 and scope.transaction_depth == 0:
+            await conn.rollback()
+        raise
+    finally:
+        scope.depth -= 1
 
 
 @asynccontextmanager
@@ -87,34 +249,140 @@ async def get_transaction() -> AsyncGenerator[AsyncConnection, None]:
             await conn.execute(insert(users).values(...))
             # Auto-commits if no exception
     """
-    engine = get_engine()
-    async with engine.begin() as conn:
+    scope = _shared_scope()
+    if scope is None:
+        conn = await _connect(_current_pool.get())
+        try:
+            async with conn.begin():
+                yield conn
+        finally:
+            await conn.close()
+        return
+
+    conn = await scope.acquire()
+    if scope.transaction_depth == 0:
+        # Reads so far ran in an implicit transaction; start the write
+        # transaction fresh, as a separate connection would have
+        if conn.in_transaction():
+            await conn.rollback()
+        transaction = conn.begin()
+    else:
+        # Nested blocks commit with the outermost one
+        transaction = conn.begin_nested()
+
+    scope.depth += 1
+    scope.transaction_depth += 1
+    try:
+        async with transaction:
+            yield conn
+    finally:
+        scope.transaction_depth -= 1
+        scope.depth -= 1
+
+
+@asynccontextmanager
+async def get_read_connection() -> AsyncGenerator[AsyncConnection, None]:
+    """
+    Get a connection for read-only queries, from the read replica if one is
+    configured.
+
+    A replica can lag the primary, so don't use this to read back data the
+    same request (or user) has just written. Without DATABASE_READ_URL, or
+    in the background pool, this is get_connection().
+    """
+    if not has_read_replica() or _current_pool.get() != INTERACTIVE_POOL:
+        async with get_connection() as conn:
+            yield conn
+        return
+
+    conn = await _connect(REPLICA_POOL)
+    try:
         yield conn
+    finally:
+        await conn.close()
+
+
+def get_pool_stats() -> dict[str, dict[str, Any]]:
+    """Size, saturation and checkout wait times for each pool in use."""
+    stats = {}
+    for pool, engine in _engines.items():
+        queue_pool = engine.pool
+        capacity = queue_pool.size() + _pool_setting(
+            pool, "MAX_OVERFLOW", _POOL_DEFAULTS[pool][1]
+        )
+        checked_out = queue_pool.checkedout()
+        waits = _pool_waits.get(pool, {})
+        checkouts = waits.get("checkouts", 0)
+        stats[pool] = {
+            "size": queue_pool.size(),
+            "capacity": capacity,
+            "checked_out": checked_out,
+            "saturation": round(checked_out / capacity, 2) if capacity else None,
+            "checkouts": checkouts,
+            "wait_avg_ms": (
+                round(waits["wait_total"] / checkouts * 1000, 1) if checkouts else None
+            ),
+            "wait_max_ms": round(waits.get("wait_max", 0.0) * 1000, 1),
+            "timeouts": waits.get("timeouts", 0),
+        }
+    return stats
+
+
+@asynccontextmanager
+async def request_scope() -> AsyncGenerator[None, None]:
+    """
+    Share one pooled connection between the DB calls made while handling a
+    request.
+
+    Inside the scope, get_connection() and get_transaction() hand out the
+    same connection, checked out on first use and returned when the scope
+    exits. Reads run in an implicit transaction; get_transaction() blocks
+    still commit when they exit (nested blocks use savepoints). Calls from
+    other tasks, or after the scope has exited, check out their own
+    connection as usual.
+    """
+    scope = _RequestScope()
+    token = _request_scope.set(scope)
+    try:
+        yield
+    finally:
+        _request_scope.reset(token)
+        await scope.release()
+
+
+async def request_connection_scope() -> AsyncGenerator[None, None]:
+    """
+    FastAPI dependency wrapping each request in request_scope().
+
+    Declare with scope="function" so the connection is released when the
+    path operation returns, not after a streamed response finishes.
+    """
+    async with request_scope():
+        yield
 
 
 async def close_engine() -> None:
-    """Close the engine and all connections. Call on shutdown."""
-    global _engine
-    if _engine is not None:
-        await _engine.dispose()
-        _engine = None
+    """Close the engines and all connections. Call on shutdown."""
+    engines = {id(engine): engine for engine in _engines.values()}
+    _engines.clear()
+    for engine in engines.values():
+        await engine.dispose()
 
 
 def reset_engine() -> None:
     """
-    Reset the engine singleton without closing connections.
+    Reset the engines without closing connections.
 
-    Use this when you need to discard an engine created in a different event loop
+    Use this when you need to discard engines created in a different event loop
     (e.g., after asyncio.run() in startup checks). The old connections will be
     garbage collected.
     """
-    global _engine
-    _engine = None
+    _engines.clear()
 
 
 def set_engine(engine: AsyncEngine | None) -> None:
     """
-    Set the engine singleton directly.
+    Set the engine used by every pool directly.
 
     Use this in tests to inject a test-specific engine created in the test's
     event loop, avoiding "Future attached to a different loop" errors.
@@ -122,8 +390,10 @@ def set_engine(engine: AsyncEngine | None) -> None:
     Args:
         engine: The engine to use, or None to clear.
     """
-    global _engine
-    _engine = engine
+    _engines.clear()
+    if engine is not None:
+        for pool in _POOL_DEFAULTS:
+            _engines[pool] = engine
 
 
 def is_configured() -> bool:
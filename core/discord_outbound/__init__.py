@@ -1,7 +1,13 @@
 # core/discord_outbound/__init__.py
 """Discord outbound operations - all Discord API calls go through here."""
 
-from .bot import get_bot, get_dm_semaphore, get_or_fetch_member, set_bot
+from .bot import (
+    get_bot,
+    get_dm_semaphore,
+    get_mutation_semaphore,
+    get_or_fetch_member,
+    set_bot,
+)
 from .channels import (
     create_category,
     create_text_channel,
@@ -9,6 +15,7 @@ from .channels import (
     get_or_fetch_channel,
 )
 from .events import create_scheduled_event
+from .members import get_member_resolver_stats, resolve_members
 from .messages import send_channel_message, send_dm
 from .permissions import (
     get_members_with_access,
@@ -27,7 +34,10 @@ __all__ = [
     "set_bot",
     "get_bot",
     "get_dm_semaphore",
+    "get_mutation_semaphore",
     "get_or_fetch_member",
+    "resolve_members",
+    "get_member_resolver_stats",
     "send_dm",
     "send_channel_message",
     "create_category",
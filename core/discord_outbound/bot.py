@@ -6,6 +6,11 @@ from discord import Client, Guild, Member
 
 _bot: Client | None = None
 _dm_semaphore: asyncio.Semaphore | None = None
+_mutation_semaphore: asyncio.Semaphore | None = None
+
+# Max in-flight role/permission edits. discord.py reads the X-RateLimit-*
+# headers and parks requests per route bucket, so this only caps concurrency.
+MUTATION_CONCURRENCY = 5
 
 
 def set_bot(bot: Client) -> None:
@@ -25,6 +30,14 @@ def get_dm_semaphore() -> asyncio.Semaphore | None:
     return _dm_semaphore
 
 
+def get_mutation_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent member/permission mutations."""
+    global _mutation_semaphore
+    if _mutation_semaphore is None:
+        _mutation_semaphore = asyncio.Semaphore(MUTATION_CONCURRENCY)
+    return _mutation_semaphore
+
+
 async def get_or_fetch_member(guild: Guild, discord_id: int) -> Member | None:
     """Get member from cache, falling back to API fetch."""
     member = guild.get_member(discord_id)
@@ -0,0 +1,117 @@
+# core/discord_outbound/members.py
+"""
+Bulk guild member resolution.
+
+get_or_fetch_member() costs one REST call per cache miss. Permission syncs
+resolve whole groups at once, so this module resolves a set of IDs with:
+
+1. The guild member cache (complete when the guild is chunked)
+2. Gateway member chunking (query_members with user_ids, 100 per request)
+3. A short-lived memo of IDs known not to be in the guild
+"""
+
+import logging
+import time
+from collections.abc import Iterable
+
+import discord
+from discord import Guild, Member
+
+logger = logging.getLogger(__name__)
+
+# Discord accepts at most 100 user_ids per member chunk request
+QUERY_MEMBERS_LIMIT = 100
+
+# Seconds to remember that an ID is not in the guild
+MISS_TTL = 300.0
+
+# (guild_id, discord_id) -> monotonic expiry time
+_misses: dict[tuple[int, int], float] = {}
+
+_stats = {"hits": 0, "misses": 0, "memo_hits": 0, "queried": 0, "queries": 0}
+
+
+def get_member_resolver_stats() -> dict[str, int]:
+    """Counters for cache hits, misses and gateway queries since startup."""
+    return dict(_stats)
+
+
+def reset_member_resolver() -> None:
+    """Clear the miss memo and counters."""
+    _misses.clear()
+    for key in _stats:
+        _stats[key] = 0
+
+
+def _is_memoized_miss(guild_id: int, discord_id: int, now: float) -> bool:
+    expiry = _misses.get((guild_id, discord_id))
+    if expiry is None:
+        return False
+    if expiry <= now:
+        del _misses[(guild_id, discord_id)]
+        return False
+    return True
+
+
+async def _query_members(guild: Guild, discord_ids: list[int]) -> list[Member]:
+    """Fetch members over the gateway, falling back to REST per member."""
+    try:
+        return await guild.query_members(user_ids=discord_ids, cache=True)
+    except (discord.ClientException, TimeoutError) as e:
+        # Members intent disabled or gateway not ready
+        logger.warning(f"Member chunk request failed, fetching individually: {e}")
+
+    members = []
+    for discord_id in discord_ids:
+        try:
+            members.append(await guild.fetch_member(discord_id))
+        except discord.NotFound:
+            pass
+    return members
+
+
+async def resolve_members(
+    guild: Guild, discord_ids: Iterable[int]
+) -> dict[int, Member]:
+    """
+    Resolve many guild members with as few API calls as possible.
+
+    Args:
+        guild: Guild to resolve members in
+        discord_ids: Discord user IDs
+
+    Returns:
+        Dict mapping discord_id -> Member for IDs that are in the guild.
+        IDs not in the guild are omitted.
+    """
+    now = time.monotonic()
+    resolved: dict[int, Member] = {}
+    pending: list[int] = []
+
+    for discord_id in set(discord_ids):
+        member = guild.get_member(discord_id)
+        if member:
+            _stats["hits"] += 1
+            resolved[discord_id] = member
+        elif _is_memoized_miss(guild.id, discord_id, now):
+            _stats["memo_hits"] += 1
+        else:
+            _stats["misses"] += 1
+            pending.append(discord_id)
+
+    # A chunked guild's cache holds every member, so a cache miss means the
+    # user isn't in the guild
+    if pending and not guild.chunked:
+        for i in range(0, len(pending), QUERY_MEMBERS_LIMIT):
+            batch = pending[i : i + QUERY_MEMBERS_LIMIT]
+            _stats["queries"] += 1
+            _stats["queried"] += len(batch)
+            for member in await _query_members(guild, batch):
+                resolved[member.id] = member
+
+    expiry = now + MISS_TTL
+    for discord_id in pending:
+        if discord_id not in resolved:
+            _misses[(guild.id, discord_id)] = expiry
+
+    return resolved
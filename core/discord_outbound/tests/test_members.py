@@ -0,0 +1,107 @@
+# core/discord_outbound/tests/test_members.py
+"""Tests for bulk member resolution."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+
+def _member(discord_id):
+    member = MagicMock(spec=discord.Member)
+    member.id = discord_id
+    return member
+
+
+def _guild(cached=(), queried=(), chunked=False):
+    cache = {i: _member(i) for i in cached}
+    guild = MagicMock(spec=discord.Guild)
+    guild.id = 1
+    guild.chunked = chunked
+    guild.get_member.side_effect = cache.get
+    guild.query_members = AsyncMock(return_value=[_member(i) for i in queried])
+    guild.fetch_member = AsyncMock()
+    return guild
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    from core.discord_outbound.members import reset_member_resolver
+
+    reset_member_resolver()
+    yield
+    reset_member_resolver()
+
+
+class TestResolveMembers:
+    @pytest.mark.asyncio
+    async def test_resolves_cache_misses_in_one_gateway_query(self):
+        from core.discord_outbound.members import (
+            get_member_resolver_stats,
+            resolve_members,
+        )
+
+        guild = _guild(cached=[1], queried=[2, 3])
+
+        result = await resolve_members(guild, [1, 2, 3, 4])
+
+        assert set(result) == {1, 2, 3}
+        guild.query_members.assert_called_once()
+        assert sorted(guild.query_members.call_args.kwargs["user_ids"]) == [2, 3, 4]
+        guild.fetch_member.assert_not_called()
+        stats = get_member_resolver_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 3
+        assert stats["queries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_memoizes_misses(self):
+        from core.discord_outbound.members import (
+            get_member_resolver_stats,
+            resolve_members,
+        )
+
+        guild = _guild()
+
+        await resolve_members(guild, [4])
+        await resolve_members(guild, [4])
+
+        guild.query_members.assert_called_once()
+        assert get_member_resolver_stats()["memo_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_chunked_guild_skips_queries(self):
+        from core.discord_outbound.members import resolve_members
+
+        guild = _guild(cached=[1], chunked=True)
+
+        result = await resolve_members(guild, [1, 2])
+
+        assert set(result) == {1}
+        guild.query_members.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_splits_large_requests(self):
+        from core.discord_outbound.members import resolve_members
+
+        guild = _guild()
+
+        await resolve_members(guild, range(250))
+
+        assert guild.query_members.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_rest_without_members_intent(self):
+        from core.discord_outbound.members import resolve_members
+
+        guild = _guild()
+        guild.query_members.side_effect = discord.ClientException("intent")
+        guild.fetch_member.side_effect = [
+            _member(2),
+            discord.NotFound(MagicMock(status=404), "unknown member"),
+        ]
+
+        result = await resolve_members(guild, [2, 3])
+
+        assert set(result) == {2}
+        assert guild.fetch_member.call_count == 2
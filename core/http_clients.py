@@ -0,0 +1,116 @@
+"""
+Shared outbound HTTP clients for external services.
+
+Creating an httpx.AsyncClient per call means a new TCP and TLS handshake
+for every Stampy question and every transcription. Instead, each service
+gets one long-lived client with keep-alive connections, HTTP/2 where the
+service supports it, and its own timeouts.
+
+Clients are created on first use and closed by close_http_clients() at
+shutdown (see main.py lifespan).
+"""
+
+import time
+from dataclasses import dataclass
+
+import httpx
+
+
+@dataclass(frozen=True)
+class ServiceConfig:
+    timeout: httpx.Timeout
+    http2: bool = True  # Negotiated via ALPN; falls back to HTTP/1.1
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+
+
+SERVICES: dict[str, ServiceConfig] = {
+    # Answers stream for up to a minute
+    "stampy": ServiceConfig(timeout=httpx.Timeout(60.0, connect=10.0)),
+    # Whisper transcriptions
+    "openai": ServiceConfig(timeout=httpx.Timeout(30.0, connect=10.0)),
+}
+
+_clients: dict[str, httpx.AsyncClient] = {}
+
+# service -> {"requests": int, "errors": int, "total_seconds": float}
+_stats: dict[str, dict] = {}
+
+
+def _event_hooks(service: str) -> dict:
+    stats = _stats.setdefault(
+        service, {"requests": 0, "errors": 0, "total_seconds": 0.0}
+    )
+
+    async def on_request(request: httpx.Request) -> None:
+        stats["requests"] += 1
+        request.extensions["started_at"] = time.monotonic()
+
+    async def on_response(response: httpx.Response) -> None:
+        started_at = response.request.extensions.get("started_at")
+        if started_at is not None:
+            # Time to response headers (streamed bodies are read later)
+            stats["total_seconds"] += time.monotonic() - started_at
+        if response.is_error:
+            stats["errors"] += 1
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+def get_http_client(service: str) -> httpx.AsyncClient:
+    """
+    Get the shared client for an external service.
+
+    Args:
+        service: Key in SERVICES, e.g. "stampy" or "openai"
+
+    Raises:
+        KeyError: If the service is not configured
+    """
+    client = _clients.get(service)
+    if client is None or client.is_closed:
+        config = SERVICES[service]
+        client = httpx.AsyncClient(
+            timeout=config.timeout,
+            http2=config.http2,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            event_hooks=_event_hooks(service),
+        )
+        _clients[service] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close all shared clients and their connections."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+def _pool_connections(client: httpx.AsyncClient) -> list:
+    # httpx doesn't expose pool state publicly; read it best-effort
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    return list(getattr(pool, "connections", []))
+
+
+def get_http_client_stats() -> dict[str, dict]:
+    """Request counts, mean time to headers and pool state per service."""
+    result = {}
+    for service, stats in _stats.items():
+        client = _clients.get(service)
+        connections = _pool_connections(client) if client else []
+        requests = stats["requests"]
+        result[service] = {
+            "requests": requests,
+            "errors": stats["errors"],
+            "mean_seconds": stats["total_seconds"] / requests if requests else 0.0,
+            "connections": len(connections),
+            "idle_connections": sum(1 for c in connections if c.is_idle()),
+        }
+    return result
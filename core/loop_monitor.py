@@ -0,0 +1,63 @@
+"""
+Event loop lag monitoring.
+
+A background task sleeps for a fixed interval and records how late it
+wakes up. Lag means something blocked the loop (CPU-bound work, sync I/O)
+and every open request and stream stalled for that long. Reported by
+/health; scripts/load_test_chat.py reads it to see how the server copes
+under load.
+"""
+
+import asyncio
+import statistics
+from collections import deque
+
+# Seconds between samples
+SAMPLE_INTERVAL = 0.1
+
+# Samples kept (60 seconds' worth)
+WINDOW = 600
+
+_samples: deque[float] = deque(maxlen=WINDOW)
+_task: asyncio.Task | None = None
+
+
+async def _sample() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(SAMPLE_INTERVAL)
+        _samples.append(max(0.0, loop.time() - start - SAMPLE_INTERVAL))
+
+
+def start_loop_monitor() -> None:
+    """Start sampling lag on the running loop (idempotent)."""
+    global _task
+    if _task is None or _task.done():
+        _task = asyncio.create_task(_sample())
+
+
+async def stop_loop_monitor() -> None:
+    global _task
+    if _task is None:
+        return
+    _task.cancel()
+    try:
+        await _task
+    except asyncio.CancelledError:
+        pass
+    _task = None
+
+
+def get_loop_lag_stats() -> dict[str, float | int]:
+    """p50/p99/max lag in milliseconds over the last minute."""
+    if not _samples:
+        return {"samples": 0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(_samples)
+    p99_index = min(len(ordered) - 1, int(len(ordered) * 0.99))
+    return {
+        "samples": len(ordered),
+        "p50_ms": round(statistics.median(ordered) * 1000, 1),
+        "p99_ms": round(ordered[p99_index] * 1000, 1),
+        "max_ms": round(ordered[-1] * 1000, 1),
+    }
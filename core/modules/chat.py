@@ -151,6 +151,8 @@ async def send_module_message(
     current_content: str | None = None,
     previous_content: str | None = None,
     provider: str | None = None,
+    client_key: str | None = None,
+    system: str | None = None,
 ) -> AsyncIterator[dict]:
     """
     Send messages to an LLM and stream the response.
@@ -162,6 +164,9 @@ async def send_module_message(
         previous_content: Content from previous stage (for chat stages)
         provider: LLM provider string (e.g., "anthropic/claude-sonnet-4-20250514")
                   If None, uses DEFAULT_PROVIDER from environment.
+        client_key: Identifies the user for fair LLM queuing (see governor.py)
+        system: Prebuilt system prompt (e.g. from chat_context.get_chat_context);
+                if None, it is built from the stage and content arguments.
 
     Yields:
         Dicts with either:
@@ -169,7 +174,8 @@ async def send_module_message(
         - {"type": "tool_use", "name": str} for tool calls
         - {"type": "done"} when complete
     """
-    system = _build_system_prompt(current_stage, current_content, previous_content)
+    if system is None:
+        system = _build_system_prompt(current_stage, current_content, previous_content)
 
     # Debug mode: show system prompt in chat
     if os.environ.get("DEBUG") == "1":
@@ -187,5 +193,6 @@ async def send_module_message(
         system=system,
         tools=tools,
         provider=provider,
+        client_key=client_key,
     ):
         yield event
@@ -0,0 +1,149 @@
+# core/modules/chat_context.py
+"""
+Memoized system prompts for module chat.
+
+A chat segment's system prompt depends only on the processed content:
+the segment's instructions (or, for question and test sections, the
+question/rubric feedback prompt) plus the text of the segments before it.
+Rebuilding it on every turn rejoins whole articles and transcripts, so
+prompts are cached per (module, section, segment) for the current content
+snapshot and dropped whenever the content cache is replaced or reprocessed.
+
+Identical prompts across turns and users also keep provider prompt caching
+effective (see llm.py).
+"""
+
+from dataclasses import dataclass
+
+from core.content.cache import SnapshotCache
+
+from .chat import _build_system_prompt
+from .context import gather_section_context
+from .flattened_types import FlattenedModule
+from .types import ChatStage
+
+TEST_FEEDBACK_INSTRUCTIONS = (
+    "You are a supportive tutor providing feedback on a student's test responses. "
+    "Evaluate the answers holistically — note patterns, connections between answers, "
+    "and overall understanding. Point out strengths, gently identify gaps, and "
+    "ask Socratic questions to deepen understanding. Be encouraging and constructive."
+)
+
+QUESTION_FEEDBACK_INSTRUCTIONS = (
+    "You are a supportive tutor providing feedback on a student's response. "
+    "Focus on what the student understood well, gently point out gaps, and "
+    "ask Socratic questions to deepen their understanding. "
+    "Be encouraging and constructive."
+)
+
+DEFAULT_CHAT_INSTRUCTIONS = "Help the user learn about AI safety."
+
+
+@dataclass(frozen=True)
+class ChatContext:
+    """Everything about a chat turn that comes from content, not the user."""
+
+    stage: ChatStage
+    system_prompt: str
+
+
+# (module slug, section index, segment index) -> ChatContext
+_contexts: SnapshotCache[tuple[str, int, int], ChatContext] = SnapshotCache()
+
+_stats = {"hits": 0, "misses": 0}
+
+
+def get_chat_context_stats() -> dict[str, int]:
+    """Cache hit/miss counters and the number of cached prompts."""
+    return {**_stats, "size": len(_contexts)}
+
+
+def clear_chat_context_cache() -> None:
+    """Drop all cached prompts and reset counters."""
+    _contexts.clear()
+    for key in _stats:
+        _stats[key] = 0
+
+
+def _chat_instructions(section: dict, current_segment: dict) -> str:
+    """Tutor instructions for a chat turn at the given segment."""
+    # Test sections: holistic feedback prompt covering all questions
+    if section.get("type") == "test":
+        instructions = TEST_FEEDBACK_INSTRUCTIONS
+        learning_outcome_name = section.get("learningOutcomeName")
+        if learning_outcome_name:
+            instructions += f"\n\nLearning Outcome: {learning_outcome_name}"
+        for seg in section.get("segments", []):
+            if seg.get("type") == "question":
+                instructions += f"\n\nQuestion: {seg.get('content', '')}"
+                if seg.get("assessmentInstructions"):
+                    instructions += f"\nRubric:\n{seg['assessmentInstructions']}"
+        return instructions
+
+    # Standalone question segments: single-question feedback prompt
+    if current_segment.get("type") == "question":
+        instructions = QUESTION_FEEDBACK_INSTRUCTIONS
+        instructions += f"\n\nQuestion: {current_segment.get('content', '')}"
+        learning_outcome_name = section.get("learningOutcomeName")
+        if learning_outcome_name:
+            instructions += f"\nLearning Outcome: {learning_outcome_name}"
+        assessment_instructions = current_segment.get("assessmentInstructions")
+        if assessment_instructions:
+            instructions += f"\nRubric:\n{assessment_instructions}"
+        return instructions
+
+    return current_segment.get("instructions", DEFAULT_CHAT_INSTRUCTIONS)
+
+
+def build_chat_context(
+    module: FlattenedModule, section_index: int, segment_index: int
+) -> ChatContext:
+    """
+    Assemble the tutor stage and system prompt for a chat segment.
+
+    Out-of-range indices fall back to the default instructions with no
+    preceding content.
+    """
+    sections = module.sections
+    section = sections[section_index] if 0 <= section_index < len(sections) else {}
+    segments = section.get("segments", [])
+    current_segment = (
+        segments[segment_index] if 0 <= segment_index < len(segments) else {}
+    )
+
+    stage = ChatStage(
+        type="chat",
+        instructions=_chat_instructions(section, current_segment),
+    )
+    previous_content = gather_section_context(section, segment_index)
+    return ChatContext(
+        stage=stage,
+        system_prompt=_build_system_prompt(stage, None, previous_content),
+    )
+
+
+def get_chat_context(
+    module: FlattenedModule, section_index: int, segment_index: int
+) -> ChatContext:
+    """
+    Cached build_chat_context() for the current content snapshot.
+
+    Args:
+        module: Module from the content cache (load_flattened_module)
+        section_index: Section index within the module
+        segment_index: Segment index within the section
+
+    Returns:
+        ChatContext with the stage and fully assembled system prompt.
+    """
+    _contexts.sync()
+
+    key = (module.slug, section_index, segment_index)
+    context = _contexts.get(key)
+    if context is None:
+        _stats["misses"] += 1
+        context = build_chat_context(module, section_index, segment_index)
+        _contexts[key] = context
+    else:
+        _stats["hits"] += 1
+    return context
@@ -7,7 +7,8 @@ Supports archiving old sessions and creating new ones.
 from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import Text, cast, func, select, update, and_
+from sqlalchemy.dialects.postgresql import ARRAY, array
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from core.tables import chat_sessions
@@ -107,6 +108,32 @@ async def add_chat_message(
     await conn.commit()
 
 
+async def update_last_chat_message(
+    conn: AsyncConnection,
+    *,
+    session_id: int,
+    content: str,
+) -> None:
+    """Replace the content of the session's last message if it is the assistant's.
+
+    Used to checkpoint a reply while it is still streaming.
+    """
+    await conn.execute(
+        update(chat_sessions)
+        .where(chat_sessions.c.session_id == session_id)
+        .where(chat_sessions.c.messages.op("->")(-1).op("->>")("role") == "assistant")
+        .values(
+            messages=func.jsonb_set(
+                chat_sessions.c.messages,
+                cast(array(["-1", "content"]), ARRAY(Text)),
+                func.to_jsonb(cast(content, Text)),
+            ),
+            last_active_at=datetime.now(timezone.utc),
+        )
+    )
+    await conn.commit()
+
+
 async def archive_chat_session(
     conn: AsyncConnection,
     *,
@@ -7,11 +7,12 @@ also be marked complete (all current required lenses done).
 from uuid import UUID
 from datetime import datetime, timezone
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncConnection
 
+from core.content.content_index import get_content_index
 from core.tables import user_content_progress
-from core.modules.progress import get_or_create_progress
+from core.modules.progress import get_completed_content_ids, get_or_create_progress
 
 
 async def propagate_completion(
@@ -19,7 +20,7 @@ async def propagate_completion(
     *,
     user_id: int | None,
     anonymous_token: UUID | None,
-    module_sections: list[dict],
+    module_slug: str,
     module_content_id: UUID,
     completed_lens_id: UUID,
 ) -> None:
@@ -29,61 +30,36 @@ async def propagate_completion(
         conn: Database connection (within a transaction)
         user_id: Authenticated user ID (or None)
         anonymous_token: Anonymous token (or None)
-        module_sections: The flattened module sections list
+        module_slug: Slug of the module the lens was completed in
         module_content_id: The module's content UUID
         completed_lens_id: The lens that was just completed
     """
-    # Find the completed lens's section
-    completed_section = None
-    for section in module_sections:
-        cid = section.get("contentId")
-        if cid and UUID(cid) == completed_lens_id:
-            completed_section = section
-            break
+    index = get_content_index()
 
+    # Find the completed lens's section
+    completed_section = index.module_refs.get((module_slug, completed_lens_id))
     if not completed_section:
         return
 
-    lo_id_str = completed_section.get("learningOutcomeId")
-
-    # Collect all required lens IDs, and those sharing the same LO
-    required_lens_ids = []
-    lo_lens_ids = []
-    for section in module_sections:
-        cid = section.get("contentId")
-        if not cid or section.get("optional", False):
-            continue
-        required_lens_ids.append(UUID(cid))
-        if lo_id_str and section.get("learningOutcomeId") == lo_id_str:
-            lo_lens_ids.append(UUID(cid))
+    lo_id_str = completed_section.learning_outcome_id
+    required_lens_ids = index.required_lenses.get(module_slug, ())
+    lo_lens_ids = index.lo_lenses.get((module_slug, lo_id_str), ()) if lo_id_str else ()
 
     # Query completion status for all required lenses
-    all_ids = list(set(required_lens_ids))
-    if user_id is not None:
-        where = and_(
-            user_content_progress.c.user_id == user_id,
-            user_content_progress.c.content_id.in_(all_ids),
-        )
-    elif anonymous_token is not None:
-        where = and_(
-            user_content_progress.c.anonymous_token == anonymous_token,
-            user_content_progress.c.content_id.in_(all_ids),
-        )
-    else:
+    if user_id is None and anonymous_token is None:
         return
-
-    result = await conn.execute(select(user_content_progress).where(where))
-    progress_map = {row.content_id: dict(row._mapping) for row in result.fetchall()}
+    completed_ids = await get_completed_content_ids(
+        conn,
+        user_id=user_id,
+        anonymous_token=anonymous_token,
+        content_ids=list(set(required_lens_ids)),
+    )
 
     now = datetime.now(timezone.utc)
 
     # Check LO completion
     if lo_id_str and lo_lens_ids:
-        lo_all_complete = all(
-            progress_map.get(lid, {}).get("completed_at") is not None
-            for lid in lo_lens_ids
-        )
-        if lo_all_complete:
+        if all(lid in completed_ids for lid in lo_lens_ids):
             await _mark_complete_if_not_already(
                 conn,
                 user_id=user_id,
@@ -94,10 +70,7 @@ async def propagate_completion(
             )
 
     # Check module completion
-    module_all_complete = all(
-        progress_map.get(lid, {}).get("completed_at") is not None
-        for lid in required_lens_ids
-    )
+    module_all_complete = all(lid in completed_ids for lid in required_lens_ids)
     if module_all_complete and module_content_id:
         await _mark_complete_if_not_already(
             conn,
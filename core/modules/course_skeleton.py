@@ -0,0 +1,194 @@
+# core/modules/course_skeleton.py
+"""
+Precomputed course structure for the course progress endpoint.
+
+Everything in a course progress response except completion comes from
+content: units split on meetings, module and stage titles, and which
+lenses each module requires. That structure is built once per course for
+the current content snapshot. Per request, the user's completed lenses
+become a bitmap over the course's lens IDs and are overlaid on the
+skeleton.
+"""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from core.content.cache import SnapshotCache
+
+from .course_loader import load_course
+from .flattened_types import MeetingMarker, ModuleRef, ParsedCourse
+from .loader import ModuleNotFoundError, load_narrative_module
+
+
+@dataclass(frozen=True)
+class StageSkeleton:
+    type: str
+    title: str
+    optional: bool
+    content_id: str | None
+    lens_index: int | None  # Bit in the completion bitmap, if a lens
+
+    def is_completed(self, completed: int) -> bool:
+        return self.lens_index is not None and bool(completed >> self.lens_index & 1)
+
+
+@dataclass(frozen=True)
+class ModuleSkeleton:
+    slug: str
+    title: str
+    optional: bool
+    stages: tuple[StageSkeleton, ...]
+    required_lenses: tuple[int, ...]  # Bits of non-optional lenses
+
+    def progress(self, completed: int) -> tuple[str, int, int]:
+        """
+        Module status from a completion bitmap.
+
+        Returns:
+            Tuple of (status, completed_count, total_count); status is one
+            of "not_started", "in_progress", "completed"
+        """
+        total = len(self.required_lenses)
+        done = sum(completed >> index & 1 for index in self.required_lenses)
+        if done == 0:
+            return "not_started", 0, total
+        if done >= total:
+            return "completed", done, total
+        return "in_progress", done, total
+
+
+@dataclass(frozen=True)
+class UnitSkeleton:
+    meeting_number: int
+    modules: tuple[ModuleSkeleton, ...]
+
+
+@dataclass(frozen=True)
+class CourseSkeleton:
+    slug: str
+    title: str
+    units: tuple[UnitSkeleton, ...]
+    lens_ids: tuple[UUID, ...]  # Every lens in the course, in bit order
+
+    def completion_bitmap(self, completed_ids: set[UUID]) -> int:
+        """Bitmap with bit i set if lens_ids[i] is completed."""
+        bitmap = 0
+        for index, lens_id in enumerate(self.lens_ids):
+            if lens_id in completed_ids:
+                bitmap |= 1 << index
+        return bitmap
+
+
+def _stage_title(section: dict) -> str:
+    section_type = section.get("type", "unknown")
+    return (
+        section.get("meta", {}).get("title")
+        or section.get("title")
+        or section_type.replace("-", " ").title()
+    )
+
+
+def build_course_skeleton(course: ParsedCourse) -> CourseSkeleton:
+    """
+    Build the user-independent structure of a course.
+
+    Modules missing from the content cache are skipped. Units are split on
+    meeting markers: the modules before a meeting form a unit numbered
+    after it, and trailing modules form one more unit.
+    """
+    lens_index: dict[UUID, int] = {}
+    units: list[UnitSkeleton] = []
+    current_modules: list[ModuleSkeleton] = []
+    current_meeting_number = None
+
+    for item in course.progression:
+        if isinstance(item, MeetingMarker):
+            if current_modules:
+                units.append(UnitSkeleton(item.number, tuple(current_modules)))
+                current_modules = []
+            current_meeting_number = item.number
+        elif isinstance(item, ModuleRef):
+            try:
+                parsed = load_narrative_module(item.slug)
+            except ModuleNotFoundError:
+                continue
+
+            stages = []
+            required = []
+            for section in parsed.sections:
+                content_id_str = section.get("contentId")
+                index = None
+                if content_id_str:
+                    index = lens_index.setdefault(UUID(content_id_str), len(lens_index))
+                optional = section.get("optional", False)
+                if index is not None and not optional:
+                    required.append(index)
+                stages.append(
+                    StageSkeleton(
+                        type=section.get("type", "unknown"),
+                        title=_stage_title(section),
+                        optional=optional,
+                        content_id=content_id_str,
+                        lens_index=index,
+                    )
+                )
+
+            current_modules.append(
+                ModuleSkeleton(
+                    slug=parsed.slug,
+                    title=parsed.title,
+                    optional=item.optional,
+                    stages=tuple(stages),
+                    required_lenses=tuple(required),
+                )
+            )
+
+    if current_modules:
+        # With no meetings at all, the only unit is meeting 1
+        meeting_number = (current_meeting_number + 1) if current_meeting_number else 1
+        units.append(UnitSkeleton(meeting_number, tuple(current_modules)))
+
+    return CourseSkeleton(
+        slug=course.slug,
+        title=course.title,
+        units=tuple(units),
+        lens_ids=tuple(lens_index),
+    )
+
+
+# course slug -> skeleton
+_skeletons: SnapshotCache[str, CourseSkeleton] = SnapshotCache()
+
+_stats = {"hits": 0, "misses": 0}
+
+
+def get_course_skeleton_stats() -> dict[str, int]:
+    """Cache hit/miss counters and the number of cached skeletons."""
+    return {**_stats, "size": len(_skeletons)}
+
+
+def clear_course_skeleton_cache() -> None:
+    """Drop all cached skeletons and reset counters."""
+    _skeletons.clear()
+    for key in _stats:
+        _stats[key] = 0
+
+
+def get_course_skeleton(course_slug: str) -> CourseSkeleton:
+    """
+    Cached build_course_skeleton() for the current content snapshot.
+
+    Raises:
+        CourseNotFoundError: If the course doesn't exist (see load_course)
+    """
+    _skeletons.sync()
+
+    course = load_course(course_slug)
+    skeleton = _skeletons.get(course.slug)
+    if skeleton is None:
+        _stats["misses"] += 1
+        skeleton = build_course_skeleton(course)
+        _skeletons[course.slug] = skeleton
+    else:
+        _stats["hits"] += 1
+    return skeleton
@@ -0,0 +1,159 @@
+# core/modules/fake_llm.py
+"""
+Deterministic local stand-in for an LLM provider.
+
+Select it with a "fake/" model string, e.g. LLM_PROVIDER=fake/tutor, to
+run chat, Prompt Lab and scoring (or load tests, see
+scripts/load_test_chat.py) without calling a paid provider.
+
+Timing and failure behaviour come from environment variables, and can be
+overridden per model string as comma-separated key=value pairs, e.g.
+"fake/ttft=0.5,tokens=50,error_rate=0.1":
+
+- ttft (FAKE_LLM_TTFT): seconds before the first token
+- token_delay (FAKE_LLM_TOKEN_DELAY): seconds between tokens
+- tokens (FAKE_LLM_TOKENS): tokens per response
+- thinking_tokens (FAKE_LLM_THINKING_TOKENS): reasoning tokens sent first
+- error_rate (FAKE_LLM_ERROR_RATE): fraction of calls that fail with a
+  429, like a rate-limited provider (exercises the governor's retries)
+
+Response text is a pure function of the conversation, so repeated runs
+produce the same output. Structured-output requests get JSON matching
+the requested schema.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+from types import SimpleNamespace
+from typing import AsyncIterator
+
+FAKE_MODEL_PREFIX = "fake/"
+
+_DEFAULTS = {
+    "ttft": float(os.environ.get("FAKE_LLM_TTFT", "0.3")),
+    "token_delay": float(os.environ.get("FAKE_LLM_TOKEN_DELAY", "0.02")),
+    "tokens": int(os.environ.get("FAKE_LLM_TOKENS", "200")),
+    "thinking_tokens": int(os.environ.get("FAKE_LLM_THINKING_TOKENS", "0")),
+    "error_rate": float(os.environ.get("FAKE_LLM_ERROR_RATE", "0")),
+}
+
+_WORDS = (
+    "alignment agent goal reward model training objective oversight value "
+    "safety system behaviour human feedback capability risk policy "
+    "interpretability robustness specification the a of to and is that "
+    "which could would because however"
+).split()
+
+# Error injection is seeded too, so a load test fails the same calls each run
+_error_rng = random.Random(int(os.environ.get("FAKE_LLM_SEED", "0")))
+
+
+class FakeRateLimitError(Exception):
+    """Injected failure, shaped like a provider rate-limit error."""
+
+    status_code = 429
+
+
+def is_fake_model(model: str) -> bool:
+    return model.startswith(FAKE_MODEL_PREFIX)
+
+
+def _settings(model: str) -> dict:
+    settings = dict(_DEFAULTS)
+    for part in model[len(FAKE_MODEL_PREFIX) :].split(","):
+        key, sep, value = part.partition("=")
+        if sep and key in settings:
+            settings[key] = type(_DEFAULTS[key])(value)
+    return settings
+
+
+def _words(messages: list[dict], count: int, salt: str) -> list[str]:
+    digest = hashlib.sha256(
+        (salt + json.dumps(messages, sort_keys=True, default=str)).encode()
+    ).hexdigest()
+    rng = random.Random(digest)
+    return [rng.choice(_WORDS) for _ in range(count)]
+
+
+def _example(schema: dict):
+    """Smallest value matching a JSON schema (the subset we use)."""
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type")
+    if kind == "object":
+        return {
+            name: _example(prop) for name, prop in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        return [_example(schema.get("items", {}))]
+    if kind == "integer":
+        return schema.get("minimum", 3)
+    if kind == "number":
+        return schema.get("minimum", 0.5)
+    if kind == "boolean":
+        return True
+    return "Fake response."
+
+
+def _usage(messages: list[dict], completion_tokens: int) -> SimpleNamespace:
+    prompt_tokens = len(json.dumps(messages, default=str)) // 4
+    return SimpleNamespace(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens,
+    )
+
+
+def _chunk(content=None, reasoning=None, usage=None) -> SimpleNamespace:
+    delta = SimpleNamespace(
+        content=content, reasoning_content=reasoning, tool_calls=None
+    )
+    choices = [] if usage else [SimpleNamespace(delta=delta)]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+async def _stream(messages: list[dict], settings: dict) -> AsyncIterator:
+    thinking = _words(messages, settings["thinking_tokens"], "thinking")
+    words = _words(messages, settings["tokens"], "text")
+
+    await asyncio.sleep(settings["ttft"])
+    for i, word in enumerate(thinking):
+        if i:
+            await asyncio.sleep(settings["token_delay"])
+        yield _chunk(reasoning=word + " ")
+    for i, word in enumerate(words):
+        if i or thinking:
+            await asyncio.sleep(settings["token_delay"])
+        yield _chunk(content=word if i == 0 else " " + word)
+    yield _chunk(usage=_usage(messages, len(thinking) + len(words)))
+
+
+async def fake_acompletion(
+    model: str,
+    messages: list[dict],
+    stream: bool = False,
+    response_format: dict | None = None,
+    **kwargs,
+):
+    """Drop-in for litellm.acompletion with a fake/ model."""
+    settings = _settings(model)
+    if settings["error_rate"] and _error_rng.random() < settings["error_rate"]:
+        raise FakeRateLimitError(f"{model}: injected rate limit")
+
+    if stream:
+        return _stream(messages, settings)
+
+    await asyncio.sleep(
+        settings["ttft"] + settings["token_delay"] * max(settings["tokens"] - 1, 0)
+    )
+    if response_format and response_format.get("type") == "json_schema":
+        content = json.dumps(_example(response_format["json_schema"]["schema"]))
+    else:
+        content = " ".join(_words(messages, settings["tokens"], "text"))
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=_usage(messages, settings["tokens"]),
+    )
@@ -0,0 +1,299 @@
+# core/modules/governor.py
+"""
+Concurrency governor for LLM calls.
+
+All LLM traffic (module chat, Prompt Lab, background scoring) shares the
+provider's rate limits. The governor keeps one class of traffic from
+starving the others:
+
+- Per-provider concurrency pools (LLM_MAX_CONCURRENCY in-flight calls)
+- Priority classes: interactive chat > Prompt Lab > background scoring.
+  Part of each pool is reserved for chat (Prompt Lab and background work
+  together never hold those slots), and background work is further capped
+  at a share of the pool.
+- Bounded waits: a chat or Prompt Lab call that can't get a slot within
+  LLM_QUEUE_TIMEOUT fails with LLMOverloadedError instead of queueing
+  forever. Background work waits; its queue retries later anyway.
+- Fair queuing: within a priority class, waiting callers are served
+  round-robin per client key (user or anonymous token), so one user's
+  burst can't monopolize the queue.
+- 429/overload-aware retry with exponential backoff and jitter
+- A circuit breaker per model: after repeated rate-limit/overload
+  failures, calls go to LLM_FALLBACK_PROVIDER until the cooldown passes.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    """LLM traffic classes, most urgent first."""
+
+    INTERACTIVE = 0
+    PROMPT_LAB = 1
+    BACKGROUND = 2
+
+
+# Max in-flight LLM calls per provider
+LLM_MAX_CONCURRENCY = int(os.environ.get("LLM_MAX_CONCURRENCY", "16"))
+
+# Share of a provider's pool background work may hold
+BACKGROUND_SHARE = 0.5
+
+# Share of a provider's pool only interactive chat may use
+INTERACTIVE_RESERVE = 0.25
+
+# Seconds a chat/Prompt Lab call may wait for a slot before giving up
+LLM_QUEUE_TIMEOUT = float(os.environ.get("LLM_QUEUE_TIMEOUT", "30"))
+
+# Model to use while the primary model's circuit is open (None = no failover)
+LLM_FALLBACK_PROVIDER = os.environ.get("LLM_FALLBACK_PROVIDER") or None
+
+# Retries for rate-limited/overloaded calls
+LLM_MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0  # seconds, doubled after each attempt
+
+# Consecutive rate-limit/overload failures that open a model's circuit
+BREAKER_THRESHOLD = 5
+# Seconds a circuit stays open before the model is tried again
+BREAKER_COOLDOWN = 30.0
+
+# HTTP statuses that mean "slow down", not "bad request"
+_RETRYABLE_STATUSES = {429, 503, 529}
+
+
+class LLMOverloadedError(Exception):
+    """No LLM slot became free within LLM_QUEUE_TIMEOUT."""
+
+
+def is_retryable(error: Exception) -> bool:
+    """True for provider rate-limit and overload errors."""
+    status = getattr(error, "status_code", None)
+    return status in _RETRYABLE_STATUSES or type(error).__name__ in (
+        "RateLimitError",
+        "ServiceUnavailableError",
+    )
+
+
+class _ProviderPool:
+    """Priority- and fairness-aware slots for one provider."""
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        # Slots non-interactive work can't take (none in a single-slot pool)
+        self.reserved = min(
+            self.capacity - 1, max(1, int(self.capacity * INTERACTIVE_RESERVE))
+        )
+        self.in_flight = 0
+        self.running = {p: 0 for p in Priority}
+        # priority -> client_key -> waiting futures (round-robin across keys)
+        self.waiters: dict[Priority, OrderedDict[str, deque[asyncio.Future]]] = {
+            p: OrderedDict() for p in Priority
+        }
+
+    def _limit(self, priority: Priority) -> int:
+        if priority == Priority.BACKGROUND:
+            return max(1, int(self.capacity * BACKGROUND_SHARE))
+        return self.capacity
+
+    def _can_run(self, priority: Priority) -> bool:
+        if self.in_flight >= self.capacity:
+            return False
+        if (
+            priority != Priority.INTERACTIVE
+            and self.in_flight >= self.capacity - self.reserved
+        ):
+            return False
+        return self.running[priority] < self._limit(priority)
+
+    def _start(self, priority: Priority) -> None:
+        self.in_flight += 1
+        self.running[priority] += 1
+
+    def _dispatch(self) -> None:
+        """Hand free slots to the highest-priority, least-recently-served waiters."""
+        for priority in Priority:
+            queues = self.waiters[priority]
+            while queues and self._can_run(priority):
+                client_key, waiting = next(iter(queues.items()))
+                future = waiting.popleft()
+                if waiting:
+                    queues.move_to_end(client_key)
+                else:
+                    del queues[client_key]
+                if future.done():  # Cancelled while waiting
+                    continue
+                self._start(priority)
+                future.set_result(None)
+
+    def waiting(self) -> int:
+        return sum(
+            len(waiting)
+            for queues in self.waiters.values()
+            for waiting in queues.values()
+        )
+
+    async def acquire(self, priority: Priority, client_key: str) -> None:
+        if self._can_run(priority) and not self.waiting():
+            self._start(priority)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self.waiters[priority].setdefault(client_key, deque()).append(future)
+        self._dispatch()
+        timeout = None if priority == Priority.BACKGROUND else LLM_QUEUE_TIMEOUT
+        try:
+            async with asyncio.timeout(timeout):
+                await future
+        except (asyncio.CancelledError, TimeoutError) as e:
+            if future.done() and not future.cancelled():
+                # Granted a slot just as we were cancelled
+                self.release(priority)
+            else:
+                future.cancel()
+            if isinstance(e, TimeoutError):
+                raise LLMOverloadedError(
+                    f"No LLM capacity within {timeout:g}s, try again shortly"
+                ) from None
+            raise
+
+    def release(self, priority: Priority) -> None:
+        self.in_flight -= 1
+        self.running[priority] -= 1
+        self._dispatch()
+
+
+class _CircuitBreaker:
+    """Tracks consecutive rate-limit/overload failures for one model."""
+
+    def __init__(self):
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    def is_open(self) -> bool:
+        if self.opened_at is None:
+            return False
+        if time.monotonic() - self.opened_at >= BREAKER_COOLDOWN:
+            # Half-open: let calls through; one more failure reopens it
+            self.opened_at = None
+            self.failures = BREAKER_THRESHOLD - 1
+            return False
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= BREAKER_THRESHOLD and self.opened_at is None:
+            self.opened_at = time.monotonic()
+
+
+_pools: dict[str, _ProviderPool] = {}
+_breakers: dict[str, _CircuitBreaker] = {}
+
+
+def _provider_of(model: str) -> str:
+    return model.split("/", 1)[0]
+
+
+def _pool(model: str) -> _ProviderPool:
+    provider = _provider_of(model)
+    if provider not in _pools:
+        _pools[provider] = _ProviderPool(LLM_MAX_CONCURRENCY)
+    return _pools[provider]
+
+
+def _breaker(model: str) -> _CircuitBreaker:
+    if model not in _breakers:
+        _breakers[model] = _CircuitBreaker()
+    return _breakers[model]
+
+
+def route_model(model: str) -> str:
+    """Return the fallback model while the primary's circuit is open."""
+    if (
+        LLM_FALLBACK_PROVIDER
+        and model != LLM_FALLBACK_PROVIDER
+        and _breaker(model).is_open()
+    ):
+        return LLM_FALLBACK_PROVIDER
+    return model
+
+
+@asynccontextmanager
+async def governed_call(
+    model: str,
+    call: Callable[[str], Awaitable[T]],
+    priority: Priority = Priority.INTERACTIVE,
+    client_key: str | None = None,
+) -> AsyncIterator[tuple[T, str]]:
+    """
+    Run call(model) in a provider slot, retrying rate-limit/overload errors
+    with backoff. Yields (result, model that answered).
+
+    Each attempt holds a slot of the provider it is routed to, so calls
+    failed over to LLM_FALLBACK_PROVIDER count against the fallback's pool.
+    The slot is released between retries and otherwise held until the block
+    exits, so a stream keeps it while being read.
+
+    Failures feed the model's circuit breaker; once it opens, retries
+    (and later calls, via route_model) use LLM_FALLBACK_PROVIDER.
+    """
+    client_key = client_key or priority.name
+    model = route_model(model)
+    attempt = 0
+    while True:
+        pool = _pool(model)
+        await pool.acquire(priority, client_key)
+        try:
+            result = await call(model)
+        except BaseException as e:
+            pool.release(priority)
+            if not isinstance(e, Exception) or not is_retryable(e):
+                raise
+            _breaker(model).record_failure()
+            if attempt >= LLM_MAX_RETRIES:
+                raise
+            next_model = route_model(model)
+            if next_model != model:
+                logger.warning(f"LLM circuit open for {model}, using {next_model}")
+            model = next_model
+            delay = RETRY_BASE_DELAY * 2**attempt * random.uniform(0.5, 1.5)
+            logger.info(f"LLM call rate limited ({e}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+        break
+
+    _breaker(model).record_success()
+    try:
+        yield result, model
+    finally:
+        pool.release(priority)
+
+
+def get_governor_stats() -> dict[str, dict]:
+    """In-flight and waiting call counts per provider, and open circuits."""
+    return {
+        "pools": {
+            provider: {"in_flight": pool.in_flight, "waiting": pool.waiting()}
+            for provider, pool in _pools.items()
+        },
+        "open_circuits": [
+            model for model, breaker in _breakers.items() if breaker.opened_at
+        ],
+    }
@@ -2,18 +2,127 @@
 LLM provider abstraction using LiteLLM.
 
 Provides a unified interface for Claude, Gemini, and other providers.
-Normalizes streaming events to our internal format.
+Normalizes streaming events to our internal format. Models named
+"fake/..." use a local stand-in instead (see fake_llm.py).
+
+Prompt caching: for providers that support it, the system prompt (base
+prompt, instructions and content context - stable for a whole
+conversation) and, for streamed chat, the conversation so far are marked
+as cache breakpoints, so follow-up turns re-read long articles/transcripts from
+the provider's prompt cache instead of processing them again.
 """
 
+import logging
 import os
 from typing import AsyncIterator
 
-from litellm import acompletion
+from .fake_llm import fake_acompletion, is_fake_model
+from .governor import Priority, governed_call
+
+logger = logging.getLogger(__name__)
 
 
 # Default provider - can be overridden per-call or via environment
 DEFAULT_PROVIDER = os.environ.get("LLM_PROVIDER", "anthropic/claude-sonnet-4-6")
 
+# Set LLM_PROMPT_CACHE=false to disable cache breakpoints
+PROMPT_CACHE_ENABLED = os.environ.get("LLM_PROMPT_CACHE", "true").lower() != "false"
+
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Running totals of prompt tokens, for monitoring cache effectiveness
+_prompt_cache_stats = {
+    "requests": 0,
+    "input_tokens": 0,
+    "cache_read_tokens": 0,
+    "cache_write_tokens": 0,
+}
+
+
+def get_prompt_cache_stats() -> dict[str, int]:
+    """Prompt token totals since startup (input, cache reads, cache writes)."""
+    return dict(_prompt_cache_stats)
+
+
+def _supports_prompt_cache(model: str) -> bool:
+    """Explicit cache_control breakpoints are an Anthropic feature."""
+    return PROMPT_CACHE_ENABLED and (
+        model.startswith("anthropic/") or "claude" in model
+    )
+
+
+def _build_messages(
+    system: str, messages: list[dict], model: str, cache_history: bool = False
+) -> list[dict]:
+    """
+    Build LiteLLM messages: system prompt first, then the conversation.
+
+    With prompt caching, a breakpoint goes after the system prompt (reused
+    across the whole conversation). For multi-turn chat (cache_history)
+    another goes after the last message, so the next turn re-reads the
+    history from cache too; one-shot calls skip it, since their final
+    message is never sent again and the cache write would be wasted.
+    """
+    if not _supports_prompt_cache(model):
+        # LiteLLM uses OpenAI-style messages with system as a message
+        return [{"role": "system", "content": system}] + messages
+
+    llm_messages = [
+        {
+            "role": "system",
+            "content": [
+                {"type": "text", "text": system, "cache_control": _CACHE_CONTROL}
+            ],
+        }
+    ] + [dict(m) for m in messages]
+
+    last = llm_messages[-1]
+    if cache_history and len(llm_messages) > 1 and isinstance(last.get("content"), str):
+        last["content"] = [
+            {"type": "text", "text": last["content"], "cache_control": _CACHE_CONTROL}
+        ]
+    return llm_messages
+
+
+async def acompletion(*args, **kwargs):
+    """litellm.acompletion; litellm takes seconds to import, so on first use."""
+    from litellm import acompletion as litellm_acompletion
+
+    return await litellm_acompletion(*args, **kwargs)
+
+
+def _completion_fn(model: str):
+    """litellm.acompletion, or the local stand-in for fake/ models."""
+    return fake_acompletion if is_fake_model(model) else acompletion
+
+
+def _usage_int(obj, name: str) -> int:
+    value = getattr(obj, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def _record_usage(model: str, usage) -> None:
+    """Capture prompt cache hit/miss token counts from a response's usage."""
+    if usage is None:
+        return
+    input_tokens = _usage_int(usage, "prompt_tokens")
+    cache_read = _usage_int(usage, "cache_read_input_tokens") or _usage_int(
+        getattr(usage, "prompt_tokens_details", None), "cached_tokens"
+    )
+    cache_write = _usage_int(usage, "cache_creation_input_tokens")
+
+    _prompt_cache_stats["requests"] += 1
+    _prompt_cache_stats["input_tokens"] += input_tokens
+    _prompt_cache_stats["cache_read_tokens"] += cache_read
+    _prompt_cache_stats["cache_write_tokens"] += cache_write
+    logger.debug(
+        "LLM usage (%s): input=%d cache_read=%d cache_write=%d",
+        model,
+        input_tokens,
+        cache_read,
+        cache_write,
+    )
+
 
 async def stream_chat(
     messages: list[dict],
@@ -23,6 +132,8 @@ async def stream_chat(
     max_tokens: int = 16384,
     thinking: bool = True,
     effort: str = "low",
+    priority: Priority = Priority.INTERACTIVE,
+    client_key: str | None = None,
 ) -> AsyncIterator[dict]:
     """
     Stream a chat completion from any LLM provider.
@@ -35,6 +146,8 @@ async def stream_chat(
         max_tokens: Maximum tokens in response
         thinking: Enable adaptive thinking (default True)
         effort: Thinking effort level — "low", "medium", or "high" (default "low")
+        priority: Traffic class for the LLM governor
+        client_key: Fair-queuing key, e.g. "user:42" (see governor.py)
 
     Yields:
         Normalized events:
@@ -45,48 +158,56 @@ async def stream_chat(
     """
     model = provider or DEFAULT_PROVIDER
 
-    # LiteLLM uses OpenAI-style messages with system as a message
-    llm_messages = [{"role": "system", "content": system}] + messages
-
-    # Build kwargs
-    kwargs = {
-        "model": model,
-        "messages": llm_messages,
-        "max_tokens": max_tokens,
-        "stream": True,
-    }
-    if thinking:
-        kwargs["thinking"] = {"type": "adaptive"}
-        kwargs["output_config"] = {"effort": effort}
-    if tools:
-        kwargs["tools"] = tools
-
-    response = await acompletion(**kwargs)
-
-    # Track if we're in a tool call
-    current_tool_name = None
-
-    async for chunk in response:
-        delta = chunk.choices[0].delta if chunk.choices else None
-        if not delta:
-            continue
-
-        # Handle thinking/reasoning content
-        reasoning = getattr(delta, "reasoning_content", None)
-        if reasoning:
-            yield {"type": "thinking", "content": reasoning}
-
-        # Handle text content
-        if delta.content:
-            yield {"type": "text", "content": delta.content}
-
-        # Handle tool calls
-        if delta.tool_calls:
-            for tool_call in delta.tool_calls:
-                if tool_call.function and tool_call.function.name:
-                    # New tool call starting
-                    current_tool_name = tool_call.function.name
-                    yield {"type": "tool_use", "name": current_tool_name}
+    def request(model: str):
+        kwargs = {
+            "model": model,
+            "messages": _build_messages(system, messages, model, cache_history=True),
+            "max_tokens": max_tokens,
+            "stream": True,
+            # Final chunk carries usage, including prompt cache token counts
+            "stream_options": {"include_usage": True},
+        }
+        if thinking:
+            kwargs["thinking"] = {"type": "adaptive"}
+            kwargs["output_config"] = {"effort": effort}
+        if tools:
+            kwargs["tools"] = tools
+        return _completion_fn(model)(**kwargs)
+
+    # The slot is held for the whole stream; rate-limit errors surface when
+    # the stream opens, so retries happen before anything is yielded
+    async with governed_call(model, request, priority, client_key) as (
+        response,
+        model,
+    ):
+        # Track if we're in a tool call
+        current_tool_name = None
+
+        async for chunk in response:
+            usage = getattr(chunk, "usage", None)
+            if usage:
+                _record_usage(model, usage)
+
+            delta = chunk.choices[0].delta if chunk.choices else None
+            if not delta:
+                continue
+
+            # Handle thinking/reasoning content
+            reasoning = getattr(delta, "reasoning_content", None)
+            if reasoning:
+                yield {"type": "thinking", "content": reasoning}
+
+            # Handle text content
+            if delta.content:
+                yield {"type": "text", "content": delta.content}
+
+            # Handle tool calls
+            if delta.tool_calls:
+                for tool_call in delta.tool_calls:
+                    if tool_call.function and tool_call.function.name:
+                        # New tool call starting
+                        current_tool_name = tool_call.function.name
+                        yield {"type": "tool_use", "name": current_tool_name}
 
     yield {"type": "done"}
 
@@ -97,7 +218,9 @@ async def complete(
     response_format: dict | None = None,
     provider: str | None = None,
     max_tokens: int = 1024,
-) -> str:
+    priority: Priority = Priority.INTERACTIVE,
+    client_key: str | None = None,
+) -> tuple[str, str]:
     """
     Non-streaming completion for structured responses (e.g., scoring).
 
@@ -107,22 +230,28 @@ async def complete(
         response_format: Optional JSON schema for structured output
         provider: Model string (uses DEFAULT_PROVIDER if None)
         max_tokens: Maximum tokens in response
+        priority: Traffic class for the LLM governor
+        client_key: Fair-queuing key (see governor.py)
 
     Returns:
-        Full response content as string
+        (full response content, model that produced it). The model differs
+        from provider after a failover to LLM_FALLBACK_PROVIDER.
     """
     model = provider or DEFAULT_PROVIDER
 
-    # LiteLLM uses OpenAI-style messages with system as a message
-    llm_messages = [{"role": "system", "content": system}] + messages
-
-    kwargs = {
-        "model": model,
-        "messages": llm_messages,
-        "max_tokens": max_tokens,
-    }
-    if response_format:
-        kwargs["response_format"] = response_format
+    def request(model: str):
+        kwargs = {
+            "model": model,
+            "messages": _build_messages(system, messages, model),
+            "max_tokens": max_tokens,
+        }
+        if response_format:
+            kwargs["response_format"] = response_format
+        return _completion_fn(model)(**kwargs)
 
-    response = await acompletion(**kwargs)
-    return response.choices[0].message.content
+    async with governed_call(model, request, priority, client_key) as (
+        response,
+        model,
+    ):
+        _record_usage(model, getattr(response, "usage", None))
+        return response.choices[0].message.content, model
@@ -205,6 +205,39 @@ async def get_module_progress(
     return {row.content_id: dict(row._mapping) for row in result.fetchall()}
 
 
+async def get_completed_content_ids(
+    conn: AsyncConnection,
+    *,
+    user_id: int | None,
+    anonymous_token: UUID | None,
+    content_ids: list[UUID],
+) -> set[UUID]:
+    """Get which of the given content items are completed.
+
+    Selects only content_id, so it is answered from the (user_id,
+    content_id) / (anonymous_token, content_id) indexes plus a filter on
+    completed_at, without loading whole progress rows.
+    """
+    if not content_ids:
+        return set()
+
+    if user_id is not None:
+        owner_clause = user_content_progress.c.user_id == user_id
+    elif anonymous_token is not None:
+        owner_clause = user_content_progress.c.anonymous_token == anonymous_token
+    else:
+        return set()
+
+    result = await conn.execute(
+        select(user_content_progress.c.content_id).where(
+            owner_clause,
+            user_content_progress.c.content_id.in_(content_ids),
+            user_content_progress.c.completed_at.is_not(None),
+        )
+    )
+    return {row.content_id for row in result}
+
+
 async def claim_progress_records(
     conn: AsyncConnection,
     *,
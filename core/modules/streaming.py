@@ -0,0 +1,98 @@
+# core/modules/streaming.py
+"""
+Coalescing of streamed LLM events.
+
+Providers emit text in tiny deltas (often a single token). Sending each one
+as its own SSE frame costs a JSON encode and a socket write per token.
+coalesce_events() merges consecutive text/thinking deltas into larger
+events over a short time/size window.
+
+The source is read by a separate task, so a slow client never stalls the
+provider stream: deltas pile up while a write is in progress and go out
+together in the next, larger frame.
+"""
+
+import asyncio
+from typing import AsyncIterator
+
+# Max seconds a delta waits for more deltas to join its frame
+FLUSH_INTERVAL = 0.05
+
+# Max characters per coalesced event
+FLUSH_CHARS = 512
+
+_MERGEABLE_TYPES = ("text", "thinking")
+_END = object()
+
+
+async def coalesce_events(
+    events: AsyncIterator[dict],
+    flush_interval: float = FLUSH_INTERVAL,
+    max_chars: int = FLUSH_CHARS,
+) -> AsyncIterator[dict]:
+    """
+    Merge consecutive text/thinking events from an LLM event stream.
+
+    Other events (tool_use, done, error) pass through unchanged and in
+    order. Exceptions raised by the source are re-raised here.
+
+    Args:
+        events: Normalized events, e.g. from stream_chat()
+        flush_interval: Max seconds to hold a delta back
+        max_chars: Max content length of a merged event
+
+    Yields:
+        Events with the same shape as the source's.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump() -> None:
+        try:
+            async for event in events:
+                queue.put_nowait(event)
+        except Exception as e:
+            queue.put_nowait(e)
+        finally:
+            queue.put_nowait(_END)
+
+    loop = asyncio.get_running_loop()
+    pump_task = asyncio.create_task(pump())
+    held = None
+    try:
+        while True:
+            item = held if held is not None else await queue.get()
+            held = None
+            if item is _END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            if item.get("type") not in _MERGEABLE_TYPES:
+                yield item
+                continue
+
+            merged = dict(item)
+            deadline = loop.time() + flush_interval
+            while len(merged["content"]) < max_chars:
+                # Backlog (client was slow) is drained without waiting
+                if queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        next_item = await asyncio.wait_for(queue.get(), timeout)
+                    except TimeoutError:
+                        break
+                else:
+                    next_item = queue.get_nowait()
+
+                same_type = isinstance(next_item, dict) and (
+                    next_item.get("type") == merged["type"]
+                )
+                if same_type:
+                    merged["content"] += next_item.get("content", "")
+                else:
+                    held = next_item
+                    break
+            yield merged
+    finally:
+        pump_task.cancel()
@@ -0,0 +1,111 @@
+# core/modules/tests/test_chat_context.py
+"""Tests for memoized chat context assembly."""
+
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from core.content.cache import ContentCache, clear_cache, set_cache
+from core.modules.chat_context import (
+    clear_chat_context_cache,
+    get_chat_context,
+    get_chat_context_stats,
+)
+from core.modules.flattened_types import FlattenedModule
+
+
+def _module():
+    return FlattenedModule(
+        slug="test-module",
+        title="Test Module",
+        content_id=uuid.UUID("00000000-0000-0000-0000-000000000001"),
+        sections=[
+            {
+                "type": "page",
+                "segments": [
+                    {"type": "text", "content": "Intro text"},
+                    {"type": "chat", "instructions": "Discuss the intro"},
+                ],
+            },
+            {
+                "type": "test",
+                "learningOutcomeName": "Alignment basics",
+                "segments": [
+                    {
+                        "type": "question",
+                        "content": "What is alignment?",
+                        "assessmentInstructions": "Mentions intent",
+                    },
+                ],
+            },
+        ],
+    )
+
+
+@pytest.fixture
+def content_cache():
+    module = _module()
+    cache = ContentCache(
+        courses={},
+        flattened_modules={module.slug: module},
+        parsed_learning_outcomes={},
+        parsed_lenses={},
+        articles={},
+        video_transcripts={},
+        last_refreshed=datetime.now(),
+    )
+    clear_chat_context_cache()
+    set_cache(cache)
+    yield cache
+    clear_cache()
+    clear_chat_context_cache()
+
+
+class TestGetChatContext:
+    def test_builds_prompt_from_instructions_and_preceding_content(self, content_cache):
+        module = content_cache.flattened_modules["test-module"]
+
+        context = get_chat_context(module, 0, 1)
+
+        assert context.stage.instructions == "Discuss the intro"
+        assert "Discuss the intro" in context.system_prompt
+        assert "Intro text" in context.system_prompt
+
+    def test_test_sections_get_feedback_prompt(self, content_cache):
+        module = content_cache.flattened_modules["test-module"]
+
+        context = get_chat_context(module, 1, 0)
+
+        assert "Learning Outcome: Alignment basics" in context.stage.instructions
+        assert "Question: What is alignment?" in context.stage.instructions
+        assert "Rubric:\nMentions intent" in context.stage.instructions
+
+    def test_reuses_cached_prompt(self, content_cache):
+        module = content_cache.flattened_modules["test-module"]
+
+        with patch(
+            "core.modules.chat_context.gather_section_context",
+            return_value="Intro text",
+        ) as gather:
+            first = get_chat_context(module, 0, 1)
+            second = get_chat_context(module, 0, 1)
+
+        assert first is second
+        gather.assert_called_once()
+        stats = get_chat_context_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_reprocessed_content_invalidates_cache(self, content_cache):
+        module = content_cache.flattened_modules["test-module"]
+        get_chat_context(module, 0, 1)
+
+        module.sections[0]["segments"][0]["content"] = "Updated text"
+        content_cache.last_refreshed += timedelta(seconds=1)
+
+        context = get_chat_context(module, 0, 1)
+
+        assert "Updated text" in context.system_prompt
+        assert get_chat_context_stats()["misses"] == 2
@@ -0,0 +1,131 @@
+# core/modules/tests/test_course_skeleton.py
+"""Tests for the precomputed course skeleton."""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.content.cache import ContentCache, clear_cache, set_cache
+from core.modules.course_skeleton import (
+    clear_course_skeleton_cache,
+    get_course_skeleton,
+    get_course_skeleton_stats,
+)
+from core.modules.flattened_types import (
+    FlattenedModule,
+    MeetingMarker,
+    ModuleRef,
+    ParsedCourse,
+)
+
+LENS_A = uuid.UUID("00000000-0000-0000-0000-00000000000a")
+LENS_B = uuid.UUID("00000000-0000-0000-0000-00000000000b")
+LENS_C = uuid.UUID("00000000-0000-0000-0000-00000000000c")
+
+
+def _module(slug, sections):
+    return FlattenedModule(
+        slug=slug, title=slug.title(), content_id=None, sections=sections
+    )
+
+
+@pytest.fixture
+def content_cache():
+    modules = {
+        "intro": _module(
+            "intro",
+            [
+                {"type": "lens", "contentId": str(LENS_A), "meta": {"title": "Lens A"}},
+                {"type": "lens", "contentId": str(LENS_B), "optional": True},
+            ],
+        ),
+        "deeper": _module(
+            "deeper",
+            [
+                {"type": "lens", "contentId": str(LENS_C), "title": "Lens C"},
+                {"type": "page-break"},
+            ],
+        ),
+    }
+    course = ParsedCourse(
+        slug="course",
+        title="Course",
+        progression=[
+            ModuleRef(slug="intro"),
+            MeetingMarker(number=1),
+            ModuleRef(slug="missing"),
+            ModuleRef(slug="deeper", optional=True),
+        ],
+    )
+    cache = ContentCache(
+        courses={"course": course},
+        flattened_modules=modules,
+        parsed_learning_outcomes={},
+        parsed_lenses={},
+        articles={},
+        video_transcripts={},
+        last_refreshed=datetime.now(),
+    )
+    clear_course_skeleton_cache()
+    set_cache(cache)
+    yield cache
+    clear_cache()
+    clear_course_skeleton_cache()
+
+
+class TestBuild:
+    def test_splits_units_on_meetings(self, content_cache):
+        skeleton = get_course_skeleton("course")
+
+        assert [u.meeting_number for u in skeleton.units] == [1, 2]
+        assert [m.slug for m in skeleton.units[0].modules] == ["intro"]
+        # Missing modules are skipped
+        assert [m.slug for m in skeleton.units[1].modules] == ["deeper"]
+        assert skeleton.units[1].modules[0].optional is True
+
+    def test_stage_titles_and_lens_indexes(self, content_cache):
+        skeleton = get_course_skeleton("course")
+        intro = skeleton.units[0].modules[0]
+        deeper = skeleton.units[1].modules[0]
+
+        assert skeleton.lens_ids == (LENS_A, LENS_B, LENS_C)
+        assert [s.title for s in intro.stages] == ["Lens A", "Lens"]
+        assert [s.title for s in deeper.stages] == ["Lens C", "Page Break"]
+        assert deeper.stages[1].lens_index is None
+        # Optional lenses don't count towards completion
+        assert intro.required_lenses == (0,)
+
+
+class TestOverlay:
+    def test_progress_from_bitmap(self, content_cache):
+        skeleton = get_course_skeleton("course")
+        intro = skeleton.units[0].modules[0]
+
+        bitmap = skeleton.completion_bitmap({LENS_B})
+        assert intro.progress(bitmap) == ("not_started", 0, 1)
+        assert intro.stages[1].is_completed(bitmap)
+        assert not intro.stages[0].is_completed(bitmap)
+
+        bitmap = skeleton.completion_bitmap({LENS_A, uuid.uuid4()})
+        assert intro.progress(bitmap) == ("completed", 1, 1)
+
+    def test_non_lens_stages_never_completed(self, content_cache):
+        skeleton = get_course_skeleton("course")
+        module = skeleton.units[1].modules[0]
+
+        assert module.progress(0) == ("not_started", 0, 1)
+        assert not module.stages[1].is_completed(-1)  # All bits set
+
+
+class TestCache:
+    def test_reuses_skeleton_until_content_refresh(self, content_cache):
+        first = get_course_skeleton("course")
+        assert get_course_skeleton("course") is first
+        # Fallback slug resolves to the same course
+        assert get_course_skeleton("default") is first
+        assert get_course_skeleton_stats()["hits"] == 2
+
+        content_cache.last_refreshed += timedelta(seconds=1)
+
+        assert get_course_skeleton("course") is not first
@@ -0,0 +1,112 @@
+# core/modules/tests/test_fake_llm.py
+"""Tests for the local fake LLM provider."""
+
+import json
+
+import pytest
+
+from core.modules import governor
+from core.modules.fake_llm import FakeRateLimitError, _settings, fake_acompletion
+from core.modules.llm import complete, stream_chat
+
+FAST = "fake/ttft=0,token_delay=0,tokens=5"
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    governor._pools.clear()
+    governor._breakers.clear()
+    yield
+    governor._pools.clear()
+    governor._breakers.clear()
+
+
+async def _collect(messages, provider=FAST):
+    return [
+        event
+        async for event in stream_chat(
+            messages, system="You are a tutor.", provider=provider
+        )
+    ]
+
+
+class TestSettings:
+    def test_overrides_from_model_string(self):
+        settings = _settings("fake/ttft=0.5,tokens=7,unknown=1")
+
+        assert settings["ttft"] == 0.5
+        assert settings["tokens"] == 7
+        assert "unknown" not in settings
+
+    def test_plain_name_uses_defaults(self):
+        assert _settings("fake/tutor")["tokens"] == _settings("fake/")["tokens"]
+
+
+class TestStreamChat:
+    @pytest.mark.asyncio
+    async def test_streams_deterministic_text(self):
+        messages = [{"role": "user", "content": "What is reward hacking?"}]
+
+        first = await _collect(messages)
+        second = await _collect(messages)
+
+        text = [e["content"] for e in first if e["type"] == "text"]
+        assert len(text) == 5
+        assert first == second
+        assert first[-1] == {"type": "done"}
+
+    @pytest.mark.asyncio
+    async def test_different_conversations_differ(self):
+        a = await _collect([{"role": "user", "content": "one"}])
+        b = await _collect([{"role": "user", "content": "two"}])
+
+        assert a != b
+
+    @pytest.mark.asyncio
+    async def test_thinking_tokens_come_first(self):
+        events = await _collect(
+            [{"role": "user", "content": "Hi"}], provider=FAST + ",thinking_tokens=3"
+        )
+
+        types = [e["type"] for e in events]
+        assert types[:3] == ["thinking"] * 3
+        assert types[3] == "text"
+
+
+class TestComplete:
+    @pytest.mark.asyncio
+    async def test_json_schema_response_is_valid_json(self):
+        schema = {
+            "type": "object",
+            "properties": {
+                "score": {"type": "integer", "minimum": 1},
+                "reasoning": {"type": "string"},
+                "level": {"type": "string", "enum": ["low", "high"]},
+            },
+        }
+
+        content, model = await complete(
+            [{"role": "user", "content": "Score this"}],
+            system="Grade it.",
+            response_format={
+                "type": "json_schema",
+                "json_schema": {"name": "score", "schema": schema},
+            },
+            provider=FAST,
+        )
+
+        assert json.loads(content) == {
+            "score": 1,
+            "reasoning": "Fake response.",
+            "level": "low",
+        }
+        assert model == FAST
+
+
+class TestErrorInjection:
+    @pytest.mark.asyncio
+    async def test_injected_errors_look_like_rate_limits(self):
+        with pytest.raises(FakeRateLimitError) as exc_info:
+            await fake_acompletion(FAST + ",error_rate=1", messages=[])
+
+        assert governor.is_retryable(exc_info.value)
@@ -0,0 +1,224 @@
+# core/modules/tests/test_governor.py
+"""Tests for the LLM concurrency governor."""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from core.modules import governor
+from core.modules.governor import Priority
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    governor._pools.clear()
+    governor._breakers.clear()
+    yield
+    governor._pools.clear()
+    governor._breakers.clear()
+
+
+async def _grant_order(pool, requests):
+    """Queue requests behind a full pool and return the order they're served in."""
+    order = []
+
+    async def waiter(priority, client_key, label):
+        await pool.acquire(priority, client_key)
+        order.append(label)
+
+    tasks = []
+    for priority, client_key, label in requests:
+        tasks.append(asyncio.create_task(waiter(priority, client_key, label)))
+        await asyncio.sleep(0)
+
+    for _ in requests:
+        pool.release(Priority.INTERACTIVE)
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestProviderPool:
+    @pytest.mark.asyncio
+    async def test_serves_higher_priority_first(self):
+        pool = governor._ProviderPool(1)
+        await pool.acquire(Priority.INTERACTIVE, "holder")
+
+        order = await _grant_order(
+            pool,
+            [
+                (Priority.BACKGROUND, "scoring", "background"),
+                (Priority.PROMPT_LAB, "user:1", "prompt_lab"),
+                (Priority.INTERACTIVE, "user:2", "chat"),
+            ],
+        )
+
+        assert order == ["chat", "prompt_lab", "background"]
+
+    @pytest.mark.asyncio
+    async def test_round_robins_between_users(self):
+        pool = governor._ProviderPool(1)
+        await pool.acquire(Priority.INTERACTIVE, "holder")
+
+        order = await _grant_order(
+            pool,
+            [
+                (Priority.INTERACTIVE, "user:1", "a1"),
+                (Priority.INTERACTIVE, "user:1", "a2"),
+                (Priority.INTERACTIVE, "user:1", "a3"),
+                (Priority.INTERACTIVE, "user:2", "b1"),
+            ],
+        )
+
+        assert order == ["a1", "b1", "a2", "a3"]
+
+    @pytest.mark.asyncio
+    async def test_background_keeps_room_for_chat(self):
+        pool = governor._ProviderPool(4)
+        await pool.acquire(Priority.BACKGROUND, "scoring")
+        await pool.acquire(Priority.BACKGROUND, "scoring")
+
+        blocked = asyncio.create_task(pool.acquire(Priority.BACKGROUND, "scoring"))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        await asyncio.wait_for(pool.acquire(Priority.INTERACTIVE, "user:1"), 1)
+        assert pool.in_flight == 3
+
+        pool.release(Priority.BACKGROUND)
+        await asyncio.wait_for(blocked, 1)
+
+    @pytest.mark.asyncio
+    async def test_reserves_slots_for_chat(self):
+        pool = governor._ProviderPool(4)
+        for _ in range(3):
+            await pool.acquire(Priority.PROMPT_LAB, "user:1")
+
+        blocked = asyncio.create_task(pool.acquire(Priority.PROMPT_LAB, "user:2"))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        await asyncio.wait_for(pool.acquire(Priority.INTERACTIVE, "user:3"), 1)
+        assert pool.in_flight == 4
+        blocked.cancel()
+
+    @pytest.mark.asyncio
+    @patch.object(governor, "LLM_QUEUE_TIMEOUT", 0.01)
+    async def test_waiting_chat_fails_fast_when_overloaded(self):
+        pool = governor._ProviderPool(1)
+        await pool.acquire(Priority.INTERACTIVE, "holder")
+
+        with pytest.raises(governor.LLMOverloadedError):
+            await pool.acquire(Priority.INTERACTIVE, "user:1")
+
+        pool.release(Priority.INTERACTIVE)
+        assert pool.in_flight == 0
+        await asyncio.wait_for(pool.acquire(Priority.INTERACTIVE, "user:2"), 1)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_skipped(self):
+        pool = governor._ProviderPool(1)
+        await pool.acquire(Priority.INTERACTIVE, "holder")
+        cancelled = asyncio.create_task(pool.acquire(Priority.INTERACTIVE, "user:1"))
+        waiting = asyncio.create_task(pool.acquire(Priority.INTERACTIVE, "user:2"))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        pool.release(Priority.INTERACTIVE)
+
+        await asyncio.wait_for(waiting, 1)
+        assert pool.in_flight == 1
+        assert pool.waiting() == 0
+
+
+async def _governed(model, call, priority=Priority.INTERACTIVE):
+    async with governor.governed_call(model, call, priority) as (result, used):
+        return result, used
+
+
+class TestGovernedCall:
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_calls(self):
+        calls = []
+
+        async def call(model):
+            calls.append(model)
+            if len(calls) < 3:
+                raise RateLimitError("slow down")
+            return "ok"
+
+        with patch("core.modules.governor.asyncio.sleep") as sleep:
+            result = await _governed("anthropic/a", call)
+
+        assert result == ("ok", "anthropic/a")
+        assert calls == ["anthropic/a"] * 3
+        assert sleep.call_count == 2
+        assert governor._pools["anthropic"].in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_other_errors(self):
+        async def call(model):
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            await _governed("anthropic/a", call)
+        assert governor._pools["anthropic"].in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_fails_over_when_circuit_opens(self):
+        calls = []
+
+        async def call(model):
+            calls.append(model)
+            if model == "anthropic/a":
+                raise RateLimitError("overloaded")
+            return "ok"
+
+        with (
+            patch.object(governor, "LLM_FALLBACK_PROVIDER", "openai/b"),
+            patch.object(governor, "BREAKER_THRESHOLD", 2),
+            patch("core.modules.governor.asyncio.sleep"),
+        ):
+            result = await _governed("anthropic/a", call)
+            # Later calls skip the open circuit entirely
+            assert governor.route_model("anthropic/a") == "openai/b"
+
+        assert result == ("ok", "openai/b")
+        assert calls == ["anthropic/a", "anthropic/a", "openai/b"]
+
+    @pytest.mark.asyncio
+    async def test_failover_holds_fallback_provider_slot(self):
+        """A failed-over call is capped by the fallback provider's pool."""
+        in_flight = {}
+
+        async def call(model):
+            if model == "anthropic/a":
+                raise RateLimitError("overloaded")
+            in_flight.update(
+                {name: pool.in_flight for name, pool in governor._pools.items()}
+            )
+            return "ok"
+
+        with (
+            patch.object(governor, "LLM_FALLBACK_PROVIDER", "openai/b"),
+            patch.object(governor, "BREAKER_THRESHOLD", 1),
+            patch("core.modules.governor.asyncio.sleep"),
+        ):
+            async with governor.governed_call("anthropic/a", call) as (_, model):
+                assert model == "openai/b"
+                # Still held while the caller reads the response
+                assert governor._pools["openai"].in_flight == 1
+
+        assert in_flight == {"anthropic": 0, "openai": 1}
+        assert governor._pools["openai"].in_flight == 0
+
+
+def test_is_retryable():
+    assert governor.is_retryable(RateLimitError())
+    assert not governor.is_retryable(ValueError())
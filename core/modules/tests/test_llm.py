@@ -144,3 +144,79 @@ async def test_stream_chat_passes_tools_to_provider():
         call_kwargs = mock_completion.call_args[1]
         assert call_kwargs["tools"] == tools
         assert call_kwargs["model"] == "gemini/gemini-1.5-pro"
+
+
+def test_build_messages_marks_cache_breakpoints_for_anthropic():
+    """System prompt and last message are cache breakpoints for Claude."""
+    from core.modules.llm import _build_messages
+
+    history = [
+        {"role": "user", "content": "Hi"},
+        {"role": "assistant", "content": "Hello"},
+        {"role": "user", "content": "Explain the article"},
+    ]
+
+    messages = _build_messages(
+        "Long article...", history, "anthropic/claude-x", cache_history=True
+    )
+
+    assert messages[0]["role"] == "system"
+    assert messages[0]["content"][0]["text"] == "Long article..."
+    assert messages[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert messages[1] == {"role": "user", "content": "Hi"}
+    assert messages[-1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    # Caller's history is not mutated
+    assert history[-1]["content"] == "Explain the article"
+
+
+def test_build_messages_one_shot_caches_system_prompt_only():
+    """One-shot calls (scoring) don't pay a cache write for their unique message."""
+    from core.modules.llm import _build_messages
+
+    messages = _build_messages(
+        "Rubric", [{"role": "user", "content": "Answer"}], "anthropic/claude-x"
+    )
+
+    assert messages[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert messages[1] == {"role": "user", "content": "Answer"}
+
+
+def test_build_messages_plain_for_other_providers():
+    """Providers without explicit cache breakpoints get plain messages."""
+    from core.modules.llm import _build_messages
+
+    messages = _build_messages(
+        "System", [{"role": "user", "content": "Hi"}], "gemini/gemini-2.0-flash"
+    )
+
+    assert messages == [
+        {"role": "system", "content": "System"},
+        {"role": "user", "content": "Hi"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_complete_records_prompt_cache_usage():
+    """Cache read/write token counts are captured from usage."""
+    from core.modules import llm
+
+    usage = MagicMock(spec=[])
+    usage.prompt_tokens = 1200
+    usage.cache_read_input_tokens = 1000
+    usage.cache_creation_input_tokens = 0
+
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = "{}"
+    mock_response.usage = usage
+
+    before = llm.get_prompt_cache_stats()
+    with patch("core.modules.llm.acompletion", AsyncMock(return_value=mock_response)):
+        await llm.complete(
+            messages=[{"role": "user", "content": "Hi"}],
+            system="System",
+            provider="anthropic/claude-x",
+        )
+    after = llm.get_prompt_cache_stats()
+
+    assert after["cache_read_tokens"] - before["cache_read_tokens"] == 1000
+    assert after["input_tokens"] - before["input_tokens"] == 1200
@@ -10,6 +10,7 @@ from core.modules.progress import (
     mark_content_complete,
     update_time_spent,
     get_module_progress,
+    get_completed_content_ids,
     claim_progress_records,
 )
 from core.database import get_transaction
@@ -384,6 +385,41 @@ async def test_get_module_progress(test_user_id):
     assert progress[lens_ids[1]]["completed_at"] is not None
 
 
+@pytest.mark.asyncio
+async def test_get_completed_content_ids(test_user_id):
+    """get_completed_content_ids should return only completed items."""
+    lens_ids = [uuid.uuid4() for _ in range(3)]
+
+    async with get_transaction() as conn:
+        await get_or_create_progress(
+            conn,
+            user_id=test_user_id,
+            anonymous_token=None,
+            content_id=lens_ids[0],
+            content_type="lens",
+            content_title="Lens 1",
+        )
+        await mark_content_complete(
+            conn,
+            user_id=test_user_id,
+            anonymous_token=None,
+            content_id=lens_ids[1],
+            content_type="lens",
+            content_title="Lens 2",
+            time_spent_s=100,
+        )
+
+    async with get_transaction() as conn:
+        completed = await get_completed_content_ids(
+            conn,
+            user_id=test_user_id,
+            anonymous_token=None,
+            content_ids=lens_ids,
+        )
+
+    assert completed == {lens_ids[1]}
+
+
 @pytest.mark.asyncio
 async def test_get_module_progress_empty_list(test_user_id):
     """get_module_progress with empty list should return empty dict."""
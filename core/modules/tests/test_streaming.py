@@ -0,0 +1,72 @@
+# core/modules/tests/test_streaming.py
+"""Tests for coalescing streamed LLM events."""
+
+import asyncio
+
+import pytest
+
+from core.modules.streaming import coalesce_events
+
+
+async def _collect(events, **kwargs):
+    return [event async for event in coalesce_events(events, **kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_merges_consecutive_text_deltas():
+    async def source():
+        for token in ["He", "llo", " wor", "ld"]:
+            yield {"type": "text", "content": token}
+        yield {"type": "done"}
+
+    events = await _collect(source())
+
+    assert events == [{"type": "text", "content": "Hello world"}, {"type": "done"}]
+
+
+@pytest.mark.asyncio
+async def test_keeps_order_across_event_types():
+    async def source():
+        yield {"type": "thinking", "content": "Hmm"}
+        yield {"type": "text", "content": "A"}
+        yield {"type": "tool_use", "name": "transition_to_next"}
+        yield {"type": "text", "content": "B"}
+
+    events = await _collect(source())
+
+    assert [e["type"] for e in events] == ["thinking", "text", "tool_use", "text"]
+
+
+@pytest.mark.asyncio
+async def test_flushes_after_interval():
+    """A pause in the stream flushes what has arrived so far."""
+
+    async def source():
+        yield {"type": "text", "content": "A"}
+        await asyncio.sleep(0.05)
+        yield {"type": "text", "content": "B"}
+
+    events = await _collect(source(), flush_interval=0.01)
+
+    assert [e["content"] for e in events] == ["A", "B"]
+
+
+@pytest.mark.asyncio
+async def test_caps_frame_size():
+    async def source():
+        for _ in range(10):
+            yield {"type": "text", "content": "x" * 10}
+
+    events = await _collect(source(), max_chars=30)
+
+    assert [len(e["content"]) for e in events] == [30, 30, 30, 10]
+
+
+@pytest.mark.asyncio
+async def test_reraises_source_errors():
+    async def source():
+        yield {"type": "text", "content": "partial"}
+        raise RuntimeError("provider error")
+
+    with pytest.raises(RuntimeError, match="provider error"):
+        await _collect(source())
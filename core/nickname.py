@@ -5,6 +5,8 @@ Discord-specific sync (update_nickname_in_discord) stays in nickname_cog.py
 since it needs bot access.
 """
 
+from datetime import datetime, timezone
+
 from .database import get_connection, get_transaction
 from .tables import users
 from sqlalchemy import select, update as sql_update
@@ -46,6 +48,7 @@ async def update_user_nickname(discord_id: str, nickname: str) -> bool:
         result = await conn.execute(
             sql_update(users)
             .where(users.c.discord_id == discord_id)
-            .values(nickname=nickname)
+            # updated_at feeds the facilitator timeline's change watermark
+            .values(nickname=nickname, updated_at=datetime.now(timezone.utc))
         )
     return result.rowcount > 0
@@ -3,9 +3,11 @@
 import os
 import re
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
+# sendgrid is imported on first send, keeping it out of app startup
+if TYPE_CHECKING:
+    from sendgrid import SendGridAPIClient
 
 
 SENDGRID_API_KEY = os.environ.get("SENDGRID_API_KEY")
@@ -15,7 +17,7 @@ FROM_NAME = os.environ.get("FROM_NAME", "Lens Academy")
 # Regex to match markdown links: [text](url)
 MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
 
-_client: SendGridAPIClient | None = None
+_client: "SendGridAPIClient | None" = None
 
 
 @dataclass
@@ -59,10 +61,12 @@ def markdown_to_plain_text(text: str) -> str:
     return MARKDOWN_LINK_PATTERN.sub(r"\1 (\2)", text)
 
 
-def _get_sendgrid_client() -> SendGridAPIClient | None:
+def _get_sendgrid_client() -> "SendGridAPIClient | None":
     """Get or create SendGrid client singleton."""
     global _client
     if _client is None and SENDGRID_API_KEY:
+        from sendgrid import SendGridAPIClient
+
         _client = SendGridAPIClient(SENDGRID_API_KEY)
     return _client
 
@@ -91,6 +95,8 @@ def send_email(
         print("Warning: SendGrid not configured (SENDGRID_API_KEY not set)")
         return False
 
+    from sendgrid.helpers.mail import Mail
+
     try:
         # Convert markdown links to appropriate formats
         plain_text = markdown_to_plain_text(body)
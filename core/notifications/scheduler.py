@@ -17,6 +17,9 @@ from apscheduler.jobstores.base import JobLookupError
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
+from core.database import in_background_pool
+from core.query_stats import track_queries
+
 logger = logging.getLogger(__name__)
 
 
@@ -208,6 +211,8 @@ def cancel_reminders(pattern: str) -> int:
 # =============================================================================
 
 
+@track_queries("job reminder")
+@in_background_pool
 async def _execute_reminder(meeting_id: int, reminder_type: str) -> None:
     """
     Execute a reminder with fresh context from DB.
@@ -337,6 +342,8 @@ def schedule_guest_sync(
     )
 
 
+@track_queries("job guest_sync")
+@in_background_pool
 async def _execute_guest_sync(group_id: int) -> None:
     """
     Run sync_group_discord_permissions for a guest visit.
@@ -668,6 +675,8 @@ def schedule_sync_retry(
 MAX_SYNC_RETRY_ATTEMPTS = 12  # ~6 hours with exponential backoff (caps at 30min)
 
 
+@track_queries("job sync_retry")
+@in_background_pool
 async def _execute_sync_retry(
     sync_type: str,
     group_id: int,
@@ -6,14 +6,24 @@ a facilitator-only workbench for iterating on AI tutor system prompts.
 
 Prompt Lab calls llm.py directly -- it does not modify chat.py or scoring.py.
 Fixtures are stored as JSON files in the repo (version-controlled, curated).
+Batch runs (fixtures x prompt variants) are stored in promptlab_runs.
 """
 
+from .batch import MAX_BATCH_ITEMS, PromptVariant, build_batch_items, run_batch
 from .fixtures import list_fixtures, load_fixture
 from .regenerate import regenerate_response, continue_conversation
+from .runs import get_batch_run, list_batch_runs, save_batch_run
 
 __all__ = [
     "list_fixtures",
     "load_fixture",
     "regenerate_response",
     "continue_conversation",
+    "MAX_BATCH_ITEMS",
+    "PromptVariant",
+    "build_batch_items",
+    "run_batch",
+    "save_batch_run",
+    "list_batch_runs",
+    "get_batch_run",
 ]
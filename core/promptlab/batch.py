@@ -0,0 +1,175 @@
+"""Batch evaluation for the Prompt Lab.
+
+Runs every conversation in a set of fixtures against several system prompt
+variants at once. Generations run concurrently (bounded by
+BATCH_CONCURRENCY and the LLM governor), so a full sweep takes roughly as
+long as the slowest single generation instead of the sum of all of them.
+
+Events from all generations are multiplexed into one stream, each tagged
+with the index of its item in the batch manifest.
+"""
+
+import asyncio
+import os
+from typing import AsyncIterator, NotRequired, TypedDict
+
+from core.modules.prompts import assemble_chat_prompt
+from core.modules.streaming import coalesce_events
+
+from .fixtures import Fixture
+from .regenerate import regenerate_response
+
+# Generations a single batch runs at once
+BATCH_CONCURRENCY = int(os.environ.get("PROMPTLAB_BATCH_CONCURRENCY", "8"))
+
+# Max fixture conversations x variants in one batch
+MAX_BATCH_ITEMS = 200
+
+
+class PromptVariant(TypedDict):
+    label: str
+    base_prompt: str
+    # Replaces each fixture section's instructions when set
+    instructions: NotRequired[str | None]
+
+
+class BatchItem(TypedDict):
+    fixture: str
+    section: str
+    conversation: str
+    variant: str
+    messages: list[dict]
+    system_prompt: str
+
+
+class BatchResult(TypedDict):
+    fixture: str
+    section: str
+    conversation: str
+    variant: str
+    response: str
+    thinking: str
+    error: str | None
+
+
+def _messages_to_regenerate(messages: list[dict]) -> list[dict]:
+    """Conversation up to (not including) its last assistant reply."""
+    for i in range(len(messages) - 1, -1, -1):
+        if messages[i]["role"] == "assistant":
+            return messages[:i]
+    return messages
+
+
+def build_batch_items(
+    fixtures: list[Fixture], variants: list[PromptVariant]
+) -> list[BatchItem]:
+    """Expand fixtures x variants into one item per conversation and variant.
+
+    Each item regenerates the conversation's last assistant reply. Items for
+    the same conversation are adjacent, in variant order.
+    """
+    items: list[BatchItem] = []
+    for fixture in fixtures:
+        for section in fixture["sections"]:
+            for conversation in section["conversations"]:
+                messages = _messages_to_regenerate(conversation["messages"])
+                for variant in variants:
+                    instructions = (
+                        variant.get("instructions") or section["instructions"]
+                    )
+                    items.append(
+                        BatchItem(
+                            fixture=fixture["name"],
+                            section=section["name"],
+                            conversation=conversation["label"],
+                            variant=variant["label"],
+                            messages=messages,
+                            system_prompt=assemble_chat_prompt(
+                                variant["base_prompt"],
+                                instructions or None,
+                                section["context"] or None,
+                            ),
+                        )
+                    )
+    return items
+
+
+async def run_batch(
+    items: list[BatchItem],
+    enable_thinking: bool = True,
+    effort: str = "low",
+    provider: str | None = None,
+    client_key: str | None = None,
+    concurrency: int = BATCH_CONCURRENCY,
+) -> AsyncIterator[dict]:
+    """
+    Generate responses for all batch items concurrently.
+
+    Args:
+        items: Items from build_batch_items()
+        enable_thinking: Whether to request thinking from the LLM
+        effort: Thinking effort level
+        provider: LLM provider string. If None, uses DEFAULT_PROVIDER.
+        client_key: Identifies the facilitator for fair LLM queuing
+        concurrency: Max generations in flight
+
+    Yields:
+        Events from all items as they arrive, each with an "item" index:
+        - {"type": "thinking"|"text", "item": int, "content": str}
+        - {"type": "error", "item": int, "message": str}
+        - {"type": "item_done", "item": int, "result": BatchResult}
+        Returns after every item's item_done event.
+    """
+    queue: asyncio.Queue[dict] = asyncio.Queue()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_item(index: int, item: BatchItem) -> None:
+        parts = {"text": [], "thinking": []}
+        error = None
+        async with semaphore:
+            events = regenerate_response(
+                messages=item["messages"],
+                system_prompt=item["system_prompt"],
+                enable_thinking=enable_thinking,
+                effort=effort,
+                provider=provider,
+                client_key=client_key,
+            )
+            try:
+                async for event in coalesce_events(events):
+                    if event["type"] == "done":
+                        continue
+                    if event["type"] in parts:
+                        parts[event["type"]].append(event["content"])
+                    elif event["type"] == "error":
+                        error = event["message"]
+                    queue.put_nowait({**event, "item": index})
+            except Exception as e:
+                # Every item must report item_done, or the batch never ends
+                error = str(e)
+                queue.put_nowait({"type": "error", "item": index, "message": error})
+
+        result = BatchResult(
+            fixture=item["fixture"],
+            section=item["section"],
+            conversation=item["conversation"],
+            variant=item["variant"],
+            response="".join(parts["text"]),
+            thinking="".join(parts["thinking"]),
+            error=error,
+        )
+        queue.put_nowait({"type": "item_done", "item": index, "result": result})
+
+    tasks = [
+        asyncio.create_task(run_item(index, item)) for index, item in enumerate(items)
+    ]
+    try:
+        remaining = len(items)
+        while remaining:
+            event = await queue.get()
+            if event["type"] == "item_done":
+                remaining -= 1
+            yield event
+    finally:
+        for task in tasks:
+            task.cancel()
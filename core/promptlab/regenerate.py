@@ -9,6 +9,7 @@ Per INFRA-04: does NOT import database modules or write to any tables.
 
 from typing import AsyncIterator
 
+from core.modules.governor import Priority
 from core.modules.llm import stream_chat
 
 
@@ -19,6 +20,7 @@ async def regenerate_response(
     effort: str = "low",
     provider: str | None = None,
     max_tokens: int = 16384,
+    client_key: str | None = None,
 ) -> AsyncIterator[dict]:
     """
     Regenerate an AI response with a custom system prompt.
@@ -39,6 +41,7 @@ async def regenerate_response(
         effort: Thinking effort level — "low", "medium", or "high".
         provider: LLM provider string. If None, uses DEFAULT_PROVIDER.
         max_tokens: Maximum tokens in response.
+        client_key: Identifies the facilitator for fair LLM queuing.
 
     Yields:
         Normalized events:
@@ -58,6 +61,8 @@ async def regenerate_response(
             max_tokens=max_tokens,
             thinking=enable_thinking,
             effort=effort,
+            priority=Priority.PROMPT_LAB,
+            client_key=client_key,
         ):
             yield event
     except Exception as e:
@@ -72,6 +77,7 @@ async def continue_conversation(
     effort: str = "low",
     provider: str | None = None,
     max_tokens: int = 16384,
+    client_key: str | None = None,
 ) -> AsyncIterator[dict]:
     """
     Continue a conversation with a follow-up message.
@@ -87,6 +93,7 @@ async def continue_conversation(
         effort: Thinking effort level — "low", "medium", or "high".
         provider: LLM provider string.
         max_tokens: Maximum tokens in response.
+        client_key: Identifies the facilitator for fair LLM queuing.
 
     Yields:
         Same normalized events as regenerate_response().
@@ -98,5 +105,6 @@ async def continue_conversation(
         effort=effort,
         provider=provider,
         max_tokens=max_tokens,
+        client_key=client_key,
     ):
         yield event
@@ -0,0 +1,65 @@
+"""Storage for Prompt Lab batch runs.
+
+The only Prompt Lab code that writes to the database: batch results are
+kept so facilitators can diff prompt variants side by side later.
+Interactive regenerate/continue stay stateless (see regenerate.py).
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from core.tables import promptlab_runs
+
+
+async def save_batch_run(
+    conn: AsyncConnection,
+    *,
+    user_id: int | None,
+    config: dict,
+    results: list[dict],
+    status: str,
+) -> int:
+    """Store a finished (or cancelled) batch run. Returns its run_id."""
+    result = await conn.execute(
+        insert(promptlab_runs)
+        .values(
+            user_id=user_id,
+            config=config,
+            results=results,
+            status=status,
+            completed_at=datetime.now(timezone.utc),
+        )
+        .returning(promptlab_runs.c.run_id)
+    )
+    return result.scalar_one()
+
+
+async def list_batch_runs(
+    conn: AsyncConnection, *, user_id: int, limit: int = 50
+) -> list[dict]:
+    """Most recent runs started by a user, without their results."""
+    result = await conn.execute(
+        select(
+            promptlab_runs.c.run_id,
+            promptlab_runs.c.config,
+            promptlab_runs.c.status,
+            promptlab_runs.c.created_at,
+            promptlab_runs.c.completed_at,
+            func.jsonb_array_length(promptlab_runs.c.results).label("result_count"),
+        )
+        .where(promptlab_runs.c.user_id == user_id)
+        .order_by(promptlab_runs.c.created_at.desc())
+        .limit(limit)
+    )
+    return [dict(row._mapping) for row in result]
+
+
+async def get_batch_run(conn: AsyncConnection, run_id: int) -> dict | None:
+    """A run with its full results, or None."""
+    result = await conn.execute(
+        select(promptlab_runs).where(promptlab_runs.c.run_id == run_id)
+    )
+    row = result.fetchone()
+    return dict(row._mapping) if row else None
@@ -0,0 +1,121 @@
+"""Tests for Prompt Lab batch evaluation."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from core.promptlab.batch import build_batch_items, run_batch
+
+FIXTURE = {
+    "name": "Fixture",
+    "module": "test-module",
+    "description": "",
+    "sections": [
+        {
+            "name": "Section",
+            "instructions": "Section instructions",
+            "context": "Section context",
+            "conversations": [
+                {
+                    "label": "Convo",
+                    "messages": [
+                        {"role": "user", "content": "Hello"},
+                        {"role": "assistant", "content": "Hi"},
+                        {"role": "user", "content": "What is X?"},
+                        {"role": "assistant", "content": "X is a concept."},
+                    ],
+                }
+            ],
+        }
+    ],
+}
+
+VARIANTS = [
+    {"label": "current", "base_prompt": "Base A"},
+    {"label": "new", "base_prompt": "Base B", "instructions": "New instructions"},
+]
+
+
+class TestBuildBatchItems:
+    def test_one_item_per_conversation_and_variant(self):
+        items = build_batch_items([FIXTURE], VARIANTS)
+
+        assert [item["variant"] for item in items] == ["current", "new"]
+        assert items[0]["fixture"] == "Fixture"
+        assert items[0]["conversation"] == "Convo"
+
+    def test_regenerates_last_assistant_reply(self):
+        items = build_batch_items([FIXTURE], VARIANTS)
+
+        assert items[0]["messages"][-1] == {"role": "user", "content": "What is X?"}
+
+    def test_variant_instructions_override_section(self):
+        items = build_batch_items([FIXTURE], VARIANTS)
+
+        assert items[0]["system_prompt"].startswith("Base A")
+        assert "Section instructions" in items[0]["system_prompt"]
+        assert "New instructions" in items[1]["system_prompt"]
+        assert "Section instructions" not in items[1]["system_prompt"]
+        assert "Section context" in items[1]["system_prompt"]
+
+
+class TestRunBatch:
+    @pytest.mark.asyncio
+    async def test_runs_items_concurrently(self):
+        items = build_batch_items([FIXTURE], VARIANTS)
+        running = 0
+        peak = 0
+
+        async def fake_regenerate(*, system_prompt, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            yield {"type": "text", "content": system_prompt[:6]}
+            running -= 1
+            yield {"type": "done"}
+
+        with patch("core.promptlab.batch.regenerate_response", fake_regenerate):
+            events = [event async for event in run_batch(items)]
+
+        assert peak == 2
+        done = {e["item"]: e["result"] for e in events if e["type"] == "item_done"}
+        assert done[0]["response"] == "Base A"
+        assert done[1]["response"] == "Base B"
+        assert done[1]["variant"] == "new"
+        assert all(e["type"] != "done" for e in events)
+
+    @pytest.mark.asyncio
+    async def test_respects_concurrency_limit(self):
+        items = build_batch_items([FIXTURE], VARIANTS)
+        running = 0
+        peak = 0
+
+        async def fake_regenerate(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            yield {"type": "done"}
+
+        with patch("core.promptlab.batch.regenerate_response", fake_regenerate):
+            events = [event async for event in run_batch(items, concurrency=1)]
+
+        assert peak == 1
+        assert sum(e["type"] == "item_done" for e in events) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_item_still_completes(self):
+        items = build_batch_items([FIXTURE], VARIANTS[:1])
+
+        async def fake_regenerate(**kwargs):
+            raise RuntimeError("boom")
+            yield
+
+        with patch("core.promptlab.batch.regenerate_response", fake_regenerate):
+            events = [event async for event in run_batch(items)]
+
+        assert events[-1]["type"] == "item_done"
+        assert events[-1]["result"]["error"] == "boom"
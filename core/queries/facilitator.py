@@ -2,7 +2,8 @@
 
 from typing import Any
 
-from sqlalchemy import select, func, literal_column
+from sqlalchemy import select, func, literal_column, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from ..tables import (
@@ -235,170 +236,154 @@ async def get_user_meeting_attendance(
     return rows
 
 
-async def get_group_completion_data(
+async def get_group_timeline_data(
     conn: AsyncConnection, group_id: int
-) -> tuple[
-    dict[int, set[str]],
-    dict[int, dict[int, bool]],
-    set[int],
-    dict[int, dict[int, str]],
-    dict[int, set[int]],
-]:
-    """Get bulk completion and attendance data for all active participants.
+) -> dict[str, Any]:
+    """Get everything the group timeline shows, in one round trip.
 
-    Returns:
-        (completions, attendance, past_meeting_numbers, rsvps, guest_elsewhere)
-        - completions: user_id -> set of completed content_id strings
-        - attendance: user_id -> {meeting_number: attended_bool}
-        - past_meeting_numbers: set of meeting numbers that have occurred
-        - rsvps: user_id -> {meeting_number: rsvp_status_str}
-        - guest_elsewhere: user_id -> set of meeting_numbers where they're visiting another group
-    """
-    # Completed content_ids per member
-    comp_result = await conn.execute(
-        select(
-            user_content_progress.c.user_id,
-            user_content_progress.c.content_id,
-        )
-        .join(groups_users, user_content_progress.c.user_id == groups_users.c.user_id)
-        .where(
-            (groups_users.c.group_id == group_id)
-            & (groups_users.c.role == "participant")
-            & (groups_users.c.status == "active")
-            & (user_content_progress.c.completed_at.isnot(None))
-        )
-    )
-    completions: dict[int, set[str]] = {}
-    for row in comp_result:
-        completions.setdefault(row.user_id, set()).add(str(row.content_id))
-
-    # All meetings for this group (need all for RSVPs, past subset for attendance)
-    all_mtg_result = await conn.execute(
-        select(
-            meetings.c.meeting_id, meetings.c.meeting_number, meetings.c.scheduled_at
-        ).where(
-            (meetings.c.group_id == group_id) & (meetings.c.meeting_number.isnot(None))
-        )
-    )
-    all_mtg_rows = list(all_mtg_result)
-    all_meeting_id_to_num = {r.meeting_id: r.meeting_number for r in all_mtg_rows}
-    past_meeting_numbers = {
-        r.meeting_number
-        for r in all_mtg_rows
-        if r.scheduled_at < func.now().compile().params.get("now_1", r.scheduled_at)
-    }
-
-    # Determine past meetings by comparing scheduled_at
-    from datetime import datetime, timezone
-
-    now = datetime.now(timezone.utc)
-    past_meeting_numbers = {
-        r.meeting_number for r in all_mtg_rows if r.scheduled_at < now
-    }
-    past_meeting_ids = {r.meeting_id for r in all_mtg_rows if r.scheduled_at < now}
-
-    # Attendance (past only) + RSVP (all meetings) per member
-    attendance: dict[int, dict[int, bool]] = {}
-    rsvps: dict[int, dict[int, str]] = {}
-    if all_mtg_rows:
-        att_result = await conn.execute(
-            select(
-                attendances.c.user_id,
-                attendances.c.meeting_id,
-                attendances.c.checked_in_at,
-                attendances.c.rsvp_status,
-            ).where(
-                attendances.c.meeting_id.in_([r.meeting_id for r in all_mtg_rows])
-                & (attendances.c.is_guest.is_(False))
-            )
-        )
-        for row in att_result:
-            mnum = all_meeting_id_to_num.get(row.meeting_id)
-            if mnum is not None:
-                # Only record attendance for past meetings
-                if row.meeting_id in past_meeting_ids:
-                    attendance.setdefault(row.user_id, {})[mnum] = (
-                        row.checked_in_at is not None
-                    )
-                if row.rsvp_status:
-                    rsvps.setdefault(row.user_id, {})[mnum] = row.rsvp_status
-
-    # Guest visits: which members are visiting another group for a given meeting_number
-    member_user_ids = select(groups_users.c.user_id).where(
-        (groups_users.c.group_id == group_id)
-        & (groups_users.c.role == "participant")
-        & (groups_users.c.status == "active")
-    )
-    guest_visit_result = await conn.execute(
-        select(attendances.c.user_id, meetings.c.meeting_number)
-        .join(meetings, attendances.c.meeting_id == meetings.c.meeting_id)
-        .where(
-            attendances.c.is_guest.is_(True)
-            & attendances.c.user_id.in_(member_user_ids)
-            & meetings.c.meeting_number.isnot(None)
-        )
-    )
-    guest_elsewhere: dict[int, set[int]] = {}
-    for row in guest_visit_result:
-        guest_elsewhere.setdefault(row.user_id, set()).add(row.meeting_number)
-
-    return completions, attendance, past_meeting_numbers, rsvps, guest_elsewhere
-
-
-async def get_group_time_and_chat_data(
-    conn: AsyncConnection, group_id: int
-) -> tuple[dict[int, dict[str, int]], dict[int, dict[str, int]]]:
-    """Get bulk time-spent and chat-message-count data for all active participants.
+    One composed query: each CTE aggregates one source over the active
+    participants, and the final select folds them into JSON per member.
 
     Returns:
-        (time_data, chat_data)
-        - time_data: user_id -> {content_id_str: total_time_spent_s}
-        - chat_data: user_id -> {content_id_str: user_message_count}
+        {"past_meetings": set of meeting numbers that have occurred,
+         "members": list (ordered by name) of
+            - user_id, name
+            - completed_ids: completed content_id strings
+            - section_times: {content_id_str: total_time_spent_s} (non-zero only)
+            - chat_counts: {content_id_str: user_message_count}
+            - meetings: {meeting_number_str: "attended"|"missed"} (past only)
+            - rsvps: {meeting_number_str: rsvp_status}
+            - guest_elsewhere: meeting_number strs where they visit another group}
+        Attendance and RSVPs exclude guest records in this group.
     """
-    # Time spent per user per content_id
-    time_result = await conn.execute(
-        select(
-            user_content_progress.c.user_id,
-            user_content_progress.c.content_id,
-            user_content_progress.c.total_time_spent_s,
-        )
-        .join(groups_users, user_content_progress.c.user_id == groups_users.c.user_id)
-        .where(
-            (groups_users.c.group_id == group_id)
-            & (groups_users.c.role == "participant")
-            & (groups_users.c.status == "active")
-            & (user_content_progress.c.total_time_spent_s > 0)
-        )
-    )
-    time_data: dict[int, dict[str, int]] = {}
-    for row in time_result:
-        time_data.setdefault(row.user_id, {})[str(row.content_id)] = (
-            row.total_time_spent_s
-        )
-
-    # Chat user-message counts per user per content_id
-    from sqlalchemy import text
-
-    chat_result = await conn.execute(
-        text("""
-            SELECT cs.user_id, cs.content_id::text, COUNT(*) as msg_count
-            FROM chat_sessions cs
-            CROSS JOIN LATERAL jsonb_array_elements(cs.messages) msg
-            JOIN groups_users gu ON gu.user_id = cs.user_id
+    query = text("""
+        WITH members AS (
+            SELECT gu.user_id, coalesce(u.nickname, u.discord_username) AS name
+            FROM groups_users gu
+            JOIN users u USING (user_id)
             WHERE gu.group_id = :group_id
             AND gu.role = 'participant'
             AND gu.status = 'active'
-            AND cs.content_id IS NOT NULL
-            AND msg.value->>'role' = 'user'
-            GROUP BY cs.user_id, cs.content_id
+        ),
+        group_meetings AS (
+            SELECT meeting_id, meeting_number, scheduled_at < now() AS is_past
+            FROM meetings
+            WHERE group_id = :group_id
+            AND meeting_number IS NOT NULL
+        ),
+        progress AS (
+            SELECT p.user_id,
+                jsonb_agg(p.content_id::text)
+                    FILTER (WHERE p.completed_at IS NOT NULL) AS completed_ids,
+                jsonb_object_agg(p.content_id::text, p.total_time_spent_s)
+                    FILTER (WHERE p.total_time_spent_s > 0) AS section_times
+            FROM user_content_progress p
+            JOIN members USING (user_id)
+            GROUP BY p.user_id
+        ),
+        chats AS (
+            SELECT user_id, jsonb_object_agg(content_id, msg_count) AS chat_counts
+            FROM (
+                SELECT cs.user_id, cs.content_id::text AS content_id,
+                    count(*) AS msg_count
+                FROM chat_sessions cs
+                JOIN members USING (user_id)
+                CROSS JOIN LATERAL jsonb_array_elements(cs.messages) msg
+                WHERE cs.content_id IS NOT NULL
+                AND msg.value->>'role' = 'user'
+                GROUP BY cs.user_id, cs.content_id
+            ) per_content
+            GROUP BY user_id
+        ),
+        meeting_status AS (
+            SELECT a.user_id,
+                jsonb_object_agg(
+                    gm.meeting_number::text,
+                    CASE WHEN a.checked_in_at IS NULL THEN 'missed'
+                        ELSE 'attended' END
+                ) FILTER (WHERE gm.is_past) AS meetings,
+                jsonb_object_agg(gm.meeting_number::text, a.rsvp_status)
+                    FILTER (WHERE a.rsvp_status IS NOT NULL) AS rsvps
+            FROM attendances a
+            JOIN group_meetings gm USING (meeting_id)
+            JOIN members USING (user_id)
+            WHERE a.is_guest IS FALSE
+            GROUP BY a.user_id
+        ),
+        guest_visits AS (
+            SELECT a.user_id,
+                jsonb_agg(DISTINCT m.meeting_number::text) AS guest_elsewhere
+            FROM attendances a
+            JOIN meetings m USING (meeting_id)
+            JOIN members USING (user_id)
+            WHERE a.is_guest IS TRUE
+            AND m.meeting_number IS NOT NULL
+            GROUP BY a.user_id
+        )
+        SELECT
+            (SELECT coalesce(jsonb_agg(meeting_number), '[]')
+                FROM group_meetings WHERE is_past) AS past_meetings,
+            (SELECT coalesce(jsonb_agg(jsonb_build_object(
+                    'user_id', m.user_id,
+                    'name', m.name,
+                    'completed_ids', coalesce(p.completed_ids, '[]'),
+                    'section_times', coalesce(p.section_times, '{}'),
+                    'chat_counts', coalesce(c.chat_counts, '{}'),
+                    'meetings', coalesce(s.meetings, '{}'),
+                    'rsvps', coalesce(s.rsvps, '{}'),
+                    'guest_elsewhere', coalesce(g.guest_elsewhere, '[]')
+                ) ORDER BY m.name), '[]')
+                FROM members m
+                LEFT JOIN progress p USING (user_id)
+                LEFT JOIN chats c USING (user_id)
+                LEFT JOIN meeting_status s USING (user_id)
+                LEFT JOIN guest_visits g USING (user_id)) AS members
+    """).columns(past_meetings=JSONB, members=JSONB)
+    result = await conn.execute(query, {"group_id": group_id})
+    row = result.one()
+    return {"past_meetings": set(row.past_meetings), "members": row.members}
+
+
+async def get_group_dashboard_watermark(conn: AsyncConnection, group_id: int) -> tuple:
+    """Get a change watermark for the group timeline dashboard.
+
+    One round trip of small aggregates over the active participants' rows
+    (all on indexed user_id / group_id columns). The tuple changes whenever
+    anything shown on the timeline could have: membership, names, progress
+    (including heartbeats), chat activity, attendance/RSVPs, and meetings
+    moving into the past. Counts catch deletions the max timestamps miss.
+    Names are covered by users.updated_at, so every update to a user's
+    nickname or username must set it (core.queries.users.update_user does).
+    core/queries/tests/test_timeline_watermark.py runs the writers of
+    timeline data against this; add new writers there.
+    """
+    result = await conn.execute(
+        text("""
+            WITH members AS (
+                SELECT user_id FROM groups_users
+                WHERE group_id = :group_id
+                AND role = 'participant'
+                AND status = 'active'
+            )
+            SELECT
+                (SELECT count(*) FROM members),
+                (SELECT max(updated_at) FROM groups_users
+                    WHERE group_id = :group_id),
+                (SELECT max(u.updated_at) FROM users u JOIN members USING (user_id)),
+                (SELECT row(count(*), max(greatest(
+                        p.started_at, p.last_heartbeat_at, p.completed_at)))::text
+                    FROM user_content_progress p JOIN members USING (user_id)),
+                (SELECT row(count(*), max(cs.last_active_at))::text
+                    FROM chat_sessions cs JOIN members USING (user_id)),
+                (SELECT row(count(*), max(greatest(
+                        a.created_at, a.rsvp_at, a.checked_in_at)))::text
+                    FROM attendances a JOIN members USING (user_id)),
+                (SELECT row(count(*), count(*) FILTER (WHERE scheduled_at < now()))::text
+                    FROM meetings WHERE group_id = :group_id)
         """),
         {"group_id": group_id},
     )
-    chat_data: dict[int, dict[str, int]] = {}
-    for row in chat_result:
-        chat_data.setdefault(row.user_id, {})[str(row.content_id)] = row.msg_count
-
-    return time_data, chat_data
+    return tuple(result.one())
 
 
 async def is_user_in_group(conn: AsyncConnection, user_id: int, group_id: int) -> bool:
@@ -1,13 +1,14 @@
 """Group-related database queries using SQLAlchemy Core."""
 
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncConnection
 
-from ..enums import GroupUserStatus
+from ..enums import GroupUserRole, GroupUserStatus, RSVPStatus
 from ..modules.course_loader import load_course
-from ..tables import cohorts, groups, groups_users, users
+from ..tables import attendances, cohorts, groups, groups_users, meetings, users
 
 
 async def create_group(
@@ -372,3 +373,101 @@ async def get_cohort_groups_summary(
     )
 
     return [dict(row) for row in result.mappings()]
+
+
+async def get_cohort_sync_state(
+    conn: AsyncConnection,
+    cohort_id: int,
+) -> dict[str, Any] | None:
+    """
+    Load everything the sync planner needs for a cohort in a few set-based queries.
+
+    Guests are included using the same access window as
+    sync_group_discord_permissions (6 days before -> 3 days after a meeting).
+
+    Returns:
+        {
+            "cohort": {"cohort_id", "cohort_name", "discord_category_id",
+                       "discord_cohort_channel_id"},
+            "groups": [
+                {"group_id", "group_name", "status", "discord_text_channel_id",
+                 "discord_voice_channel_id", "discord_role_id",
+                 "member_discord_ids": set[str],
+                 "facilitator_discord_ids": set[str],
+                 "guest_discord_ids": set[str],
+                 "member_count": int},
+                ...
+            ],
+        }
+        or None if the cohort doesn't exist.
+    """
+    cohort_result = await conn.execute(
+        select(
+            cohorts.c.cohort_id,
+            cohorts.c.cohort_name,
+            cohorts.c.discord_category_id,
+            cohorts.c.discord_cohort_channel_id,
+        ).where(cohorts.c.cohort_id == cohort_id)
+    )
+    cohort = cohort_result.mappings().first()
+    if not cohort:
+        return None
+
+    groups_result = await conn.execute(
+        select(
+            groups.c.group_id,
+            groups.c.group_name,
+            groups.c.status,
+            groups.c.discord_text_channel_id,
+            groups.c.discord_voice_channel_id,
+            groups.c.discord_role_id,
+        )
+        .where(groups.c.cohort_id == cohort_id)
+        .order_by(groups.c.group_id)
+    )
+    groups_by_id: dict[int, dict[str, Any]] = {}
+    for row in groups_result.mappings():
+        group = dict(row)
+        group["member_count"] = 0
+        group["member_discord_ids"] = set()
+        group["facilitator_discord_ids"] = set()
+        group["guest_discord_ids"] = set()
+        groups_by_id[group["group_id"]] = group
+
+    if not groups_by_id:
+        return {"cohort": dict(cohort), "groups": []}
+
+    members_result = await conn.execute(
+        select(groups_users.c.group_id, groups_users.c.role, users.c.discord_id)
+        .join(users, users.c.user_id == groups_users.c.user_id)
+        .join(groups, groups.c.group_id == groups_users.c.group_id)
+        .where(groups.c.cohort_id == cohort_id)
+        .where(groups_users.c.status == GroupUserStatus.active)
+    )
+    for row in members_result.mappings():
+        group = groups_by_id[row["group_id"]]
+        group["member_count"] += 1
+        if not row["discord_id"]:
+            continue
+        group["member_discord_ids"].add(row["discord_id"])
+        if row["role"] == GroupUserRole.facilitator:
+            group["facilitator_discord_ids"].add(row["discord_id"])
+
+    now = datetime.now(timezone.utc)
+    guests_result = await conn.execute(
+        select(meetings.c.group_id, users.c.discord_id)
+        .join(attendances, attendances.c.meeting_id == meetings.c.meeting_id)
+        .join(users, users.c.user_id == attendances.c.user_id)
+        .join(groups, groups.c.group_id == meetings.c.group_id)
+        .where(groups.c.cohort_id == cohort_id)
+        .where(attendances.c.is_guest.is_(True))
+        .where(attendances.c.rsvp_status == RSVPStatus.attending)
+        .where(meetings.c.scheduled_at > now - timedelta(days=3))
+        .where(meetings.c.scheduled_at < now + timedelta(days=6))
+        .where(users.c.discord_id.isnot(None))
+        .distinct()
+    )
+    for row in guests_result.mappings():
+        groups_by_id[row["group_id"]]["guest_discord_ids"].add(row["discord_id"])
+
+    return {"cohort": dict(cohort), "groups": list(groups_by_id.values())}
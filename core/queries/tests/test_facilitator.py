@@ -3,6 +3,8 @@
 Uses real database with rollback fixture (unit+1 integration tests).
 """
 
+import uuid
+
 import pytest
 from datetime import date, timedelta
 
@@ -20,12 +22,14 @@ from core.tables import (
     cohorts,
     groups,
     groups_users,
+    user_content_progress,
 )
 from core.queries.facilitator import (
     is_admin,
     get_facilitator_group_ids,
     get_accessible_groups,
     can_access_group,
+    get_group_dashboard_watermark,
 )
 
 
@@ -295,6 +299,42 @@ class TestGetAccessibleGroups:
         assert other_group["group_id"] not in group_ids
 
 
+class TestGetGroupDashboardWatermark:
+    """Tests for the group timeline change watermark."""
+
+    @pytest.mark.asyncio
+    async def test_stable_without_changes(self, db_conn):
+        cohort = await create_test_cohort(db_conn)
+        group = await create_test_group(db_conn, cohort["cohort_id"])
+
+        first = await get_group_dashboard_watermark(db_conn, group["group_id"])
+        second = await get_group_dashboard_watermark(db_conn, group["group_id"])
+
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_changes_with_members_and_progress(self, db_conn):
+        user = await create_test_user(db_conn, "watermark_user")
+        cohort = await create_test_cohort(db_conn)
+        group = await create_test_group(db_conn, cohort["cohort_id"])
+
+        empty = await get_group_dashboard_watermark(db_conn, group["group_id"])
+        await add_user_to_group(db_conn, user["user_id"], group["group_id"])
+        joined = await get_group_dashboard_watermark(db_conn, group["group_id"])
+        await db_conn.execute(
+            insert(user_content_progress).values(
+                user_id=user["user_id"],
+                content_id=uuid.uuid4(),
+                content_type="lens",
+                content_title="Lens",
+            )
+        )
+        progressed = await get_group_dashboard_watermark(db_conn, group["group_id"])
+
+        assert empty != joined
+        assert joined != progressed
+
+
 # ============================================================================
 # Progress Aggregation Tests - REMOVED
 # ============================================================================
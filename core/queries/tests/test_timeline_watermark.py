@@ -0,0 +1,202 @@
+"""Writers of facilitator timeline data must move its change watermark.
+
+The timeline response is cached until get_group_dashboard_watermark()
+changes, so a writer that changes what get_group_timeline_data() returns
+without touching a column the watermark reads leaves facilitators looking
+at stale data. Each test runs a real writer in its own committed
+transaction (now() is constant within one) and checks both values.
+"""
+
+import asyncio
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, insert
+
+from core.attendance import record_voice_attendance
+from core.database import close_engine, get_connection, get_transaction
+from core.modules.chat_sessions import add_chat_message, get_or_create_chat_session
+from core.modules.progress import (
+    get_or_create_progress,
+    mark_content_complete,
+    update_time_spent,
+)
+from core.nickname import update_user_nickname
+from core.queries.facilitator import (
+    get_group_dashboard_watermark,
+    get_group_timeline_data,
+)
+from core.tables import cohorts, groups, groups_users, meetings, users
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def cleanup_engine():
+    yield
+    await close_engine()
+
+
+@pytest_asyncio.fixture
+async def group():
+    """A group with one participant and a meeting that started 5 minutes ago."""
+    discord_id = f"timeline_{uuid.uuid4().hex[:12]}"
+    voice_channel_id = uuid.uuid4().hex
+    async with get_transaction() as conn:
+        user_id = await conn.scalar(
+            insert(users)
+            .values(discord_id=discord_id, discord_username="timeline_user")
+            .returning(users.c.user_id)
+        )
+        cohort_id = await conn.scalar(
+            insert(cohorts)
+            .values(
+                cohort_name="Timeline Cohort",
+                course_slug="test-course",
+                cohort_start_date=date.today(),
+                duration_days=56,
+                number_of_group_meetings=8,
+            )
+            .returning(cohorts.c.cohort_id)
+        )
+        group_id = await conn.scalar(
+            insert(groups)
+            .values(cohort_id=cohort_id, group_name="Timeline", status="active")
+            .returning(groups.c.group_id)
+        )
+        await conn.execute(
+            insert(groups_users).values(
+                user_id=user_id, group_id=group_id, role="participant", status="active"
+            )
+        )
+        await conn.execute(
+            insert(meetings).values(
+                group_id=group_id,
+                cohort_id=cohort_id,
+                meeting_number=1,
+                scheduled_at=datetime.now(timezone.utc) - timedelta(minutes=5),
+                discord_voice_channel_id=voice_channel_id,
+            )
+        )
+
+    yield {
+        "user_id": user_id,
+        "discord_id": discord_id,
+        "group_id": group_id,
+        "voice_channel_id": voice_channel_id,
+    }
+
+    async with get_transaction() as conn:
+        await conn.execute(delete(cohorts).where(cohorts.c.cohort_id == cohort_id))
+        await conn.execute(delete(users).where(users.c.user_id == user_id))
+
+
+async def _snapshot(group_id: int) -> tuple[dict, tuple]:
+    async with get_connection() as conn:
+        data = await get_group_timeline_data(conn, group_id)
+        watermark = await get_group_dashboard_watermark(conn, group_id)
+    return data, watermark
+
+
+async def _assert_tracked(group_id: int, write) -> None:
+    data, watermark = await _snapshot(group_id)
+    await write()
+    new_data, new_watermark = await _snapshot(group_id)
+
+    assert new_data != data, "the writer did not change the timeline"
+    assert new_watermark != watermark, "timeline changed but the watermark did not"
+
+
+@pytest.mark.asyncio
+async def test_rename_moves_watermark(group):
+    async def write():
+        await update_user_nickname(group["discord_id"], "Renamed")
+
+    await _assert_tracked(group["group_id"], write)
+
+
+@pytest.mark.asyncio
+async def test_completion_moves_watermark(group):
+    content_id = uuid.uuid4()
+    async with get_transaction() as conn:
+        await get_or_create_progress(
+            conn,
+            user_id=group["user_id"],
+            anonymous_token=None,
+            content_id=content_id,
+            content_type="lens",
+            content_title="Lens",
+        )
+
+    async def write():
+        async with get_transaction() as conn:
+            await mark_content_complete(
+                conn,
+                user_id=group["user_id"],
+                anonymous_token=None,
+                content_id=content_id,
+                content_type="lens",
+                content_title="Lens",
+            )
+
+    await _assert_tracked(group["group_id"], write)
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_moves_watermark(group):
+    content_id = uuid.uuid4()
+    async with get_transaction() as conn:
+        await get_or_create_progress(
+            conn,
+            user_id=group["user_id"],
+            anonymous_token=None,
+            content_id=content_id,
+            content_type="lens",
+            content_title="Lens",
+        )
+    heartbeat = {
+        "user_id": group["user_id"],
+        "anonymous_token": None,
+        "content_id": content_id,
+    }
+    async with get_transaction() as conn:
+        await update_time_spent(conn, **heartbeat)
+    # The next ping adds the (rounded) seconds since this one
+    await asyncio.sleep(1.1)
+
+    async def write():
+        async with get_transaction() as conn:
+            await update_time_spent(conn, **heartbeat)
+
+    await _assert_tracked(group["group_id"], write)
+
+
+@pytest.mark.asyncio
+async def test_chat_message_moves_watermark(group):
+    async with get_connection() as conn:
+        session = await get_or_create_chat_session(
+            conn,
+            user_id=group["user_id"],
+            anonymous_token=None,
+            content_id=uuid.uuid4(),
+            content_type="module",
+        )
+
+    async def write():
+        async with get_connection() as conn:
+            await add_chat_message(
+                conn, session_id=session["session_id"], role="user", content="Hi"
+            )
+
+    await _assert_tracked(group["group_id"], write)
+
+
+@pytest.mark.asyncio
+async def test_voice_check_in_moves_watermark(group):
+    async def write():
+        recorded = await record_voice_attendance(
+            group["discord_id"], group["voice_channel_id"]
+        )
+        assert recorded is not None
+
+    await _assert_tracked(group["group_id"], write)
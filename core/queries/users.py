@@ -3,11 +3,12 @@
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import case, delete, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from ..enums import GroupUserStatus
 from ..tables import cohorts, facilitators, groups, groups_users, signups, users
+from ..user_search import search_users_in_memory, trgm_available
 
 
 async def get_user_by_id(
@@ -297,36 +298,75 @@ async def toggle_facilitator(
         return True
 
 
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 async def search_users(
     conn: AsyncConnection,
     query: str,
     limit: int = 20,
 ) -> list[dict[str, Any]]:
     """
-    Search users by nickname or discord_username.
+    Search users by name, email prefix or Discord ID prefix.
+
+    Names match on substring or trigram similarity (typos), ranked best
+    first. Served by pg_trgm GIN indexes when the extension is installed,
+    otherwise by an in-process trigram index (core/user_search.py).
 
     Args:
         conn: Database connection
-        query: Search string (case-insensitive substring match)
+        query: Search string (case-insensitive)
         limit: Maximum results to return
 
     Returns:
         List of user dicts with user_id, discord_id, nickname, discord_username
     """
-    search_pattern = f"%{query}%"
+    columns = (
+        users.c.user_id,
+        users.c.discord_id,
+        users.c.nickname,
+        users.c.discord_username,
+    )
+    query = query.strip()
+    if not query:
+        result = await conn.execute(
+            select(*columns)
+            .order_by(users.c.nickname, users.c.discord_username)
+            .limit(limit)
+        )
+        return [dict(row) for row in result.mappings()]
+
+    if not await trgm_available(conn):
+        return await search_users_in_memory(conn, query, limit)
+
+    # Patterns are bound whole (not concatenated in SQL) so the planner can
+    # use the trigram and prefix indexes
+    escaped = _escape_like(query)
+    name_match = or_(
+        users.c.nickname.ilike(f"%{escaped}%", escape="\\"),
+        users.c.discord_username.ilike(f"%{escaped}%", escape="\\"),
+    )
+    prefix_match = or_(
+        func.lower(users.c.email).like(f"{escaped.lower()}%", escape="\\"),
+        users.c.discord_id.like(f"{escaped}%", escape="\\"),
+    )
+    score = func.greatest(
+        func.similarity(users.c.nickname, query),
+        func.similarity(users.c.discord_username, query),
+        case((name_match, 0.9), else_=0.0),
+        case((prefix_match, 1.0), else_=0.0),
+    )
 
     result = await conn.execute(
-        select(
-            users.c.user_id,
-            users.c.discord_id,
-            users.c.nickname,
-            users.c.discord_username,
-        )
+        select(*columns)
         .where(
-            (users.c.nickname.ilike(search_pattern))
-            | (users.c.discord_username.ilike(search_pattern))
+            users.c.nickname.bool_op("%")(query)
+            | users.c.discord_username.bool_op("%")(query)
+            | name_match
+            | prefix_match
         )
-        .order_by(users.c.nickname, users.c.discord_username)
+        .order_by(score.desc(), users.c.nickname, users.c.discord_username)
         .limit(limit)
     )
 
@@ -0,0 +1,196 @@
+"""
+Database query telemetry, attributed per operation.
+
+Every statement run through the engine is counted against the operation
+that issued it: an HTTP route ("GET /api/..."), a Discord command
+("discord /sync"), a scheduler job ("job sync_all_group_rsvps") or a named
+unit of work such as "sync_group". Operations are marked with
+query_scope(), track_queries() or start_query_scope(); statements outside
+any of them are counted under UNSCOPED.
+
+Per operation we keep invocations, statements, DB time and rows, plus the
+most statements one invocation issued, which is what QUERY_BUDGETS caps.
+The same SQL running N_PLUS_ONE_THRESHOLD times within one invocation is
+logged as a likely N+1 query.
+"""
+
+import functools
+import logging
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+UNSCOPED = "(unscoped)"
+
+# Repeats of one statement within an invocation that flag an N+1 pattern
+N_PLUS_ONE_THRESHOLD = int(os.environ.get("QUERY_N_PLUS_ONE_THRESHOLD", "10"))
+
+# Most statements a single invocation of an operation should issue. Going
+# over is logged in production and fails tests using the query_budget
+# fixture (see conftest.py).
+QUERY_BUDGETS: dict[str, int] = {
+    "POST /api/progress/time": 15,
+    "GET /api/facilitator/groups/{group_id}/timeline": 15,
+    "sync_group": 60,
+}
+
+# SQL kept per flagged N+1 statement, and flagged statements per operation
+_SQL_PREVIEW_CHARS = 200
+_MAX_FLAGGED = 5
+
+T = TypeVar("T")
+
+
+@dataclass
+class QueryScope:
+    """Statements issued by one invocation of an operation."""
+
+    label: str
+    statements: int = 0
+    db_time: float = 0.0
+    rows: int = 0
+    repeats: Counter = field(default_factory=Counter)
+
+
+_current_scope: ContextVar[QueryScope | None] = ContextVar("query_scope", default=None)
+
+# label -> aggregate counters
+_stats: dict[str, dict[str, Any]] = {}
+
+
+def _stats_for(label: str) -> dict[str, Any]:
+    stats = _stats.get(label)
+    if stats is None:
+        stats = _stats[label] = {
+            "calls": 0,
+            "statements": 0,
+            "db_time_ms": 0.0,
+            "rows": 0,
+            "max_statements": 0,
+            "n_plus_one": [],
+        }
+    return stats
+
+
+def start_query_scope(label: str) -> QueryScope:
+    """
+    Attribute statements from here on in the current context to label.
+
+    For hooks that have no matching exit (e.g. a Discord interaction check);
+    elsewhere prefer query_scope(), which restores the previous scope.
+    """
+    scope = QueryScope(label)
+    _current_scope.set(scope)
+    _stats_for(label)["calls"] += 1
+    return scope
+
+
+@contextmanager
+def query_scope(label: str) -> Iterator[QueryScope]:
+    """Attribute statements issued inside the block to label."""
+    token = _current_scope.set(QueryScope(label))
+    _stats_for(label)["calls"] += 1
+    try:
+        yield _current_scope.get()
+    finally:
+        _current_scope.reset(token)
+
+
+def track_queries(
+    label: str,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Decorator running an async function inside query_scope(label)."""
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            with query_scope(label):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _record(statement: str, elapsed: float, rowcount: int) -> None:
+    scope = _current_scope.get()
+    if scope is None:
+        scope = QueryScope(UNSCOPED)
+    stats = _stats_for(scope.label)
+
+    rows = max(rowcount, 0)
+    scope.statements += 1
+    scope.db_time += elapsed
+    scope.rows += rows
+    stats["statements"] += 1
+    stats["db_time_ms"] += elapsed * 1000
+    stats["rows"] += rows
+
+    if scope.label == UNSCOPED:
+        return
+
+    stats["max_statements"] = max(stats["max_statements"], scope.statements)
+    budget = QUERY_BUDGETS.get(scope.label)
+    if budget is not None and scope.statements == budget + 1:
+        logger.warning(
+            f"{scope.label} exceeded its query budget of {budget} statements"
+        )
+
+    scope.repeats[statement] += 1
+    if scope.repeats[statement] == N_PLUS_ONE_THRESHOLD:
+        preview = " ".join(statement.split())[:_SQL_PREVIEW_CHARS]
+        logger.warning(
+            f"Possible N+1 in {scope.label}: statement ran "
+            f"{N_PLUS_ONE_THRESHOLD} times: {preview}"
+        )
+        flagged = stats["n_plus_one"]
+        if preview not in flagged and len(flagged) < _MAX_FLAGGED:
+            flagged.append(preview)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _record(statement, time.perf_counter() - context._query_start, cursor.rowcount)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Count statements run through engine (idempotent)."""
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def get_query_stats() -> dict[str, dict[str, Any]]:
+    """Per-operation query counters, busiest (by DB time) first."""
+    ordered = sorted(_stats.items(), key=lambda item: -item[1]["db_time_ms"])
+    return {
+        label: {
+            **stats,
+            "db_time_ms": round(stats["db_time_ms"], 1),
+            "avg_statements": (
+                round(stats["statements"] / stats["calls"], 1)
+                if stats["calls"]
+                else None
+            ),
+            "budget": QUERY_BUDGETS.get(label),
+            "n_plus_one": list(stats["n_plus_one"]),
+        }
+        for label, stats in ordered
+    }
+
+
+def clear_query_stats() -> None:
+    _stats.clear()
@@ -7,7 +7,7 @@ Supports both authenticated users (user_id) and anonymous users (anonymous_token
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import and_, or_, select, update
+from sqlalchemy import and_, delete, or_, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncConnection
 
@@ -77,6 +77,9 @@ async def update_response(
     or anonymous_token.
 
     For completed_at: pass an ISO format string to set, or empty string to clear.
+    Setting it (re-)queues the response for AI scoring: earlier assessments
+    scored a previous version of the answer, so they are dropped and the
+    scoring attempts reset (see core/scoring.py).
 
     Returns the updated row as a dict, or None if no matching row found.
     """
@@ -91,6 +94,8 @@ async def update_response(
             values["completed_at"] = None
         else:
             values["completed_at"] = datetime.fromisoformat(completed_at)
+            values["scoring_attempts"] = 0
+            values["scoring_locked_until"] = None
 
     if not values:
         # Nothing to update — just return the existing row
@@ -126,6 +131,12 @@ async def update_response(
 
     result = await conn.execute(stmt)
     row = result.fetchone()
+    if row and "scoring_attempts" in values:
+        await conn.execute(
+            delete(question_assessments).where(
+                question_assessments.c.response_id == response_id
+            )
+        )
     return dict(row._mapping) if row else None
 
 
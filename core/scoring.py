@@ -3,20 +3,42 @@ AI scoring module for question responses.
 
 Builds prompts from question context, calls LiteLLM with structured output,
 and writes scores to the question_assessments table. Supports socratic vs
-assessment mode. Runs as a background task without blocking API responses.
+assessment mode.
+
+Scoring runs on a DB-backed queue: a completed response without a
+question_assessments row is pending work. Re-completing a response
+(core.questions.update_response) drops its assessments and resets its
+attempts, so the edited answer is scored again. A fixed pool of workers claims
+responses with FOR UPDATE SKIP LOCKED and a time-limited lease, so:
+- a burst of submissions never runs more than SCORING_CONCURRENCY LLM
+  calls at once, keeping web request latency unaffected
+- pending scores survive restarts (expired leases are reclaimed on the
+  startup sweep)
+- failed attempts are retried with exponential backoff
+
+Scores are memoized in scoring_cache: an identical answer to the same
+question under the same prompt version and model reuses the stored score
+instead of calling the LLM again (common with resubmits and retried
+test sections).
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
+import time
+from datetime import datetime, timedelta, timezone
 
 import sentry_sdk
+from sqlalchemy import exists, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 
-from core.database import get_transaction
+from core.database import get_connection, get_transaction, in_background_pool
+from core.modules.governor import Priority
 from core.modules.llm import DEFAULT_PROVIDER, complete
 from core.modules.loader import ModuleNotFoundError, load_flattened_module
-from core.tables import question_assessments
+from core.tables import question_assessments, question_responses, scoring_cache
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +48,33 @@ SCORING_PROVIDER = os.environ.get("SCORING_PROVIDER") or DEFAULT_PROVIDER
 # Prompt version for tracking in question_assessments.assessment_system_prompt_version
 ASSESSMENT_SYSTEM_PROMPT_VERSION = "v1"
 
-# Track running tasks to prevent GC (asyncio only keeps weak references)
-_running_tasks: set[asyncio.Task] = set()
+# Number of workers, i.e. max concurrent scoring LLM calls per process
+SCORING_CONCURRENCY = int(os.environ.get("SCORING_CONCURRENCY", "3"))
+
+# Max scoring requests per minute for each provider (0 = unlimited)
+SCORING_RATE_LIMIT_PER_MINUTE = int(
+    os.environ.get("SCORING_RATE_LIMIT_PER_MINUTE", "60")
+)
+
+# Attempts before a response is given up on
+SCORING_MAX_ATTEMPTS = 5
+
+# Seconds a worker holds a claimed response before others may reclaim it
+SCORING_LEASE_SECONDS = 300
+
+# Backoff after the first failed attempt, doubled after each further failure
+SCORING_RETRY_BASE_SECONDS = 30
+
+# Only responses completed within this window are picked up, so the queue
+# never backfills scores for old responses
+SCORING_MAX_AGE = timedelta(days=7)
+
+# Idle workers re-check the queue this often (for retries that became due)
+SCORING_POLL_SECONDS = 30
+
+_worker_tasks: set[asyncio.Task] = set()
+_wakeup: asyncio.Event | None = None
+_next_request_at: dict[str, float] = {}
 
 # Structured output schema for LLM scoring responses
 SCORE_SCHEMA = {
@@ -70,31 +117,183 @@ SCORE_SCHEMA = {
 }
 
 
-def enqueue_scoring(response_id: int, question_context: dict) -> None:
+def enqueue_scoring(response_id: int) -> None:
     """
-    Fire-and-forget: score a response in the background.
+    Wake a scoring worker for a newly completed response.
+
+    The response row itself is the queue entry, so this only cuts the
+    polling delay; nothing is lost if no worker is running.
 
     Args:
         response_id: The question_responses.response_id to score
-        question_context: Dict with keys: question_id, module_slug, answer_text
     """
-    task = asyncio.create_task(
-        _score_response(response_id, question_context),
-        name=f"score-{response_id}",
+    logger.debug("Response %d queued for scoring", response_id)
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+def start_scoring_workers(concurrency: int = SCORING_CONCURRENCY) -> None:
+    """Start the scoring worker pool. Called once on startup."""
+    global _wakeup
+    if _worker_tasks:
+        return
+    _wakeup = asyncio.Event()
+    # Startup sweep: workers begin by draining orphaned and expired-lease
+    # responses left by a previous process
+    _wakeup.set()
+    for i in range(concurrency):
+        task = asyncio.create_task(_worker(), name=f"scoring-worker-{i}")
+        _worker_tasks.add(task)
+        task.add_done_callback(_worker_tasks.discard)
+    logger.info("Started %d scoring workers", concurrency)
+
+
+async def stop_scoring_workers() -> None:
+    """Cancel the worker pool. In-flight responses are reclaimed after restart."""
+    global _wakeup
+    tasks = list(_worker_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    _wakeup = None
+
+
+@in_background_pool
+async def _worker() -> None:
+    """Claim and score responses until cancelled."""
+    while True:
+        try:
+            job = await _claim_next()
+        except Exception as e:
+            logger.error("Failed to claim scoring work: %s", e)
+            sentry_sdk.capture_exception(e)
+            job = None
+
+        if job is None:
+            _wakeup.clear()
+            try:
+                await asyncio.wait_for(_wakeup.wait(), SCORING_POLL_SECONDS)
+            except TimeoutError:
+                pass
+            continue
+
+        # Keep waking peers while there may be more work
+        _wakeup.set()
+        try:
+            await _run_job(job)
+        except Exception as e:
+            # e.g. _release() lost its connection; the lease expires and the
+            # response is claimed again
+            logger.error("Scoring response %d failed: %s", job["response_id"], e)
+            sentry_sdk.capture_exception(e)
+
+
+async def _claim_next() -> dict | None:
+    """
+    Claim the oldest pending response, or return None if there is none.
+
+    Pending = completed recently, not yet scored, under the attempt limit,
+    and not leased (or its lease/backoff has expired).
+    The completed_at range is served by idx_question_responses_scoring_queue,
+    so a poll scans only the scoring window, not the whole table.
+    """
+    qr = question_responses
+    pending = (
+        select(qr.c.response_id)
+        .where(qr.c.completed_at.isnot(None))
+        .where(qr.c.completed_at > datetime.now(timezone.utc) - SCORING_MAX_AGE)
+        .where(qr.c.scoring_attempts < SCORING_MAX_ATTEMPTS)
+        .where(
+            or_(
+                qr.c.scoring_locked_until.is_(None),
+                qr.c.scoring_locked_until <= func.now(),
+            )
+        )
+        .where(~exists().where(question_assessments.c.response_id == qr.c.response_id))
+        .order_by(qr.c.completed_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
     )
-    _running_tasks.add(task)
-    task.add_done_callback(_task_done)
+    async with get_transaction() as conn:
+        result = await conn.execute(
+            update(qr)
+            .where(qr.c.response_id == pending)
+            .values(
+                scoring_attempts=qr.c.scoring_attempts + 1,
+                scoring_locked_until=func.now()
+                + timedelta(seconds=SCORING_LEASE_SECONDS),
+            )
+            .returning(
+                qr.c.response_id,
+                qr.c.question_id,
+                qr.c.module_slug,
+                qr.c.answer_text,
+                qr.c.question_text,
+                qr.c.question_hash,
+                qr.c.assessment_instructions,
+                qr.c.scoring_attempts,
+            )
+        )
+        row = result.mappings().first()
+    return dict(row) if row else None
 
 
-def _task_done(task: asyncio.Task) -> None:
-    """Callback to clean up completed tasks and log errors."""
-    _running_tasks.discard(task)
-    if task.cancelled():
+async def _run_job(job: dict) -> None:
+    """Score a claimed response, scheduling a retry on failure."""
+    response_id = job["response_id"]
+    try:
+        scored = await _score_response(response_id, job)
+    except Exception as e:
+        attempts = job["scoring_attempts"]
+        if attempts >= SCORING_MAX_ATTEMPTS:
+            logger.error(
+                "Scoring response %d failed after %d attempts: %s",
+                response_id,
+                attempts,
+                e,
+            )
+            sentry_sdk.capture_exception(e)
+        else:
+            logger.warning(
+                "Scoring response %d failed (attempt %d), retrying: %s",
+                response_id,
+                attempts,
+                e,
+            )
+        backoff = timedelta(seconds=SCORING_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+        await _release(response_id, locked_until=func.now() + backoff)
         return
-    exc = task.exception()
-    if exc:
-        logger.error("Scoring task %s failed: %s", task.get_name(), exc)
-        sentry_sdk.capture_exception(exc)
+
+    if not scored:
+        # Unresolvable question - retrying won't help
+        await _release(response_id, give_up=True)
+
+
+async def _release(response_id: int, locked_until=None, give_up: bool = False) -> None:
+    """Update a claimed response's lease (retry time) or give up on it."""
+    values = {"scoring_locked_until": locked_until}
+    if give_up:
+        values["scoring_attempts"] = SCORING_MAX_ATTEMPTS
+    async with get_transaction() as conn:
+        await conn.execute(
+            update(question_responses)
+            .where(question_responses.c.response_id == response_id)
+            .values(**values)
+        )
+
+
+async def _wait_for_rate_limit(provider: str) -> None:
+    """Space out requests to each provider to SCORING_RATE_LIMIT_PER_MINUTE."""
+    if SCORING_RATE_LIMIT_PER_MINUTE <= 0:
+        return
+    interval = 60 / SCORING_RATE_LIMIT_PER_MINUTE
+    now = time.monotonic()
+    start = max(now, _next_request_at.get(provider, now))
+    # Reserve the slot before sleeping so concurrent workers queue up behind it
+    _next_request_at[provider] = start + interval
+    if start > now:
+        await asyncio.sleep(start - now)
 
 
 def _build_scoring_prompt(
@@ -227,7 +426,48 @@ def _resolve_question_details(module_slug: str, question_id: str) -> dict:
     }
 
 
-async def _score_response(response_id: int, ctx: dict) -> None:
+def _scoring_cache_key(
+    *,
+    answer_text: str,
+    question_text: str,
+    question_hash: str | None,
+    assessment_instructions: str | None,
+    learning_outcome_name: str | None,
+    mode: str,
+) -> str:
+    """
+    Hash everything that determines a score: prompt version, model,
+    question, rubric, scoring mode and the whitespace-normalized answer.
+    """
+    if not question_hash:
+        # Same scheme as question_responses.question_hash
+        question_hash = hashlib.sha256(question_text.encode()).hexdigest()
+    key = json.dumps(
+        [
+            ASSESSMENT_SYSTEM_PROMPT_VERSION,
+            SCORING_PROVIDER,
+            question_hash,
+            assessment_instructions or "",
+            learning_outcome_name or "",
+            mode,
+            " ".join(answer_text.split()),
+        ]
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+async def _get_cached_score(cache_key: str) -> dict | None:
+    """Look up a memoized score."""
+    async with get_connection() as conn:
+        result = await conn.execute(
+            select(scoring_cache.c.score_data).where(
+                scoring_cache.c.cache_key == cache_key
+            )
+        )
+        return result.scalar()
+
+
+async def _score_response(response_id: int, ctx: dict) -> bool:
     """
     Score a single response and write to question_assessments.
 
@@ -235,6 +475,10 @@ async def _score_response(response_id: int, ctx: dict) -> None:
         response_id: The response to score
         ctx: Context dict with question_id, module_slug, answer_text,
              and optionally question_text, assessment_instructions
+
+    Returns:
+        True if a score was written, False if the question couldn't be
+        resolved. LLM and DB errors propagate so the queue can retry.
     """
     # Prefer question_text from the row snapshot (new path),
     # fall back to content cache lookup (deployment safety during rollout)
@@ -255,7 +499,7 @@ async def _score_response(response_id: int, ctx: dict) -> None:
                 "Could not resolve question details for response %d, skipping scoring",
                 response_id,
             )
-            return
+            return False
         question_text = question_details["question_text"]
         assessment_instructions = question_details.get("assessment_instructions")
 
@@ -264,40 +508,80 @@ async def _score_response(response_id: int, ctx: dict) -> None:
         question_details.get("learning_outcome_name") if question_details else None
     )
 
-    # Build prompt
-    system, messages = _build_scoring_prompt(
+    cache_key = _scoring_cache_key(
         answer_text=ctx["answer_text"],
         question_text=question_text,
+        question_hash=ctx.get("question_hash"),
         assessment_instructions=assessment_instructions,
         learning_outcome_name=learning_outcome_name,
         mode=mode,
     )
+    score_data = await _get_cached_score(cache_key)
+    cached = score_data is not None
+    # Cache entries only ever hold SCORING_PROVIDER's scores
+    model_id = SCORING_PROVIDER
+
+    if not cached:
+        # Build prompt
+        system, messages = _build_scoring_prompt(
+            answer_text=ctx["answer_text"],
+            question_text=question_text,
+            assessment_instructions=assessment_instructions,
+            learning_outcome_name=learning_outcome_name,
+            mode=mode,
+        )
 
-    # Call LLM
-    raw_response = await complete(
-        messages=messages,
-        system=system,
-        response_format=SCORE_SCHEMA,
-        provider=SCORING_PROVIDER,
-        max_tokens=512,
-    )
+        # Call LLM
+        await _wait_for_rate_limit(SCORING_PROVIDER)
+        raw_response, model_id = await complete(
+            messages=messages,
+            system=system,
+            response_format=SCORE_SCHEMA,
+            provider=SCORING_PROVIDER,
+            max_tokens=512,
+            priority=Priority.BACKGROUND,
+        )
 
-    # Parse structured response
-    score_data = json.loads(raw_response)
+        # Parse structured response
+        score_data = json.loads(raw_response)
 
     # Write to DB
     async with get_transaction() as conn:
+        # The answer may have been edited and re-completed while we scored
+        # it; that reset the response to pending, so it will be re-claimed
+        current_answer = await conn.scalar(
+            select(question_responses.c.answer_text)
+            .where(question_responses.c.response_id == response_id)
+            .with_for_update()
+        )
+        if current_answer != ctx["answer_text"]:
+            logger.info("Response %d changed while scoring, discarding", response_id)
+            return True
         await conn.execute(
             question_assessments.insert().values(
                 response_id=response_id,
                 score_data=score_data,
-                model_id=SCORING_PROVIDER,
+                model_id=model_id,
                 assessment_system_prompt_version=ASSESSMENT_SYSTEM_PROMPT_VERSION,
             )
         )
+        # A fallback model's score must not be reused under the primary's key
+        if not cached and model_id == SCORING_PROVIDER:
+            await conn.execute(
+                insert(scoring_cache)
+                .values(
+                    cache_key=cache_key,
+                    score_data=score_data,
+                    model_id=SCORING_PROVIDER,
+                    assessment_system_prompt_version=ASSESSMENT_SYSTEM_PROMPT_VERSION,
+                )
+                .on_conflict_do_nothing(index_elements=["cache_key"])
+            )
 
     logger.info(
-        "Scored response %d: overall=%s",
+        "Scored response %d: overall=%s%s",
         response_id,
         score_data.get("overall_score"),
+        " (cached)" if cached else "",
     )
+    return True
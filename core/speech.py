@@ -2,7 +2,7 @@
 
 import os
 
-import httpx
+from core.http_clients import get_http_client
 
 
 async def transcribe_audio(audio_bytes: bytes, filename: str) -> str:
@@ -22,12 +22,11 @@ async def transcribe_audio(audio_bytes: bytes, filename: str) -> str:
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable is required")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            "https://api.openai.com/v1/audio/transcriptions",
-            headers={"Authorization": f"Bearer {api_key}"},
-            files={"file": (filename, audio_bytes)},
-            data={"model": "whisper-1"},
-        )
-        response.raise_for_status()
-        return response.json()["text"]
+    response = await get_http_client("openai").post(
+        "https://api.openai.com/v1/audio/transcriptions",
+        headers={"Authorization": f"Bearer {api_key}"},
+        files={"file": (filename, audio_bytes)},
+        data={"model": "whisper-1"},
+    )
+    response.raise_for_status()
+    return response.json()["text"]
@@ -9,6 +9,7 @@ state with actual state and only make changes for differences.
 
 Main entry points:
 - sync_group(group_id) - Sync all systems for a single group
+- sync_cohort_groups(group_ids) - Sync many groups with bounded concurrency
 - sync_after_group_change(group_id, previous_group_id) - Sync after membership change
 
 Individual sync functions:
@@ -18,17 +19,59 @@ Individual sync functions:
 - sync_group_rsvps(group_id) - RSVP records from calendar
 """
 
+import asyncio
 import logging
+import os
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 import sentry_sdk
 
+from .database import in_background_pool
+from .query_stats import track_queries
+
 if TYPE_CHECKING:
     import discord
 
 logger = logging.getLogger(__name__)
 
+# Max groups synced at once by sync_cohort_groups()
+SYNC_GROUP_CONCURRENCY = int(os.environ.get("SYNC_GROUP_CONCURRENCY", "4"))
+
+# Max groups whose RSVPs are fetched at once by sync_all_group_rsvps()
+RSVP_SYNC_CONCURRENCY = int(os.environ.get("RSVP_SYNC_CONCURRENCY", "4"))
+
+
+@dataclass
+class _CohortLock:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0  # Holder plus waiters
+
+
+# Serializes creation of cohort-level Discord resources (category, #general)
+# so concurrent group syncs within one cohort don't create duplicates.
+# An entry is dropped when its last user leaves.
+_cohort_locks: dict[int, _CohortLock] = {}
+
+
+@asynccontextmanager
+async def _cohort_lock(cohort_id: int) -> AsyncIterator[None]:
+    """Hold the cohort's resource-creation lock."""
+    if cohort_id not in _cohort_locks:
+        _cohort_locks[cohort_id] = _CohortLock()
+    entry = _cohort_locks[cohort_id]
+    entry.users += 1
+    try:
+        async with entry.lock:
+            yield
+    finally:
+        entry.users -= 1
+        if entry.users == 0:
+            del _cohort_locks[cohort_id]
+
 
 # ============================================================================
 # SYNC FUNCTIONS - Diff-based, used for both normal flow and recovery
@@ -1135,7 +1178,8 @@ async def sync_group_discord_permissions(group_id: int) -> dict:
        - member.add_roles(role) for new members
        - member.remove_roles(role) for removed members
        - Skip users not in guild (they'll get role on join)
-       - Add asyncio.sleep(0.1) between bulk operations for rate limits
+       - Mutations run concurrently, bounded by get_mutation_semaphore();
+         discord.py applies per-route-bucket rate limits from response headers
 
     Idempotent and efficient - no API calls if nothing changed.
 
@@ -1144,13 +1188,12 @@ async def sync_group_discord_permissions(group_id: int) -> dict:
          "role_status": str, "cohort_channel_status": str,
          "granted_discord_ids": [...], "revoked_discord_ids": [...]}
     """
-    import asyncio
-
     from .database import get_connection
     from .discord_outbound import (
         get_bot,
-        get_or_fetch_member,
+        get_mutation_semaphore,
         get_role_member_ids,
+        resolve_members,
     )
     from .tables import groups, groups_users, users, meetings, attendances
     from .enums import GroupUserStatus, GroupUserRole, RSVPStatus
@@ -1228,7 +1271,8 @@ async def sync_group_discord_permissions(group_id: int) -> dict:
     )
 
     # Step 2: Ensure cohort channel exists
-    cohort_channel_result = await _ensure_cohort_channel(cohort_id)
+    async with _cohort_lock(cohort_id):
+        cohort_channel_result = await _ensure_cohort_channel(cohort_id)
     cohort_channel_status = cohort_channel_result.get("status", "failed")
     cohort_channel = cohort_channel_result.get("channel")
 
@@ -1322,46 +1366,58 @@ async def sync_group_discord_permissions(group_id: int) -> dict:
             current_connect_ids & expected_discord_ids
         ) - desired_facilitator_ids
 
-        guild = role.guild
+        voice_members = await resolve_members(
+            role.guild, (int(d) for d in to_grant_connect | to_revoke_connect)
+        )
 
-        # Grant connect=True to new facilitators
-        for discord_id in to_grant_connect:
-            member = await get_or_fetch_member(guild, int(discord_id))
+        async def _grant_connect(discord_id: str) -> bool:
+            member = voice_members.get(int(discord_id))
             if not member:
                 logger.info(
                     f"Member {discord_id} not in guild, skipping facilitator connect grant"
                 )
-                continue
+                return False
             try:
-                await voice_channel.set_permissions(
-                    member, connect=True, reason="Facilitator voice access"
-                )
-                facilitator_granted += 1
+                async with get_mutation_semaphore():
+                    await voice_channel.set_permissions(
+                        member, connect=True, reason="Facilitator voice access"
+                    )
+                return True
             except Exception as e:
                 logger.error(
                     f"Failed to grant facilitator connect to {discord_id}: {e}"
                 )
                 sentry_sdk.capture_exception(e)
-            await asyncio.sleep(0.1)  # Rate limit protection
+                return False
 
-        # Revoke connect overwrite from demoted facilitators
-        for discord_id in to_revoke_connect:
-            member = await get_or_fetch_member(guild, int(discord_id))
+        async def _revoke_connect(discord_id: str) -> bool:
+            member = voice_members.get(int(discord_id))
             if not member:
-                continue
+                return False
             try:
-                await voice_channel.set_permissions(
-                    member,
-                    overwrite=None,
-                    reason="Facilitator voice access removed",
-                )
-                facilitator_revoked += 1
+                async with get_mutation_semaphore():
+                    await voice_channel.set_permissions(
+                        member,
+                        overwrite=None,
+                        reason="Facilitator voice access removed",
+                    )
+                return True
             except Exception as e:
                 logger.error(
                     f"Failed to revoke facilitator connect from {discord_id}: {e}"
                 )
                 sentry_sdk.capture_exception(e)
-            await asyncio.sleep(0.1)  # Rate limit protection
+                return False
+
+        # Grant connect=True to new facilitators, revoke from demoted ones
+        grant_results = await asyncio.gather(
+            *(_grant_connect(d) for d in to_grant_connect)
+        )
+        revoke_results = await asyncio.gather(
+            *(_revoke_connect(d) for d in to_revoke_connect)
+        )
+        facilitator_granted = sum(grant_results)
+        facilitator_revoked = sum(revoke_results)
 
         logger.info(
             f"Facilitator voice sync for group {group_id}: "
@@ -1373,42 +1429,50 @@ async def sync_group_discord_permissions(group_id: int) -> dict:
     to_revoke = current_discord_ids - expected_discord_ids
     unchanged = expected_discord_ids & current_discord_ids
 
-    granted, revoked, failed = 0, 0, 0
-    granted_discord_ids = []
-    revoked_discord_ids = []
-    guild = role.guild
+    # Resolve everyone in one bulk lookup instead of one fetch per member
+    members = await resolve_members(role.guild, (int(d) for d in to_grant | to_revoke))
 
-    # Grant role to new members
-    for discord_id in to_grant:
-        member = await get_or_fetch_member(guild, int(discord_id))
-        if not member:
-            logger.info(f"Member {discord_id} not in guild, skipping role grant")
-            continue
-        try:
-            await member.add_roles(role, reason="Group sync")
-            granted += 1
-            granted_discord_ids.append(discord_id)
-        except Exception as e:
-            logger.error(f"Failed to add role to member {discord_id}: {e}")
-            sentry_sdk.capture_exception(e)
-            failed += 1
-        await asyncio.sleep(0.1)  # Rate limit protection
-
-    # Remove role from removed members
-    for discord_id in to_revoke:
-        member = await get_or_fetch_member(guild, int(discord_id))
+    async def _apply_role(discord_id: str, grant: bool) -> str:
+        """Add or remove the group role; returns "ok", "skipped" or "failed"."""
+        member = members.get(int(discord_id))
         if not member:
+            if grant:
+                logger.info(f"Member {discord_id} not in guild, skipping role grant")
             # Member left the server, no need to revoke
-            continue
+            return "skipped"
         try:
-            await member.remove_roles(role, reason="Group sync")
-            revoked += 1
-            revoked_discord_ids.append(discord_id)
+            async with get_mutation_semaphore():
+                if grant:
+                    await member.add_roles(role, reason="Group sync")
+                else:
+                    await member.remove_roles(role, reason="Group sync")
+            return "ok"
         except Exception as e:
-            logger.error(f"Failed to remove role from member {discord_id}: {e}")
+            action = "add role to" if grant else "remove role from"
+            logger.error(f"Failed to {action} member {discord_id}: {e}")
             sentry_sdk.capture_exception(e)
-            failed += 1
-        await asyncio.sleep(0.1)  # Rate limit protection
+            return "failed"
+
+    # Grant role to new members and remove it from removed members.
+    # discord.py handles per-bucket rate limits; the semaphore bounds fan-out.
+    to_grant_list = list(to_grant)
+    to_revoke_list = list(to_revoke)
+    grant_outcomes = await asyncio.gather(
+        *(_apply_role(d, grant=True) for d in to_grant_list)
+    )
+    revoke_outcomes = await asyncio.gather(
+        *(_apply_role(d, grant=False) for d in to_revoke_list)
+    )
+
+    granted_discord_ids = [
+        d for d, outcome in zip(to_grant_list, grant_outcomes) if outcome == "ok"
+    ]
+    revoked_discord_ids = [
+        d for d, outcome in zip(to_revoke_list, revoke_outcomes) if outcome == "ok"
+    ]
+    granted = len(granted_discord_ids)
+    revoked = len(revoked_discord_ids)
+    failed = [*grant_outcomes, *revoke_outcomes].count("failed")
 
     logger.info(
         f"Role sync for group {group_id}: "
@@ -1681,65 +1745,139 @@ async def sync_group_rsvps(group_id: int) -> dict:
     )
 
 
-async def sync_all_group_rsvps() -> dict:
+@track_queries("job sync_all_group_rsvps")
+@in_background_pool
+async def sync_all_group_rsvps(full: bool = False) -> dict:
     """
-    Sync RSVPs for all groups that have recurring calendar events.
+    Sync RSVPs for groups whose calendar events changed since the last run.
+
+    Uses Google Calendar incremental sync: the calendar-wide sync token in
+    calendar_sync_state lists only events changed since the previous run,
+    and only the groups owning those recurring events are re-synced (with
+    bounded concurrency). With no changes this is a single API call.
 
-    Call this periodically (e.g., every 6 hours) to keep RSVPs current.
+    A full sync of every group with a recurring event runs when there is no
+    stored token yet, when Google expires the token, or when full=True.
+    The token always advances; groups that failed are stored with it and
+    re-synced individually on the next run, so one persistently failing
+    group doesn't make every run reprocess the whole backlog.
 
     Returns:
         Dict with sync statistics:
         {
+            "mode": "incremental" | "full",
             "groups_synced": int,
             "groups_skipped": int,
             "groups_failed": int,
             "total_rsvps_updated": int,
         }
     """
+    from .calendar.client import get_calendar_email
+    from .calendar.events import SyncTokenExpiredError, list_changed_events
+    from .calendar.rsvp import get_calendar_sync_state, save_calendar_sync_state
     from .database import get_connection
     from .tables import groups
-    from sqlalchemy import select
+    from sqlalchemy import or_, select
 
     result = {
+        "mode": "incremental",
         "groups_synced": 0,
         "groups_skipped": 0,
         "groups_failed": 0,
         "total_rsvps_updated": 0,
     }
 
-    async with get_connection() as conn:
-        # Get all groups with recurring calendar events
-        query_result = await conn.execute(
-            select(groups.c.group_id, groups.c.gcal_recurring_event_id).where(
-                groups.c.gcal_recurring_event_id.isnot(None)
+    calendar_id = get_calendar_email()
+    sync_token, retry_group_ids = await get_calendar_sync_state(calendar_id)
+    if full:
+        sync_token = None
+
+    changes = None
+    if sync_token:
+        try:
+            changes = await list_changed_events(sync_token)
+        except SyncTokenExpiredError:
+            logger.info("Calendar sync token expired, running full RSVP sync")
+            sync_token = None
+
+    if not sync_token:
+        # Take the token *before* syncing so changes made meanwhile are
+        # picked up next run
+        result["mode"] = "full"
+        try:
+            changes = await list_changed_events(None)
+        except SyncTokenExpiredError:
+            changes = None
+
+    if changes is None:
+        logger.warning("Calendar unavailable, skipping RSVP sync")
+        return {**result, "error": "calendar_unavailable"}
+
+    changed_events, next_sync_token = changes
+
+    query = select(groups.c.group_id).where(
+        groups.c.gcal_recurring_event_id.isnot(None)
+    )
+    if result["mode"] == "incremental":
+        changed_event_ids = {
+            event.get("recurringEventId") or event["id"]
+            for event in changed_events
+            # A cancelled series is recreated by calendar sync, not here
+            if event.get("recurringEventId") or event.get("status") != "cancelled"
+        }
+        if not changed_event_ids and not retry_group_ids:
+            await save_calendar_sync_state(calendar_id, next_sync_token, [])
+            return result
+        query = query.where(
+            or_(
+                groups.c.gcal_recurring_event_id.in_(changed_event_ids),
+                groups.c.group_id.in_(retry_group_ids),
             )
         )
-        group_rows = list(query_result.mappings())
 
-    for group_row in group_rows:
-        try:
-            sync_result = await sync_group_rsvps(group_row["group_id"])
-            if "error" in sync_result:
+    async with get_connection() as conn:
+        query_result = await conn.execute(query)
+        group_ids = [row["group_id"] for row in query_result.mappings()]
+
+    semaphore = asyncio.Semaphore(RSVP_SYNC_CONCURRENCY)
+    failed_group_ids: list[int] = []
+
+    async def _sync_one(group_id: int) -> None:
+        async with semaphore:
+            try:
+                sync_result = await sync_group_rsvps(group_id)
+            except Exception as e:
                 result["groups_failed"] += 1
-                logger.warning(
-                    f"Failed to sync RSVPs for group {group_row['group_id']}: "
-                    f"{sync_result.get('error')}"
-                )
-            else:
-                result["groups_synced"] += 1
-                result["total_rsvps_updated"] += sync_result.get("rsvps_updated", 0)
-        except Exception as e:
+                failed_group_ids.append(group_id)
+                logger.error(f"Error syncing RSVPs for group {group_id}: {e}")
+                sentry_sdk.capture_exception(e)
+                return
+        if "error" in sync_result:
             result["groups_failed"] += 1
-            logger.error(f"Error syncing RSVPs for group {group_row['group_id']}: {e}")
-            sentry_sdk.capture_exception(e)
+            failed_group_ids.append(group_id)
+            logger.warning(
+                f"Failed to sync RSVPs for group {group_id}: {sync_result.get('error')}"
+            )
+        else:
+            result["groups_synced"] += 1
+            result["total_rsvps_updated"] += sync_result.get("rsvps_updated", 0)
+
+    await asyncio.gather(*(_sync_one(gid) for gid in group_ids))
+
+    await save_calendar_sync_state(
+        calendar_id, next_sync_token, sorted(failed_group_ids)
+    )
 
     logger.info(
-        f"RSVP sync complete: {result['groups_synced']} groups synced, "
+        f"RSVP sync complete ({result['mode']}): "
+        f"{result['groups_synced']} groups synced, "
         f"{result['total_rsvps_updated']} RSVPs updated"
     )
     return result
 
 
+@track_queries("sync_group")
+@in_background_pool
 async def sync_group(group_id: int, allow_create: bool = False) -> dict[str, Any]:
     """
     Sync all external systems for a group.
@@ -1812,7 +1950,8 @@ async def sync_group(group_id: int, allow_create: bool = False) -> dict[str, Any
 
         # Create infrastructure
         # 1. Ensure cohort category
-        category_result = await _ensure_cohort_category(group["cohort_id"])
+        async with _cohort_lock(group["cohort_id"]):
+            category_result = await _ensure_cohort_category(group["cohort_id"])
         results["infrastructure"]["category"] = category_result
 
         # Get category object for channel creation
@@ -1942,6 +2081,56 @@ async def sync_group(group_id: int, allow_create: bool = False) -> dict[str, Any
     return results
 
 
+async def sync_cohort_groups(
+    group_ids: list[int],
+    allow_create: bool = False,
+    concurrency: int = SYNC_GROUP_CONCURRENCY,
+    on_progress: Callable[[int, dict[str, Any], int, int], Awaitable[None]]
+    | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Sync (or realize) many groups with bounded concurrency.
+
+    Runs sync_group() for each group, at most `concurrency` at a time.
+    Cohort-level resources are guarded by a per-cohort lock inside
+    sync_group(), and Discord rate limits are handled per route bucket by
+    discord.py, so groups don't need to be processed one after another.
+
+    Args:
+        group_ids: Groups to sync
+        allow_create: Passed through to sync_group()
+        concurrency: Max groups in flight at once
+        on_progress: Optional async callback(group_id, result, done, total),
+                     awaited as each group finishes
+
+    Returns:
+        List of {"group_id": int, "result": dict} in the order of group_ids.
+        Unexpected exceptions are captured as {"error": str}.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    total = len(group_ids)
+    done = 0
+
+    async def _run(group_id: int) -> dict[str, Any]:
+        nonlocal done
+        async with semaphore:
+            try:
+                result = await sync_group(group_id, allow_create=allow_create)
+            except Exception as e:
+                logger.error(f"Failed to sync group {group_id}: {e}")
+                sentry_sdk.capture_exception(e)
+                result = {"error": str(e)}
+        done += 1
+        if on_progress:
+            try:
+                await on_progress(group_id, result, done, total)
+            except Exception as e:
+                logger.warning(f"Progress callback failed for group {group_id}: {e}")
+        return {"group_id": group_id, "result": result}
+
+    return list(await asyncio.gather(*(_run(gid) for gid in group_ids)))
+
+
 async def sync_after_group_change(
     group_id: int,
     previous_group_id: int | None = None,
@@ -0,0 +1,376 @@
+"""
+Cohort-wide sync planner.
+
+sync_group() discovers state one group at a time, with a separate DB round
+trip for every lookup. For cohort-wide syncs the planner instead:
+
+1. Loads the whole cohort's sync state in a few set-based queries
+   (get_cohort_sync_state)
+2. Compares it with Discord's cached state (roles, channels, overwrites),
+   which costs no API calls
+3. Produces a per-group plan listing only the changes that are needed
+4. Executes the plan: groups with Discord changes get a full sync_group(),
+   every other realized group only gets the calendar/reminder/RSVP
+   syncs, with calendar changes coalesced across groups into batch calls
+
+Main entry points:
+- plan_cohort_sync(cohort_id) - Build a CohortSyncPlan (dry run)
+- execute_cohort_sync_plan(plan) - Apply a plan
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+import sentry_sdk
+
+from .sync import SYNC_GROUP_CONCURRENCY, sync_cohort_groups
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GroupSyncPlan:
+    """Changes needed to bring one group in line with the database."""
+
+    group_id: int
+    group_name: str
+    status: str
+    needs_infrastructure: bool = False
+    no_members: bool = False
+    role_action: str | None = None  # "create" | "missing" | "rename"
+    missing_channels: list[str] = field(default_factory=list)
+    missing_permissions: list[str] = field(default_factory=list)
+    grant_discord_ids: set[str] = field(default_factory=set)
+    revoke_discord_ids: set[str] = field(default_factory=set)
+    facilitator_grant_ids: set[str] = field(default_factory=set)
+    facilitator_revoke_ids: set[str] = field(default_factory=set)
+
+    @property
+    def needs_discord_sync(self) -> bool:
+        """True if Discord state differs from the database for this group."""
+        return bool(
+            self.role_action
+            or self.missing_channels
+            or self.missing_permissions
+            or self.grant_discord_ids
+            or self.revoke_discord_ids
+            or self.facilitator_grant_ids
+            or self.facilitator_revoke_ids
+        )
+
+    def describe(self) -> list[str]:
+        """Human-readable list of planned changes."""
+        if self.no_members:
+            return ["skip: no members"]
+        if self.needs_infrastructure:
+            return ["realize: channels, role, meetings, events"]
+        changes = []
+        if self.role_action:
+            changes.append(f"role: {self.role_action}")
+        for channel in self.missing_channels:
+            changes.append(f"channel missing in Discord: {channel}")
+        for channel in self.missing_permissions:
+            changes.append(f"role permissions missing: {channel}")
+        if self.grant_discord_ids:
+            changes.append(f"grant role: {len(self.grant_discord_ids)}")
+        if self.revoke_discord_ids:
+            changes.append(f"revoke role: {len(self.revoke_discord_ids)}")
+        if self.facilitator_grant_ids:
+            changes.append(f"grant voice: {len(self.facilitator_grant_ids)}")
+        if self.facilitator_revoke_ids:
+            changes.append(f"revoke voice: {len(self.facilitator_revoke_ids)}")
+        return changes
+
+
+@dataclass
+class CohortSyncPlan:
+    """Sync plan for every group in a cohort."""
+
+    cohort_id: int
+    cohort_name: str
+    groups: list[GroupSyncPlan] = field(default_factory=list)
+    cohort_channel_missing: bool = False
+    bot_available: bool = True
+
+    @property
+    def changed_groups(self) -> list[GroupSyncPlan]:
+        return [g for g in self.groups if g.needs_discord_sync]
+
+    def format(self) -> str:
+        """Render the plan as text for dry runs."""
+        lines = [f"Sync plan for cohort {self.cohort_id} ({self.cohort_name})"]
+        if not self.bot_available:
+            lines.append("  (bot unavailable - Discord state not compared)")
+        if self.cohort_channel_missing:
+            lines.append("  cohort: #general channel missing")
+        for group in self.groups:
+            changes = group.describe()
+            summary = "; ".join(changes) if changes else "no Discord changes"
+            lines.append(f"  {group.group_name} [{group.group_id}]: {summary}")
+        lines.append(
+            f"{len(self.changed_groups)}/{len(self.groups)} groups need Discord changes"
+        )
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "cohort_id": self.cohort_id,
+            "cohort_name": self.cohort_name,
+            "cohort_channel_missing": self.cohort_channel_missing,
+            "changed_groups": len(self.changed_groups),
+            "groups": [
+                {
+                    "group_id": g.group_id,
+                    "group_name": g.group_name,
+                    "needs_infrastructure": g.needs_infrastructure,
+                    "needs_discord_sync": g.needs_discord_sync,
+                    "changes": g.describe(),
+                }
+                for g in self.groups
+            ],
+        }
+
+
+def _voice_connect_ids(voice_channel) -> set[str]:
+    """Discord IDs of members with a connect=True overwrite on a voice channel."""
+    import discord
+
+    ids: set[str] = set()
+    for target, overwrite in voice_channel.overwrites.items():
+        if isinstance(target, discord.Member) and overwrite.pair()[0].connect:
+            ids.add(str(target.id))
+    return ids
+
+
+def build_group_plan(
+    group: dict[str, Any], cohort: dict[str, Any], bot
+) -> GroupSyncPlan:
+    """
+    Diff one group's DB state against Discord's cache.
+
+    Mirrors the decisions made by sync_group() and
+    sync_group_discord_permissions(), without any API calls.
+    """
+    plan = GroupSyncPlan(
+        group_id=group["group_id"],
+        group_name=group["group_name"],
+        status=group["status"],
+    )
+
+    if not group["discord_text_channel_id"]:
+        if group["member_count"] == 0:
+            plan.no_members = True
+        else:
+            plan.needs_infrastructure = True
+        return plan
+
+    if bot is None:
+        return plan
+
+    guild = bot.guilds[0] if bot.guilds else None
+    expected_ids = group["member_discord_ids"] | group["guest_discord_ids"]
+
+    # Role
+    role = None
+    if not group["discord_role_id"]:
+        plan.role_action = "create"
+    elif guild:
+        role = guild.get_role(int(group["discord_role_id"]))
+        expected_name = f"Cohort {cohort['cohort_name']} - Group {group['group_name']}"
+        if role is None:
+            plan.role_action = "missing"
+        elif role.name != expected_name:
+            plan.role_action = "rename"
+
+    # Channels
+    text_channel = bot.get_channel(int(group["discord_text_channel_id"]))
+    if not text_channel:
+        plan.missing_channels.append("text")
+    voice_channel = None
+    if group["discord_voice_channel_id"]:
+        voice_channel = bot.get_channel(int(group["discord_voice_channel_id"]))
+        if not voice_channel:
+            plan.missing_channels.append("voice")
+    cohort_channel = None
+    if cohort["discord_cohort_channel_id"]:
+        cohort_channel = bot.get_channel(int(cohort["discord_cohort_channel_id"]))
+
+    # Role overwrites on the group's channels and the cohort channel
+    if role:
+        for name, channel in (
+            ("text", text_channel),
+            ("voice", voice_channel),
+            ("cohort", cohort_channel),
+        ):
+            if channel and role not in channel.overwrites:
+                plan.missing_permissions.append(name)
+
+    # Role membership (a missing role means everyone needs granting)
+    current_ids = {str(m.id) for m in role.members} if role else set()
+    plan.grant_discord_ids = expected_ids - current_ids
+    plan.revoke_discord_ids = current_ids - expected_ids
+
+    # Facilitator voice overwrites
+    if voice_channel:
+        current_connect = _voice_connect_ids(voice_channel)
+        desired = group["facilitator_discord_ids"]
+        plan.facilitator_grant_ids = desired - current_connect
+        plan.facilitator_revoke_ids = (current_connect & expected_ids) - desired
+
+    return plan
+
+
+async def plan_cohort_sync(cohort_id: int) -> CohortSyncPlan | None:
+    """
+    Build a sync plan for a cohort without changing anything.
+
+    Returns:
+        CohortSyncPlan, or None if the cohort doesn't exist.
+    """
+    from .database import get_connection
+    from .discord_outbound import get_bot
+    from .queries.groups import get_cohort_sync_state
+
+    async with get_connection() as conn:
+        state = await get_cohort_sync_state(conn, cohort_id)
+
+    if state is None:
+        return None
+
+    bot = get_bot()
+    cohort = state["cohort"]
+    plan = CohortSyncPlan(
+        cohort_id=cohort_id,
+        cohort_name=cohort["cohort_name"],
+        bot_available=bot is not None,
+    )
+    plan.groups = [build_group_plan(group, cohort, bot) for group in state["groups"]]
+    if bot is not None and any(
+        g.status != "preview" and not g.needs_infrastructure for g in plan.groups
+    ):
+        channel_id = cohort["discord_cohort_channel_id"]
+        plan.cohort_channel_missing = not (
+            channel_id and bot.get_channel(int(channel_id))
+        )
+    return plan
+
+
+async def _sync_external_only(
+    group_ids: list[int], concurrency: int
+) -> list[dict[str, Any]]:
+    """
+    Run the non-Discord syncs for groups that have no Discord changes.
+
+    Calendar attendees for all groups are synced together in coalesced
+    batch calls; reminder and RSVP syncs run per group. Failures are
+    scheduled for retry the same way sync_group() does.
+    """
+    from .calendar.coordinator import sync_groups_calendar
+    from .notifications.scheduler import schedule_sync_retry
+    from .sync import sync_group_reminders, sync_group_rsvps
+
+    results: dict[int, dict[str, Any]] = {gid: {} for gid in group_ids}
+    if not group_ids:
+        return []
+
+    try:
+        calendar_results = await sync_groups_calendar(group_ids)
+        for group_id, calendar_result in calendar_results.items():
+            results[group_id]["calendar"] = calendar_result
+    except Exception as e:
+        logger.error(f"Calendar sync failed for cohort groups: {e}")
+        sentry_sdk.capture_exception(e)
+        for result in results.values():
+            result["calendar"] = {"error": str(e)}
+    for group_id, result in results.items():
+        calendar_result = result.get("calendar", {})
+        if calendar_result.get("failed", 0) > 0 or calendar_result.get("error"):
+            schedule_sync_retry(sync_type="calendar", group_id=group_id, attempt=0)
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _per_group(group_id: int) -> None:
+        async with semaphore:
+            for sync_type, sync in (
+                ("reminders", sync_group_reminders),
+                ("rsvps", sync_group_rsvps),
+            ):
+                try:
+                    results[group_id][sync_type] = await sync(group_id)
+                except Exception as e:
+                    logger.error(
+                        f"{sync_type.capitalize()} sync failed "
+                        f"for group {group_id}: {e}"
+                    )
+                    sentry_sdk.capture_exception(e)
+                    results[group_id][sync_type] = {"error": str(e)}
+                    schedule_sync_retry(
+                        sync_type=sync_type, group_id=group_id, attempt=0
+                    )
+
+    await asyncio.gather(*(_per_group(gid) for gid in group_ids))
+
+    return [{"group_id": gid, "result": result} for gid, result in results.items()]
+
+
+async def execute_cohort_sync_plan(
+    plan: CohortSyncPlan,
+    allow_create: bool = False,
+    concurrency: int = SYNC_GROUP_CONCURRENCY,
+) -> list[dict[str, Any]]:
+    """
+    Apply a cohort sync plan.
+
+    - Groups with Discord changes (or missing infrastructure when
+      allow_create=True) go through the full sync_group(), which also
+      handles notifications and retries. A missing cohort channel counts
+      as a Discord change for every realized group, since each group role
+      needs permissions on the recreated channel.
+    - Other realized groups only get the calendar, reminder and RSVP
+      syncs (with retries on failure); Discord is left untouched. Calendar
+      attendee changes for these groups are coalesced into batch calls
+      (see calendar.coordinator).
+    - Groups without members or without infrastructure (allow_create=False)
+      are reported and skipped.
+
+    Returns:
+        List of {"group_id": int, "result": dict, "planned": [str]}
+    """
+    full_sync_ids = []
+    external_ids = []
+    skipped: list[dict[str, Any]] = []
+    for group in plan.groups:
+        if group.no_members or (group.needs_infrastructure and not allow_create):
+            skipped.append(
+                {
+                    "group_id": group.group_id,
+                    "result": {"needs_infrastructure": True},
+                    "planned": group.describe(),
+                }
+            )
+        elif (
+            group.needs_infrastructure
+            or group.needs_discord_sync
+            or plan.cohort_channel_missing
+        ):
+            full_sync_ids.append(group.group_id)
+        else:
+            external_ids.append(group.group_id)
+
+    results = await sync_cohort_groups(
+        full_sync_ids, allow_create=allow_create, concurrency=concurrency
+    )
+
+    results += await _sync_external_only(external_ids, concurrency)
+
+    planned = {g.group_id: g.describe() for g in plan.groups}
+    for entry in results:
+        entry["planned"] = planned[entry["group_id"]]
+
+    logger.info(
+        f"Cohort {plan.cohort_id} sync: {len(full_sync_ids)} full, "
+        f"{len(external_ids)} external-only, {len(skipped)} skipped"
+    )
+    return results + skipped
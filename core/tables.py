@@ -16,7 +16,7 @@ from sqlalchemy import (
     func,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TIMESTAMP, UUID
 
 from .enums import (
     cohort_role_enum,
@@ -66,7 +66,19 @@ users = Table(
     Column("updated_at", TIMESTAMP(timezone=True), server_default=func.now()),
     Column("deleted_at", TIMESTAMP(timezone=True)),
     Index("idx_users_discord_id", "discord_id"),
-    Index("idx_users_email", "email"),
+    # Case-insensitive lookups (calendar RSVP attendees)
+    Index("idx_users_email_lower", func.lower(text("email"))),
+    # Admin search prefix matching. Trigram indexes on nickname and
+    # discord_username are created by migration where pg_trgm is available.
+    Index(
+        "idx_users_email_prefix",
+        text("lower(email) text_pattern_ops"),
+    ),
+    Index(
+        "idx_users_discord_id_prefix",
+        "discord_id",
+        postgresql_ops={"discord_id": "text_pattern_ops"},
+    ),
 )
 
 
@@ -463,12 +475,23 @@ question_responses = Table(
     # Timestamps
     Column("created_at", TIMESTAMP(timezone=True), server_default=func.now()),
     Column("completed_at", TIMESTAMP(timezone=True), nullable=True),
+    # AI scoring queue state (see core/scoring.py)
+    Column("scoring_attempts", Integer, server_default="0", nullable=False),
+    Column(
+        "scoring_locked_until", TIMESTAMP(timezone=True), nullable=True
+    ),  # Worker lease, or retry backoff after a failed attempt
     # Indexes
     Index("idx_question_responses_user_id", "user_id"),
     Index("idx_question_responses_anon", "anonymous_token"),
     Index("idx_question_responses_question", "question_id"),
     Index("idx_question_responses_module", "module_slug"),
     Index("idx_question_responses_hash", "question_hash"),
+    # Scoring queue claim: range scan over recent completed responses
+    Index(
+        "idx_question_responses_scoring_queue",
+        "completed_at",
+        postgresql_where=text("completed_at IS NOT NULL"),
+    ),
 )
 
 
@@ -496,3 +519,73 @@ question_assessments = Table(
     # Indexes
     Index("idx_question_assessments_response_id", "response_id"),
 )
+
+
+# =====================================================
+# 15. CALENDAR_SYNC_STATE
+# =====================================================
+# Google Calendar incremental sync tokens (one row per calendar)
+calendar_sync_state = Table(
+    "calendar_sync_state",
+    metadata,
+    Column("calendar_id", Text, primary_key=True),
+    Column("sync_token", Text, nullable=True),
+    # Groups whose RSVP sync failed on the last run, retried on the next
+    Column("failed_group_ids", ARRAY(Integer), nullable=False, server_default="{}"),
+    Column("updated_at", TIMESTAMP(timezone=True), server_default=func.now()),
+)
+
+
+# =====================================================
+# 16. SCORING_CACHE
+# =====================================================
+# Memoized AI scores, keyed by a hash of everything that determines the
+# scoring prompt (see core/scoring.py _scoring_cache_key)
+scoring_cache = Table(
+    "scoring_cache",
+    metadata,
+    Column("cache_key", Text, primary_key=True),
+    Column("score_data", JSONB, nullable=False),
+    Column("model_id", Text, nullable=False),
+    Column("assessment_system_prompt_version", Text, nullable=False),
+    Column("created_at", TIMESTAMP(timezone=True), server_default=func.now()),
+)
+
+
+# =====================================================
+# 17. PROMPTLAB_RUNS
+# =====================================================
+# Prompt Lab batch evaluations (fixtures x prompt variants), kept for
+# side-by-side comparison
+promptlab_runs = Table(
+    "promptlab_runs",
+    metadata,
+    Column("run_id", Integer, primary_key=True, autoincrement=True),
+    Column(
+        "user_id",
+        Integer,
+        ForeignKey("users.user_id", ondelete="SET NULL"),
+        nullable=True,
+    ),
+    Column("config", JSONB, nullable=False),  # Fixtures, variants, model options
+    Column("results", JSONB, server_default="[]", nullable=False),
+    Column("status", Text, nullable=False),  # "complete" or "cancelled"
+    Column("created_at", TIMESTAMP(timezone=True), server_default=func.now()),
+    Column("completed_at", TIMESTAMP(timezone=True), nullable=True),
+    Index("idx_promptlab_runs_user_id", "user_id"),
+)
+
+
+# =====================================================
+# 18. RATE_LIMIT_BUCKETS
+# =====================================================
+# GCRA state shared across replicas when RATE_LIMIT_BACKEND=postgres
+# (see web_api/rate_limit.py); one row per "<policy>:<client>" key
+rate_limit_buckets = Table(
+    "rate_limit_buckets",
+    metadata,
+    Column("bucket_key", Text, primary_key=True),
+    # Theoretical arrival time of the next request at the sustained rate
+    Column("tat", TIMESTAMP(timezone=True), nullable=False),
+    Index("idx_rate_limit_buckets_tat", "tat"),
+)
@@ -0,0 +1,139 @@
+"""Tests for routing connections between the interactive, background and replica pools."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from core import database
+from core.database import (
+    BACKGROUND_POOL,
+    INTERACTIVE_POOL,
+    REPLICA_POOL,
+    get_connection,
+    get_pool_stats,
+    get_read_connection,
+    get_transaction,
+    in_background_pool,
+    request_scope,
+    use_pool,
+)
+
+
+def _engine(name):
+    """Engine whose connections record which pool they came from."""
+    engine = MagicMock()
+
+    async def connect():
+        conn = AsyncMock()
+        conn.pool_name = name
+        conn.in_transaction = MagicMock(return_value=False)
+        transaction = MagicMock()
+        transaction.__aenter__ = AsyncMock(return_value=transaction)
+        transaction.__aexit__ = AsyncMock(return_value=None)
+        conn.begin = MagicMock(return_value=transaction)
+        return conn
+
+    engine.connect = MagicMock(side_effect=connect)
+    engine.pool.size.return_value = 5
+    engine.pool.checkedout.return_value = 3
+    return engine
+
+
+@pytest.fixture
+def engines():
+    engines = {
+        pool: _engine(pool)
+        for pool in (INTERACTIVE_POOL, BACKGROUND_POOL, REPLICA_POOL)
+    }
+    database._engines.update(engines)
+    database._pool_waits.clear()
+    yield engines
+    database._engines.clear()
+    database._pool_waits.clear()
+
+
+class TestPoolRouting:
+    @pytest.mark.asyncio
+    async def test_defaults_to_interactive_pool(self, engines):
+        async with get_connection() as conn:
+            assert conn.pool_name == INTERACTIVE_POOL
+        async with get_transaction() as conn:
+            assert conn.pool_name == INTERACTIVE_POOL
+
+    @pytest.mark.asyncio
+    async def test_background_work_uses_background_pool(self, engines):
+        @in_background_pool
+        async def job():
+            async with get_transaction() as conn:
+                return conn.pool_name
+
+        assert await job() == BACKGROUND_POOL
+        async with get_connection() as conn:
+            assert conn.pool_name == INTERACTIVE_POOL
+
+    @pytest.mark.asyncio
+    async def test_background_work_skips_request_connection(self, engines):
+        async with request_scope():
+            async with get_connection() as shared:
+                pass
+            with use_pool(BACKGROUND_POOL):
+                async with get_connection() as conn:
+                    assert conn is not shared
+                    assert conn.pool_name == BACKGROUND_POOL
+
+    @pytest.mark.asyncio
+    async def test_read_connection_uses_replica_when_configured(
+        self, engines, monkeypatch
+    ):
+        async with get_read_connection() as conn:
+            assert conn.pool_name == INTERACTIVE_POOL
+
+        monkeypatch.setenv("DATABASE_READ_URL", "postgresql://replica/db")
+        async with get_read_connection() as conn:
+            assert conn.pool_name == REPLICA_POOL
+
+
+class TestGetEngine:
+    def test_pool_sizes_from_environment(self, monkeypatch):
+        monkeypatch.setenv("DATABASE_URL", "postgresql://primary/db")
+        monkeypatch.setenv("DB_BACKGROUND_POOL_SIZE", "1")
+        monkeypatch.setenv("DB_BACKGROUND_MAX_OVERFLOW", "0")
+        database._engines.clear()
+
+        with (
+            patch.object(database, "create_async_engine") as create,
+            patch.object(database, "instrument_engine"),
+        ):
+            database.get_engine(BACKGROUND_POOL)
+            database.get_engine(INTERACTIVE_POOL)
+        database._engines.clear()
+
+        background, interactive = create.call_args_list
+        assert background.kwargs["pool_size"] == 1
+        assert background.kwargs["max_overflow"] == 0
+        assert interactive.kwargs["pool_size"] == 5
+        assert interactive.args[0] == "postgresql+asyncpg://primary/db"
+
+
+class TestPoolStats:
+    @pytest.mark.asyncio
+    async def test_reports_checkouts_and_saturation(self, engines):
+        async with get_connection():
+            pass
+
+        stats = get_pool_stats()[INTERACTIVE_POOL]
+        assert stats["checkouts"] == 1
+        assert stats["capacity"] == 15
+        assert stats["saturation"] == 0.2
+        assert stats["wait_avg_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_counts_timeouts(self, engines):
+        engines[INTERACTIVE_POOL].connect.side_effect = PoolTimeoutError()
+
+        with pytest.raises(PoolTimeoutError):
+            async with get_connection():
+                pass
+
+        assert get_pool_stats()[INTERACTIVE_POOL]["timeouts"] == 1
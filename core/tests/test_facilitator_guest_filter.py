@@ -12,7 +12,7 @@ from sqlalchemy.dialects import postgresql
 
 from core.queries.facilitator import (
     get_group_members_with_progress,
-    get_group_completion_data,
+    get_group_timeline_data,
     get_user_meeting_attendance,
 )
 
@@ -65,46 +65,20 @@ class TestGuestFiltering:
         )
 
     @pytest.mark.asyncio
-    async def test_completion_data_excludes_guests(self):
-        """get_group_completion_data attendance query should filter on is_guest."""
-        from datetime import datetime, timezone
-
-        # The function calls conn.execute 3 times:
-        #   1. completions query (can be empty)
-        #   2. meetings query (needs rows so attendance branch runs)
-        #   3. attendance query (the one we want to inspect)
-        fake_meeting = Mock()
-        fake_meeting.meeting_id = 1
-        fake_meeting.meeting_number = 1
-        fake_meeting.scheduled_at = datetime(2020, 1, 1, tzinfo=timezone.utc)
-
-        empty_result = _make_mapping_result([])
-        meetings_result = Mock()
-        meetings_result.mappings = Mock(return_value=Mock(all=Mock(return_value=[])))
-        meetings_result.__iter__ = Mock(return_value=iter([fake_meeting]))
-
+    async def test_timeline_data_excludes_guests(self):
+        """get_group_timeline_data attendance/RSVPs should skip guest records."""
         conn = AsyncMock()
-        conn.execute = AsyncMock(
-            side_effect=[empty_result, meetings_result, empty_result]
-        )
+        result = Mock()
+        result.one.return_value = Mock(past_meetings=[], members=[])
+        conn.execute = AsyncMock(return_value=result)
 
-        try:
-            await get_group_completion_data(conn, group_id=1)
-        except Exception:
-            pass  # May fail with mock data; we only need query capture
-
-        # Find any executed query that touches attendances and verify is_guest
-        found = False
-        for call in conn.execute.call_args_list:
-            if call.args:
-                try:
-                    sql = _compile_sql(call.args[0])
-                    if "attendances" in sql and "is_guest" in sql:
-                        found = True
-                        break
-                except Exception:
-                    continue
-        assert found, "Attendance query must filter on is_guest"
+        await get_group_timeline_data(conn, group_id=1)
+
+        sql = _compile_sql(conn.execute.call_args[0][0])
+        meeting_status = sql[sql.index("meeting_status AS") : sql.index("guest_visits")]
+        assert "a.is_guest IS FALSE" in meeting_status, (
+            f"Attendance aggregation must filter on is_guest.\nSQL: {sql}"
+        )
 
     @pytest.mark.asyncio
     async def test_user_meeting_attendance_excludes_guests(self):
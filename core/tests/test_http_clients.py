@@ -0,0 +1,63 @@
+"""Tests for shared outbound HTTP clients."""
+
+import httpx
+import pytest
+
+from core import http_clients
+from core.http_clients import (
+    close_http_clients,
+    get_http_client,
+    get_http_client_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+async def _reset():
+    yield
+    await close_http_clients()
+    http_clients._stats.clear()
+
+
+class TestGetHttpClient:
+    @pytest.mark.asyncio
+    async def test_reuses_client_per_service(self):
+        assert get_http_client("stampy") is get_http_client("stampy")
+        assert get_http_client("stampy") is not get_http_client("openai")
+
+    @pytest.mark.asyncio
+    async def test_uses_service_timeouts(self):
+        client = get_http_client("openai")
+
+        assert client.timeout == http_clients.SERVICES["openai"].timeout
+
+    @pytest.mark.asyncio
+    async def test_recreates_client_after_close(self):
+        client = get_http_client("stampy")
+
+        await close_http_clients()
+
+        assert client.is_closed
+        assert get_http_client("stampy") is not client
+
+    @pytest.mark.asyncio
+    async def test_unknown_service_raises(self):
+        with pytest.raises(KeyError):
+            get_http_client("unknown")
+
+
+class TestStats:
+    @pytest.mark.asyncio
+    async def test_counts_requests_and_errors(self):
+        def handler(request):
+            status = 500 if request.url.path == "/fail" else 200
+            return httpx.Response(status)
+
+        client = get_http_client("openai")
+        client._transport = httpx.MockTransport(handler)
+
+        await client.get("https://example.com/ok")
+        await client.get("https://example.com/fail")
+
+        stats = get_http_client_stats()["openai"]
+        assert stats["requests"] == 2
+        assert stats["errors"] == 1
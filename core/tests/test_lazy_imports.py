@@ -0,0 +1,45 @@
+"""Heavy SDKs stay out of startup imports (see core/__init__.py)."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+HEAVY_MODULES = ("litellm", "googleapiclient", "sendgrid", "cohort_scheduler")
+
+
+def _loaded_after(code: str) -> list[str]:
+    """Heavy modules in sys.modules after running code in a fresh interpreter."""
+    script = (
+        f"{code}\nimport json, sys\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_importing_core_skips_heavy_sdks():
+    loaded = _loaded_after(
+        "import core\n"
+        "import core.modules.llm\n"
+        "import core.notifications.channels.email\n"
+        "import core.calendar.client"
+    )
+
+    assert loaded == []
+
+
+def test_lazy_names_resolve_on_access():
+    import core
+    from core.google_docs import extract_doc_id
+
+    assert core.extract_doc_id is extract_doc_id
+    assert "extract_doc_id" in dir(core)
@@ -0,0 +1,49 @@
+"""Tests for event loop lag monitoring."""
+
+import asyncio
+import time
+
+import pytest
+
+from core import loop_monitor
+from core.loop_monitor import get_loop_lag_stats, start_loop_monitor, stop_loop_monitor
+
+
+@pytest.fixture(autouse=True)
+async def _reset():
+    loop_monitor._samples.clear()
+    yield
+    await stop_loop_monitor()
+    loop_monitor._samples.clear()
+
+
+class TestLoopMonitor:
+    def test_empty_stats(self):
+        assert get_loop_lag_stats() == {
+            "samples": 0,
+            "p50_ms": 0.0,
+            "p99_ms": 0.0,
+            "max_ms": 0.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_records_blocking_call(self):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(loop_monitor, "SAMPLE_INTERVAL", 0.01)
+            start_loop_monitor()
+            await asyncio.sleep(0.005)
+            time.sleep(0.1)  # Block the loop
+            await asyncio.sleep(0.03)
+
+        stats = get_loop_lag_stats()
+        assert stats["samples"] >= 1
+        assert stats["max_ms"] >= 50
+
+    @pytest.mark.asyncio
+    async def test_start_is_idempotent(self):
+        start_loop_monitor()
+        task = loop_monitor._task
+
+        start_loop_monitor()
+
+        assert loop_monitor._task is task
@@ -0,0 +1,101 @@
+"""Tests for per-operation query telemetry."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from core import query_stats
+from core.query_stats import (
+    UNSCOPED,
+    get_query_stats,
+    instrument_engine,
+    query_scope,
+    track_queries,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    query_stats.clear_query_stats()
+    yield
+    query_stats.clear_query_stats()
+
+
+@pytest.fixture
+def engine():
+    """A real (sync, SQLite) engine behind a stand-in AsyncEngine."""
+    sync_engine = create_engine("sqlite://")
+    instrument_engine(MagicMock(sync_engine=sync_engine))
+    yield sync_engine
+    sync_engine.dispose()
+
+
+def _run(engine, *statements):
+    with engine.connect() as conn:
+        for statement in statements:
+            conn.execute(text(statement))
+
+
+class TestQueryStats:
+    def test_attributes_statements_to_scope(self, engine):
+        with query_scope("GET /api/things"):
+            _run(engine, "SELECT 1", "SELECT 2")
+        with query_scope("GET /api/things"):
+            _run(engine, "SELECT 1")
+        _run(engine, "SELECT 3")
+
+        stats = get_query_stats()
+        assert stats["GET /api/things"]["calls"] == 2
+        assert stats["GET /api/things"]["statements"] == 3
+        assert stats["GET /api/things"]["max_statements"] == 2
+        assert stats["GET /api/things"]["avg_statements"] == 1.5
+        assert stats[UNSCOPED]["statements"] == 1
+
+    def test_nested_scope_restores_outer(self, engine):
+        with query_scope("outer"):
+            with query_scope("inner"):
+                _run(engine, "SELECT 1")
+            _run(engine, "SELECT 2")
+
+        stats = get_query_stats()
+        assert stats["inner"]["statements"] == 1
+        assert stats["outer"]["statements"] == 1
+
+    def test_instrumenting_twice_counts_once(self, engine):
+        instrument_engine(MagicMock(sync_engine=engine))
+
+        with query_scope("op"):
+            _run(engine, "SELECT 1")
+
+        assert get_query_stats()["op"]["statements"] == 1
+
+    def test_flags_repeated_statement(self, engine, caplog):
+        statements = ["SELECT 1"] * query_stats.N_PLUS_ONE_THRESHOLD
+
+        with query_scope("GET /api/groups"):
+            _run(engine, *statements)
+
+        assert get_query_stats()["GET /api/groups"]["n_plus_one"] == ["SELECT 1"]
+        assert "Possible N+1 in GET /api/groups" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_track_queries_decorator(self, engine):
+        @track_queries("job nightly")
+        async def job():
+            _run(engine, "SELECT 1")
+            return "done"
+
+        assert await job() == "done"
+        assert get_query_stats()["job nightly"]["statements"] == 1
+
+    def test_budget_reported(self, engine, caplog):
+        query_stats.QUERY_BUDGETS["op"] = 1
+        try:
+            with query_scope("op"):
+                _run(engine, "SELECT 1", "SELECT 2")
+            assert get_query_stats()["op"]["budget"] == 1
+        finally:
+            del query_stats.QUERY_BUDGETS["op"]
+
+        assert "op exceeded its query budget of 1 statements" in caplog.text
@@ -0,0 +1,124 @@
+"""Tests for request-scoped connection sharing in core.database."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core import database
+from core.database import get_connection, get_transaction, request_scope
+
+
+def _mock_conn():
+    conn = AsyncMock()
+    conn.in_transaction = MagicMock(return_value=False)
+    transaction = MagicMock()
+    transaction.__aenter__ = AsyncMock(return_value=transaction)
+    transaction.__aexit__ = AsyncMock(return_value=None)
+    conn.begin = MagicMock(return_value=transaction)
+    conn.begin_nested = MagicMock(return_value=transaction)
+    return conn
+
+
+class _Connect:
+    """Like AsyncEngine.connect(): awaitable, or an async context manager."""
+
+    def __init__(self):
+        self.conn = _mock_conn()
+
+    def __await__(self):
+        return asyncio.sleep(0, self.conn).__await__()
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *exc):
+        await self.conn.close()
+
+
+@pytest.fixture
+def engine():
+    """Engine whose connect() hands out a fresh mock connection each time."""
+    engine = MagicMock()
+    engine.connect = MagicMock(side_effect=_Connect)
+    database.set_engine(engine)
+    yield engine
+    database.set_engine(None)
+
+
+class TestRequestScope:
+    @pytest.mark.asyncio
+    async def test_one_checkout_per_scope(self, engine):
+        async with request_scope():
+            async with get_connection() as first:
+                pass
+            async with get_transaction() as second:
+                async with get_connection() as inner:
+                    assert inner is second
+            async with get_connection() as third:
+                pass
+
+        assert first is second is third
+        assert engine.connect.call_count == 1
+        first.begin.assert_called_once()
+        first.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_lazy_checkout(self, engine):
+        async with request_scope():
+            pass
+
+        engine.connect.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_transaction_discards_prior_reads(self, engine):
+        async with request_scope():
+            async with get_connection() as conn:
+                conn.in_transaction.return_value = True
+            async with get_transaction():
+                pass
+
+        conn.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_nested_transaction_uses_savepoint(self, engine):
+        async with request_scope():
+            async with get_transaction() as conn:
+                async with get_transaction():
+                    pass
+
+        conn.begin.assert_called_once()
+        conn.begin_nested.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_error_rolls_back_shared_connection(self, engine):
+        async with request_scope():
+            with pytest.raises(RuntimeError):
+                async with get_connection() as conn:
+                    raise RuntimeError("query failed")
+
+        conn.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_other_tasks_check_out_their_own(self, engine):
+        async def use_connection():
+            async with get_connection() as conn:
+                return conn
+
+        async with request_scope():
+            async with get_connection() as shared:
+                pass
+            other = await asyncio.create_task(use_connection())
+
+        assert other is not shared
+        assert engine.connect.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_calls_after_scope_exit_check_out_their_own(self, engine):
+        async with request_scope():
+            async with get_connection() as shared:
+                pass
+        async with get_connection() as after:
+            pass
+
+        assert after is not shared
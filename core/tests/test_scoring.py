@@ -1,9 +1,21 @@
-"""Tests for AI scoring module (prompt building and question resolution)."""
+"""Tests for AI scoring module (prompt building, question resolution, queue)."""
 
-from unittest.mock import patch
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from core.modules.flattened_types import FlattenedModule
-from core.scoring import _build_scoring_prompt, _resolve_question_details
+from core.scoring import (
+    _build_scoring_prompt,
+    _resolve_question_details,
+    _run_job,
+    _score_response,
+    _scoring_cache_key,
+    _wait_for_rate_limit,
+    _worker,
+)
 
 
 def _make_module(sections):
@@ -255,3 +267,201 @@ class TestResolveQuestionDetails:
         result = _resolve_question_details("missing-mod", "missing-mod:0:0")
 
         assert result == {}
+
+
+# =====================================================
+# TestScoringQueue
+# =====================================================
+
+
+def _job(attempts=1):
+    return {
+        "response_id": 7,
+        "question_id": "test-module:0:0",
+        "module_slug": "test-module",
+        "answer_text": "My answer",
+        "question_text": "Explain X",
+        "assessment_instructions": None,
+        "scoring_attempts": attempts,
+    }
+
+
+class TestScoringQueue:
+    """Tests for retry and give-up handling of claimed responses."""
+
+    @pytest.mark.asyncio
+    @patch("core.scoring._release", new_callable=AsyncMock)
+    @patch("core.scoring._score_response", new_callable=AsyncMock)
+    async def test_success_keeps_lease(self, mock_score, mock_release):
+        """A written score ends the job; the assessment row takes it off the queue."""
+        mock_score.return_value = True
+
+        await _run_job(_job())
+
+        mock_release.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("core.scoring._release", new_callable=AsyncMock)
+    @patch("core.scoring._score_response", new_callable=AsyncMock)
+    async def test_failure_schedules_retry(self, mock_score, mock_release):
+        """LLM errors release the response with a backoff instead of dropping it."""
+        mock_score.side_effect = RuntimeError("provider down")
+
+        await _run_job(_job(attempts=2))
+
+        mock_release.assert_called_once()
+        assert mock_release.call_args.kwargs["locked_until"] is not None
+
+    @pytest.mark.asyncio
+    @patch("core.scoring._release", new_callable=AsyncMock)
+    @patch("core.scoring._score_response", new_callable=AsyncMock)
+    async def test_unresolvable_question_is_given_up(self, mock_score, mock_release):
+        """Responses whose question can't be resolved are not retried."""
+        mock_score.return_value = False
+
+        await _run_job(_job())
+
+        mock_release.assert_called_once_with(7, give_up=True)
+
+    @pytest.mark.asyncio
+    @patch("core.scoring._release", new_callable=AsyncMock)
+    @patch("core.scoring._score_response", new_callable=AsyncMock)
+    @patch("core.scoring._claim_next", new_callable=AsyncMock)
+    async def test_worker_survives_release_failure(
+        self, mock_claim, mock_score, mock_release
+    ):
+        """A failed lease update is logged and the worker claims the next job."""
+        mock_claim.side_effect = [_job(), _job(), asyncio.CancelledError()]
+        mock_score.side_effect = RuntimeError("provider down")
+        mock_release.side_effect = [RuntimeError("connection reset"), None]
+
+        with (
+            patch("core.scoring._wakeup", asyncio.Event()),
+            patch("core.scoring.sentry_sdk") as mock_sentry,
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await _worker()
+
+        assert mock_claim.await_count == 3
+        assert mock_release.await_count == 2
+        mock_sentry.capture_exception.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("core.scoring.SCORING_RATE_LIMIT_PER_MINUTE", 60)
+    @patch("core.scoring._next_request_at", {})
+    @patch("core.scoring.asyncio.sleep", new_callable=AsyncMock)
+    async def test_rate_limit_spaces_requests_per_provider(self, mock_sleep):
+        """The second request to a provider waits; other providers don't."""
+        await _wait_for_rate_limit("provider-a")
+        await _wait_for_rate_limit("provider-b")
+        mock_sleep.assert_not_called()
+
+        await _wait_for_rate_limit("provider-a")
+
+        mock_sleep.assert_called_once()
+        assert 0.9 < mock_sleep.call_args.args[0] <= 1.0
+
+
+# =====================================================
+# TestScoringCache
+# =====================================================
+
+
+def _cache_key(**overrides):
+    kwargs = {
+        "answer_text": "My answer",
+        "question_text": "Explain X",
+        "question_hash": None,
+        "assessment_instructions": None,
+        "learning_outcome_name": None,
+        "mode": "socratic",
+    }
+    kwargs.update(overrides)
+    return _scoring_cache_key(**kwargs)
+
+
+class TestScoringCache:
+    """Tests for memoized scores of identical answers."""
+
+    def test_key_ignores_answer_whitespace(self):
+        assert _cache_key(answer_text="My  answer\n") == _cache_key()
+
+    def test_key_changes_with_answer_rubric_and_mode(self):
+        base = _cache_key()
+        assert _cache_key(answer_text="Other answer") != base
+        assert _cache_key(assessment_instructions="Be strict") != base
+        assert _cache_key(mode="assessment") != base
+
+    @pytest.mark.asyncio
+    @patch("core.scoring.complete", new_callable=AsyncMock)
+    @patch("core.scoring._get_cached_score", new_callable=AsyncMock)
+    @patch("core.scoring._resolve_question_details", return_value={})
+    async def test_cache_hit_skips_llm(self, _mock_details, mock_cached, mock_llm):
+        """A cached score is written for the response without an LLM call."""
+        mock_cached.return_value = {"overall_score": 4, "reasoning": "Good"}
+        conn = MagicMock()
+        conn.execute = AsyncMock()
+        conn.scalar = AsyncMock(return_value="My answer")
+
+        @asynccontextmanager
+        async def fake_transaction():
+            yield conn
+
+        with patch("core.scoring.get_transaction", fake_transaction):
+            scored = await _score_response(7, _job())
+
+        assert scored is True
+        mock_llm.assert_not_called()
+        # Only the assessment insert; the cache row already exists
+        assert conn.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch("core.scoring.complete", new_callable=AsyncMock)
+    @patch("core.scoring._get_cached_score", new_callable=AsyncMock)
+    @patch("core.scoring._resolve_question_details", return_value={})
+    async def test_discards_score_for_edited_answer(
+        self, _mock_details, mock_cached, _mock_llm
+    ):
+        """An answer re-completed mid-scoring is left for the next claim."""
+        mock_cached.return_value = {"overall_score": 4, "reasoning": "Good"}
+        conn = MagicMock()
+        conn.execute = AsyncMock()
+        conn.scalar = AsyncMock(return_value="My edited answer")
+
+        @asynccontextmanager
+        async def fake_transaction():
+            yield conn
+
+        with patch("core.scoring.get_transaction", fake_transaction):
+            scored = await _score_response(7, _job())
+
+        assert scored is True
+        conn.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("core.scoring._wait_for_rate_limit", new_callable=AsyncMock)
+    @patch("core.scoring.complete", new_callable=AsyncMock)
+    @patch("core.scoring._get_cached_score", new_callable=AsyncMock)
+    @patch("core.scoring._resolve_question_details", return_value={})
+    async def test_fallback_score_is_not_cached(
+        self, _mock_details, mock_cached, mock_llm, _mock_rate_limit
+    ):
+        """A score from the failover model is stored under that model only."""
+        mock_cached.return_value = None
+        mock_llm.return_value = ('{"overall_score": 3}', "openai/fallback")
+        conn = MagicMock()
+        conn.execute = AsyncMock()
+        conn.scalar = AsyncMock(return_value="My answer")
+
+        @asynccontextmanager
+        async def fake_transaction():
+            yield conn
+
+        with patch("core.scoring.get_transaction", fake_transaction):
+            scored = await _score_response(7, _job())
+
+        assert scored is True
+        # Only the assessment insert, no scoring_cache entry
+        assert conn.execute.call_count == 1
+        insert = conn.execute.call_args.args[0]
+        assert insert.compile().params["model_id"] == "openai/fallback"
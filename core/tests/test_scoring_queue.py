@@ -0,0 +1,129 @@
+"""Database tests for the scoring queue (core/scoring.py).
+
+These run the claim SQL against the real database, so the test responses
+are completed at the start of the scoring window: the oldest pending rows,
+claimed before anything else in the table.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, func, select, update
+
+from core.database import close_engine, get_transaction
+from core.questions import submit_response, update_response
+from core.scoring import SCORING_MAX_AGE, SCORING_MAX_ATTEMPTS, _claim_next
+from core.tables import question_assessments, question_responses
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def cleanup_engine():
+    yield
+    await close_engine()
+
+
+@pytest_asyncio.fixture
+async def anonymous_token():
+    """Anonymous owner of the test responses; deletes them afterwards."""
+    token = uuid.uuid4()
+    yield token
+    async with get_transaction() as conn:
+        await conn.execute(
+            delete(question_responses).where(
+                question_responses.c.anonymous_token == token
+            )
+        )
+
+
+def _window_start(minutes: int = 5) -> str:
+    return (
+        datetime.now(timezone.utc) - SCORING_MAX_AGE + timedelta(minutes=minutes)
+    ).isoformat()
+
+
+async def _completed_response(
+    anonymous_token, answer_text="First answer", minutes: int = 5
+) -> int:
+    async with get_transaction() as conn:
+        row = await submit_response(
+            conn,
+            anonymous_token=anonymous_token,
+            question_id="test-module:0:0",
+            module_slug="test-module",
+            question_text="Explain X",
+            question_hash="hash",
+            answer_text=answer_text,
+        )
+        await update_response(
+            conn,
+            response_id=row["response_id"],
+            anonymous_token=anonymous_token,
+            completed_at=_window_start(minutes),
+        )
+    return row["response_id"]
+
+
+@pytest.mark.asyncio
+async def test_recompleted_response_is_scored_again(anonymous_token):
+    """Editing and re-completing an answer drops the stale score and re-queues it."""
+    response_id = await _completed_response(anonymous_token)
+    async with get_transaction() as conn:
+        await conn.execute(
+            question_assessments.insert().values(
+                response_id=response_id, score_data={"overall_score": 2}
+            )
+        )
+        await conn.execute(
+            update(question_responses)
+            .where(question_responses.c.response_id == response_id)
+            .values(scoring_attempts=SCORING_MAX_ATTEMPTS)
+        )
+
+    job = await _claim_next()
+    assert job is None or job["response_id"] != response_id
+
+    async with get_transaction() as conn:
+        await update_response(
+            conn,
+            response_id=response_id,
+            anonymous_token=anonymous_token,
+            answer_text="Edited answer",
+            completed_at=_window_start(),
+        )
+        assessments = await conn.scalar(
+            select(func.count())
+            .select_from(question_assessments)
+            .where(question_assessments.c.response_id == response_id)
+        )
+    assert assessments == 0
+
+    job = await _claim_next()
+    assert job["response_id"] == response_id
+    assert job["answer_text"] == "Edited answer"
+    assert job["scoring_attempts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_claim_skips_locked_and_leased_responses(anonymous_token):
+    """Concurrent claims never hand out the same response twice."""
+    first = await _completed_response(anonymous_token, minutes=5)
+    second = await _completed_response(anonymous_token, minutes=6)
+
+    # Another worker is mid-claim on the oldest response
+    async with get_transaction() as other_worker:
+        await other_worker.execute(
+            select(question_responses.c.response_id)
+            .where(question_responses.c.response_id == first)
+            .with_for_update()
+        )
+        job = await _claim_next()
+    assert job["response_id"] == second
+
+    job = await _claim_next()
+    assert job["response_id"] == first
+
+    # Both are now leased
+    job = await _claim_next()
+    assert job is None or job["response_id"] not in (first, second)
@@ -4,6 +4,20 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
+def _resolve_with(fetch):
+    """Build a resolve_members() stand-in from a per-member fetch function."""
+
+    async def resolve(guild, discord_ids):
+        members = {}
+        for discord_id in discord_ids:
+            member = await fetch(guild, discord_id)
+            if member:
+                members[discord_id] = member
+        return members
+
+    return resolve
+
+
 class TestSyncMeetingReminders:
     """Test reminder sync logic.
 
@@ -152,8 +166,8 @@ class TestSyncGroupDiscordPermissions:
             with patch("core.database.get_connection") as mock_get_conn:
                 mock_get_conn.return_value.__aenter__.return_value = mock_conn
                 with patch(
-                    "core.discord_outbound.get_or_fetch_member",
-                    side_effect=mock_fetch,
+                    "core.discord_outbound.resolve_members",
+                    side_effect=_resolve_with(mock_fetch),
                 ):
                     with patch(
                         "core.discord_outbound.get_role_member_ids",
@@ -439,8 +453,8 @@ class TestSyncGroupDiscordPermissions:
             with patch("core.database.get_connection") as mock_get_conn:
                 mock_get_conn.return_value.__aenter__.return_value = mock_conn
                 with patch(
-                    "core.discord_outbound.get_or_fetch_member",
-                    side_effect=mock_fetch,
+                    "core.discord_outbound.resolve_members",
+                    side_effect=_resolve_with(mock_fetch),
                 ):
                     with patch(
                         "core.discord_outbound.get_role_member_ids",
@@ -577,8 +591,8 @@ class TestSyncGroupDiscordPermissions:
             with patch("core.database.get_connection") as mock_get_conn:
                 mock_get_conn.return_value.__aenter__.return_value = mock_conn
                 with patch(
-                    "core.discord_outbound.get_or_fetch_member",
-                    side_effect=mock_fetch,
+                    "core.discord_outbound.resolve_members",
+                    side_effect=_resolve_with(mock_fetch),
                 ):
                     with patch(
                         "core.discord_outbound.get_role_member_ids",
@@ -717,8 +731,8 @@ class TestSyncGroupDiscordPermissions:
             with patch("core.database.get_connection") as mock_get_conn:
                 mock_get_conn.return_value.__aenter__.return_value = mock_conn
                 with patch(
-                    "core.discord_outbound.get_or_fetch_member",
-                    side_effect=mock_fetch,
+                    "core.discord_outbound.resolve_members",
+                    side_effect=_resolve_with(mock_fetch),
                 ):
                     with patch(
                         "core.discord_outbound.get_role_member_ids",
@@ -862,6 +876,151 @@ class TestSyncGroupRsvps:
         assert result == {"synced": 2, "instances_fetched": 2}
 
 
+class TestSyncAllGroupRsvps:
+    """Test incremental RSVP sync driven by calendar sync tokens."""
+
+    def _conn_returning(self, group_rows):
+        mock_conn = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.mappings.return_value = group_rows
+        mock_conn.execute = AsyncMock(return_value=mock_result)
+        return mock_conn
+
+    @pytest.mark.asyncio
+    async def test_no_changes_costs_one_api_call(self):
+        """With no changed events, no groups are synced and the token advances."""
+        from core.sync import sync_all_group_rsvps
+
+        with (
+            patch("core.calendar.client.get_calendar_email", return_value="cal"),
+            patch(
+                "core.calendar.rsvp.get_calendar_sync_state",
+                AsyncMock(return_value=("tok1", [])),
+            ),
+            patch(
+                "core.calendar.rsvp.save_calendar_sync_state", new_callable=AsyncMock
+            ) as mock_save,
+            patch(
+                "core.calendar.events.list_changed_events",
+                AsyncMock(return_value=([], "tok2")),
+            ) as mock_list,
+            patch("core.sync.sync_group_rsvps", new_callable=AsyncMock) as mock_rsvps,
+        ):
+            result = await sync_all_group_rsvps()
+
+        mock_list.assert_called_once_with("tok1")
+        mock_rsvps.assert_not_called()
+        mock_save.assert_called_once_with("cal", "tok2", [])
+        assert result["mode"] == "incremental"
+        assert result["groups_synced"] == 0
+
+    @pytest.mark.asyncio
+    async def test_syncs_only_groups_with_changed_events(self):
+        """Changed instances map back to their series' group."""
+        from core.sync import sync_all_group_rsvps
+
+        changed = [
+            {"id": "rec1_20260101", "recurringEventId": "rec1"},
+            {"id": "rec2", "status": "cancelled"},
+        ]
+        mock_conn = self._conn_returning([{"group_id": 7}])
+
+        with (
+            patch("core.calendar.client.get_calendar_email", return_value="cal"),
+            patch(
+                "core.calendar.rsvp.get_calendar_sync_state",
+                AsyncMock(return_value=("tok1", [])),
+            ),
+            patch(
+                "core.calendar.rsvp.save_calendar_sync_state", new_callable=AsyncMock
+            ) as mock_save,
+            patch(
+                "core.calendar.events.list_changed_events",
+                AsyncMock(return_value=(changed, "tok2")),
+            ),
+            patch("core.database.get_connection") as mock_get_conn,
+            patch("core.sync.sync_group_rsvps", new_callable=AsyncMock) as mock_rsvps,
+        ):
+            mock_get_conn.return_value.__aenter__.return_value = mock_conn
+            mock_rsvps.return_value = {"rsvps_updated": 3}
+            result = await sync_all_group_rsvps()
+
+        mock_rsvps.assert_called_once_with(7)
+        mock_save.assert_called_once_with("cal", "tok2", [])
+        assert result["groups_synced"] == 1
+        assert result["total_rsvps_updated"] == 3
+
+    @pytest.mark.asyncio
+    async def test_expired_token_falls_back_to_full_sync(self):
+        """A 410 from Google triggers a full sync; failed groups are recorded."""
+        from core.calendar.events import SyncTokenExpiredError
+        from core.sync import sync_all_group_rsvps
+
+        mock_conn = self._conn_returning(
+            [
+                {"group_id": 1},
+                {"group_id": 2},
+            ]
+        )
+
+        with (
+            patch("core.calendar.client.get_calendar_email", return_value="cal"),
+            patch(
+                "core.calendar.rsvp.get_calendar_sync_state",
+                AsyncMock(return_value=("stale", [])),
+            ),
+            patch(
+                "core.calendar.rsvp.save_calendar_sync_state", new_callable=AsyncMock
+            ) as mock_save,
+            patch(
+                "core.calendar.events.list_changed_events",
+                AsyncMock(side_effect=[SyncTokenExpiredError(), ([], "fresh")]),
+            ),
+            patch("core.database.get_connection") as mock_get_conn,
+            patch("core.sync.sync_group_rsvps", new_callable=AsyncMock) as mock_rsvps,
+        ):
+            mock_get_conn.return_value.__aenter__.return_value = mock_conn
+            mock_rsvps.side_effect = [{"rsvps_updated": 0}, {"error": "api_failed"}]
+            result = await sync_all_group_rsvps()
+
+        assert result["mode"] == "full"
+        assert mock_rsvps.call_count == 2
+        assert result["groups_failed"] == 1
+        # The token advances anyway; only the failed group is retried
+        mock_save.assert_called_once_with("cal", "fresh", [2])
+
+    @pytest.mark.asyncio
+    async def test_retries_failed_groups_without_calendar_changes(self):
+        """Groups that failed last run are re-synced even if nothing changed."""
+        from core.sync import sync_all_group_rsvps
+
+        mock_conn = self._conn_returning([{"group_id": 4}])
+
+        with (
+            patch("core.calendar.client.get_calendar_email", return_value="cal"),
+            patch(
+                "core.calendar.rsvp.get_calendar_sync_state",
+                AsyncMock(return_value=("tok1", [4])),
+            ),
+            patch(
+                "core.calendar.rsvp.save_calendar_sync_state", new_callable=AsyncMock
+            ) as mock_save,
+            patch(
+                "core.calendar.events.list_changed_events",
+                AsyncMock(return_value=([], "tok2")),
+            ),
+            patch("core.database.get_connection") as mock_get_conn,
+            patch("core.sync.sync_group_rsvps", new_callable=AsyncMock) as mock_rsvps,
+        ):
+            mock_get_conn.return_value.__aenter__.return_value = mock_conn
+            mock_rsvps.return_value = {"rsvps_updated": 1}
+            result = await sync_all_group_rsvps()
+
+        mock_rsvps.assert_called_once_with(4)
+        assert result["groups_synced"] == 1
+        mock_save.assert_called_once_with("cal", "tok2", [])
+
+
 class TestSyncGroup:
     """Test unified sync_group function."""
 
@@ -1083,6 +1242,100 @@ class TestSyncAfterGroupChange:
             assert result["new_group"] == {"discord": {"granted": 1}}
 
 
+class TestSyncCohortGroups:
+    """Tests for sync_cohort_groups() bounded fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_runs_groups_concurrently_up_to_limit(self):
+        """Should never have more than `concurrency` syncs in flight."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_sync(group_id, allow_create=False):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"group_id": group_id}
+
+        with patch("core.sync.sync_group", side_effect=fake_sync):
+            from core.sync import sync_cohort_groups
+
+            results = await sync_cohort_groups(list(range(10)), concurrency=3)
+
+        assert peak == 3
+        # Results preserve input order
+        assert [r["group_id"] for r in results] == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_reports_progress_and_captures_exceptions(self):
+        """Exceptions become error results and progress fires for every group."""
+
+        async def fake_sync(group_id, allow_create=False):
+            if group_id == 2:
+                raise RuntimeError("boom")
+            return {"ok": True}
+
+        progress = []
+
+        async def on_progress(group_id, result, done, total):
+            progress.append((group_id, done, total))
+
+        with patch("core.sync.sync_group", side_effect=fake_sync):
+            from core.sync import sync_cohort_groups
+
+            results = await sync_cohort_groups(
+                [1, 2, 3], allow_create=True, on_progress=on_progress
+            )
+
+        assert results[1] == {"group_id": 2, "result": {"error": "boom"}}
+        assert sorted(done for _, done, _ in progress) == [1, 2, 3]
+        assert all(total == 3 for _, _, total in progress)
+
+
+class TestCohortLock:
+    """Tests for the per-cohort resource-creation lock."""
+
+    @pytest.mark.asyncio
+    async def test_serializes_within_cohort_and_drops_idle_locks(self):
+        """Holders of one cohort's lock run one at a time; the entry goes once idle."""
+        import asyncio
+
+        from core.sync import _cohort_lock, _cohort_locks
+
+        order = []
+
+        async def hold(name):
+            async with _cohort_lock(1):
+                order.append(f"{name} in")
+                await asyncio.sleep(0.01)
+                order.append(f"{name} out")
+
+        first = asyncio.create_task(hold("a"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(hold("b"))
+        await asyncio.sleep(0)
+        assert _cohort_locks[1].users == 2
+
+        await asyncio.gather(first, second)
+
+        assert order == ["a in", "a out", "b in", "b out"]
+        assert 1 not in _cohort_locks
+
+    @pytest.mark.asyncio
+    async def test_drops_lock_when_holder_raises(self):
+        from core.sync import _cohort_lock, _cohort_locks
+
+        with pytest.raises(RuntimeError):
+            async with _cohort_lock(2):
+                raise RuntimeError("boom")
+
+        assert 2 not in _cohort_locks
+
+
 class TestEnsureCohortCategory:
     """Tests for ensure_cohort_category() helper."""
 
@@ -4,6 +4,20 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
+def _resolve_with(fetch):
+    """Build a resolve_members() stand-in from a per-member fetch function."""
+
+    async def resolve(guild, discord_ids):
+        members = {}
+        for discord_id in discord_ids:
+            member = await fetch(guild, discord_id)
+            if member:
+                members[discord_id] = member
+        return members
+
+    return resolve
+
+
 class TestGuestVisitorsInExpectedMembers:
     """Verify sync_group_discord_permissions includes guest visitors."""
 
@@ -140,8 +154,8 @@ class TestGuestVisitorsInExpectedMembers:
             with patch("core.database.get_connection") as mock_get_conn:
                 mock_get_conn.return_value.__aenter__.return_value = mock_conn
                 with patch(
-                    "core.discord_outbound.get_or_fetch_member",
-                    side_effect=mock_fetch,
+                    "core.discord_outbound.resolve_members",
+                    side_effect=_resolve_with(mock_fetch),
                 ):
                     with patch(
                         "core.discord_outbound.get_role_member_ids",
@@ -218,8 +232,8 @@ class TestGuestVisitorsInExpectedMembers:
             with patch("core.database.get_connection") as mock_get_conn:
                 mock_get_conn.return_value.__aenter__.return_value = mock_conn
                 with patch(
-                    "core.discord_outbound.get_or_fetch_member",
-                    side_effect=mock_fetch,
+                    "core.discord_outbound.resolve_members",
+                    side_effect=_resolve_with(mock_fetch),
                 ):
                     with patch(
                         "core.discord_outbound.get_role_member_ids",
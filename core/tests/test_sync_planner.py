@@ -0,0 +1,143 @@
+"""Tests for the cohort-wide sync planner."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core.sync_planner import CohortSyncPlan, _sync_external_only, build_group_plan
+
+COHORT = {
+    "cohort_id": 1,
+    "cohort_name": "Jan",
+    "discord_category_id": "10",
+    "discord_cohort_channel_id": "20",
+}
+
+
+def _group(**overrides):
+    group = {
+        "group_id": 5,
+        "group_name": "Alpha",
+        "status": "active",
+        "discord_text_channel_id": "30",
+        "discord_voice_channel_id": None,
+        "discord_role_id": "40",
+        "member_discord_ids": {"1", "2"},
+        "facilitator_discord_ids": set(),
+        "guest_discord_ids": set(),
+        "member_count": 2,
+    }
+    group.update(overrides)
+    return group
+
+
+def _member(discord_id):
+    member = MagicMock()
+    member.id = int(discord_id)
+    return member
+
+
+def _bot_with_role(member_ids, role_name="Cohort Jan - Group Alpha"):
+    role = MagicMock()
+    role.name = role_name
+    role.members = [_member(d) for d in member_ids]
+
+    channel = MagicMock()
+    channel.overwrites = {role: MagicMock()}
+
+    guild = MagicMock()
+    guild.get_role.return_value = role
+
+    bot = MagicMock()
+    bot.guilds = [guild]
+    bot.get_channel.return_value = channel
+    return bot
+
+
+class TestBuildGroupPlan:
+    def test_unrealized_group_with_members_needs_infrastructure(self):
+        plan = build_group_plan(
+            _group(discord_text_channel_id=None), COHORT, _bot_with_role([])
+        )
+
+        assert plan.needs_infrastructure is True
+        assert plan.needs_discord_sync is False
+
+    def test_unrealized_group_without_members_is_skipped(self):
+        plan = build_group_plan(
+            _group(discord_text_channel_id=None, member_count=0),
+            COHORT,
+            _bot_with_role([]),
+        )
+
+        assert plan.no_members is True
+        assert plan.describe() == ["skip: no members"]
+
+    def test_in_sync_group_has_no_changes(self):
+        plan = build_group_plan(_group(), COHORT, _bot_with_role(["1", "2"]))
+
+        assert plan.needs_discord_sync is False
+        assert plan.describe() == []
+
+    def test_diffs_role_membership_including_guests(self):
+        plan = build_group_plan(
+            _group(guest_discord_ids={"9"}), COHORT, _bot_with_role(["1", "3"])
+        )
+
+        assert plan.grant_discord_ids == {"2", "9"}
+        assert plan.revoke_discord_ids == {"3"}
+        assert plan.needs_discord_sync is True
+
+    def test_flags_role_rename_and_missing_overwrites(self):
+        bot = _bot_with_role(["1", "2"], role_name="Old name")
+        bot.get_channel.return_value.overwrites = {}
+
+        plan = build_group_plan(_group(), COHORT, bot)
+
+        assert plan.role_action == "rename"
+        assert plan.missing_permissions == ["text", "cohort"]
+
+    def test_no_discord_comparison_without_bot(self):
+        plan = build_group_plan(_group(), COHORT, None)
+
+        assert plan.needs_discord_sync is False
+
+
+class TestCohortSyncPlan:
+    def test_format_summarizes_changed_groups(self):
+        bot = _bot_with_role(["1"])
+        plan = CohortSyncPlan(
+            cohort_id=1,
+            cohort_name="Jan",
+            groups=[build_group_plan(_group(), COHORT, bot)],
+        )
+
+        text = plan.format()
+
+        assert "Alpha [5]: grant role: 1" in text
+        assert "1/1 groups need Discord changes" in text
+
+
+class TestSyncExternalOnly:
+    @pytest.mark.asyncio
+    @patch("core.notifications.scheduler.schedule_sync_retry")
+    @patch("core.sync.sync_group_rsvps", new_callable=AsyncMock)
+    @patch("core.sync.sync_group_reminders", new_callable=AsyncMock)
+    @patch("core.calendar.coordinator.sync_groups_calendar", new_callable=AsyncMock)
+    async def test_syncs_rsvps_and_retries_failures(
+        self, mock_calendar, mock_reminders, mock_rsvps, mock_retry
+    ):
+        mock_calendar.return_value = {1: {"updated": 1}, 2: {"failed": 1}}
+        mock_reminders.return_value = {"jobs": 2}
+        mock_rsvps.side_effect = [{"synced": 3}, RuntimeError("calendar down")]
+
+        results = await _sync_external_only([1, 2], concurrency=1)
+
+        by_group = {entry["group_id"]: entry["result"] for entry in results}
+        assert by_group[1]["rsvps"] == {"synced": 3}
+        assert by_group[2]["rsvps"] == {"error": "calendar down"}
+        assert {call.kwargs["sync_type"] for call in mock_retry.call_args_list} == {
+            "calendar",
+            "rsvps",
+        }
+        assert all(call.kwargs["group_id"] == 2 for call in mock_retry.call_args_list)
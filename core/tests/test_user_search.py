@@ -0,0 +1,105 @@
+"""Tests for the in-process user search index."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from core import user_search
+from core.user_search import TrigramIndex, similarity, trigrams
+
+ROWS = [
+    {
+        "user_id": 1,
+        "discord_id": "111222333",
+        "nickname": "Alice",
+        "discord_username": "alice_w",
+        "email": "alice@example.com",
+    },
+    {
+        "user_id": 2,
+        "discord_id": "444555666",
+        "nickname": None,
+        "discord_username": "bob_smith",
+        "email": "robert@example.org",
+    },
+    {
+        "user_id": 3,
+        "discord_id": "777888999",
+        "nickname": "Malice",
+        "discord_username": "mal",
+        "email": None,
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    user_search.clear_user_search_index()
+    yield
+    user_search.clear_user_search_index()
+
+
+def _ids(rows):
+    return [row["user_id"] for row in rows]
+
+
+class TestTrigrams:
+    def test_matches_pg_trgm(self):
+        # SELECT show_trgm('Cat') -> {"  c"," ca","at ",cat}
+        assert trigrams("Cat") == {"  c", " ca", "cat", "at "}
+
+    def test_similarity(self):
+        assert similarity(trigrams("alice"), trigrams("alice")) == 1.0
+        assert similarity(trigrams("alice"), trigrams("bob")) == 0.0
+
+
+class TestTrigramIndex:
+    def test_exact_name_ranks_first(self):
+        index = TrigramIndex.build(ROWS)
+
+        assert _ids(index.search("alice", 10)) == [1, 3]
+
+    def test_tolerates_typos(self):
+        index = TrigramIndex.build(ROWS)
+
+        assert _ids(index.search("bob_smiht", 10)) == [2]
+
+    def test_short_substring(self):
+        index = TrigramIndex.build(ROWS)
+
+        assert _ids(index.search("sm", 10)) == [2]
+
+    def test_email_and_discord_id_prefix(self):
+        index = TrigramIndex.build(ROWS)
+
+        assert _ids(index.search("robert@", 10)) == [2]
+        assert _ids(index.search("7778", 10)) == [3]
+
+    def test_limit(self):
+        index = TrigramIndex.build(ROWS)
+
+        assert len(index.search("alice", 1)) == 1
+
+
+class TestSearchUsersFallback:
+    @pytest.mark.asyncio
+    async def test_uses_in_memory_index_without_pg_trgm(self):
+        from core.queries.users import search_users
+
+        probe = MagicMock()
+        probe.scalar.return_value = False
+        rows = MagicMock()
+        rows.mappings.return_value = ROWS
+        mock_conn = AsyncMock()
+        mock_conn.execute.side_effect = [probe, rows]
+
+        results = await search_users(mock_conn, "malice")
+        # Index is reused until it goes stale
+        await search_users(mock_conn, "bob")
+
+        assert results[0] == {
+            "user_id": 3,
+            "discord_id": "777888999",
+            "nickname": "Malice",
+            "discord_username": "mal",
+        }
+        assert mock_conn.execute.call_count == 2
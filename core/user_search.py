@@ -0,0 +1,157 @@
+"""
+In-process trigram index for admin user search.
+
+Admin search normally runs in Postgres with pg_trgm GIN indexes (see
+search_users in core/queries/users.py). Where the extension isn't
+installed, users are matched against this index instead: a snapshot of
+the searchable columns, rebuilt at most every INDEX_TTL seconds, so a
+keystroke costs a few dict lookups rather than a scan of the users table.
+
+Trigrams and similarity follow pg_trgm, so both paths rank alike.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from .tables import users
+
+# Seconds before the in-process index is rebuilt from the database
+INDEX_TTL = 60.0
+
+# pg_trgm's default similarity threshold
+SIMILARITY_THRESHOLD = 0.3
+
+SEARCH_COLUMNS = ("nickname", "discord_username", "email", "discord_id")
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def trigrams(text: str) -> set[str]:
+    """pg_trgm-style trigrams: lowercased words padded "  w ", sliced by 3."""
+    result = set()
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        result.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+def similarity(a: set[str], b: set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class TrigramIndex:
+    """Trigram postings over the searchable user columns."""
+
+    rows: list[dict] = field(default_factory=list)
+    # trigram -> positions in rows with a searchable column containing it
+    postings: dict[str, set[int]] = field(default_factory=dict)
+    # Per row: (lowercased name, its trigrams) for nickname and username
+    names: list[list[tuple[str, set[str]]]] = field(default_factory=list)
+    built_at: float = 0.0
+
+    @classmethod
+    def build(cls, rows: list[dict]) -> "TrigramIndex":
+        index = cls(rows=rows, built_at=time.monotonic())
+        for position, row in enumerate(rows):
+            for column in SEARCH_COLUMNS:
+                for trigram in trigrams(row.get(column) or ""):
+                    index.postings.setdefault(trigram, set()).add(position)
+            index.names.append(
+                [
+                    (name.lower(), trigrams(name))
+                    for name in (row.get("nickname"), row.get("discord_username"))
+                    if name
+                ]
+            )
+        return index
+
+    def _score(self, position: int, query: str, query_trigrams: set[str]) -> float:
+        best = 0.0
+        for name, name_trigrams in self.names[position]:
+            if query in name:
+                best = max(best, 1.0 if name == query else 0.9)
+            best = max(best, similarity(query_trigrams, name_trigrams))
+        row = self.rows[position]
+        email = (row.get("email") or "").lower()
+        discord_id = row.get("discord_id") or ""
+        if email.startswith(query) or discord_id.startswith(query):
+            best = 1.0
+        return best
+
+    def search(self, query: str, limit: int) -> list[dict]:
+        """Best matches by similarity, substring or email/Discord ID prefix."""
+        query = query.strip().lower()
+        query_trigrams = trigrams(query)
+
+        candidates: set[int] = set()
+        for trigram in query_trigrams:
+            candidates |= self.postings.get(trigram, set())
+        # Substrings shorter than a trigram, or spanning words, can match
+        # rows that share no trigram with the query; check everything then
+        if len(query) < 3 or not candidates:
+            candidates = set(range(len(self.rows)))
+
+        scored = []
+        for position in candidates:
+            score = self._score(position, query, query_trigrams)
+            if score >= SIMILARITY_THRESHOLD:
+                nickname = self.rows[position].get("nickname") or ""
+                scored.append((-score, nickname, position))
+        scored.sort()
+        return [self.rows[position] for _, _, position in scored[:limit]]
+
+
+_index: TrigramIndex | None = None
+
+# Whether the pg_trgm extension is installed (checked once per process)
+_trgm_available: bool | None = None
+
+
+def clear_user_search_index() -> None:
+    global _index, _trgm_available
+    _index = None
+    _trgm_available = None
+
+
+async def trgm_available(conn: AsyncConnection) -> bool:
+    """Whether search can use pg_trgm (installed by a migration where allowed)."""
+    global _trgm_available
+    if _trgm_available is None:
+        result = await conn.execute(
+            text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+        )
+        _trgm_available = bool(result.scalar())
+    return _trgm_available
+
+
+async def search_users_in_memory(
+    conn: AsyncConnection, query: str, limit: int
+) -> list[dict]:
+    """Search users with the in-process index, rebuilding it when stale."""
+    global _index
+    if _index is None or time.monotonic() - _index.built_at > INDEX_TTL:
+        result = await conn.execute(
+            select(
+                users.c.user_id,
+                users.c.discord_id,
+                users.c.nickname,
+                users.c.discord_username,
+                users.c.email,
+            )
+        )
+        _index = TrigramIndex.build([dict(row) for row in result.mappings()])
+
+    return [
+        {
+            key: row[key]
+            for key in ("user_id", "discord_id", "nickname", "discord_username")
+        }
+        for row in _index.search(query, limit)
+    ]
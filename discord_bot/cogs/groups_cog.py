@@ -5,6 +5,7 @@ Creates Discord channels, scheduled events, and welcome messages.
 
 import logging
 import sys
+import time
 from pathlib import Path
 
 import discord
@@ -19,10 +20,13 @@ from core.queries.groups import (
     get_cohort_groups_for_realization,
     get_realized_groups_for_discord_user,
 )
-from core.sync import sync_group, sync_group_discord_permissions
+from core.sync import sync_cohort_groups, sync_group_discord_permissions
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between progress message edits during realization
+PROGRESS_EDIT_INTERVAL = 2.0
+
 
 class GroupsCog(commands.Cog):
     """Cog for realizing groups in Discord from database."""
@@ -85,32 +89,39 @@ class GroupsCog(commands.Cog):
             )
             return
 
-        # Process each preview group
+        # Realize all preview groups concurrently
+        preview_groups = {
+            group_data["group_id"]: group_data["group_name"]
+            for group_data in cohort_data["groups"]
+            if group_data.get("status") == "preview"
+        }
         created_count = 0
         failed_count = 0
-        results = []
-
-        for group_data in cohort_data["groups"]:
-            if group_data.get("status") != "preview":
-                continue
-
-            group_name = group_data["group_name"]
-            group_id = group_data["group_id"]
-
-            await progress_msg.edit(content=f"Processing {group_name}...")
-
-            try:
-                result = await sync_group(group_id, allow_create=True)
-                results.append({"group": group_name, "result": result})
+        last_edit = 0.0
 
-                if result.get("error") or result.get("needs_infrastructure"):
-                    failed_count += 1
-                else:
-                    created_count += 1
-            except Exception as e:
-                logger.error(f"Failed to realize group {group_id}: {e}")
+        async def on_progress(group_id: int, result: dict, done: int, total: int):
+            nonlocal created_count, failed_count, last_edit
+            if result.get("error") or result.get("needs_infrastructure"):
                 failed_count += 1
-                results.append({"group": group_name, "error": str(e)})
+            else:
+                created_count += 1
+
+            # Throttle edits; the final summary replaces this message anyway
+            now = time.monotonic()
+            if done < total and now - last_edit < PROGRESS_EDIT_INTERVAL:
+                return
+            last_edit = now
+            await progress_msg.edit(
+                content=f"Realized {done}/{total} groups "
+                f"(latest: {preview_groups[group_id]})..."
+            )
+
+        await progress_msg.edit(content=f"Processing {len(preview_groups)} groups...")
+        await sync_cohort_groups(
+            list(preview_groups),
+            allow_create=True,
+            on_progress=on_progress,
+        )
 
         # Summary
         color = discord.Color.green() if failed_count == 0 else discord.Color.orange()
@@ -12,6 +12,7 @@ import asyncio
 import time
 import os
 import re
+from collections.abc import Awaitable, Callable
 
 import sys
 from pathlib import Path
@@ -29,6 +30,10 @@ STAMPY_AVATAR = "https://raw.githubusercontent.com/StampyAI/StampyAIAssets/main/
 SCROLL_LINES = 5
 SCROLL_LINE_WIDTH = 50
 SCROLL_UPDATE_INTERVAL = 0.5  # 2fps (safe margin under 2.5/sec rate limit)
+RATE_LIMIT_BACKOFF = 1.0  # Seconds to wait after a rate-limited edit
+
+# Answer text formatted for the live preview (the message shows 1990 chars)
+ANSWER_PREVIEW_CHARS = 2100
 
 
 def format_thinking(text: str, prefix: str = "*Thinking...*") -> str:
@@ -54,11 +59,150 @@ def wrap_text_to_lines(text: str, width: int = SCROLL_LINE_WIDTH) -> list[str]:
     return lines
 
 
-def format_scrolling_codeblock(text: str, num_lines: int = SCROLL_LINES) -> str:
-    """Format text as a scrolling codeblock showing last N lines."""
-    lines = wrap_text_to_lines(text)
-    display_lines = lines[-num_lines:] if len(lines) > num_lines else lines
-    return "```\n" + "\n".join(display_lines) + "\n```"
+class StreamingText:
+    """Append-only streamed text that keeps its wrapped lines up to date.
+
+    Produces the same lines as wrap_text_to_lines(text), but each append only
+    wraps the new chunk, so streaming a long response stays linear instead of
+    rejoining and rewrapping everything per chunk.
+    """
+
+    def __init__(self, width: int = SCROLL_LINE_WIDTH):
+        self.width = width
+        self._chunks: list[str] = []
+        self._size = 0
+        self._lines: list[str] = []  # Completed lines
+        self._current = ""  # Line being filled, built as wrap_text_to_lines does
+        self._partial = ""  # Trailing word the next chunk may continue
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, chunk: str) -> None:
+        if not chunk:
+            return
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+
+        text = self._partial + chunk
+        words = text.split()
+        self._partial = words.pop() if words and not text[-1].isspace() else ""
+        for word in words:
+            self._current = self._wrap_word(self._current, word, self._lines)
+
+    def _wrap_word(self, current: str, word: str, lines: list[str]) -> str:
+        if len(current) + len(word) + 1 > self.width:
+            if current:
+                lines.append(current.strip())
+            return word + " "
+        return current + word + " "
+
+    def _pending_lines(self) -> list[str]:
+        """Lines after the completed ones (current line plus partial word)."""
+        lines: list[str] = []
+        current = self._current
+        if self._partial:
+            current = self._wrap_word(current, self._partial, lines)
+        if current.strip():
+            lines.append(current.strip())
+        return lines
+
+    @property
+    def line_count(self) -> int:
+        return len(self._lines) + len(self._pending_lines())
+
+    def tail(self, num_lines: int) -> list[str]:
+        """The last num_lines wrapped lines."""
+        if num_lines <= 0:
+            return []
+        return (self._lines[-num_lines:] + self._pending_lines())[-num_lines:]
+
+    def head(self, num_chars: int) -> str:
+        """The first num_chars characters, without joining the whole text."""
+        if self._size <= num_chars:
+            return self.text
+        parts, size = [], 0
+        for chunk in self._chunks:
+            parts.append(chunk)
+            size += len(chunk)
+            if size >= num_chars:
+                break
+        return "".join(parts)[:num_chars]
+
+    @property
+    def text(self) -> str:
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+
+def format_scrolling_codeblock(
+    text: StreamingText, num_lines: int = SCROLL_LINES
+) -> str:
+    """Format streamed text as a scrolling codeblock showing the last N lines."""
+    return "```\n" + "\n".join(text.tail(num_lines)) + "\n```"
+
+
+class EditScheduler:
+    """Coalesces edits to streaming messages.
+
+    Callers mark a message dirty with a coroutine function that renders and
+    applies its latest state. Each message is edited at most once per
+    interval, and only its newest state is sent; edits run in a background
+    task so the stream is never blocked on Discord.
+    """
+
+    def __init__(self, interval: float = SCROLL_UPDATE_INTERVAL):
+        self.interval = interval
+        self._pending: dict[str, Callable[[], Awaitable[None]]] = {}
+        self._next_edit: dict[str, float] = {}
+        self._wake = asyncio.Event()
+        self._closed = False
+        self._task = asyncio.create_task(self._run())
+
+    def mark_dirty(self, key: str, edit: Callable[[], Awaitable[None]]) -> None:
+        if self._closed:
+            return
+        self._pending[key] = edit
+        self._wake.set()
+
+    async def close(self) -> None:
+        """Drop pending edits and wait for an in-flight edit to finish."""
+        if self._closed:
+            return
+        self._closed = True
+        self._pending.clear()
+        self._wake.set()
+        await self._task
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._closed:
+            if not self._pending:
+                await self._wake.wait()
+                self._wake.clear()
+                continue
+
+            key = min(self._pending, key=lambda k: self._next_edit.get(k, 0.0))
+            delay = self._next_edit.get(key, 0.0) - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), delay)
+                except TimeoutError:
+                    pass
+                self._wake.clear()
+                continue
+
+            edit = self._pending.pop(key)
+            self._next_edit[key] = loop.time() + self.interval
+            try:
+                await edit()
+            except discord.errors.HTTPException as e:
+                print(f"[Stampy] Rate limited on {key} update: {e}")
+                self._next_edit[key] = loop.time() + RATE_LIMIT_BACKOFF
+            except Exception as e:
+                # Keep the scheduler alive for the message's later edits
+                print(f"[Stampy] Error on {key} update: {e}")
 
 
 def get_ref_mapping(text: str) -> tuple[list[str], dict[str, str]]:
@@ -111,14 +255,14 @@ class ThinkingExpandView(discord.ui.View):
 
     def __init__(self):
         super().__init__(timeout=600)  # 10 min timeout
-        self.thinking_text = ""
+        self.thinking = StreamingText()
         self.expanded = False
         self.is_streaming = True  # Still receiving thinking chunks
         self.phase = "thinking"  # "thinking", "answering", or "done"
 
-    def update_thinking(self, text: str):
-        """Update the thinking text (called during streaming)."""
-        self.thinking_text = text
+    def update_thinking(self, chunk: str):
+        """Append a thinking chunk (called during streaming)."""
+        self.thinking.append(chunk)
 
     def finish_streaming(self):
         """Mark streaming as complete."""
@@ -139,7 +283,7 @@ class ThinkingExpandView(discord.ui.View):
         if self.expanded:
             # Show full text in embed (4096 char description limit)
             max_len = 4000  # Leave room for code block formatting
-            text = self.thinking_text
+            text = self.thinking.head(max_len + 1)
             if len(text) > max_len:
                 cut_point = text.rfind(" ", 0, max_len)
                 if cut_point == -1:
@@ -148,7 +292,7 @@ class ThinkingExpandView(discord.ui.View):
             description = f"```\n{text}\n```"
         else:
             # Show scrolling last 5 lines
-            description = format_scrolling_codeblock(self.thinking_text)
+            description = format_scrolling_codeblock(self.thinking)
 
         embed = discord.Embed(
             title=title, description=description, color=discord.Color.blue()
@@ -277,7 +421,6 @@ class StampyCog(commands.Cog):
 
         # Create view with toggle button (added once we have enough text)
         thinking_view = ThinkingExpandView()
-        view_added = False
         MIN_LINES_FOR_BUTTON = 3
 
         # Initial thinking message without button
@@ -292,15 +435,48 @@ class StampyCog(commands.Cog):
         )
         print(f"[Stampy] Sent thinking message: {thinking_msg.id}")
 
-        thinking_chunks = []
-        answer_chunks = []
+        thinking = thinking_view.thinking
+        answer = StreamingText()
         citations = []
         answer_msg = None
-        answer_msg_precreated = (
-            False  # Track if answer msg was pre-created during thinking
-        )
-        last_thinking_update = time.time()
-        last_answer_update = 0  # Start at 0 so first update happens immediately
+        answer_msg_task = None  # Answer message pre-created during thinking
+        last_answer_display = None
+        edits = EditScheduler()
+
+        async def edit_thinking():
+            if not len(thinking):
+                await thinking_msg.edit(
+                    embed=discord.Embed(
+                        description="*(No thinking content)*",
+                        color=discord.Color.blue(),
+                    ),
+                    view=None,
+                )
+                return
+            t0 = time.time()
+            await thinking_msg.edit(
+                embed=thinking_view.get_display_content(thinking_view.phase),
+                view=thinking_view
+                if thinking.line_count >= MIN_LINES_FOR_BUTTON
+                else None,
+            )
+            print(f"[Timing] thinking_msg.edit took {(time.time() - t0) * 1000:.0f}ms")
+
+        async def edit_answer():
+            nonlocal last_answer_display
+            # Only the start of the answer fits in the message, so only that
+            # part is formatted; once it's full, edits stop
+            display = format_refs_inline(answer.head(ANSWER_PREVIEW_CHARS))
+            if len(display) > 1990 or len(answer) > ANSWER_PREVIEW_CHARS:
+                display = display[:1990] + "..."
+            if display == last_answer_display:
+                return
+            t0 = time.time()
+            await answer_msg.edit(content=display)
+            last_answer_display = display
+            print(
+                f"[Timing] answer_msg.edit took {(time.time() - t0) * 1000:.0f}ms, content_len={len(answer)}"
+            )
 
         # Timing instrumentation
         last_chunk_time = time.time()
@@ -319,52 +495,23 @@ class StampyCog(commands.Cog):
                 )
 
                 if state == "thinking":
-                    thinking_chunks.append(content)
-                    full_thinking = "".join(thinking_chunks)
-                    thinking_view.update_thinking(full_thinking)
-
-                    # Check if we have enough lines to show the button
-                    num_lines = len(wrap_text_to_lines(full_thinking))
-
-                    # Update at 2fps (every 500ms)
-                    now = time.time()
-                    if now - last_thinking_update >= SCROLL_UPDATE_INTERVAL:
-                        try:
-                            # Add view once we have enough lines
-                            if num_lines >= MIN_LINES_FOR_BUTTON and not view_added:
-                                view_added = True
-
-                            t0 = time.time()
-                            await thinking_msg.edit(
-                                embed=thinking_view.get_display_content("thinking"),
-                                view=thinking_view if view_added else None,
-                            )
-                            print(
-                                f"[Timing] thinking_msg.edit took {(time.time() - t0) * 1000:.0f}ms"
+                    thinking_view.update_thinking(content)
+                    edits.mark_dirty("thinking", edit_thinking)
+
+                    # Pre-create answer message during thinking phase (after ~3 lines)
+                    # This eliminates the expensive webhook.send() from the critical path
+                    if (
+                        answer_msg_task is None
+                        and thinking.line_count >= MIN_LINES_FOR_BUTTON
+                    ):
+                        answer_msg_task = asyncio.create_task(
+                            webhook.send(
+                                "...",
+                                username=STAMPY_NAME,
+                                avatar_url=STAMPY_AVATAR,
+                                wait=True,
                             )
-
-                            # Pre-create answer message during thinking phase (after ~3 lines)
-                            # This eliminates the expensive webhook.send() from the critical path
-                            if (
-                                not answer_msg_precreated
-                                and num_lines >= MIN_LINES_FOR_BUTTON
-                            ):
-                                t0 = time.time()
-                                answer_msg = await webhook.send(
-                                    "...",
-                                    username=STAMPY_NAME,
-                                    avatar_url=STAMPY_AVATAR,
-                                    wait=True,
-                                )
-                                answer_msg_precreated = True
-                                print(
-                                    f"[Timing] Pre-created answer message in {(time.time() - t0) * 1000:.0f}ms: {answer_msg.id}"
-                                )
-
-                        except discord.errors.HTTPException as e:
-                            print(f"[Stampy] Rate limited on thinking update: {e}")
-                            await asyncio.sleep(1.0)  # Rate limited, back off more
-                        last_thinking_update = now
+                        )
 
                 elif state == "citations":
                     citations = content  # content is list of citation dicts
@@ -372,50 +519,24 @@ class StampyCog(commands.Cog):
 
                 elif state == "streaming":
                     # First streaming chunk - finalize thinking, start/update answer
-                    if len(answer_chunks) == 0:  # First streaming chunk
+                    if answer_msg is None:
                         stream_start_time = time.time()
                         print(
-                            f"[Timing] First streaming chunk arrived, answer_msg_precreated={answer_msg_precreated}"
+                            f"[Timing] First streaming chunk arrived, answer_msg_precreated={answer_msg_task is not None}"
                         )
 
                         thinking_view.finish_streaming()
                         thinking_view.phase = (
                             "answering"  # Transition to answering phase
                         )
-                        final_thinking = "".join(thinking_chunks)
-
-                        # Fire-and-forget thinking finalization (non-blocking)
-                        async def finalize_thinking():
-                            try:
-                                if final_thinking:
-                                    num_lines = len(wrap_text_to_lines(final_thinking))
-                                    await thinking_msg.edit(
-                                        embed=thinking_view.get_display_content(
-                                            "answering"
-                                        ),
-                                        view=thinking_view
-                                        if num_lines >= MIN_LINES_FOR_BUTTON
-                                        else None,
-                                    )
-                                    print(
-                                        "[Timing] Fire-and-forget thinking finalization done"
-                                    )
-                                else:
-                                    no_content_embed = discord.Embed(
-                                        description="*(No thinking content)*",
-                                        color=discord.Color.blue(),
-                                    )
-                                    await thinking_msg.edit(
-                                        embed=no_content_embed, view=None
-                                    )
-                            except discord.errors.HTTPException as e:
-                                print(
-                                    f"[Stampy] Rate limited on thinking finalization: {e}"
-                                )
-
-                        asyncio.create_task(finalize_thinking())
+                        edits.mark_dirty("thinking", edit_thinking)
 
-                        if not answer_msg_precreated:
+                        if answer_msg_task is not None:
+                            answer_msg = await answer_msg_task
+                            print(
+                                f"[Timing] Using pre-created answer message: {answer_msg.id}"
+                            )
+                        else:
                             # Fallback: create answer message now (shouldn't normally happen)
                             print(
                                 "[Timing] Answer message not pre-created, creating now..."
@@ -430,43 +551,24 @@ class StampyCog(commands.Cog):
                             print(
                                 f"[Timing] Fallback webhook.send (answer) took {(time.time() - t0) * 1000:.0f}ms"
                             )
-                        else:
-                            print(
-                                f"[Timing] Using pre-created answer message: {answer_msg.id}"
-                            )
 
                         print(
                             f"[Timing] Total time from first stream chunk to answer ready: {(time.time() - stream_start_time) * 1000:.0f}ms"
                         )
 
-                        # Reset timing for answer updates - allow immediate first update
+                        # Reset timing for answer updates
                         last_chunk_time = time.time()
-                        last_answer_update = 0
-
-                    answer_chunks.append(content)
-                    current = "".join(answer_chunks)
-
-                    # Update answer at 2fps
-                    now = time.time()
-                    if now - last_answer_update >= SCROLL_UPDATE_INTERVAL:
-                        # Format references inline during streaming
-                        display = format_refs_inline(current)
-                        display = (
-                            display[:1990] + "..." if len(display) > 1990 else display
-                        )
-                        try:
-                            t0 = time.time()
-                            await answer_msg.edit(content=display)
-                            print(
-                                f"[Timing] answer_msg.edit took {(time.time() - t0) * 1000:.0f}ms, content_len={len(current)}"
-                            )
-                        except discord.errors.HTTPException as e:
-                            print(f"[Stampy] Rate limited on answer update: {e}")
-                            await asyncio.sleep(1.0)
-                        last_answer_update = now
+
+                    answer.append(content)
+                    edits.mark_dirty("answer", edit_answer)
+
+            # Stop live updates so they can't overwrite the final messages
+            await edits.close()
+            if answer_msg is None and answer_msg_task is not None:
+                answer_msg = await answer_msg_task
 
             # Final answer
-            final_answer = "".join(answer_chunks)
+            final_answer = answer.text
             print(
                 f"[Stampy] Got {len(final_answer)} chars of answer, {len(citations)} citations"
             )
@@ -560,14 +662,12 @@ class StampyCog(commands.Cog):
 
                 # Transition to "done" - remove status title from thinking embed
                 thinking_view.phase = "done"
-                final_thinking = "".join(thinking_chunks)
-                if final_thinking:
-                    num_lines = len(wrap_text_to_lines(final_thinking))
+                if len(thinking):
                     try:
                         await thinking_msg.edit(
                             embed=thinking_view.get_display_content("done"),
                             view=thinking_view
-                            if num_lines >= MIN_LINES_FOR_BUTTON
+                            if thinking.line_count >= MIN_LINES_FOR_BUTTON
                             else None,
                         )
                     except discord.errors.HTTPException:
@@ -577,15 +677,12 @@ class StampyCog(commands.Cog):
                 # No streaming content received, just thinking
                 thinking_view.finish_streaming()
                 thinking_view.phase = "done"
-                final_thinking = "".join(thinking_chunks)
-                if final_thinking:
-                    # Ensure view is added if we have enough lines
-                    num_lines = len(wrap_text_to_lines(final_thinking))
-                    if num_lines >= MIN_LINES_FOR_BUTTON:
-                        view_added = True
+                if len(thinking):
                     await thinking_msg.edit(
                         embed=thinking_view.get_display_content("done"),
-                        view=thinking_view if view_added else None,
+                        view=thinking_view
+                        if thinking.line_count >= MIN_LINES_FOR_BUTTON
+                        else None,
                     )
                 else:
                     no_response_embed = discord.Embed(
@@ -597,6 +694,7 @@ class StampyCog(commands.Cog):
         except Exception as e:
             print(f"[Stampy] Error streaming: {e}")
             traceback.print_exc()
+            await edits.close()
             error_embed = discord.Embed(
                 title="Error", description=str(e), color=discord.Color.red()
             )
@@ -10,10 +10,23 @@ import os
 import traceback
 
 import discord
+from discord import app_commands
 from discord.ext import commands
 from dotenv import load_dotenv
 from test_bot_manager import test_bot_manager
 
+from core.query_stats import start_query_scope
+
+
+class TrackedCommandTree(app_commands.CommandTree):
+    """Command tree attributing each slash command's DB queries to it."""
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Runs in the same task as the command, just before it
+        if interaction.command is not None:
+            start_query_scope(f"discord /{interaction.command.qualified_name}")
+        return True
+
 
 def create_bot() -> commands.Bot:
     """Create and configure the bot instance."""
@@ -23,7 +36,12 @@ def create_bot() -> commands.Bot:
     intents.presences = True  # Required for presence/activity data
     intents.members = True  # Required for full member data
 
-    bot = commands.Bot(command_prefix="!", intents=intents)
+    bot = commands.Bot(command_prefix="!", intents=intents, tree_cls=TrackedCommandTree)
+
+    @bot.before_invoke
+    async def track_prefix_command(ctx: commands.Context) -> None:
+        start_query_scope(f"discord !{ctx.command.qualified_name}")
+
     return bot
 
 
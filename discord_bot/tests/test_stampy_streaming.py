@@ -0,0 +1,126 @@
+"""
+Tests for Stampy's incremental streaming text and edit scheduling.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from discord_bot.cogs.stampy_cog import (
+    EditScheduler,
+    StreamingText,
+    wrap_text_to_lines,
+)
+
+SAMPLE = (
+    "The orthogonality thesis says that intelligence and final goals are "
+    "independent: more or less any level of intelligence could in principle "
+    "be combined with more or less any final goal.\n\nInstrumental "
+    "convergence suggests that many goals share sub-goals such as "
+    "self-preservation and resource acquisition. A-very-long-hyphenated-word-"
+    "that-exceeds-the-scroll-width-all-by-itself appears here too."
+)
+
+
+def _stream(text: str, seed: int) -> StreamingText:
+    rng = random.Random(seed)
+    buffer = StreamingText()
+    i = 0
+    while i < len(text):
+        size = rng.randint(1, 12)
+        buffer.append(text[i : i + size])
+        i += size
+    return buffer
+
+
+class TestStreamingText:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_full_rewrap_for_any_chunking(self, seed):
+        buffer = _stream(SAMPLE, seed)
+        expected = wrap_text_to_lines(SAMPLE)
+
+        assert buffer.text == SAMPLE
+        assert buffer.line_count == len(expected)
+        assert buffer.tail(5) == expected[-5:]
+
+    def test_matches_full_rewrap_while_streaming(self):
+        buffer = StreamingText()
+        text = ""
+        for word in SAMPLE.split(" "):
+            chunk = word + " "
+            buffer.append(chunk)
+            text += chunk
+            assert buffer.tail(3) == wrap_text_to_lines(text)[-3:]
+
+    def test_head_returns_prefix(self):
+        buffer = _stream(SAMPLE, 0)
+
+        assert buffer.head(10) == SAMPLE[:10]
+        assert buffer.head(10_000) == SAMPLE
+
+    def test_empty(self):
+        buffer = StreamingText()
+
+        assert buffer.text == ""
+        assert buffer.line_count == 0
+        assert buffer.tail(5) == []
+
+
+class TestEditScheduler:
+    @pytest.mark.asyncio
+    async def test_coalesces_to_latest_state(self):
+        sent = []
+        state = {"value": 0}
+
+        async def edit():
+            sent.append(state["value"])
+
+        scheduler = EditScheduler(interval=0.05)
+        for value in range(1, 6):
+            state["value"] = value
+            scheduler.mark_dirty("answer", edit)
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.1)
+        await scheduler.close()
+
+        # First edit goes out immediately, the rest collapse into one
+        assert sent[0] == 1
+        assert sent[-1] == 5
+        assert len(sent) <= 3
+
+    @pytest.mark.asyncio
+    async def test_close_drops_pending_edits(self):
+        sent = []
+
+        async def edit():
+            sent.append("edit")
+
+        scheduler = EditScheduler(interval=10)
+        scheduler.mark_dirty("thinking", edit)
+        await asyncio.sleep(0)
+        scheduler.mark_dirty("thinking", edit)
+        await scheduler.close()
+        scheduler.mark_dirty("thinking", edit)
+        await asyncio.sleep(0)
+
+        assert sent == ["edit"]
+
+    @pytest.mark.asyncio
+    async def test_failed_edit_does_not_stop_scheduler(self):
+        sent = []
+
+        async def broken():
+            raise ValueError("render failed")
+
+        async def edit():
+            sent.append("edit")
+
+        scheduler = EditScheduler(interval=0)
+        scheduler.mark_dirty("answer", broken)
+        await asyncio.sleep(0.01)
+        scheduler.mark_dirty("answer", edit)
+        await asyncio.sleep(0.01)
+        await scheduler.close()
+
+        assert sent == ["edit"]
@@ -119,18 +119,32 @@ if __name__ == "__main__":
     if _early_args.no_db:
         os.environ["SKIP_DB_CHECK"] = "true"
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request
 
-from core.database import close_engine, check_connection
+from core.database import (
+    close_engine,
+    check_connection,
+    get_pool_stats,
+    request_connection_scope,
+)
 from core import get_allowed_origins, is_dev_mode
 from core.config import check_required_env_vars
 from core.content import initialize_cache, ContentBranchNotConfiguredError
 from core.notifications import init_scheduler, shutdown_scheduler
 from core.sync import sync_all_group_rsvps
-from core.discord_outbound import set_bot as set_notification_bot
+from core.scoring import start_scoring_workers, stop_scoring_workers
+from core.http_clients import close_http_clients, get_http_client_stats
+from core.query_stats import query_scope
+from core.loop_monitor import get_loop_lag_stats, start_loop_monitor, stop_loop_monitor
+from core.discord_outbound import (
+    get_member_resolver_stats,
+    set_bot as set_notification_bot,
+)
+from core.modules.governor import get_governor_stats
+from core.modules.chat_context import get_chat_context_stats
+from core.modules.llm import get_prompt_cache_stats
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
+from web_api.static_manifest import StaticManifest, serve as serve_static
 
 # Import bot from discord_bot module
 from discord_bot.main import bot
@@ -199,6 +213,16 @@ async def lifespan(app: FastAPI):
 
     skip_db = os.getenv("SKIP_DB_CHECK", "").lower() in ("true", "1", "yes")
 
+    start_loop_monitor()
+
+    # Load the built frontend into memory (see web_api.static_manifest)
+    if serves_spa:
+        manifest = await asyncio.to_thread(get_static_manifest)
+        print(
+            f"✓ Frontend: {len(manifest.files)} files, "
+            f"{manifest.total_bytes() / 1_000_000:.1f} MB in memory"
+        )
+
     # Initialize educational content cache from GitHub
     try:
         await initialize_cache()
@@ -248,11 +272,15 @@ async def lifespan(app: FastAPI):
             scheduler.add_job(
                 sync_all_group_rsvps,
                 trigger="interval",
-                hours=6,
+                minutes=30,
                 id="sync_calendar_rsvps",
                 replace_existing=True,
             )
-            print("Scheduled RSVP sync job (every 6 hours)")
+            print("Scheduled RSVP sync job (every 30 minutes)")
+
+        # Start AI scoring workers (also picks up responses left pending
+        # by a previous process)
+        start_scoring_workers()
     else:
         print("Running in --no-db mode (database operations will fail)")
 
@@ -278,7 +306,10 @@ async def lifespan(app: FastAPI):
     # Graceful shutdown of all peer services
     print("Shutting down peer services...")
     shutdown_scheduler()
+    await stop_scoring_workers()
     await stop_bot()
+    await close_http_clients()  # Close shared outbound HTTP connections
+    await stop_loop_monitor()
     await close_engine()  # Close database connections
     if _bot_task:
         _bot_task.cancel()
@@ -288,10 +319,24 @@ async def lifespan(app: FastAPI):
             pass
 
 
+async def request_query_scope(request: Request):
+    """Attribute a request's DB statements to its route (see core.query_stats)."""
+    route = request.scope.get("route")
+    path = route.path if route else request.url.path
+    with query_scope(f"{request.method} {path}"):
+        yield
+
+
 # Create FastAPI app with lifespan
 app = FastAPI(
     title="AI Safety Course Platform API",
     lifespan=lifespan,
+    # Per-route query telemetry, and one pooled DB connection per request
+    # shared by auth and handler
+    dependencies=[
+        Depends(request_query_scope, scope="function"),
+        Depends(request_connection_scope, scope="function"),
+    ],
 )
 
 # CORS configuration (uses centralized config from core/)
@@ -328,8 +373,21 @@ static_path = (
 spa_path = project_root / "web_frontend" / "dist"  # React SPA build
 
 
+# Vike SSG + SPA static file serving (only in production, not dev mode)
+serves_spa = spa_path.exists() and not is_dev_mode()
+_static_manifest: StaticManifest | None = None
+
+
+def get_static_manifest() -> StaticManifest:
+    """The built frontend, loaded on first use (normally by the lifespan)."""
+    global _static_manifest
+    if _static_manifest is None:
+        _static_manifest = StaticManifest.build(spa_path / "client")
+    return _static_manifest
+
+
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Serve landing page or API status."""
     if is_dev_mode():
         return {
@@ -339,9 +397,10 @@ async def root():
         }
     # In production, the catch-all route also handles the root path
     # This route takes precedence over the catch-all, but keep for clarity
-    landing_file = spa_path / "client" / "index.html"
-    if landing_file.exists():
-        return FileResponse(landing_file)
+    if serves_spa:
+        landing = get_static_manifest().files.get("index.html")
+        if landing is not None:
+            return serve_static(landing, request)
     return {"status": "ok", "bot_ready": bot.is_ready() if bot else False}
 
 
@@ -361,77 +420,45 @@ async def health():
         "status": "healthy",
         "bot_connected": bot.is_ready() if bot else False,
         "bot_latency_ms": round(bot.latency * 1000) if bot and bot.is_ready() else None,
+        "event_loop_lag": get_loop_lag_stats(),
+        "db_pools": get_pool_stats(),
+        "http_clients": get_http_client_stats(),
+        "llm_governor": get_governor_stats(),
+        "llm_prompt_cache": get_prompt_cache_stats(),
+        "chat_context_cache": get_chat_context_stats(),
+        "discord_member_resolver": get_member_resolver_stats(),
     }
 
 
-# Vike SSG + SPA static file serving (only in production, not dev mode)
-if spa_path.exists() and not is_dev_mode():
-    # Mount static assets from built frontend
-    assets_path = spa_path / "client" / "assets"
-    if assets_path.exists():
-        app.mount("/assets", StaticFiles(directory=assets_path), name="assets")
+# Answered from the in-memory manifest, so page requests don't touch disk
+if serves_spa:
+
+    @app.get("/assets/{asset_path:path}")
+    async def spa_asset(asset_path: str, request: Request):
+        """Serve a hashed build asset (cached as immutable)."""
+        asset = get_static_manifest().files.get(f"assets/{asset_path}")
+        if asset is None:
+            raise HTTPException(status_code=404, detail="Not found")
+        return serve_static(asset, request)
 
     @app.get("/{full_path:path}")
-    async def spa_catchall(full_path: str):
+    async def spa_catchall(full_path: str, request: Request):
         """Serve Vike SSG pages or SPA fallback.
 
         For SSG pages: Serve pre-rendered HTML directly
         For SPA pages: Serve 200.html (Vike's SPA fallback) or index.html
         API routes (/api/*, /auth/*) are excluded - they 404 if no match.
+        Only paths in the manifest are served, so there is no way out of
+        the build directory.
         """
         # Don't catch API routes - let them 404 properly
         if full_path.startswith("api/") or full_path.startswith("auth/"):
             raise HTTPException(status_code=404, detail="Not found")
 
-        client_path = spa_path / "client"
-        client_path_resolved = client_path.resolve()
-
-        def is_safe_path(path: Path) -> bool:
-            """Verify path is within client_path to prevent path traversal attacks."""
-            try:
-                resolved = path.resolve()
-                return resolved.is_relative_to(client_path_resolved)
-            except (ValueError, RuntimeError):
-                return False
-
-        # Try exact file match first (for static assets like favicon, images)
-        static_file = client_path / full_path
-        if not is_safe_path(static_file):
+        page = get_static_manifest().page(full_path)
+        if page is None:
             raise HTTPException(status_code=404, detail="Not found")
-        if static_file.exists() and static_file.is_file():
-            return FileResponse(static_file)
-
-        # Try SSG pre-rendered HTML (e.g., /course/default -> /course/default/index.html)
-        # Handle both with and without trailing slash
-        path_to_check = full_path.rstrip("/")
-        if path_to_check == "":
-            path_to_check = "index"
-
-        ssg_file = client_path / path_to_check / "index.html"
-        if not is_safe_path(ssg_file):
-            raise HTTPException(status_code=404, detail="Not found")
-        if ssg_file.exists():
-            return FileResponse(ssg_file)
-
-        # Check for direct .html file (e.g., /404 -> /404.html)
-        direct_html = client_path / f"{path_to_check}.html"
-        if not is_safe_path(direct_html):
-            raise HTTPException(status_code=404, detail="Not found")
-        if direct_html.exists():
-            return FileResponse(direct_html)
-
-        # SPA fallback - serve 200/index.html (our pre-rendered SPA shell)
-        # or root index.html if 200 doesn't exist
-        spa_fallback = client_path / "200" / "index.html"
-        if spa_fallback.exists():
-            return FileResponse(spa_fallback)
-
-        # Fallback to root index.html (SSG landing page as last resort)
-        index_fallback = client_path / "index.html"
-        if index_fallback.exists():
-            return FileResponse(index_fallback)
-
-        raise HTTPException(status_code=404, detail="Not found")
+        return serve_static(page, request)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the backend.
+
+Measures, with the Discord bot and database disabled:
+
+- time to app created: importing main (which builds the FastAPI app),
+  with the slowest imports from `python -X importtime`
+- time to healthy: launching `python main.py --no-bot --no-db` until
+  /health answers
+
+Each is the median over --runs fresh processes, checked against the
+budget in scripts/startup_budget.json (exit status 1 if over budget).
+
+    python scripts/bench_startup.py
+    python scripts/bench_startup.py --runs 5 --top 30
+    python scripts/bench_startup.py --skip-healthy   # import time only
+
+Time to healthy includes the content cache fetch in the app's lifespan,
+so it depends on network access to GitHub.
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BUDGET_FILE = Path(__file__).resolve().parent / "startup_budget.json"
+
+ENV = {
+    **os.environ,
+    "DISABLE_DISCORD_BOT": "true",
+    "SKIP_DB_CHECK": "true",
+}
+
+IMPORT_MAIN = (
+    "import time; start = time.perf_counter(); import main; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def measure_app_created() -> tuple[float, str]:
+    """Seconds to import main in a fresh interpreter, and its importtime log."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_MAIN],
+        cwd=PROJECT_ROOT,
+        env=ENV,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def slowest_imports(importtime_log: str, top: int) -> list[tuple[int, str]]:
+    """(cumulative microseconds, module) for the slowest top-level imports."""
+    rows = []
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        rows.append((int(cumulative), name.rstrip()))
+    # Only modules main imports directly; nested imports are already
+    # counted in their importer's cumulative time
+    rows = [(us, name) for us, name in rows if len(name) - len(name.lstrip()) == 3]
+    return sorted(rows, reverse=True)[:top]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_healthy(timeout: float) -> float:
+    """Seconds from launching the server until /health returns 200."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "main.py", "--no-bot", "--no-db", "--port", str(port)],
+        cwd=PROJECT_ROOT,
+        env=ENV,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"server exited with status {server.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError, TimeoutError):
+                pass
+            time.sleep(0.05)
+        raise TimeoutError(f"/health did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--skip-healthy", action="store_true")
+    args = parser.parse_args()
+
+    budget = json.loads(BUDGET_FILE.read_text())
+    over_budget = []
+
+    created = []
+    log = ""
+    for _ in range(args.runs):
+        seconds, log = measure_app_created()
+        created.append(seconds)
+    app_created = statistics.median(created)
+    print(
+        f"Time to app created: {app_created:.2f}s (budget {budget['app_created_s']}s)"
+    )
+    print("Slowest imports under main (cumulative):")
+    for us, name in slowest_imports(log, args.top):
+        print(f"  {us / 1000:8.1f} ms  {name.strip()}")
+    if app_created > budget["app_created_s"]:
+        over_budget.append("app created")
+
+    if not args.skip_healthy:
+        healthy = statistics.median(
+            measure_healthy(args.timeout) for _ in range(args.runs)
+        )
+        print(f"Time to healthy: {healthy:.2f}s (budget {budget['healthy_s']}s)")
+        if healthy > budget["healthy_s"]:
+            over_budget.append("healthy")
+
+    if over_budget:
+        print(f"Over budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Load test for module chat streaming.
+
+Drives N concurrent anonymous chat sessions against /api/chat/module and
+reports time to first token, throughput and server event loop lag.
+
+Run the server locally against a local database with the fake LLM, so no
+provider is called:
+
+    LLM_PROVIDER=fake/tutor FAKE_LLM_TTFT=0.3 FAKE_LLM_TOKEN_DELAY=0.02 \\
+        python main.py --dev --no-bot
+
+Then:
+
+    python scripts/load_test_chat.py --module introduction \\
+        --section 0 --segment 1 --sessions 50 --turns 3
+
+Event loop lag comes from the server's /health endpoint and covers the
+last minute, so keep runs under a minute or read it as "recent".
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+import httpx
+
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "0.0.0.0", "::1"}
+
+
+@dataclass
+class Results:
+    ttft: list[float] = field(default_factory=list)  # seconds to first text
+    durations: list[float] = field(default_factory=list)  # seconds per turn
+    chars: int = 0
+    frames: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def run_turn(client: httpx.AsyncClient, args, token: str, results: Results):
+    start = time.perf_counter()
+    first_text = None
+    try:
+        async with client.stream(
+            "POST",
+            "/api/chat/module",
+            headers={"X-Anonymous-Token": token},
+            json={
+                "slug": args.module,
+                "sectionIndex": args.section,
+                "segmentIndex": args.segment,
+                "message": args.message,
+            },
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                event = json.loads(line[6:])
+                results.frames += 1
+                if event.get("type") == "text":
+                    if first_text is None:
+                        first_text = time.perf_counter()
+                    results.chars += len(event.get("content", ""))
+                elif event.get("type") == "error":
+                    results.errors.append(event.get("message", "error"))
+                    return
+    except (httpx.HTTPError, json.JSONDecodeError) as e:
+        results.errors.append(f"{type(e).__name__}: {e}")
+        return
+
+    end = time.perf_counter()
+    if first_text is not None:
+        results.ttft.append(first_text - start)
+    results.durations.append(end - start)
+
+
+async def run_session(client: httpx.AsyncClient, args, results: Results):
+    token = str(uuid.uuid4())
+    for _ in range(args.turns):
+        await run_turn(client, args, token, results)
+
+
+async def main(args) -> int:
+    host = urlparse(args.url).hostname
+    if host not in LOCAL_HOSTS and not args.allow_remote:
+        print(f"Refusing to load test non-local host {host} (use --allow-remote)")
+        return 1
+
+    results = Results()
+    limits = httpx.Limits(max_connections=args.sessions + 5)
+    async with httpx.AsyncClient(
+        base_url=args.url, timeout=args.timeout, limits=limits
+    ) as client:
+        start = time.perf_counter()
+        sessions = []
+        for _ in range(args.sessions):
+            sessions.append(asyncio.create_task(run_session(client, args, results)))
+            if args.ramp:
+                await asyncio.sleep(args.ramp / args.sessions)
+        await asyncio.gather(*sessions)
+        elapsed = time.perf_counter() - start
+
+        health = (await client.get("/health")).json()
+
+    turns = args.sessions * args.turns
+    completed = len(results.durations)
+    print(f"Sessions: {args.sessions} x {args.turns} turns in {elapsed:.1f}s")
+    print(f"Turns: {completed}/{turns} completed, {len(results.errors)} errors")
+    for message in sorted(set(results.errors))[:5]:
+        print(f"  error: {message}")
+    print(
+        f"TTFT: p50={percentile(results.ttft, 0.5) * 1000:.0f}ms "
+        f"p99={percentile(results.ttft, 0.99) * 1000:.0f}ms"
+    )
+    if results.durations:
+        print(
+            f"Turn time: p50={statistics.median(results.durations):.2f}s "
+            f"p99={percentile(results.durations, 0.99):.2f}s"
+        )
+    print(
+        f"Throughput: {completed / elapsed:.1f} turns/s, "
+        f"{results.chars / elapsed:.0f} chars/s, "
+        f"{results.frames / elapsed:.0f} SSE frames/s"
+    )
+    lag = health.get("event_loop_lag")
+    if lag:
+        print(
+            f"Server event loop lag: p50={lag['p50_ms']}ms p99={lag['p99_ms']}ms "
+            f"max={lag['max_ms']}ms ({lag['samples']} samples)"
+        )
+    return 1 if results.errors else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--module", required=True, help="Module slug")
+    parser.add_argument("--section", type=int, default=0)
+    parser.add_argument("--segment", type=int, default=0)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--message", default="Can you explain that in more detail?")
+    parser.add_argument(
+        "--ramp", type=float, default=0.0, help="Seconds to spread session starts"
+    )
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--allow-remote", action="store_true")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -1,53 +1,188 @@
-"""Simple in-memory rate limiter for auth endpoints."""
+"""
+Rate limiting for auth and expensive endpoints.
 
+Limits use GCRA (the generic cell rate algorithm, equivalent to a token
+bucket): each key stores a single "theoretical arrival time", so a check
+is O(1) and memory is one float per key. Keys live in an LRU capped at
+max_keys, so a flood of distinct IPs can't grow the table without bound;
+an evicted key was idle the longest and loses at most its remaining burst.
+
+With RATE_LIMIT_BACKEND=postgres the arrival times are kept in the
+rate_limit_buckets table instead, so limits hold across replicas. If the
+database is unavailable the in-process limiter is used for that request.
+"""
+
+import logging
+import math
+import os
+import random
 import time
-from collections import defaultdict
+from collections import OrderedDict
+from uuid import UUID
 
 from fastapi import HTTPException, Request
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# "memory" (per process) or "postgres" (shared across replicas)
+RATE_LIMIT_BACKEND = os.environ.get("RATE_LIMIT_BACKEND", "memory").lower()
+
+# Default cap on keys tracked per limiter in memory
+MAX_KEYS = 10_000
+
+# Roughly one in this many shared checks also deletes expired rows
+_PRUNE_EVERY = 500
+
+# Allow if greatest(tat, now) <= now + tolerance, then advance tat by one
+# interval. A new key starts one interval ahead of now.
+_SHARED_CHECK = text("""
+    INSERT INTO rate_limit_buckets AS b (bucket_key, tat)
+    VALUES (:key, clock_timestamp() + make_interval(secs => :interval))
+    ON CONFLICT (bucket_key) DO UPDATE
+        SET tat = greatest(b.tat, clock_timestamp())
+            + make_interval(secs => :interval)
+        WHERE greatest(b.tat, clock_timestamp())
+            <= clock_timestamp() + make_interval(secs => :tolerance)
+    RETURNING tat
+""")
+
+_SHARED_RETRY_AFTER = text("""
+    SELECT extract(epoch FROM tat - clock_timestamp())
+    FROM rate_limit_buckets WHERE bucket_key = :key
+""")
+
+_SHARED_PRUNE = text("DELETE FROM rate_limit_buckets WHERE tat < clock_timestamp()")
+
+
+def client_ip(request: Request) -> str:
+    """Extract client IP, respecting X-Forwarded-For behind reverse proxy."""
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        # First IP in the chain is the original client
+        return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def client_key(
+    request: Request,
+    user_id: int | None = None,
+    anonymous_token: UUID | str | None = None,
+) -> str:
+    """Rate limit key: the user if known, else the anonymous token, else the IP."""
+    if user_id is not None:
+        return f"user:{user_id}"
+    if anonymous_token is not None:
+        return f"anon:{anonymous_token}"
+    return f"ip:{client_ip(request)}"
 
 
 class RateLimiter:
     """
-    Token-bucket rate limiter keyed by client IP.
+    GCRA rate limiter allowing max_requests per window, with bursts.
 
     Args:
         max_requests: Maximum requests allowed in the window.
         window_seconds: Time window in seconds.
+        name: Policy name, namespacing keys in the shared table.
+        max_keys: Keys tracked in memory before the least recent is evicted.
     """
 
-    def __init__(self, max_requests: int, window_seconds: int):
+    def __init__(
+        self,
+        max_requests: int,
+        window_seconds: int,
+        name: str = "default",
+        max_keys: int = MAX_KEYS,
+    ):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        # {ip: [timestamp, ...]}
-        self._requests: dict[str, list[float]] = defaultdict(list)
-
-    def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP, respecting X-Forwarded-For behind reverse proxy."""
-        forwarded = request.headers.get("x-forwarded-for")
-        if forwarded:
-            # First IP in the chain is the original client
-            return forwarded.split(",")[0].strip()
-        return request.client.host if request.client else "unknown"
-
-    def check(self, request: Request) -> None:
-        """Raise 429 if rate limit exceeded."""
-        ip = self._get_client_ip(request)
+        self.name = name
+        self.max_keys = max_keys
+        # Time between requests at the sustained rate
+        self.interval = window_seconds / max_requests
+        # How far ahead of now the arrival time may run: a full burst
+        self.tolerance = window_seconds - self.interval
+        # {key: theoretical arrival time}, least recently used first
+        self._tats: OrderedDict[str, float] = OrderedDict()
+
+    def reset(self) -> None:
+        self._tats.clear()
+
+    def _check_local(self, key: str) -> float | None:
+        """Seconds until key may retry, or None if allowed (and counted)."""
         now = time.monotonic()
-        cutoff = now - self.window_seconds
+        tat = max(self._tats.get(key, now), now)
+        if tat - now > self.tolerance:
+            self._tats.move_to_end(key)
+            return tat - now - self.tolerance
+
+        self._tats[key] = tat + self.interval
+        self._tats.move_to_end(key)
+        if len(self._tats) > self.max_keys:
+            self._tats.popitem(last=False)
+        return None
+
+    async def _check_shared(self, key: str) -> float | None:
+        from core.database import get_transaction
 
-        # Prune old entries
-        entries = self._requests[ip]
-        self._requests[ip] = [t for t in entries if t > cutoff]
+        bucket_key = f"{self.name}:{key}"
+        params = {
+            "key": bucket_key,
+            "interval": self.interval,
+            "tolerance": self.tolerance,
+        }
+        async with get_transaction() as conn:
+            result = await conn.execute(_SHARED_CHECK, params)
+            if result.first() is not None:
+                if random.randrange(_PRUNE_EVERY) == 0:
+                    await conn.execute(_SHARED_PRUNE)
+                return None
+            result = await conn.execute(_SHARED_RETRY_AFTER, {"key": bucket_key})
+            wait = result.scalar() or 0.0
+        return max(float(wait) - self.tolerance, 0.0)
 
-        if len(self._requests[ip]) >= self.max_requests:
-            raise HTTPException(status_code=429, detail="Too many requests")
+    async def check(self, request: Request, key: str | None = None) -> None:
+        """
+        Raise 429 if the rate limit is exceeded.
 
-        self._requests[ip].append(now)
+        Args:
+            request: The FastAPI request (keyed by client IP if no key given)
+            key: Explicit key, e.g. from client_key()
+        """
+        if key is None:
+            key = f"ip:{client_ip(request)}"
+
+        if RATE_LIMIT_BACKEND == "postgres":
+            try:
+                retry_after = await self._check_shared(key)
+            except Exception as e:
+                logger.warning(f"Shared rate limit check failed, using local: {e}")
+                retry_after = self._check_local(key)
+        else:
+            retry_after = self._check_local(key)
+
+        if retry_after is not None:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many requests",
+                headers={"Retry-After": str(max(math.ceil(retry_after), 1))},
+            )
 
 
 # Auth endpoint rate limiters
 # OAuth start: 10 requests per minute (normal browsing)
-oauth_start_limiter = RateLimiter(max_requests=10, window_seconds=60)
+oauth_start_limiter = RateLimiter(max_requests=10, window_seconds=60, name="oauth")
 
 # Token refresh: 10 per minute (legitimate clients do 1 per 15 min)
-refresh_limiter = RateLimiter(max_requests=10, window_seconds=60)
+refresh_limiter = RateLimiter(max_requests=10, window_seconds=60, name="refresh")
+
+# Expensive endpoint limiters, keyed per user / anonymous token / IP
+# Module chat: each message is an LLM call
+chat_limiter = RateLimiter(max_requests=30, window_seconds=60, name="chat")
+
+# Transcription: each request is a Whisper call on up to 25MB of audio
+transcribe_limiter = RateLimiter(max_requests=10, window_seconds=60, name="transcribe")
+
+# Question responses: each submission triggers AI scoring
+question_limiter = RateLimiter(max_requests=30, window_seconds=60, name="questions")
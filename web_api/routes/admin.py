@@ -4,18 +4,20 @@ Admin panel API routes.
 All endpoints require admin authentication.
 
 Endpoints:
-- POST /api/admin/users/search - Search users by name/username
+- POST /api/admin/users/search - Search users by name, email or Discord ID
 - GET /api/admin/users/{user_id} - Get user details
 - POST /api/admin/groups/{group_id}/sync - Sync a group
 - POST /api/admin/groups/{group_id}/realize - Realize a group
 - POST /api/admin/groups/{group_id}/members/add - Add user to group
 - POST /api/admin/groups/{group_id}/members/remove - Remove user from group
 - POST /api/admin/groups/create - Create a new group
-- POST /api/admin/cohorts/{cohort_id}/sync - Sync all groups in cohort
+- POST /api/admin/cohorts/{cohort_id}/sync - Sync all groups in cohort (?dry_run=true for plan)
 - POST /api/admin/cohorts/{cohort_id}/realize - Realize All Preview Groups
 - GET /api/admin/cohorts/{cohort_id}/groups - List groups in cohort
+- GET /api/admin/query-stats - DB statements, time and rows per route/command/job
 """
 
+import logging
 import sys
 from pathlib import Path
 from typing import Any
@@ -30,15 +32,18 @@ from core.group_joining import get_user_current_group_membership, assign_to_grou
 from core.queries.cohorts import get_all_cohorts_summary
 from core.queries.groups import (
     create_group,
-    get_cohort_group_ids,
     get_cohort_groups_summary,
     get_cohort_preview_group_ids,
     remove_user_from_group,
 )
 from core.queries.users import get_user_admin_details, search_users
-from core.sync import sync_after_group_change, sync_group
+from core.query_stats import get_query_stats
+from core.sync import sync_after_group_change, sync_cohort_groups, sync_group
+from core.sync_planner import execute_cohort_sync_plan, plan_cohort_sync
 from web_api.auth import require_admin
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
 
@@ -69,7 +74,7 @@ async def search_users_endpoint(
     admin: dict = Depends(require_admin),
 ) -> dict[str, Any]:
     """
-    Search users by nickname or discord_username.
+    Search users by name (fuzzy), email prefix or Discord ID prefix.
 
     Returns list of matching users with basic info.
     """
@@ -223,16 +228,25 @@ async def create_group_endpoint(
 @router.post("/cohorts/{cohort_id}/sync")
 async def sync_cohort_endpoint(
     cohort_id: int,
+    dry_run: bool = False,
     admin: dict = Depends(require_admin),
 ) -> dict[str, Any]:
-    """Sync all groups in a cohort."""
-    async with get_connection() as conn:
-        group_ids = await get_cohort_group_ids(conn, cohort_id)
+    """
+    Sync all groups in a cohort.
 
-    results = []
-    for group_id in group_ids:
-        result = await sync_group(group_id, allow_create=False)
-        results.append({"group_id": group_id, "result": result})
+    Loads the cohort's state in bulk and only runs Discord syncs for groups
+    whose Discord state differs. With dry_run=true, returns the plan
+    without changing anything.
+    """
+    plan = await plan_cohort_sync(cohort_id)
+    if plan is None:
+        raise HTTPException(status_code=404, detail="Cohort not found")
+
+    logger.info(plan.format())
+    if dry_run:
+        return {"dry_run": True, "plan": plan.to_dict()}
+
+    results = await execute_cohort_sync_plan(plan, allow_create=False)
 
     return {"synced": len(results), "results": results}
 
@@ -246,10 +260,7 @@ async def realize_cohort_endpoint(
     async with get_connection() as conn:
         group_ids = await get_cohort_preview_group_ids(conn, cohort_id)
 
-    results = []
-    for group_id in group_ids:
-        result = await sync_group(group_id, allow_create=True)
-        results.append({"group_id": group_id, "result": result})
+    results = await sync_cohort_groups(group_ids, allow_create=True)
 
     return {"realized": len(results), "results": results}
 
@@ -279,3 +290,15 @@ async def list_cohort_groups_endpoint(
         groups_list = await get_cohort_groups_summary(conn, cohort_id)
 
     return {"groups": groups_list}
+
+
+@router.get("/query-stats")
+async def query_stats_endpoint(
+    admin: dict = Depends(require_admin),
+) -> dict[str, Any]:
+    """
+    Database query telemetry per HTTP route, Discord command and job.
+
+    Counters accumulate since process start.
+    """
+    return {"operations": get_query_stats()}
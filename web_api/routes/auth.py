@@ -158,7 +158,7 @@ async def discord_oauth_start(
         origin: Frontend origin URL (validated against whitelist)
         anonymous_token: Optional anonymous session token to claim on login
     """
-    oauth_start_limiter.check(request)
+    await oauth_start_limiter.check(request)
 
     # Validate origin against whitelist
     validated_origin = _validate_origin(origin)
@@ -311,7 +311,7 @@ async def refresh_token_endpoint(request: Request, response: Response):
     Reads the refresh_token cookie, validates it, revokes the old token,
     issues a new refresh token in the same family, and returns a new JWT.
     """
-    refresh_limiter.check(request)
+    await refresh_limiter.check(request)
 
     raw_refresh = request.cookies.get("refresh_token")
 
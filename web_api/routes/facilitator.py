@@ -18,7 +18,9 @@ from fastapi import APIRouter, Depends, HTTPException
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from core.database import get_connection
+from core.content.cache import CacheNotInitializedError, get_cache
+from core.content.content_index import get_content_index
+from core.database import get_connection, get_read_connection
 from core.modules.loader import get_available_modules, load_flattened_module
 from core.modules.course_loader import (
     load_course,
@@ -29,9 +31,9 @@ from core.modules.flattened_types import ModuleRef, MeetingMarker
 from core.queries.facilitator import (
     can_access_group,
     get_accessible_groups,
-    get_group_completion_data,
+    get_group_dashboard_watermark,
     get_group_members_with_progress,
-    get_group_time_and_chat_data,
+    get_group_timeline_data,
     get_user_all_progress,
     get_user_chat_sessions_for_facilitator,
     get_user_meeting_attendance,
@@ -104,6 +106,21 @@ async def list_group_members(
     return {"members": members}
 
 
+# Groups whose timeline responses are kept (least recently built dropped)
+TIMELINE_CACHE_SIZE = 256
+
+# group_id -> (data/content version, response)
+_timeline_cache: dict[int, tuple[tuple, dict[str, Any]]] = {}
+
+
+def _content_version() -> tuple | None:
+    try:
+        cache = get_cache()
+    except CacheNotInitializedError:
+        return None
+    return (id(cache), cache.last_refreshed)
+
+
 @router.get("/groups/{group_id}/timeline")
 async def get_group_timeline(
     group_id: int,
@@ -113,19 +130,21 @@ async def get_group_timeline(
     discord_id = user["sub"]
     db_user = await get_db_user_or_403(discord_id)
 
-    async with get_connection() as conn:
+    async with get_read_connection() as conn:
         if not await can_access_group(conn, db_user["user_id"], group_id):
             raise HTTPException(403, "Access denied to this group")
 
-        members = await get_group_members_with_progress(conn, group_id)
-        (
-            completions,
-            attendance,
-            past_meetings,
-            rsvps,
-            guest_elsewhere,
-        ) = await get_group_completion_data(conn, group_id)
-        time_data, chat_data = await get_group_time_and_chat_data(conn, group_id)
+        # Facilitators refresh this constantly; reuse the last response
+        # until the group's data or the content changes
+        version = (
+            await get_group_dashboard_watermark(conn, group_id),
+            _content_version(),
+        )
+        cached = _timeline_cache.get(group_id)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        data = await get_group_timeline_data(conn, group_id)
 
     # Build timeline structure from course progression
     try:
@@ -134,95 +153,80 @@ async def get_group_timeline(
         return {"timeline_items": [], "members": []}
 
     # Map content_id -> module_slug for aggregation
+    index = get_content_index()
     content_to_slug: dict[str, str] = {}
     module_cid_to_slug: dict[str, str] = {}  # module content_id -> slug
     timeline_items: list[dict[str, Any]] = []
     for item in course.progression:
         if isinstance(item, ModuleRef):
             slug = item.slug
-            try:
-                module = load_flattened_module(slug)
-            except Exception:
+            module = index.modules.get(slug)
+            if module is None:
                 continue
             if module.content_id:
                 module_cid_to_slug[str(module.content_id)] = slug
-            for section in module.sections:
-                content_id = section.get("contentId")
-                if content_id:
-                    content_to_slug[content_id] = slug
-                    title = (
-                        section.get("meta", {}).get("title")
-                        or section.get("title")
-                        or "Untitled"
-                    )
-                    timeline_items.append(
-                        {
-                            "type": "section",
-                            "content_id": content_id,
-                            "module_slug": slug,
-                            "title": title,
-                        }
-                    )
+            for lens_id in index.module_lenses[slug]:
+                content_id = str(lens_id)
+                content_to_slug[content_id] = slug
+                timeline_items.append(
+                    {
+                        "type": "section",
+                        "content_id": content_id,
+                        "module_slug": slug,
+                        "title": index.module_refs[(slug, lens_id)].title,
+                    }
+                )
         elif isinstance(item, MeetingMarker):
             timeline_items.append(
                 {
                     "type": "meeting",
                     "number": item.number,
-                    "is_past": item.number in past_meetings,
+                    "is_past": item.number in data["past_meetings"],
                 }
             )
 
-    # Build per-member data with module_stats
+    # Roll section-level time and module-level chats up to module slugs
+    # (content ids map to modules through the in-memory content index)
     members_out = []
-    for m in members:
-        uid = m["user_id"]
-        user_comps = list(completions.get(uid, set()))
-        user_att: dict[str, str] = {}
-        for num, attended in attendance.get(uid, {}).items():
-            user_att[str(num)] = "attended" if attended else "missed"
-        user_rsvps: dict[str, str] = {}
-        for num, status in rsvps.get(uid, {}).items():
-            user_rsvps[str(num)] = status
-
-        # Aggregate time by module slug (from section-level time data)
+    for m in data["members"]:
         module_stats: dict[str, dict[str, int]] = {}
-        user_time = time_data.get(uid, {})
-        user_chats = chat_data.get(uid, {})
-        for cid, slug in content_to_slug.items():
-            if cid in user_time:
-                if slug not in module_stats:
-                    module_stats[slug] = {"time_seconds": 0, "chat_count": 0}
-                module_stats[slug]["time_seconds"] += user_time.get(cid, 0)
-
-        # Add module-level chat counts (chats are keyed by module content_id)
-        for mod_cid, slug in module_cid_to_slug.items():
-            if mod_cid in user_chats:
-                if slug not in module_stats:
-                    module_stats[slug] = {"time_seconds": 0, "chat_count": 0}
-                module_stats[slug]["chat_count"] += user_chats[mod_cid]
-
-        # Per-section time data (time tracking is still section-level)
         section_times: dict[str, int] = {}
-        for cid in content_to_slug:
-            if cid in user_time:
-                section_times[cid] = user_time[cid]
-
-        user_guest_elsewhere = [str(num) for num in guest_elsewhere.get(uid, set())]
+        for cid, seconds in m["section_times"].items():
+            slug = content_to_slug.get(cid)
+            if slug is None:
+                continue
+            if slug not in module_stats:
+                module_stats[slug] = {"time_seconds": 0, "chat_count": 0}
+            module_stats[slug]["time_seconds"] += seconds
+            section_times[cid] = seconds
+
+        for mod_cid, count in m["chat_counts"].items():
+            slug = module_cid_to_slug.get(mod_cid)
+            if slug is None:
+                continue
+            if slug not in module_stats:
+                module_stats[slug] = {"time_seconds": 0, "chat_count": 0}
+            module_stats[slug]["chat_count"] += count
 
         members_out.append(
             {
-                "user_id": uid,
+                "user_id": m["user_id"],
                 "name": m["name"],
-                "completed_ids": user_comps,
-                "meetings": user_att,
-                "rsvps": user_rsvps,
+                "completed_ids": m["completed_ids"],
+                "meetings": m["meetings"],
+                "rsvps": m["rsvps"],
                 "module_stats": module_stats,
                 "section_times": section_times,
-                "guest_elsewhere": user_guest_elsewhere,
+                "guest_elsewhere": m["guest_elsewhere"],
             }
         )
 
-    return {"timeline_items": timeline_items, "members": members_out}
+    response = {"timeline_items": timeline_items, "members": members_out}
+    _timeline_cache.pop(group_id, None)
+    if len(_timeline_cache) >= TIMELINE_CACHE_SIZE:
+        _timeline_cache.pop(next(iter(_timeline_cache)))
+    _timeline_cache[group_id] = (version, response)
+    return response
 
 
 @router.get("/groups/{group_id}/users/{target_user_id}/progress")
@@ -391,32 +395,13 @@ async def get_user_chats(
 
         sessions = await get_user_chat_sessions_for_facilitator(conn, target_user_id)
 
-    # Build content_id -> module info map from content cache
-    content_to_module: dict[str, dict[str, str]] = {}
-    for slug in get_available_modules():
-        try:
-            module = load_flattened_module(slug)
-        except Exception:
-            continue
-        # Map module-level content_id
-        if module.content_id:
-            content_to_module[str(module.content_id)] = {
-                "slug": slug,
-                "title": module.title,
-            }
-        # Map section-level content_ids
-        for section in module.sections:
-            cid = section.get("contentId")
-            if cid:
-                content_to_module[cid] = {"slug": slug, "title": module.title}
+    index = get_content_index()
 
     chats_out = []
     for session in sessions:
         content_id = session.get("content_id")
         content_id_str = str(content_id) if content_id else None
-        module_info = (
-            content_to_module.get(content_id_str or "") if content_id_str else None
-        )
+        ref = index.lookup(content_id)
 
         started_at = session.get("started_at")
         last_active = session.get("last_active_at")
@@ -426,8 +411,8 @@ async def get_user_chats(
             {
                 "session_id": session["session_id"],
                 "content_id": content_id_str,
-                "module_slug": module_info["slug"] if module_info else None,
-                "module_title": module_info["title"] if module_info else None,
+                "module_slug": ref.module_slug if ref else None,
+                "module_title": ref.module_title if ref else None,
                 "messages": json.loads(session["messages"])
                 if isinstance(session.get("messages"), str)
                 else session.get("messages", []),
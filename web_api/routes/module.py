@@ -6,14 +6,16 @@ Endpoints:
 - GET /api/chat/module/{slug}/history - Get chat history for a module
 """
 
+import asyncio
 import json
 import logging
 import sys
+import time
 from pathlib import Path
 from uuid import UUID
 
 import sentry_sdk
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
@@ -22,16 +24,25 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from core.database import get_connection
 from core.modules import ModuleNotFoundError
 from core.modules.chat import send_module_message
-from core.modules.chat_sessions import add_chat_message, get_or_create_chat_session
-from core.modules.context import gather_section_context
+from core.modules.chat_sessions import (
+    add_chat_message,
+    get_or_create_chat_session,
+    update_last_chat_message,
+)
+from core.modules.chat_context import get_chat_context
+from core.modules.governor import LLMOverloadedError
 from core.modules.loader import load_flattened_module
-from core.modules.types import ChatStage
+from core.modules.streaming import coalesce_events
 from web_api.auth import get_user_or_anonymous
+from web_api.rate_limit import chat_limiter, client_key
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/chat", tags=["module"])
 
+# Seconds between saves of a partial assistant reply while it streams
+CHECKPOINT_INTERVAL = 3.0
+
 
 class ModuleChatRequest(BaseModel):
     """Request body for module chat."""
@@ -79,53 +90,8 @@ async def event_generator(
                 content=user_message,
             )
 
-    # Get section and gather context
-    section = (
-        module.sections[section_index] if section_index < len(module.sections) else {}
-    )
-    previous_content = gather_section_context(section, segment_index)
-
-    # Get chat instructions from segment
-    segments = section.get("segments", [])
-    current_segment = segments[segment_index] if segment_index < len(segments) else {}
-
-    # Test sections: holistic feedback prompt covering all questions
-    if section.get("type") == "test":
-        instructions = (
-            "You are a supportive tutor providing feedback on a student's test responses. "
-            "Evaluate the answers holistically — note patterns, connections between answers, "
-            "and overall understanding. Point out strengths, gently identify gaps, and "
-            "ask Socratic questions to deepen understanding. Be encouraging and constructive."
-        )
-        learning_outcome_name = section.get("learningOutcomeName")
-        if learning_outcome_name:
-            instructions += f"\n\nLearning Outcome: {learning_outcome_name}"
-        for seg in segments:
-            if seg.get("type") == "question":
-                instructions += f"\n\nQuestion: {seg.get('content', '')}"
-                if seg.get("assessmentInstructions"):
-                    instructions += f"\nRubric:\n{seg['assessmentInstructions']}"
-    # Standalone question segments: single-question feedback prompt
-    elif current_segment.get("type") == "question":
-        question_text = current_segment.get("content", "")
-        assessment_instructions = current_segment.get("assessmentInstructions")
-        learning_outcome_name = section.get("learningOutcomeName")
-
-        instructions = (
-            "You are a supportive tutor providing feedback on a student's response. "
-            "Focus on what the student understood well, gently point out gaps, and "
-            "ask Socratic questions to deepen their understanding. "
-            "Be encouraging and constructive."
-        )
-        instructions += f"\n\nQuestion: {question_text}"
-        if learning_outcome_name:
-            instructions += f"\nLearning Outcome: {learning_outcome_name}"
-        if assessment_instructions:
-            instructions += f"\nRubric:\n{assessment_instructions}"
-    else:
-        instructions = current_segment.get(
-            "instructions", "Help the user learn about AI safety."
-        )
+    # Stage and system prompt depend only on content, so they're cached
+    context = get_chat_context(module, section_index, segment_index)
 
     # Build messages for LLM (existing history + new message)
     llm_messages = [
@@ -136,42 +102,77 @@ async def event_generator(
     if user_message:
         llm_messages.append({"role": "user", "content": user_message})
 
-    # Create chat stage
-    stage = ChatStage(
-        type="chat",
-        instructions=instructions,
-    )
+    # Fair-queuing key for the LLM governor
+    client_key = f"user:{user_id}" if user_id else f"anon:{anonymous_token}"
 
-    # Stream response
+    # Stream response, saving the partial reply periodically so a client
+    # disconnect doesn't lose it
     assistant_content = ""
+    saved = False  # assistant message exists in the session
+    save_lock = asyncio.Lock()
+    last_checkpoint = time.monotonic()
+
+    async def save_reply() -> None:
+        nonlocal saved
+        async with save_lock:
+            async with get_connection() as conn:
+                if saved:
+                    await update_last_chat_message(
+                        conn, session_id=session_id, content=assistant_content
+                    )
+                else:
+                    await add_chat_message(
+                        conn,
+                        session_id=session_id,
+                        role="assistant",
+                        content=assistant_content,
+                    )
+            saved = True
+
+    async def checkpointed(events):
+        nonlocal assistant_content, last_checkpoint
+        async for event in events:
+            if event.get("type") == "text":
+                assistant_content += event.get("content", "")
+                now = time.monotonic()
+                if now - last_checkpoint >= CHECKPOINT_INTERVAL:
+                    last_checkpoint = now
+                    # Shielded so a disconnect can't interrupt a write
+                    await asyncio.shield(save_reply())
+            yield event
+
     try:
-        async for chunk in send_module_message(
-            llm_messages, stage, None, previous_content
+        async for chunk in coalesce_events(
+            checkpointed(
+                send_module_message(
+                    llm_messages,
+                    context.stage,
+                    system=context.system_prompt,
+                    client_key=client_key,
+                )
+            )
         ):
-            if chunk.get("type") == "text":
-                assistant_content += chunk.get("content", "")
             yield f"data: {json.dumps(chunk)}\n\n"
+    except LLMOverloadedError as e:
+        # Expected under load; the client shows the message and can retry
+        logger.warning("Chat LLM overloaded: %s", e)
+        yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+        yield f"data: {json.dumps({'type': 'done'})}\n\n"
     except Exception as e:
         logger.error("Chat LLM error: %s", e)
         sentry_sdk.capture_exception(e)
         yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
         yield f"data: {json.dumps({'type': 'done'})}\n\n"
-        return
-
-    # Save assistant response
-    if assistant_content:
-        async with get_connection() as conn:
-            await add_chat_message(
-                conn,
-                session_id=session_id,
-                role="assistant",
-                content=assistant_content,
-            )
+    finally:
+        # Save the final (or, after a disconnect, partial) reply
+        if assistant_content:
+            await asyncio.shield(save_reply())
 
 
 @router.post("/module")
 async def chat_module(
     request: ModuleChatRequest,
+    http_request: Request,
     auth: tuple[int | None, UUID | None] = Depends(get_user_or_anonymous),
 ) -> StreamingResponse:
     """
@@ -192,6 +193,9 @@ async def chat_module(
     - {"type": "error", "message": "..."} on error
     """
     user_id, anonymous_token = auth
+    await chat_limiter.check(
+        http_request, client_key(http_request, user_id, anonymous_token)
+    )
 
     # Load module
     try:
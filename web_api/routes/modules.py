@@ -22,6 +22,7 @@ from core.modules import (
 from core.modules.loader import load_flattened_module
 from core.modules.flattened_types import FlattenedModule
 from core.modules.progress import get_module_progress
+from core.content.content_index import get_content_index
 from core.modules.chat_sessions import get_or_create_chat_session
 from core.database import get_connection
 from core import get_or_create_user
@@ -120,8 +121,7 @@ async def get_module_progress_endpoint(
     except ModuleNotFoundError:
         raise HTTPException(404, "Module not found")
 
-    # Collect content IDs from flattened sections (sections are dicts)
-    content_ids = [UUID(s["contentId"]) for s in module.sections if s.get("contentId")]
+    content_ids = list(get_content_index().module_lenses.get(module.slug, ()))
 
     async with get_connection() as conn:
         # Get progress for all lenses/sections
@@ -12,6 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException, Header, Query, Request
 from pydantic import BaseModel
 
 from core import get_or_create_user
+from core.content.content_index import get_content_index
 from core.database import get_transaction
 from core.modules.progress import (
     get_or_create_progress,
@@ -151,13 +152,13 @@ async def complete_content(
                         conn,
                         user_id=user_id,
                         anonymous_token=anonymous_token,
-                        module_sections=module.sections,
+                        module_slug=module.slug,
                         module_content_id=module.content_id,
                         completed_lens_id=body.content_id,
                     )
-                content_ids = [
-                    UUID(s["contentId"]) for s in module.sections if s.get("contentId")
-                ]
+                content_ids = list(
+                    get_content_index().module_lenses.get(module.slug, ())
+                )
 
                 progress_map = await get_module_progress(
                     conn,
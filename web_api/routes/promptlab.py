@@ -6,11 +6,15 @@ Endpoints:
 - GET /api/promptlab/fixtures/{name} - Load a specific fixture
 - POST /api/promptlab/regenerate - Regenerate AI response (SSE stream)
 - POST /api/promptlab/continue - Continue conversation (SSE stream)
+- POST /api/promptlab/batch - Run fixtures x prompt variants (SSE stream)
+- GET /api/promptlab/runs - List the current user's batch runs
+- GET /api/promptlab/runs/{run_id} - Get a batch run with its results
 
 All endpoints require facilitator/admin authentication.
-No database writes occur in any Prompt Lab code path.
+Batch runs are the only Prompt Lab data written to the database.
 """
 
+import asyncio
 import json
 import sys
 import urllib.parse
@@ -22,13 +26,20 @@ from pydantic import BaseModel
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from core.database import get_connection
+from core.database import get_connection, get_transaction
 from core.modules.prompts import assemble_chat_prompt
 from core.promptlab import (
+    MAX_BATCH_ITEMS,
+    PromptVariant,
+    build_batch_items,
+    get_batch_run,
+    list_batch_runs,
     list_fixtures,
     load_fixture,
     regenerate_response,
     continue_conversation,
+    run_batch,
+    save_batch_run,
 )
 from core.queries.facilitator import get_facilitator_group_ids, is_admin
 from core.queries.users import get_user_by_discord_id
@@ -79,6 +90,20 @@ class ContinueRequest(BaseModel):
     model: str | None = None
 
 
+class BatchVariant(BaseModel):
+    label: str  # Shown in results, e.g. "current" or "shorter feedback"
+    baseSystemPrompt: str
+    instructions: str | None = None  # Overrides each fixture section's instructions
+
+
+class BatchRequest(BaseModel):
+    fixtures: list[str]  # Fixture names
+    variants: list[BatchVariant]
+    enableThinking: bool = True
+    effort: str = "low"
+    model: str | None = None
+
+
 # --- Endpoints ---
 
 
@@ -116,7 +141,7 @@ async def get_fixture(
 @router.post("/regenerate")
 async def regenerate(
     request: RegenerateRequest,
-    _user: dict = Depends(get_facilitator_user),
+    user: dict = Depends(get_facilitator_user),
 ) -> StreamingResponse:
     """
     Regenerate an AI response with a custom system prompt.
@@ -140,6 +165,7 @@ async def regenerate(
                 enable_thinking=request.enableThinking,
                 effort=request.effort,
                 provider=request.model,
+                client_key=f"user:{user['user_id']}",
             ):
                 yield f"data: {json.dumps(event)}\n\n"
         except Exception as e:
@@ -160,7 +186,7 @@ async def regenerate(
 @router.post("/continue")
 async def continue_chat(
     request: ContinueRequest,
-    _user: dict = Depends(get_facilitator_user),
+    user: dict = Depends(get_facilitator_user),
 ) -> StreamingResponse:
     """
     Continue a conversation with a follow-up message.
@@ -183,6 +209,7 @@ async def continue_chat(
                 enable_thinking=request.enableThinking,
                 effort=request.effort,
                 provider=request.model,
+                client_key=f"user:{user['user_id']}",
             ):
                 yield f"data: {json.dumps(event)}\n\n"
         except Exception as e:
@@ -198,3 +225,145 @@ async def continue_chat(
             "X-Accel-Buffering": "no",
         },
     )
+
+
+@router.post("/batch")
+async def run_batch_evaluation(
+    request: BatchRequest,
+    user: dict = Depends(get_facilitator_user),
+) -> StreamingResponse:
+    """
+    Regenerate every fixture conversation with every prompt variant.
+
+    Auth: facilitator or admin required.
+    Returns Server-Sent Events:
+    - {"type": "batch_start", "items": [...]} listing each item's fixture,
+      section, conversation and variant; later events refer to items by index
+    - text/thinking/error events with an "item" index, interleaved
+    - {"type": "item_done", "item": int, "result": {...}} per item
+    - {"type": "done", "runId": int} once the run is saved
+    Returns 404 if a fixture is not found, 400 if the batch is empty or too large.
+    """
+    fixtures = []
+    for name in request.fixtures:
+        fixture = load_fixture(name)
+        if not fixture:
+            raise HTTPException(404, f"Fixture not found: {name}")
+        fixtures.append(fixture)
+
+    variants = [
+        PromptVariant(
+            label=v.label,
+            base_prompt=v.baseSystemPrompt,
+            instructions=v.instructions,
+        )
+        for v in request.variants
+    ]
+    items = build_batch_items(fixtures, variants)
+    if not items:
+        raise HTTPException(400, "Batch has no conversations to run")
+    if len(items) > MAX_BATCH_ITEMS:
+        raise HTTPException(
+            400, f"Batch has {len(items)} items; the limit is {MAX_BATCH_ITEMS}"
+        )
+
+    async def event_generator():
+        results: list[dict | None] = [None] * len(items)
+        status = "cancelled"
+        try:
+            manifest = [
+                {k: item[k] for k in ("fixture", "section", "conversation", "variant")}
+                for item in items
+            ]
+            yield f"data: {json.dumps({'type': 'batch_start', 'items': manifest})}\n\n"
+
+            async for event in run_batch(
+                items,
+                enable_thinking=request.enableThinking,
+                effort=request.effort,
+                provider=request.model,
+                client_key=f"user:{user['user_id']}",
+            ):
+                if event["type"] == "item_done":
+                    results[event["item"]] = event["result"]
+                yield f"data: {json.dumps(event)}\n\n"
+            status = "complete"
+        finally:
+            # Save even if the client disconnected, so finished items aren't lost
+            run_id = await asyncio.shield(
+                _save_run(user["user_id"], request, results, status)
+            )
+        yield f"data: {json.dumps({'type': 'done', 'runId': run_id})}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+async def _save_run(
+    user_id: int, request: BatchRequest, results: list[dict | None], status: str
+) -> int:
+    async with get_transaction() as conn:
+        return await save_batch_run(
+            conn,
+            user_id=user_id,
+            config=request.model_dump(),
+            results=[r for r in results if r is not None],
+            status=status,
+        )
+
+
+@router.get("/runs")
+async def list_runs(
+    user: dict = Depends(get_facilitator_user),
+) -> dict:
+    """
+    List the current user's most recent batch runs (without results).
+
+    Auth: facilitator or admin required.
+    """
+    async with get_connection() as conn:
+        runs = await list_batch_runs(conn, user_id=user["user_id"])
+    return {
+        "runs": [
+            {
+                "runId": run["run_id"],
+                "config": run["config"],
+                "status": run["status"],
+                "resultCount": run["result_count"],
+                "createdAt": run["created_at"].isoformat(),
+            }
+            for run in runs
+        ]
+    }
+
+
+@router.get("/runs/{run_id}")
+async def get_run(
+    run_id: int,
+    user: dict = Depends(get_facilitator_user),
+) -> dict:
+    """
+    Get one of the current user's batch runs with all of its results, for
+    side-by-side comparison.
+
+    Auth: facilitator or admin required.
+    Returns 404 if the run is not found or belongs to another user.
+    """
+    async with get_connection() as conn:
+        run = await get_batch_run(conn, run_id)
+    if not run or run["user_id"] != user["user_id"]:
+        raise HTTPException(404, "Run not found")
+    return {
+        "runId": run["run_id"],
+        "config": run["config"],
+        "status": run["status"],
+        "results": run["results"],
+        "createdAt": run["created_at"].isoformat(),
+    }
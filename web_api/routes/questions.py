@@ -10,7 +10,7 @@ Endpoints:
 import hashlib
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 
 from core.questions import (
@@ -23,6 +23,7 @@ from core.questions import (
 from core.database import get_connection, get_transaction
 from core.scoring import enqueue_scoring
 from web_api.auth import get_user_or_anonymous
+from web_api.rate_limit import client_key, question_limiter
 
 router = APIRouter(prefix="/api/questions", tags=["questions"])
 
@@ -88,6 +89,7 @@ class ScoreResponse(BaseModel):
 @router.post("/responses", response_model=SubmitResponseResponse, status_code=201)
 async def submit_question_response(
     body: SubmitResponseRequest,
+    request: Request,
     auth: tuple = Depends(get_user_or_anonymous),
 ):
     """Submit a question response (student answer).
@@ -97,6 +99,7 @@ async def submit_question_response(
     (multiple attempts per question are supported).
     """
     user_id, anonymous_token = auth
+    await question_limiter.check(request, client_key(request, user_id, anonymous_token))
 
     # Validate answer_text is non-empty
     if not body.answer_text.strip():
@@ -258,16 +261,7 @@ async def update_question_response(
 
     # Trigger AI scoring when response is completed (not on draft saves)
     if body.completed_at and body.completed_at not in ("", "null"):
-        enqueue_scoring(
-            response_id=row["response_id"],
-            question_context={
-                "question_id": row["question_id"],
-                "module_slug": row["module_slug"],
-                "answer_text": row["answer_text"],
-                "question_text": row.get("question_text"),
-                "assessment_instructions": row.get("assessment_instructions"),
-            },
-        )
+        enqueue_scoring(response_id=row["response_id"])
 
     created_at = row["created_at"]
     if isinstance(created_at, datetime):
@@ -1,9 +1,10 @@
 """Speech-to-text API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile
 
 from core.speech import transcribe_audio
 from web_api.auth import get_optional_user
+from web_api.rate_limit import client_ip, transcribe_limiter
 
 router = APIRouter(prefix="/api", tags=["speech"])
 
@@ -11,11 +12,18 @@ MAX_FILE_SIZE = 25 * 1024 * 1024  # 25MB (Whisper API limit)
 
 
 @router.post("/transcribe")
-async def transcribe(audio: UploadFile, user: dict | None = Depends(get_optional_user)):
+async def transcribe(
+    audio: UploadFile,
+    request: Request,
+    user: dict | None = Depends(get_optional_user),
+):
     """Transcribe audio to text using Whisper API.
     Accepts audio files in webm, mp3, wav, m4a, flac, ogg formats.
     Returns the transcribed text.
     """
+    key = f"discord:{user['sub']}" if user else f"ip:{client_ip(request)}"
+    await transcribe_limiter.check(request, key)
+
     contents = await audio.read()
 
     if len(contents) > MAX_FILE_SIZE:
@@ -0,0 +1,196 @@
+"""
+In-memory manifest of the built frontend (web_frontend/dist/client).
+
+Built once at startup: every file is read, given a content-hash ETag and,
+if compressible, precompressed with gzip (and brotli when the brotli
+package is installed; a .br/.gz file emitted next to it by the build is
+used as is). Requests are then answered from memory with Accept-Encoding
+negotiation and If-None-Match -> 304, without touching the filesystem.
+
+Vite's /assets files have content hashes in their names, so they are
+cached as immutable. Everything else (HTML, favicon, ...) is revalidated
+on each use, which is a cheap 304 once the browser has it.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from fastapi import Request, Response
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# Smaller files don't gain enough from compression to be worth a variant
+MIN_COMPRESS_BYTES = 256
+
+# Quality 11 is slow enough on large bundles to delay startup noticeably
+BROTLI_QUALITY = 9
+
+_COMPRESSIBLE_TYPES = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/wasm",
+    "application/xml",
+    "image/svg+xml",
+    "image/x-icon",
+}
+
+# Preference order when the client accepts several
+_ENCODINGS = ("br", "gzip")
+_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+@dataclass(frozen=True)
+class Variant:
+    body: bytes
+    etag: str
+    encoding: str | None = None
+
+
+@dataclass(frozen=True)
+class StaticFile:
+    media_type: str
+    cache_control: str
+    identity: Variant
+    encoded: dict[str, Variant] = field(default_factory=dict)
+
+
+def _is_compressible(media_type: str) -> bool:
+    return media_type.startswith("text/") or media_type in _COMPRESSIBLE_TYPES
+
+
+def _compress(encoding: str, body: bytes) -> bytes | None:
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=9, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return None
+
+
+def _load_file(path: Path, rel: str) -> StaticFile:
+    body = path.read_bytes()
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    cache_control = IMMUTABLE if rel.startswith("assets/") else REVALIDATE
+
+    encoded = {}
+    if _is_compressible(media_type) and len(body) >= MIN_COMPRESS_BYTES:
+        for encoding in _ENCODINGS:
+            sibling = path.with_name(path.name + _SUFFIXES[encoding])
+            if sibling.is_file():
+                compressed = sibling.read_bytes()
+            else:
+                compressed = _compress(encoding, body)
+            if compressed is not None and len(compressed) < len(body):
+                encoded[encoding] = Variant(
+                    compressed, f'"{digest}-{encoding}"', encoding
+                )
+
+    return StaticFile(media_type, cache_control, Variant(body, f'"{digest}"'), encoded)
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """Codings from an Accept-Encoding header, minus any with q=0."""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                if float(value) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    if "*" in accepted:
+        accepted.update(_ENCODINGS)
+    return accepted
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak If-None-Match comparison."""
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+class StaticManifest:
+    """Files of a frontend build, keyed by path relative to its root."""
+
+    def __init__(self, files: dict[str, StaticFile]):
+        self.files = files
+
+    @classmethod
+    def build(cls, root: Path) -> "StaticManifest":
+        files = {}
+        for path in sorted(root.rglob("*")):
+            if not path.is_file():
+                continue
+            # Precompressed siblings are picked up by the file they belong to
+            if path.suffix in (".br", ".gz") and path.with_suffix("").is_file():
+                continue
+            rel = path.relative_to(root).as_posix()
+            files[rel] = _load_file(path, rel)
+        return cls(files)
+
+    def page(self, full_path: str) -> StaticFile | None:
+        """Resolve a request path the way Vike's SSG output is laid out.
+
+        An exact file (favicon, images) wins, then pre-rendered HTML
+        (/course/default -> course/default/index.html, /404 -> 404.html),
+        then the SPA shell (200/index.html) and finally the landing page.
+        """
+        exact = self.files.get(full_path)
+        if exact is not None:
+            return exact
+
+        route = full_path.rstrip("/") or "index"
+        for candidate in (
+            f"{route}/index.html",
+            f"{route}.html",
+            "200/index.html",
+            "index.html",
+        ):
+            file = self.files.get(candidate)
+            if file is not None:
+                return file
+        return None
+
+    def total_bytes(self) -> int:
+        return sum(
+            len(file.identity.body)
+            + sum(len(variant.body) for variant in file.encoded.values())
+            for file in self.files.values()
+        )
+
+
+def serve(file: StaticFile, request: Request) -> Response:
+    """Negotiate the encoding for a manifest file and answer, or 304."""
+    variant = file.identity
+    if file.encoded:
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        for encoding in _ENCODINGS:
+            if encoding in accepted and encoding in file.encoded:
+                variant = file.encoded[encoding]
+                break
+
+    headers = {"ETag": variant.etag, "Cache-Control": file.cache_control}
+    if file.encoded:
+        headers["Vary"] = "Accept-Encoding"
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, variant.etag):
+        return Response(status_code=304, headers=headers)
+
+    if variant.encoding:
+        headers["Content-Encoding"] = variant.encoding
+    return Response(content=variant.body, media_type=file.media_type, headers=headers)
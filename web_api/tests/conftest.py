@@ -16,6 +16,7 @@ from core.modules.flattened_types import (
     ModuleRef,
     MeetingMarker,
 )
+from web_api import rate_limit
 
 
 @pytest.fixture(autouse=True)
@@ -177,3 +178,16 @@ def api_test_cache():
     yield cache
 
     clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """Start each test with empty rate limit buckets."""
+    for limiter in (
+        rate_limit.oauth_start_limiter,
+        rate_limit.refresh_limiter,
+        rate_limit.chat_limiter,
+        rate_limit.transcribe_limiter,
+        rate_limit.question_limiter,
+    ):
+        limiter.reset()
@@ -513,11 +513,32 @@ class TestAdminGroupCreate:
 class TestAdminCohortSync:
     """Tests for POST /api/admin/cohorts/{cohort_id}/sync endpoint."""
 
-    @patch("web_api.routes.admin.get_connection")
-    @patch("web_api.routes.admin.sync_group")
-    @patch("web_api.routes.admin.get_cohort_group_ids")
-    def test_syncs_all_cohort_groups(self, mock_get_ids, mock_sync, mock_get_conn):
-        """Should sync all groups in cohort."""
+    @staticmethod
+    def _make_plan():
+        from core.sync_planner import CohortSyncPlan, GroupSyncPlan
+
+        return CohortSyncPlan(
+            cohort_id=1,
+            cohort_name="Jan",
+            groups=[
+                GroupSyncPlan(
+                    group_id=1,
+                    group_name="A",
+                    status="active",
+                    grant_discord_ids={"111"},
+                ),
+                GroupSyncPlan(group_id=2, group_name="B", status="active"),
+                GroupSyncPlan(group_id=3, group_name="C", status="active"),
+            ],
+        )
+
+    @patch("core.sync_planner._sync_external_only", new_callable=AsyncMock)
+    @patch("core.sync.sync_group", new_callable=AsyncMock)
+    @patch("web_api.routes.admin.plan_cohort_sync", new_callable=AsyncMock)
+    def test_only_fully_syncs_groups_with_discord_changes(
+        self, mock_plan, mock_sync, mock_external
+    ):
+        """Should run sync_group only for groups whose Discord state differs."""
         from web_api.routes.admin import router
         from fastapi import FastAPI
 
@@ -527,34 +548,31 @@ class TestAdminCohortSync:
         # Override require_admin dependency to return mock admin user
         app.dependency_overrides[require_admin] = lambda: {"user_id": 1}
 
-        mock_conn = AsyncMock()
-        mock_conn.__aenter__.return_value = mock_conn
-        mock_conn.__aexit__.return_value = None
-        mock_get_conn.return_value = mock_conn
-
-        mock_get_ids.return_value = [1, 2, 3]
+        mock_plan.return_value = self._make_plan()
         mock_sync.return_value = {"discord": {"granted": 1}}
+        mock_external.return_value = [
+            {"group_id": gid, "result": {"calendar": {}, "reminders": {}}}
+            for gid in (2, 3)
+        ]
 
         client = TestClient(app)
         response = client.post("/api/admin/cohorts/1/sync")
 
         assert response.status_code == 200
-        assert mock_sync.call_count == 3
-        # Verify sync_group called with allow_create=False
-        for call in mock_sync.call_args_list:
-            assert call[1]["allow_create"] is False
+        mock_sync.assert_called_once_with(1, allow_create=False)
+        mock_external.assert_called_once()
+        assert mock_external.call_args.args[0] == [2, 3]
 
         data = response.json()
         assert data["synced"] == 3
-        assert len(data["results"]) == 3
+        assert {r["group_id"] for r in data["results"]} == {1, 2, 3}
 
         app.dependency_overrides.clear()
 
-    @patch("web_api.routes.admin.get_connection")
-    @patch("web_api.routes.admin.sync_group")
-    @patch("web_api.routes.admin.get_cohort_group_ids")
-    def test_handles_empty_cohort(self, mock_get_ids, mock_sync, mock_get_conn):
-        """Should handle cohort with no groups."""
+    @patch("core.sync.sync_group", new_callable=AsyncMock)
+    @patch("web_api.routes.admin.plan_cohort_sync", new_callable=AsyncMock)
+    def test_dry_run_returns_plan_without_syncing(self, mock_plan, mock_sync):
+        """dry_run=true should return the plan and make no changes."""
         from web_api.routes.admin import router
         from fastapi import FastAPI
 
@@ -563,30 +581,46 @@ class TestAdminCohortSync:
 
         app.dependency_overrides[require_admin] = lambda: {"user_id": 1}
 
-        mock_conn = AsyncMock()
-        mock_conn.__aenter__.return_value = mock_conn
-        mock_conn.__aexit__.return_value = None
-        mock_get_conn.return_value = mock_conn
-
-        mock_get_ids.return_value = []
+        mock_plan.return_value = self._make_plan()
 
         client = TestClient(app)
-        response = client.post("/api/admin/cohorts/1/sync")
+        response = client.post("/api/admin/cohorts/1/sync?dry_run=true")
 
         assert response.status_code == 200
         data = response.json()
-        assert data["synced"] == 0
-        assert data["results"] == []
+        assert data["dry_run"] is True
+        assert data["plan"]["changed_groups"] == 1
+        assert data["plan"]["groups"][0]["changes"] == ["grant role: 1"]
         mock_sync.assert_not_called()
 
         app.dependency_overrides.clear()
 
+    @patch("web_api.routes.admin.plan_cohort_sync", new_callable=AsyncMock)
+    def test_returns_404_for_unknown_cohort(self, mock_plan):
+        """Should return 404 when the cohort doesn't exist."""
+        from web_api.routes.admin import router
+        from fastapi import FastAPI
+
+        app = FastAPI()
+        app.include_router(router)
+
+        app.dependency_overrides[require_admin] = lambda: {"user_id": 1}
+
+        mock_plan.return_value = None
+
+        client = TestClient(app)
+        response = client.post("/api/admin/cohorts/99/sync")
+
+        assert response.status_code == 404
+
+        app.dependency_overrides.clear()
+
 
 class TestAdminCohortRealize:
     """Tests for POST /api/admin/cohorts/{cohort_id}/realize endpoint."""
 
     @patch("web_api.routes.admin.get_connection")
-    @patch("web_api.routes.admin.sync_group")
+    @patch("core.sync.sync_group")
     @patch("web_api.routes.admin.get_cohort_preview_group_ids")
     def test_realizes_preview_groups(self, mock_get_ids, mock_sync, mock_get_conn):
         """Should realize all preview groups in cohort."""
@@ -622,7 +656,7 @@ class TestAdminCohortRealize:
         app.dependency_overrides.clear()
 
     @patch("web_api.routes.admin.get_connection")
-    @patch("web_api.routes.admin.sync_group")
+    @patch("core.sync.sync_group")
     @patch("web_api.routes.admin.get_cohort_preview_group_ids")
     def test_handles_no_preview_groups(self, mock_get_ids, mock_sync, mock_get_conn):
         """Should handle cohort with no preview groups."""
@@ -208,7 +208,7 @@ class TestPostChatModule:
                 side_effect=lambda *a, **kw: mock_stream(),
             ),
             patch(
-                "web_api.routes.module.gather_section_context",
+                "core.modules.chat_context.gather_section_context",
                 return_value="Video content here",
             ) as ctx_mock,
         ):
@@ -368,3 +368,55 @@ class TestPostChatModule:
             assistant_calls = [c for c in calls if c.kwargs.get("role") == "assistant"]
             assert len(assistant_calls) >= 1
             assert assistant_calls[0].kwargs["content"] == "Hello there!"
+
+    def test_checkpoints_partial_reply_while_streaming(
+        self, client, mock_chat_module_cache, mock_auth
+    ):
+        """Long replies are saved once, then updated in place, not re-appended."""
+
+        async def mock_stream(*args, **kwargs):
+            yield {"type": "text", "content": "Hello "}
+            yield {"type": "text", "content": "there!"}
+            yield {"type": "done"}
+
+        add_mock = AsyncMock()
+        update_mock = AsyncMock()
+
+        mock_conn = MagicMock()
+        mock_conn.__aenter__ = AsyncMock(return_value=mock_conn)
+        mock_conn.__aexit__ = AsyncMock(return_value=None)
+
+        with (
+            patch("web_api.routes.module.CHECKPOINT_INTERVAL", 0),
+            patch(
+                "web_api.routes.module.get_connection",
+                return_value=mock_conn,
+            ),
+            patch(
+                "web_api.routes.module.get_or_create_chat_session",
+                return_value={"session_id": 1, "messages": []},
+            ),
+            patch("web_api.routes.module.add_chat_message", add_mock),
+            patch("web_api.routes.module.update_last_chat_message", update_mock),
+            patch(
+                "web_api.routes.module.send_module_message",
+                side_effect=lambda *a, **kw: mock_stream(),
+            ),
+        ):
+            response = client.post(
+                "/api/chat/module",
+                json={
+                    "slug": "test-module",
+                    "sectionIndex": 0,
+                    "segmentIndex": 1,
+                    "message": "Hello",
+                },
+            )
+            list(response.iter_lines())
+
+        assistant_calls = [
+            c for c in add_mock.call_args_list if c.kwargs.get("role") == "assistant"
+        ]
+        assert len(assistant_calls) == 1
+        assert assistant_calls[0].kwargs["content"] == "Hello "
+        assert update_mock.call_args.kwargs["content"] == "Hello there!"
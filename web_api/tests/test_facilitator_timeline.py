@@ -0,0 +1,146 @@
+"""Tests for the cached facilitator group timeline."""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.modules.flattened_types import MeetingMarker, ModuleRef
+from web_api.auth import get_current_user
+from web_api.routes import facilitator
+from web_api.routes.facilitator import router
+
+
+@asynccontextmanager
+async def _fake_connection():
+    yield MagicMock()
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_current_user] = lambda: {"sub": "123"}
+    facilitator._timeline_cache.clear()
+    with (
+        patch.object(facilitator, "get_read_connection", _fake_connection),
+        patch.object(
+            facilitator,
+            "get_db_user_or_403",
+            AsyncMock(return_value={"user_id": 1}),
+        ),
+        patch.object(facilitator, "can_access_group", AsyncMock(return_value=True)),
+        patch.object(
+            facilitator,
+            "load_course",
+            MagicMock(return_value=MagicMock(progression=[])),
+        ),
+        patch.object(facilitator, "get_content_index", MagicMock()),
+    ):
+        yield TestClient(app)
+    facilitator._timeline_cache.clear()
+
+
+def _timeline_data(name):
+    return {
+        "past_meetings": set(),
+        "members": [
+            {
+                "user_id": 7,
+                "name": name,
+                "completed_ids": [],
+                "section_times": {},
+                "chat_counts": {},
+                "meetings": {},
+                "rsvps": {},
+                "guest_elsewhere": [],
+            }
+        ],
+    }
+
+
+def _names(response):
+    return [m["name"] for m in response.json()["members"]]
+
+
+class TestTimelineCache:
+    def test_reuses_response_until_watermark_changes(self, client):
+        watermark = AsyncMock(return_value=("v1",))
+        data = AsyncMock(return_value=_timeline_data("Old name"))
+
+        with (
+            patch.object(facilitator, "get_group_dashboard_watermark", watermark),
+            patch.object(facilitator, "get_group_timeline_data", data),
+        ):
+            assert _names(client.get("/api/facilitator/groups/5/timeline")) == [
+                "Old name"
+            ]
+            data.return_value = _timeline_data("New name")
+
+            # Same watermark: served from the cache without re-querying
+            cached = client.get("/api/facilitator/groups/5/timeline")
+            assert _names(cached) == ["Old name"]
+            assert data.await_count == 1
+
+            # A rename bumps users.updated_at, which moves the watermark
+            watermark.return_value = ("v2",)
+            refreshed = client.get("/api/facilitator/groups/5/timeline")
+
+        assert _names(refreshed) == ["New name"]
+        assert data.await_count == 2
+
+
+class TestTimelineResponse:
+    def test_rolls_member_data_up_to_modules(self, client):
+        index = SimpleNamespace(
+            modules={"intro": SimpleNamespace(content_id="module-cid")},
+            module_lenses={"intro": ["lens-a", "lens-b"]},
+            module_refs={
+                ("intro", "lens-a"): SimpleNamespace(title="Lens A"),
+                ("intro", "lens-b"): SimpleNamespace(title="Lens B"),
+            },
+        )
+        course = SimpleNamespace(
+            progression=[ModuleRef(slug="intro"), MeetingMarker(number=1)]
+        )
+        data = _timeline_data("Ada")
+        data["past_meetings"] = {1}
+        data["members"][0].update(
+            completed_ids=["lens-a"],
+            section_times={"lens-a": 60, "lens-b": 30, "unknown-lens": 5},
+            chat_counts={"module-cid": 4, "other-module": 9},
+            meetings={"1": "attended"},
+            rsvps={"1": "attending"},
+        )
+
+        with (
+            patch.object(
+                facilitator,
+                "get_group_dashboard_watermark",
+                AsyncMock(return_value=("v1",)),
+            ),
+            patch.object(
+                facilitator, "get_group_timeline_data", AsyncMock(return_value=data)
+            ),
+            patch.object(facilitator, "load_course", MagicMock(return_value=course)),
+            patch.object(
+                facilitator, "get_content_index", MagicMock(return_value=index)
+            ),
+        ):
+            body = client.get("/api/facilitator/groups/5/timeline").json()
+
+        assert body["timeline_items"][-1] == {
+            "type": "meeting",
+            "number": 1,
+            "is_past": True,
+        }
+        (member,) = body["members"]
+        assert member["module_stats"] == {
+            "intro": {"time_seconds": 90, "chat_count": 4}
+        }
+        assert member["section_times"] == {"lens-a": 60, "lens-b": 30}
+        assert member["meetings"] == {"1": "attended"}
+        assert member["completed_ids"] == ["lens-a"]
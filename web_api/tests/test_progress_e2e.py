@@ -73,7 +73,7 @@ class TestHeartbeatMultiLevel:
 
     @pytest.mark.asyncio
     async def test_heartbeat_creates_records_at_all_three_levels(
-        self, anon_token, lens_id, lo_id, module_id
+        self, anon_token, lens_id, lo_id, module_id, query_budget
     ):
         """Sending a heartbeat should create progress records for lens, LO, and module."""
         from main import app
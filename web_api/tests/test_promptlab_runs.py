@@ -0,0 +1,56 @@
+"""Tests for the Prompt Lab saved-run endpoints."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from web_api.routes import promptlab
+from web_api.routes.promptlab import get_facilitator_user, router
+
+
+@asynccontextmanager
+async def _fake_connection():
+    yield MagicMock()
+
+
+def _run(user_id):
+    return {
+        "run_id": 3,
+        "user_id": user_id,
+        "config": {},
+        "status": "completed",
+        "results": [],
+        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+    }
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_facilitator_user] = lambda: {"user_id": 1}
+    with patch.object(promptlab, "get_connection", _fake_connection):
+        yield TestClient(app)
+
+
+class TestGetRun:
+    def test_returns_own_run(self, client):
+        with patch.object(
+            promptlab, "get_batch_run", AsyncMock(return_value=_run(user_id=1))
+        ):
+            response = client.get("/api/promptlab/runs/3")
+
+        assert response.status_code == 200
+        assert response.json()["runId"] == 3
+
+    def test_hides_other_users_run(self, client):
+        with patch.object(
+            promptlab, "get_batch_run", AsyncMock(return_value=_run(user_id=2))
+        ):
+            response = client.get("/api/promptlab/runs/3")
+
+        assert response.status_code == 404
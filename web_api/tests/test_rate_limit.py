@@ -0,0 +1,93 @@
+"""Tests for the GCRA rate limiter."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from web_api import rate_limit
+from web_api.rate_limit import RateLimiter, client_key
+
+
+def _request(ip="1.2.3.4", forwarded=None):
+    request = MagicMock()
+    request.headers = {"x-forwarded-for": forwarded} if forwarded else {}
+    request.client.host = ip
+    return request
+
+
+class TestClientKey:
+    def test_prefers_user_then_token_then_ip(self):
+        request = _request(forwarded="9.9.9.9, 10.0.0.1")
+
+        assert client_key(request, 7, "tok") == "user:7"
+        assert client_key(request, None, "tok") == "anon:tok"
+        assert client_key(request) == "ip:9.9.9.9"
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_allows_burst_then_limits(self):
+        limiter = RateLimiter(max_requests=3, window_seconds=60)
+        request = _request()
+
+        for _ in range(3):
+            await limiter.check(request)
+        with pytest.raises(HTTPException) as exc:
+            await limiter.check(request)
+
+        assert exc.value.status_code == 429
+        assert exc.value.headers["Retry-After"] == "20"
+
+    @pytest.mark.asyncio
+    async def test_replenishes_at_sustained_rate(self):
+        limiter = RateLimiter(max_requests=3, window_seconds=60)
+        request = _request()
+
+        with patch.object(rate_limit.time, "monotonic", return_value=1000.0):
+            for _ in range(3):
+                await limiter.check(request)
+        # One interval (20s) later, exactly one more request is allowed
+        with patch.object(rate_limit.time, "monotonic", return_value=1020.0):
+            await limiter.check(request)
+            with pytest.raises(HTTPException):
+                await limiter.check(request)
+
+    @pytest.mark.asyncio
+    async def test_keys_are_independent(self):
+        limiter = RateLimiter(max_requests=1, window_seconds=60)
+        request = _request()
+
+        await limiter.check(request, "user:1")
+        await limiter.check(request, "user:2")
+        with pytest.raises(HTTPException):
+            await limiter.check(request, "user:1")
+
+    @pytest.mark.asyncio
+    async def test_memory_bounded_by_lru(self):
+        limiter = RateLimiter(max_requests=1, window_seconds=60, max_keys=2)
+        request = _request()
+
+        await limiter.check(request, "a")
+        await limiter.check(request, "b")
+        with pytest.raises(HTTPException):
+            await limiter.check(request, "a")  # Touches "a"
+        await limiter.check(request, "c")  # Evicts "b"
+
+        assert list(limiter._tats) == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_shared_backend_falls_back_to_local(self):
+        limiter = RateLimiter(max_requests=1, window_seconds=60)
+        request = _request()
+
+        with (
+            patch.object(rate_limit, "RATE_LIMIT_BACKEND", "postgres"),
+            patch(
+                "core.database.get_transaction",
+                side_effect=RuntimeError("no database"),
+            ),
+        ):
+            await limiter.check(request)
+            with pytest.raises(HTTPException):
+                await limiter.check(request)
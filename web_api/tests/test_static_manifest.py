@@ -0,0 +1,126 @@
+"""Tests for serving the built frontend from the in-memory manifest."""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+from web_api.static_manifest import IMMUTABLE, REVALIDATE, StaticManifest, serve
+
+PAGE_HTML = "<html>" + "course page " * 100 + "</html>"
+
+
+@pytest.fixture
+def client_dir(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "index-abc123.js").write_text("console.log(1);" * 100)
+    (tmp_path / "course" / "default").mkdir(parents=True)
+    (tmp_path / "course" / "default" / "index.html").write_text(PAGE_HTML)
+    (tmp_path / "200").mkdir()
+    (tmp_path / "200" / "index.html").write_text("<html>spa shell</html>")
+    (tmp_path / "index.html").write_text("<html>landing</html>")
+    (tmp_path / "404.html").write_text("<html>not found</html>")
+    (tmp_path / "favicon.ico").write_bytes(b"\x00\x01")
+    return tmp_path
+
+
+@pytest.fixture
+def client(client_dir):
+    manifest = StaticManifest.build(client_dir)
+    app = FastAPI()
+
+    @app.get("/{full_path:path}")
+    async def page(full_path: str, request: Request):
+        file = manifest.page(full_path)
+        if file is None:
+            raise HTTPException(status_code=404)
+        return serve(file, request)
+
+    return TestClient(app)
+
+
+class TestPageLookup:
+    def test_resolves_like_vike_output(self, client_dir):
+        manifest = StaticManifest.build(client_dir)
+        files = manifest.files
+
+        assert manifest.page("favicon.ico") is files["favicon.ico"]
+        assert manifest.page("course/default/") is files["course/default/index.html"]
+        assert manifest.page("404") is files["404.html"]
+        assert manifest.page("") is files["index.html"]
+        assert manifest.page("course/unknown") is files["200/index.html"]
+        assert manifest.page("../../etc/passwd") is files["200/index.html"]
+
+    def test_no_filesystem_access_after_build(self, client_dir, monkeypatch):
+        manifest = StaticManifest.build(client_dir)
+        monkeypatch.setattr("pathlib.Path.exists", lambda self: pytest.fail())
+
+        assert manifest.page("course/default") is not None
+
+    def test_uses_precompressed_sibling(self, client_dir):
+        js = client_dir / "assets" / "index-abc123.js"
+        (client_dir / "assets" / "index-abc123.js.gz").write_bytes(b"from build")
+
+        manifest = StaticManifest.build(client_dir)
+
+        assert "assets/index-abc123.js.gz" not in manifest.files
+        asset = manifest.files["assets/index-abc123.js"]
+        assert asset.encoded["gzip"].body == b"from build"
+        assert asset.identity.body == js.read_bytes()
+
+
+class TestServe:
+    def test_negotiates_gzip(self, client):
+        response = client.get(
+            "/course/default", headers={"Accept-Encoding": "gzip, br;q=0"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["cache-control"] == REVALIDATE
+        assert response.text == PAGE_HTML
+
+    def test_identity_when_not_accepted(self, client):
+        response = client.get("/course/default", headers={"Accept-Encoding": "br;q=0"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text == PAGE_HTML
+
+    def test_not_modified_for_matching_etag(self, client):
+        first = client.get("/course/default", headers={"Accept-Encoding": "gzip"})
+
+        second = client.get(
+            "/course/default",
+            headers={
+                "Accept-Encoding": "gzip",
+                "If-None-Match": f"W/{first.headers['etag']}",
+            },
+        )
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == first.headers["etag"]
+
+    def test_etag_differs_per_encoding(self, client):
+        plain = client.get("/course/default", headers={"Accept-Encoding": "identity"})
+        gzipped = client.get("/course/default", headers={"Accept-Encoding": "gzip"})
+
+        assert plain.headers["etag"] != gzipped.headers["etag"]
+
+    def test_hashed_assets_are_immutable(self, client):
+        response = client.get("/assets/index-abc123.js")
+
+        assert response.headers["cache-control"] == IMMUTABLE
+
+    def test_small_files_are_not_compressed(self, client_dir):
+        manifest = StaticManifest.build(client_dir)
+
+        assert manifest.files["favicon.ico"].encoded == {}
+        assert (
+            gzip.decompress(
+                manifest.files["course/default/index.html"].encoded["gzip"].body
+            )
+            == PAGE_HTML.encode()
+        )